@@ -177,5 +177,13 @@ copyfile(pyliner_rollup, pyliner_rollup_target)
 open(join(python_pb, "__init__.py"), 'a').close()
 rmtree(join(target, extras["autogen_version"]))
 
+# Merge every message definition into one descriptor bundle next to the map
+print "Bundling message descriptors..."
+bundle_env = dict(os.environ, PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION="python")
+bundle_env["PYTHONPATH"] = os.pathsep.join(
+    filter(None, [join(base, "..", "pyliner"), bundle_env.get("PYTHONPATH")]))
+subprocess.check_call(['python', '-m', 'pyliner.proto_registry', python_pb],
+                      env=bundle_env)
+
 rmtree(join(base, "temp"))
 
@@ -1,11 +1,12 @@
 """ This file was autogenerated from template version 0.0.0.1 and autogenerator version {{cookiecutter.autogen_version}} """
-{% for app, app_data in cookiecutter.Airliner.apps.iteritems() -%}
-    {% for airliner_msg, proto_data in app_data.proto_msgs.iteritems() %}
-import {{proto_data.proto_msg[:-3]}}_pb2{% endfor %}{% endfor %}
+from os.path import dirname, isfile, join
 
+from pyliner.proto_registry import MessageRegistry
 
-proto_msg_map = {
+BUNDLE = join(dirname(__file__), 'pyliner_msgs.desc')
+
+proto_msg_map = MessageRegistry({
     {%- for app, app_data in cookiecutter.Airliner.apps.iteritems() -%}
         {%- for airliner_msg, proto_data in app_data.proto_msgs.iteritems() %}
-    "{{airliner_msg}}": {{proto_data.proto_msg[:-3]}}_pb2.{{proto_data.proto_msg}},{% endfor %}{% endfor %}
-}
+    "{{airliner_msg}}": ("pyliner.python_pb.{{proto_data.proto_msg[:-3]}}_pb2", "{{proto_data.proto_msg}}"),{% endfor %}{% endfor %}
+}, bundle=BUNDLE if isfile(BUNDLE) else None)
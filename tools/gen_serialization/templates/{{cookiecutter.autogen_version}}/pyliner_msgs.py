@@ -1,7 +1,6 @@
 """ This file was autogenerated from template version 0.0.0.1 and autogenerator version {{cookiecutter.autogen_version}} """
-{% for airliner_msg, proto_data in cookiecutter.proto_msgs.iteritems() %}
-from pyliner.python_pb import {{proto_data.proto_msg[:-3]}}_pb2{% endfor %}
+from pyliner.proto_registry import MessageRegistry
 
-proto_msg_map = { {% for airliner_msg, proto_data in cookiecutter.proto_msgs.iteritems() %}
-    "{{airliner_msg}}": {{proto_data.proto_msg[:-3]}}_pb2.{{proto_data.proto_msg}},{% endfor %}
-}
+proto_msg_map = MessageRegistry({ {% for airliner_msg, proto_data in cookiecutter.proto_msgs.iteritems() %}
+    "{{airliner_msg}}": ("pyliner.python_pb.{{proto_data.proto_msg[:-3]}}_pb2", "{{proto_data.proto_msg}}"),{% endfor %}
+})
@@ -0,0 +1,93 @@
+"""
+Measure how many intents per second a Vehicle with every default App attached
+can broadcast and handle.
+
+Usage:
+    python -m benchmarks.intent_throughput [--seconds 2] [--airliner-map PATH]
+
+Without --airliner-map, the map is merged in memory from
+pyliner_ops_names.json and pyliner_msgs.json, so no vehicle or airliner.json
+is needed.
+"""
+
+import argparse
+import logging
+import time
+from os.path import abspath, dirname, join
+
+from pyliner.action import ACTION_APP_LIST, ACTION_CALC_DISTANCE, \
+    ACTION_TELEM
+from pyliner.apps.communication import Communication
+from pyliner.intent import Intent
+from pyliner.position import Coordinate
+from pyliner.util import read_json
+from pyliner.vehicle import Vehicle
+
+ROOT = dirname(dirname(abspath(__file__)))
+
+# The checked-in message definitions name operations after their message. The
+# default Apps subscribe to these operational names when they are attached.
+ALIASES = {'VehicleGlobalPosition': 'PX4_VehicleGlobalPositionMsg_t'}
+
+
+def airliner_map():
+    """Merge the operational names and message definitions into one map."""
+    merged = read_json(join(ROOT, 'pyliner_ops_names.json'))
+    msgs = read_json(join(ROOT, 'pyliner_msgs.json'))
+    for name, app in merged['Airliner']['apps'].items():
+        app['operations'] = msgs['Airliner']['apps'][name]['operations']
+    operations = merged['Airliner']['apps']['PX4']['operations']
+    for alias, operation in ALIASES.items():
+        operations.setdefault(alias, operations[operation])
+    return merged
+
+
+def measure(vehicle, intent, seconds):
+    """Broadcast intent repeatedly for some seconds.
+
+    Returns:
+        float: Intents per second.
+    """
+    count = 0
+    start = time.time()
+    end = start + seconds
+    while time.time() < end:
+        for _ in range(100):
+            vehicle.broadcast(intent)
+        count += 100
+    return count / (time.time() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--seconds', type=float, default=2.0,
+                        help='Seconds to run each case for.')
+    parser.add_argument('--airliner-map',
+                        help='Airliner map to use instead of the merged one.')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    mapping = read_json(args.airliner_map) if args.airliner_map \
+        else airliner_map()
+    vehicle = Vehicle('benchmark', Communication(mapping, to_port=0))
+    origin = Coordinate(47.0, -122.0)
+    cases = [
+        ('Explicit', Intent(ACTION_APP_LIST,
+                            component='com.windhover.pyliner.vehicle_app')),
+        ('Filtered', Intent(ACTION_APP_LIST)),
+        ('Telemetry', Intent(
+            ACTION_TELEM, data='/Airliner/PX4/VehicleGlobalPosition/Lat')),
+        ('Distance', Intent(ACTION_CALC_DISTANCE,
+                            data=(origin, Coordinate(47.001, -122.001)))),
+        ('No receiver', Intent('ACTION_BENCHMARK_UNKNOWN')),
+    ]
+    try:
+        for name, intent in cases:
+            print('{:<12} {:>10.0f} intents/s'.format(
+                name, measure(vehicle, intent, args.seconds)))
+    finally:
+        vehicle.shutdown()
+
+
+if __name__ == '__main__':
+    main()
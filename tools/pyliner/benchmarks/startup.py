@@ -0,0 +1,67 @@
+"""
+Measure how long pyliner takes to start, each case in a fresh interpreter.
+
+Usage:
+    python -m benchmarks.startup [--runs 5]
+
+Cases:
+    Import  import pyliner and its message map.
+    Script  Build a Vehicle with every default App, read one telemetry item,
+        and shut down, as a short script would.
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from os.path import abspath, dirname
+
+ROOT = dirname(dirname(abspath(__file__)))
+
+IMPORT = 'from pyliner.python_pb import pyliner_msgs'
+
+SCRIPT = """
+import logging
+logging.disable(logging.CRITICAL)
+from benchmarks.intent_throughput import airliner_map
+from pyliner.action import ACTION_TELEM
+from pyliner.apps.communication import Communication
+from pyliner.intent import Intent
+from pyliner.vehicle import Vehicle
+vehicle = Vehicle('benchmark', Communication(airliner_map(), to_port=0))
+vehicle.broadcast(Intent(
+    ACTION_TELEM, data='/Airliner/PX4/VehicleGlobalPosition/Alt')).first()
+vehicle.shutdown()
+"""
+
+CASES = [('Import', IMPORT), ('Script', SCRIPT)]
+
+
+def measure(source, runs):
+    """Run source in a new interpreter runs times.
+
+    Returns:
+        list[float]: Wall time of each run in seconds, sorted.
+    """
+    times = []
+    for _ in range(runs):
+        start = time.time()
+        subprocess.check_call([sys.executable, '-c', source], cwd=ROOT)
+        times.append(time.time() - start)
+    return sorted(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--runs', type=int, default=5,
+                        help='Interpreters to start for each case.')
+    args = parser.parse_args()
+
+    for name, source in CASES:
+        times = measure(source, args.runs)
+        print('{:<12} min {:>6.3f} s  median {:>6.3f} s'.format(
+            name, times[0], times[len(times) // 2]))
+
+
+if __name__ == '__main__':
+    main()
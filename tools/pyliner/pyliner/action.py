@@ -33,6 +33,9 @@ ACTION_APP_LIST = 'ACTION_APP_LIST'
 
 ACTION_VEHICLE_SHUTDOWN = 'ACTION_VEHICLE_SHUTDOWN'
 
+# Geofence
+ACTION_FENCE_WARNING = 'ACTION_FENCE_WARNING'
+
 # FlightDirector
 ACTION_AXIS_SET = 'ACTION_AXIS_SET'
 ACTION_AXIS_ZERO = 'ACTION_AXIS_ZERO'
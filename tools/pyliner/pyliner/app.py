@@ -24,7 +24,9 @@ class App(Loggable):
     receive intents from other apps.
 
     If an app requests control of the vehicle it must wait until such control is
-    granted before and commands that it sends are accepted.
+    granted before and commands that it sends are accepted. Once granted, the
+    app keeps its control lease between control blocks, renewing it on each
+    use, until the lease runs out, is revoked, or release_control() is called.
 
     Lifecycle:
            +--------------------------+
@@ -41,6 +43,9 @@ class App(Loggable):
         self.vehicle = None
         """:type: AppAccess"""
 
+        self._lease = None
+        """:type: ControlToken"""
+
     @property
     @abstractmethod
     def qualified_name(self):
@@ -87,6 +92,7 @@ class App(Loggable):
         """
         if self._state is App.DETACHED:
             raise AppDetachedError('Service cannot be detached at this time.')
+        self.release_control()
         self._state = App.DETACHED
         self.vehicle = None
         self.logger = None
@@ -94,11 +100,27 @@ class App(Loggable):
     def control_block(self):
         """Return a ControlBlock context manager, which when entered, waits
         for vehicle control before broadcasting Intents.
+
+        If the App still holds a valid control lease from an earlier block,
+        the lease is renewed and used without requesting control again.
         """
         if self.state is App.DETACHED:
             raise AppDetachedError('Detached App will never get control.')
         return _ControlBlock(self)
 
+    def release_control(self):
+        """Give up the control lease kept from earlier control blocks, if any.
+
+        Other Apps waiting for control are granted it immediately instead of
+        when the lease runs out or is rotated.
+        """
+        lease, self._lease = self._lease, None
+        if lease is not None and lease.valid:
+            self.vehicle.broadcast(Intent(
+                action=ACTION_CONTROL_RELEASE,
+                data=lease
+            ))
+
 
 class _ControlBlock(Broadcaster):
     def __init__(self, app):
@@ -122,7 +144,12 @@ class _ControlBlock(Broadcaster):
             callback=lambda i: self.revoke()
         )
 
-        # Send control request.
+        # Renew a lease kept from an earlier block, or request control.
+        lease = self.app._lease
+        if lease is not None and lease.renew():
+            self.grant(lease)
+            return self
+        self.app._lease = None
         enqueue = self.app.vehicle.broadcast(Intent(
             action=ACTION_CONTROL_REQUEST,
             data=self.app.qualified_name
@@ -133,17 +160,40 @@ class _ControlBlock(Broadcaster):
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self._control.wait()
-        self.app.vehicle.broadcast(Intent(
-            action=ACTION_CONTROL_RELEASE,
-            data=self._auth
-        ))
+        self.release()
+
+    def release(self):
+        """Leave the block without waiting for control.
+
+        A lease that is held is kept for the next block, as on exit. If
+        control was revoked, or never granted, the App's queued request is
+        withdrawn instead.
+        """
+        self._exit = True
         self.app.vehicle.remove_filter(self._grant_filter)
         self.app.vehicle.remove_filter(self._revoke_filter)
+        # Keep the lease for the next block. It is released by the App, or
+        # ends on its own when it runs out or is revoked.
+        if self._auth is not None and self._auth.renew():
+            self.app._lease = self._auth
+        else:
+            self.app.vehicle.broadcast(Intent(
+                action=ACTION_CONTROL_RELEASE,
+                data=self._auth
+            ))
 
     def broadcast(self, intent):
         self._control.wait()
         return self.app.vehicle.broadcast(intent)
 
+    @property
+    def token(self):
+        """The ControlToken if control is currently granted, else None.
+
+        Unlike request(), this never waits for control.
+        """
+        return self._auth if self._control.is_set() else None
+
     def grant(self, data):
         if self._exit:
             return False
@@ -157,5 +207,11 @@ class _ControlBlock(Broadcaster):
         return self._auth.request(data)
 
     def revoke(self):
+        """Called when control is revoked. Returns True to be requeued."""
         self._auth = None
         self._control.clear()
+        return True
+
+    def wait(self, timeout=None):
+        """Block until control is granted. Return True if it was."""
+        return self._control.wait(timeout)
@@ -42,6 +42,10 @@ class AppAccess(Loggable, Broadcaster):
         """:type: BaseVehicle"""
         self._filter = {}
         """:type: dict[IntentFilter, Callable[[Intent], Any]"""
+        self._routes = {}
+        """:type: dict[str, tuple[Callable[[Intent], Any]]]
+        Routing table of action to every callback whose filter accepts it.
+        Rebuilt whenever a filter is added or removed."""
 
     def attach(self, vehicle):
         """Attach the App to a Vehicle."""
@@ -53,8 +57,8 @@ class AppAccess(Loggable, Broadcaster):
     def detach(self):
         """Detach the App from the Vehicle it was previously attached to."""
         self.info('Detaching {}'.format(self.app.qualified_name))
-        self.clear_filter()
         self.app.detach()
+        self.clear_filter()
         self._vehicle = None
         self.logger = None
 
@@ -75,6 +79,7 @@ class AppAccess(Loggable, Broadcaster):
         if not callable(callback):
             raise TypeError('callback must be callable.')
         self._filter[intent_filter] = callback
+        self._build_routes()
         self._vehicle.add_filter(intent_filter, self)
         return intent_filter
 
@@ -92,6 +97,17 @@ class AppAccess(Loggable, Broadcaster):
         for filter_pair in self._filter.keys():
             self.remove_filter(filter_pair)
 
+    def deliver(self, delivery):
+        """Receive an (intent, future, done) tuple from a broadcast pool.
+
+        done is called with no arguments once the intent has been handled.
+        """
+        intent, future, done = delivery
+        try:
+            self.receive(intent, future)
+        finally:
+            done()
+
     def receive(self, intent, future):
         """Receive an intent and pass it to any callbacks that are listening.
 
@@ -116,14 +132,23 @@ class AppAccess(Loggable, Broadcaster):
             if result is not None or exception is not None:
                 future.add(IntentResponse(result=result, exception=exception))
 
-        handled = False
-        for intent_filter, callback in self._filter.items():
-            if intent in intent_filter:
+        callbacks = self._routes.get(intent.action)
+        if callbacks:
+            for callback in callbacks:
                 handle(callback)
-                handled = True
-        if not handled and callable(self.callback):
+        elif callable(self.callback):
             handle(self.callback)
 
+    @property
+    def clock(self):
+        """The Clock of the vehicle, which all App timing should use."""
+        return self._vehicle.clock
+
+    @property
+    def flight_log(self):
+        """The FlightLog of the vehicle, or None if it is not recording."""
+        return self._vehicle.flight_log
+
     @property
     def shutdown(self):
         return self._vehicle.is_shutdown
@@ -131,4 +156,18 @@ class AppAccess(Loggable, Broadcaster):
     def remove_filter(self, intent_filter):
         """Remove a filter from this access."""
         del self._filter[intent_filter]
+        self._build_routes()
         self._vehicle.remove_filter(intent_filter, self)
+
+    def _build_routes(self):
+        """Rebuild the routing table from the current filters.
+
+        The table is replaced, never modified, so an intent being received on
+        another thread always sees a complete table.
+        """
+        routes = {}
+        for intent_filter, callback in self._filter.items():
+            for action in set(intent_filter.actions):
+                routes.setdefault(action, []).append(callback)
+        self._routes = {action: tuple(callbacks)
+                        for action, callbacks in routes.items()}
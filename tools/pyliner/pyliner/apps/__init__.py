@@ -4,6 +4,7 @@ from controller import Controller
 from flight_director import FlightDirector
 from geofence import Geofence
 from geographic_app import GeographicApp
+from loop_communication import LoopCommunication
 from navigation import Navigation
 from socket_app import SocketApp
 from time_app import TimeApp
@@ -14,6 +15,7 @@ __all__ = ['CommanderApp',
            'FlightDirector',
            'Geofence',
            'GeographicApp',
+           'LoopCommunication',
            'Navigation',
            'SocketApp',
            'TimeApp']
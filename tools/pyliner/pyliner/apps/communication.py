@@ -2,28 +2,41 @@
 The communication module provides a Communication Service for sending commands
 over UDP to the vehicle.
 
+Classes:
+    PreparedCommand  A command serializer prepared once per op path.
+    SubscriptionManager  Shared telemetry handles, registered in batches.
+    TelemetryHub  Shares one telemetry socket between several vehicles.
+    TelemetrySnapshot  The subscribed values of one telemetry packet.
+
+Methods:
+    snapshot_values  Read several telemetry items as of the same packet.
+
 Services:
     Communication  Handles UDP interface with physical vehicle.
 """
 
+import logging
+import re
 import threading
 import json
 from Queue import Empty
-
-import socketserver
+from collections import Mapping, OrderedDict, defaultdict
+from operator import attrgetter
 
 from pyliner.action import ACTION_SEND_COMMAND, ACTION_SEND_BYTES, ACTION_TELEM, \
     ACTION_CONTROL_REQUEST, ACTION_CONTROL_GRANT, ACTION_CONTROL_REVOKE, \
     ACTION_CONTROL_RELEASE
 from pyliner.arte_ccsds import CCSDS_TlmPkt_t, CCSDS_CmdPkt_t
+from pyliner.capture import TelemetryCapture
+from pyliner.clock import WALL_CLOCK
 from pyliner.conversions import hertz
 from pyliner.intent import IntentFilter, Intent, FutureTimeoutError, \
     IntentExplicitFailure
 from pyliner.pyliner_error import PylinerError
 from ..python_pb import pyliner_msgs
 from pyliner.app import App
-from pyliner.util import init_socket, handler_factory, CallableDefaultDict, \
-    RealTimeThread, OrderedSetQueue
+from pyliner.util import init_socket, RealTimeThread, OrderedSetQueue, \
+    UDPReceiver
 
 
 # TODO Python3 does not see telemetry. This is the only barrier to Python3.
@@ -44,11 +57,50 @@ class InvalidOperationException(PylinerError):
     pass
 
 
+class TelemetrySnapshot(object):
+    """The subscribed values of one telemetry packet.
+
+    A snapshot is never modified once it is published, so a reader holding
+    one sees every value as of the same packet without any locking. Each
+    message ID has its own sequence number which increases by one for every
+    packet received.
+    """
+    __slots__ = ['mid', 'seq', 'time', 'values']
+
+    def __init__(self, mid, seq, time, values):
+        self.mid = mid
+        self.seq = seq
+        self.time = time
+        self.values = values
+        """:type: dict[str, Any]"""
+
+    def __contains__(self, op_path):
+        return op_path in self.values
+
+    def __getitem__(self, op_path):
+        return self.values[op_path]
+
+    def __repr__(self):
+        return '{}(mid={:#06x}, seq={}, time={})'.format(
+            self.__class__.__name__, self.mid, self.seq, self.time)
+
+    def get(self, op_path, default=None):
+        return self.values.get(op_path, default)
+
+
 class _Telemetry(object):
     """Represents an operational path of telemetry from Airliner."""
 
-    def __init__(self, name=None, time=None, value=None):
+    def __init__(self, name=None, time=None, value=None, executor=None):
+        """
+        Args:
+            executor (ListenerExecutor): Runs the listeners. If None,
+                listeners are called inline by update().
+        """
+        self.executor = executor
         self.name = name
+        self.snapshot = None
+        """:type: TelemetrySnapshot"""
         self.time = time
         self.value = value
 
@@ -61,29 +113,340 @@ class _Telemetry(object):
 
     def remove_listener(self, listener):
         self._listener.remove(listener)
+        if self.executor is not None:
+            self.executor.remove_listener(listener)
 
-    def update(self, value, time=None):
+    @property
+    def seq(self):
+        """Sequence number of the packet this value came from, or None."""
+        return self.snapshot.seq if self.snapshot is not None else None
+
+    def copy(self):
+        """Return an unlistened copy of this telemetry's current state."""
+        copy = _Telemetry(self.name, self.time, self.value)
+        copy.snapshot = self.snapshot
+        return copy
+
+    def update(self, value, time=None, snapshot=None):
+        self.snapshot = snapshot
         self.time = time
         self.value = value
-        for listener in self._listener:
-            listener(self)
+        if not self._listener:
+            return
+        if self.executor is None:
+            for listener in self._listener:
+                listener(self)
+        else:
+            # Queued listeners run later, so they are given this update
+            # rather than the live object which may have moved on.
+            update = self.copy()
+            for listener in self._listener:
+                self.executor.submit(listener, update)
+
+
+def snapshot_values(items):
+    """Return the values of several telemetry items as of the same packet.
+
+    Every item is read from the snapshot of the first item. Items that are not
+    part of that snapshot, because they belong to another message, fall back on
+    their own latest value.
+
+    Args:
+        items (Iterable[_Telemetry]): Telemetry items to read.
+
+    Returns:
+        list: The value of each item, in order.
+    """
+    items = list(items)
+    snapshot = items[0].snapshot if items else None
+    if snapshot is None:
+        return [item.value for item in items]
+    values = snapshot.values
+    return [values[item.name] if item.name in values else item.value
+            for item in items]
+
+
+class _FieldPath(object):
+    """A protobuf field path compiled into a getter and setter.
+
+    Field paths are dotted attribute chains such as "Payload.CmdCounter",
+    where any step may index into a repeated field ("Payload.Values[2]").
+    The path is parsed once so reading or writing a field costs about the
+    same as direct attribute access.
+    """
+    _STEP = re.compile(r'^(\w+)((?:\[\d+\])*)$')
+
+    __slots__ = ('path', 'get', '_parents', '_leaf', '_leaf_index')
+
+    def __init__(self, path):
+        self.path = path
+        steps = []
+        for part in path.split('.'):
+            match = _FieldPath._STEP.match(part)
+            if not match:
+                raise InvalidOperationException(
+                    'Invalid field path {!r}.'.format(path))
+            name, indices = match.groups()
+            steps.append((name, tuple(
+                int(i) for i in re.findall(r'\d+', indices))))
+
+        if not any(indices for _, indices in steps):
+            self.get = attrgetter(path)
+        else:
+            self.get = self._walk_all
+        self._parents = tuple(steps[:-1])
+        self._leaf, self._leaf_index = steps[-1]
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.path)
+
+    @staticmethod
+    def _step(obj, name, indices):
+        obj = getattr(obj, name)
+        for index in indices:
+            obj = obj[index]
+        return obj
+
+    def _walk(self, msg):
+        for name, indices in self._parents:
+            msg = _FieldPath._step(msg, name, indices)
+        return msg
+
+    def _walk_all(self, msg):
+        return _FieldPath._step(self._walk(msg), self._leaf, self._leaf_index)
+
+    def set(self, msg, value):
+        """Assign value to this field of msg."""
+        parent = self._walk(msg)
+        if not self._leaf_index:
+            setattr(parent, self._leaf, value)
+        else:
+            container = _FieldPath._step(
+                parent, self._leaf, self._leaf_index[:-1])
+            container[self._leaf_index[-1]] = value
+
+
+class _Operation(object):
+    """An indexed entry of the Airliner map.
+
+    Operation paths ("/Airliner/ES/HK") and telemetry or argument paths
+    ("/Airliner/ES/HK/CmdCounter") both resolve to one of these. Argument
+    paths additionally carry the field path into the message, which is
+    compiled the first time it is used.
+    """
+    __slots__ = ('op', 'mid', 'cc', 'msg', 'field_path', '_field', '_proto')
+
+    def __init__(self, op, field_path=None):
+        self.op = op
+        """:type: dict"""
+        self.cc = int(op['airliner_cc'])
+        self.field_path = field_path
+        self.msg = op['airliner_msg']
+        try:
+            self.mid = int(op['airliner_mid'], 0)
+        except ValueError:
+            self.mid = None
+        self._field = None
+        self._proto = None
+
+    def __repr__(self):
+        return '{}(mid={}, cc={}, msg={!r}, field_path={!r})'.format(
+            self.__class__.__name__, self.mid, self.cc, self.msg,
+            self.field_path)
+
+    @property
+    def field(self):
+        """The compiled _FieldPath for this entry, or None."""
+        if self._field is None and self.field_path:
+            self._field = _FieldPath(self.field_path)
+        return self._field
+
+    @property
+    def proto(self):
+        """The protobuf class for this operation's message, or None."""
+        if self._proto is None and self.msg:
+            self._proto = pyliner_msgs.proto_msg_map[self.msg]
+        return self._proto
+
+
+class _OpIndex(Mapping):
+    """Read-only mapping of op path to _Operation.
+
+    An index is never modified once built, so it may be shared by any number
+    of Communication instances and threads.
+    """
+
+    def __init__(self, index):
+        self._index = index
+        self.get = index.get
+
+    def __contains__(self, op_path):
+        return op_path in self._index
+
+    def __getitem__(self, op_path):
+        return self._index[op_path]
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+
+def _build_op_index(airliner_map):
+    """Flatten an Airliner map into an _OpIndex of op path to _Operation.
+
+    If two apps share an app_ops_name the first definition found of each
+    operation is kept.
+    """
+    index = {}
+    for fsw, fsw_data in airliner_map.items():
+        if not isinstance(fsw_data, dict) or 'apps' not in fsw_data:
+            continue
+        for app in fsw_data['apps'].values():
+            if 'app_ops_name' not in app:
+                continue
+            app_path = '/{}/{}'.format(fsw, app['app_ops_name'])
+            proto_msgs = app.get('proto_msgs', {})
+            for op_name, op in app.get('operations', {}).items():
+                op_path = '{}/{}'.format(app_path, op_name)
+                if op_path in index:
+                    continue
+                index[op_path] = operation = _Operation(op)
+                op_names = proto_msgs.get(operation.msg, {}) \
+                    .get('operational_names', {})
+                for name, name_data in op_names.items():
+                    index['{}/{}'.format(op_path, name)] = _Operation(
+                        op, name_data['field_path'])
+    return _OpIndex(index)
+
+
+class PreparedCommand(object):
+    """A reusable command template for one operation and set of arguments.
+
+    The CCSDS header and the protobuf message are built once. Each call to
+    serialize only assigns the argument values that changed since the
+    previous call, then re-serializes the message. The encoded header is
+    only rebuilt when the payload size changes.
+
+    Obtain instances through Communication.prepare().
+    """
+
+    def __init__(self, op_path, header, pb_obj, fields):
+        """
+        Args:
+            op_path (str): Operational path of the command.
+            header (Union[CCSDS_CmdPkt_t, CCSDS_TlmPkt_t]): Packet header.
+            pb_obj: Protobuf message, or None if the command has no payload.
+            fields (dict[str, _FieldPath]): Argument name to field path.
+        """
+        self.op_path = op_path
+        self.arg_names = frozenset(fields)
+
+        self._fields = fields
+        self._header = header
+        self._header_bytes = None
+        self._last = {}
+        self._lock = threading.Lock()
+        self._payload_size = None
+        self._pb_obj = pb_obj
+
+    def __repr__(self):
+        return '{}({!r}, {})'.format(self.__class__.__name__, self.op_path,
+                                     sorted(self.arg_names))
+
+    def serialize(self, values=None):
+        """Return the encoded command with the given argument values.
+
+        Args:
+            values (dict[str, Any]): Argument name to value. Must name exactly
+                the arguments this command was prepared with.
+
+        Returns:
+            bytes: CCSDS header followed by the serialized payload.
+
+        Raises:
+            InvalidCommandException: If the arguments do not match or a value
+                cannot be assigned to its field.
+        """
+        values = values or {}
+        if set(values) != self.arg_names:
+            raise InvalidCommandException(
+                'Prepared command {} expects arguments {} but got {}.'.format(
+                    self.op_path, sorted(self.arg_names), sorted(values)))
+        with self._lock:
+            last = self._last
+            for name, value in values.items():
+                if name in last and last[name] == value:
+                    continue
+                field = self._fields[name]
+                try:
+                    field.set(self._pb_obj, value)
+                except Exception as e:
+                    last.pop(name, None)
+                    raise InvalidCommandException(
+                        'Invalid value {!r} for argument {} of {}: {}'.format(
+                            value, name, self.op_path, e))
+                last[name] = value
+
+            payload = self._pb_obj.SerializeToString() \
+                if self._pb_obj is not None and self._fields else b''
+            if len(payload) != self._payload_size:
+                self._payload_size = len(payload)
+                self._header.set_user_data_length(self._payload_size)
+                self._header_bytes = self._header.get_encoded()
+            return self._header_bytes + payload
 
 
 class ControlToken(object):
     """Created by the Communication App and passed to Apps that are granted
     control of the vehicle. All commands sent that require authentication
-    must use the request method to wrap their request."""
+    must use the request method to wrap their request.
 
-    def __init__(self, app_name):
+    A token is a lease on control. It is valid until it has gone duration
+    seconds without being renewed, or until it is released or revoked. Apps
+    keep a valid token between commands, renewing it with each use, instead
+    of requesting control again.
+    """
+
+    def __init__(self, app_name, clock=WALL_CLOCK, duration=None):
+        """
+        Args:
+            app_name (str): Qualified name of the App granted control.
+            clock (Clock): Clock the lease is measured on.
+            duration (Real): Seconds the lease lasts after each renewal. If
+                None, the lease never expires.
+        """
         self.app_name = app_name
-        # self._token =
+        self.clock = clock
+        self.duration = duration
+        self.ended = False
+        """True once released or revoked. An ended lease is never valid."""
+        self.expires = float('inf') if duration is None \
+            else clock.time() + duration
 
     def __repr__(self):
         return '{}({})'.format(self.__class__.__name__, self.app_name[-10:])
 
+    def renew(self):
+        """Extend a valid lease by its duration. Return whether it is valid.
+
+        An expired or ended lease cannot be renewed, control must be
+        requested again.
+        """
+        if not self.valid:
+            return False
+        if self.duration is not None:
+            self.expires = self.clock.time() + self.duration
+        return True
+
     def request(self, data):
         return ControlRequest(self, data)
 
+    @property
+    def valid(self):
+        return not self.ended and self.clock.time() < self.expires
+
 
 class ControlRequest(object):
     """Created via a ControlToken, used to authenticate a request sent to the
@@ -99,6 +462,213 @@ class ControlRequest(object):
             self.__class__.__name__, self.token, self.data)
 
 
+class _Subscription(object):
+    """Dispatch entry for one subscribed op path."""
+    __slots__ = ['callbacks', 'handle', 'msg', 'op_path']
+
+    def __init__(self, op_path, msg, handle):
+        self.callbacks = ()
+        self.handle = handle
+        """:type: _Telemetry"""
+        self.msg = msg
+        self.op_path = op_path
+
+
+class SubscriptionManager(object):
+    """Hand out one shared Telemetry handle per op path.
+
+    The first request for a path creates its handle. All the new paths of one
+    request are registered for dispatch together, so each message ID's
+    dispatch table is replaced once per request rather than once per path.
+    Requesting a path that already has a handle is a single dict lookup, no
+    matter how many Apps have asked for it before.
+    """
+
+    def __init__(self, ops, factory, logger=None):
+        """
+        Args:
+            ops (_OpIndex): Op index to resolve paths with.
+            factory (Callable[[str], _Telemetry]): Creates the handle for an
+                op path.
+            logger (Logger): Logger to use. Default
+                logging.getLogger('SubscriptionManager')
+        """
+        self.by_mid = {}
+        """:type: dict[int, tuple[_Subscription]]"""
+        self.factory = factory
+        self.logger = logger if logger else \
+            logging.getLogger('SubscriptionManager')
+        self.ops = ops
+        """:type: _OpIndex"""
+
+        self._lock = threading.Lock()
+        self._subscriptions = {}
+        """:type: dict[str, _Subscription]"""
+
+    def __contains__(self, op_path):
+        return op_path in self._subscriptions
+
+    def __len__(self):
+        return len(self._subscriptions)
+
+    def add_callback(self, op_path, callback):
+        """Call callback with the handle of op_path on every update."""
+        if not callable(callback):
+            raise TypeError('Callback must be callable.')
+        self.handle(op_path)
+        with self._lock:
+            subscription = self._subscriptions[op_path]
+            subscription.callbacks += (callback,)
+
+    def handle(self, op_path):
+        """Return the shared handle of one op path."""
+        subscription = self._subscriptions.get(op_path)
+        if subscription is not None:
+            return subscription.handle
+        return self.handles((op_path,))[0]
+
+    def handles(self, op_paths):
+        """Return the shared handles of several op paths, in order.
+
+        Either every path is registered or, if any is not a valid operation,
+        none are.
+
+        Raises:
+            InvalidOperationException: If a path is not a valid operation.
+        """
+        op_paths = list(op_paths)
+        subscriptions = self._subscriptions
+        try:
+            return [subscriptions[op_path].handle for op_path in op_paths]
+        except KeyError:
+            pass
+
+        with self._lock:
+            new = [op_path for op_path in OrderedDict.fromkeys(op_paths)
+                   if op_path not in subscriptions]
+            operations = [self.ops.get(op_path) for op_path in new]
+            for op_path, operation in zip(new, operations):
+                if operation is None:
+                    raise InvalidOperationException(
+                        'Invalid telemetry operational name received. '
+                        'Operation ({}) not defined.'.format(op_path))
+
+            added = defaultdict(list)
+            for op_path, operation in zip(new, operations):
+                subscription = _Subscription(
+                    op_path, operation.msg, self.factory(op_path))
+                subscriptions[op_path] = subscription
+                if operation.mid is None:
+                    self.logger.error(
+                        'Operation %s has no valid message ID (%r) and will '
+                        'never receive telemetry.', op_path,
+                        operation.op['airliner_mid'])
+                else:
+                    added[operation.mid].append(subscription)
+            # Dispatch tables are replaced rather than mutated so the receive
+            # thread never iterates a tuple that is being changed.
+            for mid, additions in added.items():
+                self.by_mid[mid] = self.by_mid.get(mid, ()) + tuple(additions)
+
+        if new:
+            self.logger.info('Subscribing to: %s', ', '.join(new))
+        return [subscriptions[op_path].handle for op_path in op_paths]
+
+    def remove_callback(self, op_path, callback):
+        """Stop calling callback on updates of op_path."""
+        with self._lock:
+            subscription = self._subscriptions[op_path]
+            subscription.callbacks = tuple(
+                c for c in subscription.callbacks if c != callback)
+
+
+class TelemetryHub(object):
+    """Receive telemetry for several vehicles on a single socket.
+
+    Every vehicle sends its telemetry to the same port. Datagrams are routed
+    to the Communication registered for their source (host, port), falling
+    back on the Communication registered for the source host alone. All
+    Communications created by the hub share one op index built from the
+    Airliner map.
+
+    >>> hub = TelemetryHub(read_json('airliner.json'), to_port=5012)
+    >>> rocky = Vehicle('rocky', hub.communication(('10.0.0.2', 5013),
+    ...                                            address='10.0.0.2'))
+    """
+
+    def __init__(self, airliner_map, to_port=5012):
+        """
+        Args:
+            airliner_map (dict): Airliner Mapping, typically read from a JSON.
+            to_port (int): Telemetry-Output port that every vehicle sends to.
+        """
+        self.airliner_map = airliner_map
+        self.ops = _build_op_index(airliner_map)
+        """:type: _OpIndex"""
+        self.unrouted = 0
+
+        self._routes = {}
+        """:type: dict[tuple|str, Communication]"""
+        self._routes_lock = threading.Lock()
+
+        self.receiver = UDPReceiver(
+            ('0.0.0.0', to_port), self._on_recv_batch, name='TelemetryHub')
+        self.receiver.start()
+
+    def __repr__(self):
+        return '{}(port={}, routes={})'.format(
+            self.__class__.__name__, self.receiver.server_address[1],
+            len(self._routes))
+
+    def add(self, source, communication):
+        """Route datagrams from source to a Communication.
+
+        Args:
+            source (tuple|str): Source (host, port), or a host to match
+                datagrams from any port on that host.
+            communication (Communication): Communication to route to.
+        """
+        with self._routes_lock:
+            routes = dict(self._routes)
+            routes[source] = communication
+            self._routes = routes
+
+    def close(self):
+        """Stop receiving and close the socket."""
+        self.receiver.close()
+
+    def communication(self, source, **kwargs):
+        """Create a Communication that receives the telemetry sent by source.
+
+        Args:
+            source (tuple|str): See add().
+            **kwargs: Passed on to Communication. listen, ops, and to_port
+                are set by the hub.
+        """
+        kwargs.update(listen=False, ops=self.ops,
+                      to_port=self.receiver.server_address[1])
+        communication = Communication(self.airliner_map, **kwargs)
+        self.add(source, communication)
+        return communication
+
+    def remove(self, source):
+        """Stop routing datagrams from source."""
+        with self._routes_lock:
+            routes = dict(self._routes)
+            del routes[source]
+            self._routes = routes
+
+    def _on_recv_batch(self, batch):
+        routes = self._routes
+        for tlm in batch:
+            address = tlm[1]
+            communication = routes.get(address) or routes.get(address[0])
+            if communication is None:
+                self.unrouted += 1
+            else:
+                communication._on_recv_telemetry(tlm)
+
+
 class Communication(App):
     """Provide methods to send and receive telemetry to a vehicle.
 
@@ -159,18 +729,44 @@ class Communication(App):
         If an App does not promptly respond to a GRANT intent with True, the
         system will assume that the App no longer needs control or has stalled,
         and will REVOKE control without placing it back in the control queue.
+
+    Control Leases:
+        The ControlToken is a lease that lasts CONTROL_LEASE seconds after it
+        was granted or last renewed. Instead of releasing control after every
+        command, an App may keep its token and renew() it before each use, so
+        a burst of commands costs one request and grant. Admission of a
+        command only compares its token to the current one and checks the
+        lease, both constant time.
+
+        A lease that runs out ends as if released, and the next App in the
+        queue is granted control. Commands sent with it are refused with a
+        CommandAuthorizationError, and it cannot be renewed; the App must
+        request control again. Rotation still revokes a lease when other Apps
+        are waiting, so no App holds control indefinitely.
     """
     CONTROL_ACK_WAIT = 1.0 / 16.0
+    CONTROL_LEASE = 1.0
     CONTROL_ROTATE_EVERY = hertz(4)
 
     def __init__(self, airliner_map, address='localhost',
-                 ci_port=5009, to_port=5012):
+                 ci_port=5009, to_port=5012, capture=None, listen=True,
+                 ops=None, listener_executor=None):
         """
         Args:
             airliner_map (dict): Airliner Mapping, typically read from a JSON.
             address (str): Address to connect to the vehicle.
             ci_port (int): Command-Ingest port
             to_port (int): Telemetry-Output port
+            capture (TelemetryCapture): Raw telemetry capture. If None,
+                defaults to a TelemetryCapture() ring buffer.
+            listen (bool): If True, bind to_port and receive telemetry on a
+                UDPReceiver thread. If False, datagrams must be passed to
+                _on_recv_batch by some other transport.
+            ops (_OpIndex): Op index built from airliner_map, to share
+                between instances. If None, one is built.
+            listener_executor (ListenerExecutor): Runs telemetry listeners
+                and subscription callbacks off the receive thread. If None,
+                they are called inline as packets are received.
         """
         super(Communication, self).__init__()
 
@@ -181,7 +777,7 @@ class Communication(App):
         # Telemetry variables
         self.address = address
         self.airliner_map = airliner_map
-        self.all_telemetry = []
+        self.capture = capture if capture is not None else TelemetryCapture()
         self.ci_port = ci_port
         self.ci_socket = init_socket()
         self.control_current = None
@@ -190,27 +786,33 @@ class Communication(App):
         self.control_thread = None
         """:type: PeriodicExecutor"""
         self.control_queue = OrderedSetQueue()
-        self.subscribers = []
+        self.listener_executor = listener_executor
+        """:type: ListenerExecutor"""
         self.to_port = to_port
 
-        self._telemetry = CallableDefaultDict(
-            default_factory=lambda k: self.subscribe(k))
-        """:type: dict[str, _Telemetry]"""
+        self._ops = ops if ops is not None else _build_op_index(airliner_map)
+        """:type: dict[str, _Operation]"""
+        self._prepared = {}
+        """:type: dict[tuple, PreparedCommand]"""
+        self._snapshots = {}
+        """:type: dict[int, TelemetrySnapshot]"""
+
+        self.subscriptions = SubscriptionManager(
+            self._ops, self._new_telemetry)
 
         # Receive Telemetry
-        self.tlm_listener = socketserver.UDPServer(
-            ("0.0.0.0", self.to_port), handler_factory(self._on_recv_telemetry))
-        self.listener_thread = threading.Thread(
-            target=self.tlm_listener.serve_forever)
-        self.listener_thread.daemon = True
-        self.listener_thread.start()
+        self.tlm_listener = None
+        """:type: UDPReceiver"""
+        if listen:
+            self.tlm_listener = UDPReceiver(
+                ("0.0.0.0", self.to_port), self._on_recv_batch,
+                name='TelemetryReceiver')
+            self.tlm_listener.start()
 
     def attach(self, vehicle):
         super(Communication, self).attach(vehicle)
-        self.control_thread = RealTimeThread(
-            name='ControlRotateThread', target=self.control_rotate,
-            every=Communication.CONTROL_ROTATE_EVERY)
-        self.control_thread.start()
+        self.subscriptions.logger = self.logger
+        self._start_control_rotate()
 
         def filter_control(data, call):
             if not isinstance(data, ControlRequest):
@@ -220,6 +822,10 @@ class Communication(App):
             elif data.token is not self.control_current:
                 raise CommandAuthorizationError(
                     'App is not authorized to send commands.')
+            elif not data.token.valid:
+                with self.control_lock:
+                    self.control_expire()
+                raise CommandAuthorizationError('Control lease expired.')
             else:
                 return call(data.data)
 
@@ -228,7 +834,7 @@ class Communication(App):
             lambda i: filter_control(i.data, self.send_command))
         self.vehicle.add_filter(
             IntentFilter(actions=[ACTION_SEND_BYTES]),
-            lambda i: filter_control(i.data, self.send_bytes))
+            lambda i: filter_control(i.data, self._send_logged_bytes))
         self.vehicle.add_filter(
             IntentFilter(actions=[ACTION_TELEM]),
             lambda i: self.telemetry(i.data))
@@ -241,7 +847,9 @@ class Communication(App):
 
     def detach(self):
         self.vehicle.clear_filter()
-        self.control_thread.stop()
+        self._stop_control_rotate()
+        if self.capture.recorder is not None:
+            self.capture.recorder.close()
         super(Communication, self).detach()
 
     def control_grant(self):
@@ -259,7 +867,9 @@ class Communication(App):
 
         for app_name in get_or_stop():
             # self.debug('Grant Control: {}'.format(app_name))
-            self.control_current = ControlToken(app_name=app_name)
+            self.control_current = ControlToken(
+                app_name=app_name, clock=self.vehicle.clock,
+                duration=Communication.CONTROL_LEASE)
             try:
                 control_ack = self.vehicle.broadcast(Intent(
                     action=ACTION_CONTROL_GRANT, component=app_name,
@@ -292,6 +902,7 @@ class Communication(App):
                 self.control_queue.remove(intent.origin)
             elif intent.data is self.control_current:
                 self.debug('Control Release by ' + str(intent.data.app_name))
+                self.control_current.ended = True
                 self.control_current = None
                 self.control_grant()
             else:
@@ -311,28 +922,61 @@ class Communication(App):
                 return False
             else:
                 self.control_queue.put(intent.origin)
+                self.control_expire()
                 if not self.control_current:
                     self.control_grant()
                 return True
 
+    def control_expire(self):
+        """If the current lease has run out, end it and grant the next App.
+
+        Assumes control_lock
+        """
+        if self.control_current is not None \
+                and not self.control_current.valid:
+            self.debug('Lease Expired: ' + str(self.control_current.app_name))
+            self.control_current.ended = True
+            self.control_current = None
+            self.control_grant()
+
     def control_revoke(self, reason=None):
-        self.vehicle.broadcast(Intent(
+        """End the current lease and tell its App.
+
+        Assumes control_lock
+
+        Returns:
+            IntentFuture: Holds True if the App was inside a control block.
+        """
+        self.control_current.ended = True
+        future = self.vehicle.broadcast(Intent(
             action=ACTION_CONTROL_REVOKE, data=reason,
             component=self.control_current.app_name
         ))
         self.control_current = None
+        return future
 
     def control_rotate(self):
         """If other Apps are waiting for control, rotate control.
 
-        Put App which was rotated out back into queue.
+        An App rotated out while inside a control block is put back into the
+        queue. An App only keeping an idle lease between blocks loses it, and
+        requests control again when it next enters a block. An expired lease is
+        ended first, whether or not other Apps are waiting.
         """
         with self.control_lock:
+            self.control_expire()
             if self.control_current is not None \
                     and not self.control_queue.empty():
-                self.debug('Rotate Out: ' + str(self.control_current.app_name))
-                self.control_queue.put(self.control_current.app_name)
-                self.control_revoke()
+                app_name = self.control_current.app_name
+                self.debug('Rotate Out: ' + str(app_name))
+                revoked = self.control_revoke()
+                try:
+                    in_block = revoked.first(
+                        Communication.CONTROL_ACK_WAIT).result is True
+                except (FutureTimeoutError, IntentExplicitFailure):
+                    in_block = False
+                if in_block:
+                    self.control_queue.put(app_name)
                 self.control_grant()
 
     @property
@@ -346,24 +990,56 @@ class Communication(App):
     def send_command(self, telemetry):
         to_json_op = getattr(telemetry, "to_json", None)
         if callable(to_json_op):
-            msg = telemetry.to_json() 
+            msg = telemetry.to_json()
         else:
             msg = telemetry
-            
-        buffer = self._serialize(telemetry)
-            
-        self.vehicle.debug(
-            'Sending telemetry to airliner: %s', msg)
-        
+
+        buffer = self._serialize(msg)
+
+        # The flight log keeps the command without formatting it.
+        vehicle = self.vehicle
+        flight_log = vehicle.flight_log if vehicle is not None else None
+        if flight_log is not None:
+            flight_log.command(msg['name'], buffer)
+        elif vehicle is not None:
+            vehicle.debug('Sending telemetry to airliner: %s', msg)
+
         return self.send_bytes(buffer)
 
+    def snapshot(self, op_path):
+        """Return the latest snapshot of the message containing op_path.
+
+        Returns:
+            TelemetrySnapshot: The latest snapshot, or None if no packet of
+                that message has been received since it was subscribed to.
+
+        Raises:
+            InvalidOperationException: If op_path is not a valid operation.
+        """
+        operation = self._ops.get(op_path)
+        if operation is None:
+            raise InvalidOperationException(
+                'Operation ({}) not defined.'.format(op_path))
+        return self._snapshots.get(operation.mid)
+
     def telemetry(self, args):
+        """Return shared Telemetry handles, subscribing to new paths at once.
+
+        Args:
+            args (str | list[str] | dict[Any, str]): Op paths to look up.
+
+        Returns:
+            A handle, a list of handles, or a dict of handles by the same
+            keys, matching the type of args.
+        """
         if isinstance(args, str):
-            return self._telemetry[args]
+            return self.subscriptions.handle(args)
         elif isinstance(args, dict):
-            return {k: self._telemetry[v] for k, v in args.items()}
+            keys = list(args)
+            return dict(zip(keys, self.subscriptions.handles(
+                args[key] for key in keys)))
         elif isinstance(args, list):
-            return [self._telemetry[t] for t in args]
+            return self.subscriptions.handles(args)
         else:
             raise TypeError('Can only parse str, dict, and list data.')
 
@@ -377,20 +1053,11 @@ class Communication(App):
                 is required. "/Airliner/CNTL/ManualSetpoint"
 
         Returns:
-            dict: Operational dictionary of requested path.
-
-        Raises:
-            KeyError: If any part of the Airliner map is invalid. Including if
-                the requested path does not exist.
+            dict: Operational dictionary of requested path, or None if the
+                path does not exist.
         """
-        ops_names = op_path.split('/')[1:]
-
-        def get_app(app_ops_name):
-            for app in self.airliner_map[ops_names[0]]['apps'].values():
-                if app['app_ops_name'] == app_ops_name:
-                    return app
-
-        return get_app(ops_names[1])['operations'][ops_names[2]]
+        operation = self._ops.get(op_path)
+        return operation.op if operation else None
 
     @staticmethod
     def _get_ccsds_msg(op):
@@ -428,18 +1095,22 @@ class Communication(App):
             True path to access this attribute in protobuf message
                 (E.g. Payload.CmdCounter)
         """
-        op = self._get_airliner_op(op_path)
-        ops_names = op_path.split('/')[1:]
-        for fsw, fsw_data in self.airliner_map.items():
-            if fsw == ops_names[0]:
-                for app, app_data in fsw_data["apps"].items():
-                    if app_data["app_ops_name"] == ops_names[1]:
-                        for op_name, op_data in app_data["proto_msgs"] \
-                                [op["airliner_msg"]] \
-                                ["operational_names"].items():
-                            if op_name == ops_names[3]:
-                                return op_data["field_path"]
-        return None
+        operation = self._ops.get(op_path)
+        return operation.field_path if operation else None
+
+    def _get_field_path(self, op_path):
+        """Get the compiled field path for an operational path.
+
+        Args:
+            op_path (str): Operation path as located in input file
+                (E.g. "/Airliner/ES/HK/CmdCounter")
+
+        Returns:
+            _FieldPath: Compiled accessor, or None if the op path has no
+                field path.
+        """
+        operation = self._ops.get(op_path)
+        return operation.field if operation else None
 
     def _get_pb_decode_obj(self, raw_tlm, op_path):
         """ Generates protobuf object from raw telemetry
@@ -465,42 +1136,6 @@ class Communication(App):
         pb_msg.ParseFromString(raw_tlm)
         return pb_msg
 
-    def _get_pb_encode_obj(self, json, op):
-        """ Generates protobuf object from user script command
-
-        Args:
-            json (dict): User command specifying op and args
-            op (dict): Operation dictionary
-
-        Returns:
-            Protobuf object for this specific message with set values
-        """
-        # Check if no args cmd
-        if not op["airliner_msg"]:
-            return None
-
-        # Call the correct protobuf constructor for this command
-        pb_obj = self._proto_obj_factory(op["airliner_msg"])
-
-        # Generate executable string assigning correct values to pb object
-        for arg in json["args"]:
-            arg_path = self._get_op_attr(json["name"] + '/' + arg["name"])
-            if not arg_path:
-                raise InvalidCommandException(
-                    "Invalid command received. Argument operational name (%s) "
-                    "not found." % arg["name"])
-            # TODO: Python3 would be str not basestring
-            if isinstance(arg["value"], basestring):
-                stmt = "pb_obj.{} = \"{}\"".format(arg_path, arg["value"])
-            else:
-                stmt = "pb_obj.{} = {}".format(arg_path, arg["value"])
-            try:
-                exec (stmt)
-            except Exception as e:
-                print('Problem with {}\n{}'.format(stmt, e))
-
-        return pb_obj
-
     def _get_pb_value(self, pb_msg, op_path):
         """ Get value from protobuf object
 
@@ -512,21 +1147,28 @@ class Communication(App):
         Returns:
             Value of attribute for passed proto message
         """
-        arg_path = self._get_op_attr(op_path)
-        if not arg_path:
+        field = self._get_field_path(op_path)
+        if not field:
             return None
-        # value = getattr(pb_msg, arg_path)
-        value = None
-        exec ('value = pb_msg.' + arg_path)
-        return value
+        return field.get(pb_msg)
+
+    def _on_recv_batch(self, batch):
+        """Callback for the TO socket listener.
+
+        Args:
+            batch (list[tuple]): (datagram, address) pairs drained from the
+                socket in one wakeup, in the order they were received.
+        """
+        for tlm in batch:
+            self._on_recv_telemetry(tlm)
 
     def _on_recv_telemetry(self, tlm):
-        """ Callback for TO socket listener
+        """ Handle a single datagram from the TO socket listener
 
         Args:
-            tlm(str): Raw bytes received from socket
+            tlm(tuple): Raw bytes received from socket and the sender address
         """
-        self.all_telemetry.append(tlm)
+        self.capture.add(tlm[0])
         # self.vehicle.debug("Recvd tlm: %s", tlm)
 
         # TODO: Check if needed
@@ -547,26 +1189,75 @@ class Communication(App):
                 "Exception when decoding tlm in ccsds: %s", e)
             return
 
-        # Iterate over subscribed telemetry to check if we care
-        for subscribed_tlm in self.subscribers:
-            if int(subscribed_tlm['airliner_mid'], 0) == \
-                    int(tlm_pkt.PriHdr.StreamId.data):
-                # Get pb msg for this msg
-                op_path = subscribed_tlm['op_path']
-                pb_msg = self._get_pb_decode_obj(tlm[0][12:], op_path)
-                callback = subscribed_tlm['callback']
-                telemItem = subscribed_tlm['telemItem']
-                
-                telemItem.update(
-                    value=self._get_pb_value(pb_msg, op_path), time=tlm_time)
-
-                # Update telemetry dictionary with fresh data
-                self._telemetry[op_path].update(
-                    value=self._get_pb_value(pb_msg, op_path), time=tlm_time)
-                
-                if callable(callback):
-                    callback(self._telemetry[op_path])
-                
+        # Only visit the subscribers registered for this stream ID. The
+        # payload is parsed at most once per message type and every
+        # subscribed field is read from that one protobuf object.
+        stream_id = int(tlm_pkt.PriHdr.StreamId.data)
+        vehicle = self.vehicle
+        flight_log = vehicle.flight_log if vehicle is not None else None
+        if flight_log is not None:
+            flight_log.telemetry(stream_id, tlm[0])
+        subscriptions = self.subscriptions.by_mid.get(stream_id)
+        if not subscriptions:
+            return
+        payload = tlm[0][12:]
+        decoded = {}
+        values = {}
+        for subscription in subscriptions:
+            op_path = subscription.op_path
+            try:
+                pb_msg = decoded[subscription.msg]
+            except KeyError:
+                pb_msg = decoded[subscription.msg] = \
+                    self._get_pb_decode_obj(payload, op_path)
+            values[op_path] = self._get_pb_value(pb_msg, op_path)
+
+        # Publish the snapshot before any listener runs. Replacing the dict
+        # entry is atomic, so readers never see a partially updated packet.
+        previous = self._snapshots.get(stream_id)
+        snapshot = TelemetrySnapshot(
+            stream_id, previous.seq + 1 if previous else 1, tlm_time, values)
+        self._snapshots[stream_id] = snapshot
+
+        for subscription in subscriptions:
+            handle = subscription.handle
+            handle.update(value=values[subscription.op_path], time=tlm_time,
+                          snapshot=snapshot)
+
+            callbacks = subscription.callbacks
+            if not callbacks:
+                continue
+            if self.listener_executor is None:
+                for callback in callbacks:
+                    callback(handle)
+            else:
+                copy = handle.copy()
+                for callback in callbacks:
+                    self.listener_executor.submit(callback, copy)
+
+    def _new_telemetry(self, op_path):
+        return _Telemetry(name=op_path, executor=self.listener_executor)
+
+    def _send_logged_bytes(self, message):
+        """Send raw bytes, recording them under their stream ID."""
+        vehicle = self.vehicle
+        flight_log = vehicle.flight_log if vehicle is not None else None
+        if flight_log is not None:
+            # Named after its stream ID by the flight log writer.
+            flight_log.command(None, message)
+        return self.send_bytes(message)
+
+    def _start_control_rotate(self):
+        """Start calling control_rotate every CONTROL_ROTATE_EVERY seconds."""
+        self.control_thread = RealTimeThread(
+            name='ControlRotateThread', target=self.control_rotate,
+            every=Communication.CONTROL_ROTATE_EVERY,
+            clock=self.vehicle.clock)
+        self.control_thread.start()
+
+    def _stop_control_rotate(self):
+        self.control_thread.stop()
+
     @staticmethod
     def _proto_obj_factory(msg):
         """ Returns a protobuf object for the type of airliner msg passed """
@@ -593,6 +1284,9 @@ class Communication(App):
     def _serialize(self, telemetry):
         """ User accessible function to send a command to the software bus.
 
+        Commands are encoded through a cached PreparedCommand for their op
+        path and argument names, see prepare().
+
         Args:
             telemetry (Telemetry): Telemetry specifying the operation to execute
                 and any args for it.
@@ -602,65 +1296,86 @@ class Communication(App):
             json = telemetry.to_json()
         else:
             json = telemetry
-            
+
         if "name" not in json:
             raise InvalidCommandException(
                 "Invalid command received. Missing \"name\" attribute")
 
-        # Check if no args tlm
-        args_present = "args" in json
+        values = {arg["name"]: arg["value"] for arg in json.get("args", ())}
+        return self.prepare(json["name"], values).serialize(values)
+
+    def prepare(self, op_path, arg_names=()):
+        """Get the PreparedCommand for an operation and set of arguments.
+
+        Prepared commands are cached, so repeated sends of the same command
+        reuse one header and protobuf message.
+
+        Args:
+            op_path (str): Operational path of the command.
+                E.g. "/Airliner/PX4/ManualSetpoint"
+            arg_names (Iterable[str]): Operational names of the arguments
+                that will be given to PreparedCommand.serialize().
+
+        Returns:
+            PreparedCommand: The cached command template.
+
+        Raises:
+            InvalidCommandException: If the operation or any argument is not
+                defined.
+        """
+        key = (op_path, frozenset(arg_names))
+        try:
+            return self._prepared[key]
+        except KeyError:
+            pass
 
         # Get command operation
-        op = self._get_airliner_op(json["name"])
+        op = self._get_airliner_op(op_path)
         if not op:
             raise InvalidCommandException(
                 "Invalid telemetry received. Operation ({}) not "
-                "defined.".format(json["name"]))
+                "defined.".format(op_path))
+
+        fields = {}
+        for name in key[1]:
+            field = self._get_field_path(op_path + '/' + name)
+            if not field:
+                raise InvalidCommandException(
+                    "Invalid command received. Argument operational name (%s) "
+                    "not found." % name)
+            fields[name] = field
 
         # Generate airliner cmd
         header = self._get_ccsds_msg(op)
-        payload = self._get_pb_encode_obj(json, op) if args_present else None
+        pb_obj = self._proto_obj_factory(op["airliner_msg"]) \
+            if op["airliner_msg"] and fields else None
 
-        # Set header correctly
-        payload_size = payload.ByteSize() if args_present else 0
-        header.set_user_data_length(payload_size)
+        return self._prepared.setdefault(
+            key, PreparedCommand(op_path, header, pb_obj, fields))
 
-        serial_cmd = Communication.serialize(header, payload)
-        return serial_cmd
+    def subscribe(self, tlm_item, callback=None):
+        """Subscribe to one telemetry item, optionally with a callback.
 
-    def subscribe(self, tlm_item, callback = 0):
-        """
-        Receives an operational path to an airliner msg attribute to subscribe
-        to, as well as an optional callback function.
+        Every subscriber of an op path shares one Telemetry handle.
 
         Args:
-            tlm_item (dict[str, list[str]]): Dictionary specifying the telemetry
-                items to subscribe to, using the telemetry item's operational
-                names.
-                E.g. {'tlm': ['/Airliner/ES/HK/CmdCounter']}
-                    or
-                     {'tlm': ['/Airliner/ES/HK/CmdCounter',
-                              '/Airliner/ES/HK/ErrCounter']}
-        """
-            
-        self.vehicle.info('Subscribing to: {}'.format(tlm_item))
-        # Get operation for specified telemetry
-        op = self._get_airliner_op(tlm_item)
-        if not op:
-            err_msg = "Invalid telemetry operational name received. " \
-                      "Operation (%s) not defined." % tlm_item
-            self.vehicle.error(err_msg)
-            raise InvalidOperationException(err_msg)
-
-        newTelemetry = _Telemetry(name=tlm_item)
-        
-        # Add entry to subscribers list
-        self.subscribers.append({'op_path': tlm_item,
-                                 'airliner_mid': op['airliner_mid'],
-                                 'tlmSeqNum': 0,
-                                 'callback': callback,
-                                 'telemItem': newTelemetry})
-
-        # Add entry to telemetry dictionary to prevent key errors
-        # in user scripts and set default values.
-        return newTelemetry
+            tlm_item (str): Operational path of the telemetry item.
+                E.g. '/Airliner/ES/HK/CmdCounter'
+            callback (Callable[[_Telemetry], None]): If not None, called with
+                the handle every time the item is received.
+
+        Returns:
+            _Telemetry: The shared handle for tlm_item.
+
+        Raises:
+            InvalidOperationException: If tlm_item is not a valid operation.
+        """
+        if callback is not None:
+            self.subscriptions.add_callback(tlm_item, callback)
+        return self.subscriptions.handle(tlm_item)
+
+    def unsubscribe(self, tlm_item, callback):
+        """Stop calling a callback given to subscribe()."""
+        self.subscriptions.remove_callback(tlm_item, callback)
+        if self.listener_executor is not None:
+            self.listener_executor.remove_listener(callback)
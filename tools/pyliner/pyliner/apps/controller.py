@@ -9,7 +9,6 @@ Apps:
     Controller  Sends high-level one-off vehicle management commands.
 
 """
-import time
 
 from enum import Enum
 
@@ -165,4 +164,4 @@ class Controller(App):
                 data=block.request(
                     ManualSetpoint(TransitionSwitch=1, ArmSwitch=1))
             )).first()
-        time.sleep(5)
+        self.vehicle.clock.sleep(5)
@@ -6,11 +6,19 @@ Apps:
     FlightDirector  Grants the user control of a vehicle's basic axes.
 """
 
+import threading
+
 from pyliner.app import App
 from pyliner.action import ACTION_AXIS_SET, ACTION_SEND_COMMAND, \
     ACTION_AXIS_ZERO
+from pyliner.app_access import InvalidStateError
+from pyliner.conversions import hertz
 from pyliner.intent import Intent, IntentFilter
 from pyliner.telemetry import ManualSetpoint
+from pyliner.util import RealTimeThread
+
+STREAM_RATE = hertz(50)
+"""Default seconds between ManualSetpoints while streaming."""
 
 
 class FlightDirector(App):
@@ -27,12 +35,31 @@ class FlightDirector(App):
     Axis Zero:
         This app listens to ACTION_AXIS_ZERO intents, and when one is received
         it sets all axes to zero.
+
+    Streaming:
+        By default every change of the axes requests control, sends one
+        ManualSetpoint, and releases control again. For high-rate input such
+        as a joystick, start_streaming() takes control once and sends the
+        latest axes at a fixed rate until stop_streaming(). Setting an axis
+        while streaming only updates the state that the next send reads.
+        >>> vehicle.fd.start_streaming(every=hertz(50))
+        >>> while flying:
+        ...     vehicle.fd.set(x=stick.x, y=stick.y)
+        >>> vehicle.fd.stop_streaming()
+
+        If control is revoked while streaming, sends are skipped until it is
+        granted again.
     """
     def __init__(self, strict_set=False):
         super(FlightDirector, self).__init__()
         self._x = self._y = self._z = self._r = 0.0
         self.strict_set = strict_set
 
+        self._lock = threading.Lock()
+        self._stream_block = None
+        self._stream_thread = None
+        """:type: RealTimeThread"""
+
     def attach(self, vehicle_wrapper):
         super(FlightDirector, self).attach(vehicle_wrapper)
         self.vehicle.add_filter(
@@ -45,6 +72,8 @@ class FlightDirector(App):
         )
 
     def detach(self):
+        if self.streaming:
+            self.stop_streaming()
         self.vehicle.callback = None
         super(FlightDirector, self).detach()
 
@@ -52,30 +81,89 @@ class FlightDirector(App):
     def qualified_name(self):
         return 'com.windhover.pyliner.apps.flight_director'
 
+    @property
+    def streaming(self):
+        """True between start_streaming() and stop_streaming()."""
+        return self._stream_thread is not None
+
     def _send_telemetry(self):
-        """Generate a ManualSetpoint and transmit it."""
-        mod_z = self.z / 2.0 + 0.5  # [-1, 1] -> [0, 1]
-        # self.debug('Sending Telemetry: {} {} {} {}'.format(
-        #     self.x, self.y, mod_z, self.r))
+        """Generate a ManualSetpoint and transmit it.
+
+        While streaming this does nothing, the next send picks up the change.
+        """
+        if self.streaming:
+            return
         with self.control_block() as block:
             block.broadcast(Intent(
                 action=ACTION_SEND_COMMAND,
-                data=block.request(ManualSetpoint(
-                    X=self._x, Y=self._y, Z=mod_z, R=self._r,
-                    PosctlSwitch=1, GearSwitch=1, ArmSwitch=1)))).first()
+                data=block.request(self._setpoint()))).first()
+
+    def _send_stream(self, block):
+        """Renew the lease and send the latest axes, if control is granted."""
+        token = block.token
+        vehicle = self.vehicle
+        if token is not None and token.renew() and vehicle is not None:
+            vehicle.broadcast(Intent(
+                action=ACTION_SEND_COMMAND,
+                data=token.request(self._setpoint())))
+
+    def _setpoint(self):
+        """Build a ManualSetpoint from a consistent view of the axes."""
+        with self._lock:
+            mod_z = self._z / 2.0 + 0.5  # [-1, 1] -> [0, 1]
+            return ManualSetpoint(
+                X=self._x, Y=self._y, Z=mod_z, R=self._r,
+                PosctlSwitch=1, GearSwitch=1, ArmSwitch=1)
 
     def set(self, x=None, y=None, z=None, r=None):
         """Set multiple axes at the same time."""
-        if x is not None:
-            self._x_set(x)
-        if y is not None:
-            self._y_set(y)
-        if z is not None:
-            self._z_set(z)
-        if r is not None:
-            self._r_set(r)
+        with self._lock:
+            if x is not None:
+                self._x_set(x)
+            if y is not None:
+                self._y_set(y)
+            if z is not None:
+                self._z_set(z)
+            if r is not None:
+                self._r_set(r)
         self._send_telemetry()
 
+    def start_streaming(self, every=STREAM_RATE):
+        """Take control and send the axes at a fixed rate.
+
+        Blocks until control is granted.
+
+        Args:
+            every (Real): Seconds between sends, on the vehicle clock.
+        """
+        if self.streaming:
+            raise InvalidStateError('Already streaming.')
+        block = self.control_block()
+        block.__enter__()
+        block.wait()
+        self._stream_block = block
+        self._stream_thread = RealTimeThread(
+            self._send_stream, every=every, args=(block,),
+            logger=self.vehicle.logger, name='FlightDirectorStream',
+            exception=lambda e: self.vehicle.exception(
+                'Flight Director stream stopped'), clock=self.vehicle.clock)
+        self._stream_thread.start()
+
+    def stop_streaming(self):
+        """Stop sending and release control.
+
+        The axes keep their values, so the next change sends them once.
+        """
+        if not self.streaming:
+            raise InvalidStateError('Not streaming.')
+        self._stream_thread.stop()
+        self._stream_thread = None
+        block, self._stream_block = self._stream_block, None
+        # Control may have been revoked, so do not wait for it.
+        block.release()
+        block.revoke()  # A send already under way finds no token.
+        self.release_control()
+
     def _set_check(self, axis, value):
         """If a value is invalid raise an exception, otherwise do nothing."""
         if not isinstance(value, float):
@@ -86,7 +174,8 @@ class FlightDirector(App):
 
     def zero(self):
         """Zero out all axes."""
-        self._x = self._y = self._z = self._r = 0.0
+        with self._lock:
+            self._x = self._y = self._z = self._r = 0.0
         self._send_telemetry()
 
     # The methods below deal with the nuances of having each of x, y, z, and r
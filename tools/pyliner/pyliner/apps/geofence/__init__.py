@@ -5,11 +5,15 @@ Apps:
     Geofence  Maintains a volumetric space of operations for the vehicle and
         commands an RTL in the event of a violation.
 
+Classes:
+    FenceWarning  Predicted fence breach, sent with ACTION_FENCE_WARNING.
+
 Volumes:
     Layer  Primarily used by the geofence, layers of volumes.
     LayerCake  A set of cylinders around a single Coordinate.
 
 Modules:
+    index  Spatial index used by layers to find candidate volumes.
     volume  Collection of base and simple Volume classes.
 
 Notes:
@@ -19,20 +23,35 @@ Notes:
         Possible solution: If max_longitude < min_longitude, then the box
             crosses the anti-meridian.
 """
+import math
 import warnings
+from collections import namedtuple
 from functools import partial
 
 from enum import Enum
 from sortedcontainers import SortedDict
 
-from pyliner.action import ACTION_RTL, ACTION_TELEM
+from pyliner.action import ACTION_FENCE_WARNING, ACTION_RTL, ACTION_TELEM
 from pyliner.app import App
+from pyliner.apps.communication import snapshot_values
+from pyliner.apps.geographic_app import GeographicApp
+from pyliner.apps.geofence.index import GRID_CELL, GridIndex
 from pyliner.apps.geofence.volume import Volume, CompositeVolume
 from pyliner.intent import Intent
 from pyliner.position import Position
 from pyliner.util import indent, RealTimeThread
 
 FENCE_SLEEP = 1.0
+LOOKAHEAD_RESOLUTION = 5.0
+"""Default meters between the points checked along a predicted path."""
+
+FenceWarning = namedtuple('FenceWarning', ['position', 'time'])
+"""Predicted fence breach.
+
+Attributes:
+    position (Position): First predicted position outside the fence.
+    time (float): Seconds until the vehicle is predicted to reach it.
+"""
 
 
 class FenceGenerator(object):
@@ -57,21 +76,45 @@ class LayerKind(Enum):
 
 
 class Layer(CompositeVolume):
-    """A layer of volumes in a geofence."""
+    """A layer of volumes in a geofence.
 
-    def __init__(self, name, kind, geographic=None):
-        super(Layer, self).__init__(geographic)
-        self.name = name
+    Points are only tested against the volumes whose bounding boxes overlap
+    the same grid cell, found through a GridIndex that is rebuilt the next
+    time it is needed after a volume is added or removed.
+    """
+
+    def __init__(self, name, kind, geographic=None, cell_size=GRID_CELL):
+        self.cell_size = cell_size
         self.kind = kind
+        self.name = name
+
+        self._index = None
+        super(Layer, self).__init__(geographic)
 
     def __contains__(self, other):
-        return other in self.bounding_box \
-               and super(Layer, self).__contains__(other)
+        if isinstance(other, Volume):
+            return super(Layer, self).__contains__(other)
+        box = self.bounding_box
+        if box is None or other not in box:
+            return False
+        return any((bb is None or other in bb) and other in volume
+                   for bb, volume in self.index.candidates(other))
 
     def __str__(self):
         return '{}\n'.format(self.name) + '\n'.join(
             '{}'.format(volume) for volume in indent(4, self))
 
+    @property
+    def index(self):
+        """The GridIndex of the volumes in this layer."""
+        if self._index is None:
+            self._index = GridIndex(self, self.cell_size)
+        return self._index
+
+    def invalidate(self):
+        super(Layer, self).invalidate()
+        self._index = None
+
 
 class Geofence(App):
     """A Geofence defines the space a vehicle is allowed to operate within.
@@ -87,23 +130,39 @@ class Geofence(App):
     # TODO Use a small memory database (like TinyDB) to handle layer mapping.
     #   Added benefit of allowing both name and order mapping to layer at once.
 
-    def __init__(self):
+    def __init__(self, check_every=FENCE_SLEEP, horizon=None,
+                 resolution=LOOKAHEAD_RESOLUTION):
+        """
+        Args:
+            check_every (float): Seconds between fence checks. If None, the
+                fence is checked every time a new position is received.
+            horizon (float): If not None, also extrapolate the position this
+                many seconds ahead along the current velocity, and broadcast
+                ACTION_FENCE_WARNING with a FenceWarning if the path leaves
+                the fence.
+            resolution (float): Meters between the points checked along the
+                predicted path.
+        """
         super(Geofence, self).__init__()
+        self.check_every = check_every
         self.enabled = False
+        self.horizon = horizon
         self.layers = SortedDict()
         """:type: dict[Any, _Layer]"""
+        self.resolution = resolution
 
         self._check_thread = None
         self._fence_violation = False
+        self._fence_warning = False
         self._telemetry = None
 
     def __contains__(self, other):
         """True if the given other is contained within the Geofence."""
-        contained = False
-        for layer in self.layers.values():
+        # The topmost layer containing the point decides.
+        for layer in reversed(self.layers.values()):
             if other in layer:
-                contained = layer.kind is LayerKind.ADDITIVE
-        return contained
+                return layer.kind is LayerKind.ADDITIVE
+        return False
 
     def __str__(self):
         return 'Geofence{\n' + '\n'.join(' {}{}: {}'.format(
@@ -112,22 +171,34 @@ class Geofence(App):
 
     def attach(self, vehicle):
         super(Geofence, self).attach(vehicle)
+        telemetry = {
+            'latitude': '/Airliner/PX4/VehicleGlobalPosition/Lat',
+            'longitude': '/Airliner/PX4/VehicleGlobalPosition/Lon',
+            'altitude': '/Airliner/PX4/VehicleGlobalPosition/Alt'}
+        if self.horizon is not None:
+            telemetry.update({
+                'north': '/Airliner/PX4/VehicleGlobalPosition/VelN',
+                'east': '/Airliner/PX4/VehicleGlobalPosition/VelE',
+                'down': '/Airliner/PX4/VehicleGlobalPosition/VelD'})
         self._telemetry = self.vehicle.broadcast(Intent(
-            action=ACTION_TELEM,
-            data={
-                'latitude': '/Airliner/PX4/VehicleGlobalPosition/Lat',
-                'longitude': '/Airliner/PX4/VehicleGlobalPosition/Lon',
-                'altitude': '/Airliner/PX4/VehicleGlobalPosition/Alt'})
-        ).first().result
-
-        self._check_thread = RealTimeThread(
-            self._check_fence, every=FENCE_SLEEP,
-            logger=self.vehicle.logger, name='FenceCheck',
-            exception=lambda e: self.vehicle.exception('Geofence Exception'))
-        self._check_thread.start()
+            action=ACTION_TELEM, data=telemetry)).first().result
+
+        if self.check_every is None:
+            self._telemetry['latitude'].add_listener(self._on_position)
+        else:
+            self._check_thread = RealTimeThread(
+                self._check_fence, every=self.check_every,
+                logger=self.vehicle.logger, name='FenceCheck',
+                exception=lambda e: self.vehicle.exception(
+                    'Geofence Exception'), clock=self.vehicle.clock)
+            self._check_thread.start()
 
     def detach(self):
-        self._check_thread.stop()
+        if self._check_thread is None:
+            self._telemetry['latitude'].remove_listener(self._on_position)
+        else:
+            self._check_thread.stop()
+            self._check_thread = None
         self._telemetry = None
         super(Geofence, self).detach()
 
@@ -145,14 +216,36 @@ class Geofence(App):
         return layer
 
     def _check_fence(self):
+        if self.horizon is None:
+            position = self.position
+        else:
+            values = snapshot_values(self._telemetry[key] for key in (
+                'latitude', 'longitude', 'altitude', 'north', 'east', 'down'))
+            position = Position(*values[:3])
         old = self._fence_violation
         self._fence_violation = self._fence_violation or \
-                                (self.enabled and self.position not in self)
+                                (self.enabled and position not in self)
         if not old and self._fence_violation:
-            self.vehicle.error('Encountered Fence Violation at %s',
-                               self.position)
+            self.vehicle.error('Encountered Fence Violation at %s', position)
             self.vehicle.broadcast(Intent(action=ACTION_RTL))
             print('Encountered fence violation. Press Ctrl-C exit.')
+        if self._fence_violation or not self.enabled \
+                or self.horizon is None or None in values:
+            return
+
+        warning = self.predict_breach(position, *values[3:])
+        if warning is not None and not self._fence_warning:
+            self.vehicle.warning('Predicted Fence Violation in %.1fs at %s',
+                                 warning.time, warning.position)
+            self.vehicle.broadcast(
+                Intent(action=ACTION_FENCE_WARNING, data=warning))
+        self._fence_warning = warning is not None
+
+    def _on_position(self, _):
+        try:
+            self._check_fence()
+        except Exception:
+            self.vehicle.exception('Geofence Exception')
 
     def layer_by_name(self, name):
         for layer in self.layers.values():
@@ -161,10 +254,47 @@ class Geofence(App):
 
     @property
     def position(self):
-        return Position(
-            self._telemetry['latitude'].value,
-            self._telemetry['longitude'].value,
-            self._telemetry['altitude'].value)
+        return Position(*snapshot_values(
+            self._telemetry[key]
+            for key in ('latitude', 'longitude', 'altitude')))
+
+    def predict_breach(self, position, north, east, down, horizon=None):
+        """Check the straight path ahead of a moving position.
+
+        Points along the path are tested every resolution meters, so the
+        cost grows with speed times horizon rather than with time.
+
+        Args:
+            position (Position): Current position.
+            north (float): Velocity north in meters per second.
+            east (float): Velocity east in meters per second.
+            down (float): Velocity down in meters per second.
+            horizon (float): Seconds to look ahead. Default self.horizon.
+
+        Returns:
+            FenceWarning: The first point found outside the fence, or None if
+                the whole path is inside.
+        """
+        horizon = self.horizon if horizon is None else horizon
+        ground = math.hypot(north, east) * horizon
+        steps = int(math.ceil(math.hypot(ground, down * horizon) /
+                              self.resolution))
+        if not steps:
+            return None
+        # The path is short, so interpolate linearly between the ends.
+        end = GeographicApp.pbd(
+            position, math.degrees(math.atan2(east, north)), ground)
+        d_lat = (end.latitude - position.latitude) / steps
+        d_lon = ((end.longitude - position.longitude + 180) % 360 - 180) / \
+            steps
+        d_alt = -down * horizon / steps
+        for step in range(1, steps + 1):
+            point = Position(position.latitude + d_lat * step,
+                             position.longitude + d_lon * step,
+                             position.altitude + d_alt * step)
+            if point not in self:
+                return FenceWarning(point, horizon * step / steps)
+        return None
 
     def remove_layer(self, position):
         del self.layers[position]
@@ -0,0 +1,89 @@
+"""
+Spatial index used by geofence layers to find the few volumes that may contain
+a point without testing every volume.
+
+Classes:
+    GridIndex  Buckets volumes by the latitude-longitude cells they overlap.
+"""
+
+import math
+from collections import defaultdict
+
+GRID_CELL = 0.05
+"""Default grid cell size in degrees, about 5.5 km of latitude."""
+MAX_CELLS = 256
+"""Volumes overlapping more cells than this are kept in a separate list."""
+
+
+class GridIndex(object):
+    """Bucket volumes by the grid cells their bounding boxes overlap.
+
+    A point only needs to be tested against the volumes in its own cell, and
+    against those volumes too large to bucket. Each candidate is returned with
+    its bounding box so the box may be checked before the volume itself.
+
+    The index does not track changes to the volumes. Build a new index if a
+    volume is added, removed, or modified.
+    """
+
+    def __init__(self, volumes=(), cell_size=GRID_CELL, max_cells=MAX_CELLS):
+        """
+        Args:
+            volumes (Iterable[Volume]): Volumes to index.
+            cell_size (float): Size of a grid cell in degrees.
+            max_cells (int): Volumes overlapping more cells than this are
+                tested for every point, after their bounding box.
+        """
+        self.cell_size = cell_size
+        self.max_cells = max_cells
+
+        self._cells = defaultdict(list)
+        """:type: dict[tuple[int, int], list[tuple[Box, Volume]]]"""
+        self._large = []
+        """:type: list[tuple[Box, Volume]]"""
+        for volume in volumes:
+            self.insert(volume)
+
+    def __len__(self):
+        return len(set(id(volume) for _, volume in self._entries()))
+
+    def __repr__(self):
+        return '{}(cells={}, large={})'.format(
+            self.__class__.__name__, len(self._cells), len(self._large))
+
+    def candidates(self, point):
+        """Return the (bounding box, volume) pairs that may contain point."""
+        cell = self._cells.get(self._cell(point.latitude, point.longitude))
+        if cell is None:
+            return self._large
+        return cell + self._large if self._large else cell
+
+    def insert(self, volume):
+        """Add a volume to the index.
+
+        A volume without a bounding box is assumed to be unbounded.
+        """
+        box = volume.bounding_box
+        if box is None:
+            self._large.append((None, volume))
+            return
+        low = self._cell(box.min_latitude, box.min_longitude)
+        high = self._cell(box.max_latitude, box.max_longitude)
+        if (high[0] - low[0] + 1) * (high[1] - low[1] + 1) > self.max_cells:
+            self._large.append((box, volume))
+            return
+        entry = (box, volume)
+        for lat in range(low[0], high[0] + 1):
+            for lon in range(low[1], high[1] + 1):
+                self._cells[lat, lon].append(entry)
+
+    def _cell(self, latitude, longitude):
+        return (int(math.floor(latitude / self.cell_size)),
+                int(math.floor(longitude / self.cell_size)))
+
+    def _entries(self):
+        for entries in self._cells.values():
+            for entry in entries:
+                yield entry
+        for entry in self._large:
+            yield entry
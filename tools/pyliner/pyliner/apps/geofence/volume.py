@@ -6,17 +6,33 @@ Volumes:
     CompositeVolume  Volume made of a set of other volumes.
     Box  A box aligned along latitude and longitude
     VerticalCylinder  A cylinder around a Coordinate.
+    PolygonPrism  A polygon extruded between two altitudes.
+    Corridor  A fixed-width corridor along a route.
+
+Notes:
+    PolygonPrism and Corridor project their vertices once into a plane
+    tangent to the Earth at their center. Edges are straight lines in
+    latitude and longitude, and distances in the plane are scaled correctly
+    at the center latitude, drifting by about tan(latitude) * 0.0175% per km
+    north or south of it.
 """
 
 import itertools
+import math
 import warnings
 from abc import ABCMeta, abstractmethod
+from bisect import bisect_right
 from collections import Container
 from numbers import Real
 
+from geographiclib.geodesic import Geodesic
+
 from pyliner.apps.geographic_app import GeographicApp
 from pyliner.position import Position, Coordinate
 
+_EARTH_RADIUS = 6371008.8
+"""Mean radius of the Earth in meters."""
+
 
 class Volume(Container):
     """A generic volume class. Extend to create concrete volumes.
@@ -40,11 +56,18 @@ class Volume(Container):
 
 
 class CompositeVolume(Volume, set):
-    """A volume directly composed of the union of multiple other volumes."""
+    """A volume directly composed of the union of multiple other volumes.
+
+    The bounding box is cached until a volume is added or removed, by any of
+    the set methods or in-place operators. Call invalidate() after changing a
+    member volume in place.
+    """
 
     def __init__(self, geographic, volumes=None):
         Volume.__init__(self, geographic)
         set.__init__(self)
+        self._bounding_box = None
+        self._bounding_box_valid = False
         if volumes:
             self.update(volumes)
 
@@ -61,14 +84,80 @@ class CompositeVolume(Volume, set):
         """
         return any(x in volume for volume in self) \
             if not isinstance(x, Volume) \
-            else super(CompositeVolume, self).__contains__(x)
+            else set.__contains__(self, x)
+
+    def __iand__(self, other):
+        return self._changed(set.__iand__(self, other))
+
+    def __ior__(self, other):
+        for volume in other:
+            self._check_geographic(volume)
+        return self._changed(set.__ior__(self, other))
+
+    def __isub__(self, other):
+        return self._changed(set.__isub__(self, other))
+
+    def __ixor__(self, other):
+        for volume in other:
+            self._check_geographic(volume)
+        return self._changed(set.__ixor__(self, other))
 
     def add(self, volume):
         self._check_geographic(volume)
         super(CompositeVolume, self).add(volume)
+        self.invalidate()
 
     @property
     def bounding_box(self):
+        if not self._bounding_box_valid:
+            self._bounding_box = self._compute_bounding_box()
+            self._bounding_box_valid = True
+        return self._bounding_box
+
+    def clear(self):
+        super(CompositeVolume, self).clear()
+        self.invalidate()
+
+    def difference_update(self, *s):
+        super(CompositeVolume, self).difference_update(*s)
+        self.invalidate()
+
+    def discard(self, volume):
+        super(CompositeVolume, self).discard(volume)
+        self.invalidate()
+
+    def intersection_update(self, *s):
+        super(CompositeVolume, self).intersection_update(*s)
+        self.invalidate()
+
+    def invalidate(self):
+        """Forget cached values derived from the member volumes."""
+        self._bounding_box_valid = False
+
+    def pop(self):
+        volume = super(CompositeVolume, self).pop()
+        self.invalidate()
+        return volume
+
+    def remove(self, volume):
+        super(CompositeVolume, self).remove(volume)
+        self.invalidate()
+
+    def symmetric_difference_update(self, other):
+        other = list(other)
+        for volume in other:
+            self._check_geographic(volume)
+        super(CompositeVolume, self).symmetric_difference_update(other)
+        self.invalidate()
+
+    def _changed(self, result):
+        """Invalidate after an in-place operator, unless it did not apply."""
+        if result is NotImplemented:
+            return result
+        self.invalidate()
+        return self
+
+    def _compute_bounding_box(self):
         boxes = filter(lambda bb: bb is not None,
                        (x.bounding_box for x in self))
         if not boxes:
@@ -102,9 +191,11 @@ class CompositeVolume(Volume, set):
         return CompositeVolume(self.geographic, flat)
 
     def update(self, *s):
-        for volume in itertools.chain(s):
+        s = [list(volumes) for volumes in s]
+        for volume in itertools.chain(*s):
             self._check_geographic(volume)
         super(CompositeVolume, self).update(*s)
+        self.invalidate()
 
 
 class Box(Volume):
@@ -151,8 +242,13 @@ class VerticalCylinder(Volume):
         self.low = low
         self.radius = radius
 
+        self._bounding_box = None
+        self._bounding_box_key = None
+
     def __contains__(self, other):
+        # The bounding box rejects most points without solving a geodesic.
         return self.low <= other.altitude <= self.high and \
+               other in self.bounding_box and \
                self.geographic.distance(self.center, other) <= self.radius
 
     def __repr__(self):
@@ -161,6 +257,15 @@ class VerticalCylinder(Volume):
 
     @property
     def bounding_box(self):
+        """The bounding box, recomputed only if the cylinder has changed."""
+        key = (self.center.latitude, self.center.longitude, self.radius,
+               self.low, self.high)
+        if key != self._bounding_box_key:
+            self._bounding_box = self._compute_bounding_box()
+            self._bounding_box_key = key
+        return self._bounding_box
+
+    def _compute_bounding_box(self):
         # Check for poles
         distance = self.geographic.distance
         pbd = self.geographic.pbd
@@ -172,17 +277,31 @@ class VerticalCylinder(Volume):
             max_lat = 90
         if distance(self.center, Coordinate(-90, 0)) <= self.radius:
             min_lat = -90
-        if max_lat or min_lat:
-            min_lon = 0
-            max_lon = 360
+        if max_lat is not None or min_lat is not None:
+            min_lon = -180
+            max_lon = 180
+        else:
+            # The widest point of the circle lies slightly poleward of due
+            # east, so widen the east-west extent by the ratio of the two on a
+            # sphere.
+            arc = self.radius / _EARTH_RADIUS
+            cos_lat = math.cos(math.radians(self.center.latitude))
+            widen = math.asin(min(1.0, math.sin(arc) / cos_lat)) / \
+                math.atan(math.tan(arc) / cos_lat) if arc else 1.0
+            east = pbd(self.center, 90, self.radius).longitude
+            half = widen * ((east - self.center.longitude) % 360)
+            min_lon = self.center.longitude - half
+            max_lon = self.center.longitude + half
 
         return Box(Position(
-            min_lat or pbd(self.center, 180, self.radius).latitude,
-            min_lon or pbd(self.center, 270, self.radius).longitude,
+            pbd(self.center, 180, self.radius).latitude
+            if min_lat is None else min_lat,
+            min_lon,
             self.low
         ), Position(
-            max_lat or pbd(self.center, 0, self.radius).latitude,
-            max_lon or pbd(self.center, 90, self.radius).longitude,
+            pbd(self.center, 0, self.radius).latitude
+            if max_lat is None else max_lat,
+            max_lon,
             self.high
         ))
 
@@ -202,3 +321,182 @@ class LayerCake(CompositeVolume):
     def add_ring(self, radius, low, high):
         self.add(
             VerticalCylinder(self.geographic, self.center, low, high, radius))
+
+
+class PolygonPrism(Volume):
+    """A polygon on the Earth's surface extruded between two altitudes.
+
+    The polygon is closed automatically and may be concave, but should not
+    intersect itself. Edges are banded by latitude so a point is only tested
+    against the edges in its own band.
+    """
+
+    def __init__(self, geographic, vertices, low, high):
+        # type: (GeographicApp, list[Coordinate], Real, Real) -> None
+        super(PolygonPrism, self).__init__(geographic)
+        if len(vertices) < 3:
+            raise ValueError('A polygon needs at least 3 vertices.')
+        self.high = high
+        self.low = low
+        self.vertices = tuple(vertices)
+
+        self._box = _coordinate_box(self.vertices, low, high)
+        self._frame = _LocalFrame(self._box)
+        points = [self._frame.project(v.latitude, v.longitude)
+                  for v in self.vertices]
+        edges = []
+        for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1]):
+            if y1 != y2:  # Horizontal edges never cross a horizontal ray.
+                bottom, top = min(y1, y2), max(y1, y2)
+                edges.append((bottom, top, (
+                    bottom, top, x1, y1, (x2 - x1) / (y2 - y1))))
+        self._bands = _Bands(edges)
+
+    def __contains__(self, other):
+        if not self.low <= other.altitude <= self.high \
+                or other not in self._box:
+            return False
+        x, y = self._frame.project(other.latitude, other.longitude)
+        # Count the edges crossed by a ray from the point toward the east.
+        inside = False
+        for bottom, top, x1, y1, slope in self._bands.at(y):
+            if bottom <= y < top and x < x1 + (y - y1) * slope:
+                inside = not inside
+        return inside
+
+    def __repr__(self):
+        return 'PolygonPrism({}, {}, {}, {})'.format(
+            self.geographic, list(self.vertices), self.low, self.high)
+
+    @property
+    def bounding_box(self):
+        return self._box
+
+
+class Corridor(Volume):
+    """A corridor of fixed width along a route, between two altitudes.
+
+    The ends of the corridor are rounded, so a point is inside if it is
+    within half the width of any leg of the route.
+    """
+
+    def __init__(self, geographic, route, width, low, high):
+        # type: (GeographicApp, list[Coordinate], Real, Real, Real) -> None
+        super(Corridor, self).__init__(geographic)
+        if not route:
+            raise ValueError('A corridor needs at least 1 waypoint.')
+        self.high = high
+        self.low = low
+        self.route = tuple(route)
+        self.width = width
+
+        half = width / 2.0
+        center = _coordinate_box(self.route, low, high)
+        self._frame = _LocalFrame(center)
+        self._half_squared = half * half
+        points = [self._frame.project(c.latitude, c.longitude)
+                  for c in self.route]
+        if len(points) == 1:
+            points.append(points[0])
+        # Band the legs along whichever axis the route covers more of.
+        xs, ys = [p[0] for p in points], [p[1] for p in points]
+        self._axis = 0 if max(xs) - min(xs) > max(ys) - min(ys) else 1
+        legs = []
+        for (x1, y1), (x2, y2) in zip(points, points[1:]):
+            dx, dy = x2 - x1, y2 - y1
+            ends = ((x1, x2), (y1, y2))[self._axis]
+            legs.append((min(ends) - half, max(ends) + half,
+                         (x1, y1, dx, dy, dx * dx + dy * dy)))
+        self._bands = _Bands(legs)
+
+        lat_pad, lon_pad = self._frame.degrees(half)
+        self._box = Box(
+            Position(center.min_latitude - lat_pad,
+                     center.min_longitude - lon_pad, low),
+            Position(center.max_latitude + lat_pad,
+                     center.max_longitude + lon_pad, high))
+
+    def __contains__(self, other):
+        if not self.low <= other.altitude <= self.high \
+                or other not in self._box:
+            return False
+        point = self._frame.project(other.latitude, other.longitude)
+        x, y = point
+        for x1, y1, dx, dy, length in self._bands.at(point[self._axis]):
+            # Closest point on the leg, as a fraction of the way along it.
+            t = ((x - x1) * dx + (y - y1) * dy) / length if length else 0.0
+            t = min(1.0, max(0.0, t))
+            ex, ey = x - x1 - t * dx, y - y1 - t * dy
+            if ex * ex + ey * ey <= self._half_squared:
+                return True
+        return False
+
+    def __repr__(self):
+        return 'Corridor({}, {}, {}, {}, {})'.format(
+            self.geographic, list(self.route), self.width, self.low,
+            self.high)
+
+    @property
+    def bounding_box(self):
+        return self._box
+
+
+class _Bands(object):
+    """Bucket items by the interval they cover along one axis.
+
+    Items are split into about as many equal bands as there are items, so
+    finding the items that may overlap a coordinate takes one bisection.
+    """
+
+    def __init__(self, items):
+        """
+        Args:
+            items (list[tuple[float, float, Any]]): (low, high, item) tuples.
+        """
+        count = max(1, len(items))
+        low = min(lo for lo, _, _ in items) if items else 0.0
+        high = max(hi for _, hi, _ in items) if items else 0.0
+        step = (high - low) / count or 1.0
+        self._bounds = [low + step * band for band in range(1, count)]
+        self._bands = [[] for _ in range(count)]
+        for lo, hi, item in items:
+            for band in range(bisect_right(self._bounds, lo),
+                              bisect_right(self._bounds, hi) + 1):
+                self._bands[band].append(item)
+
+    def at(self, coordinate):
+        """Return the items that may overlap coordinate."""
+        return self._bands[bisect_right(self._bounds, coordinate)]
+
+
+class _LocalFrame(object):
+    """Equirectangular projection to meters around the center of a box."""
+
+    def __init__(self, box):
+        self.latitude = (box.min_latitude + box.max_latitude) / 2.0
+        self.longitude = (box.min_longitude + box.max_longitude) / 2.0
+        a, f = Geodesic.WGS84.a, Geodesic.WGS84.f
+        e2 = f * (2 - f)
+        phi = math.radians(self.latitude)
+        w = math.sqrt(1 - e2 * math.sin(phi) ** 2)
+        # Meters per degree of latitude and of longitude.
+        self.north = math.radians(a * (1 - e2) / w ** 3)
+        self.east = math.radians(a / w * math.cos(phi))
+
+    def degrees(self, meters):
+        """Return (latitude, longitude) degrees spanned by meters."""
+        return meters / self.north, meters / self.east
+
+    def project(self, latitude, longitude):
+        """Return (east, north) meters from the center."""
+        return ((longitude - self.longitude + 180) % 360 - 180) * self.east, \
+            (latitude - self.latitude) * self.north
+
+
+def _coordinate_box(coordinates, low, high):
+    """Box around coordinates between the low and high altitudes."""
+    return Box(
+        Position(min(c.latitude for c in coordinates),
+                 min(c.longitude for c in coordinates), low),
+        Position(max(c.latitude for c in coordinates),
+                 max(c.longitude for c in coordinates), high))
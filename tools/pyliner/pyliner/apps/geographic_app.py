@@ -2,6 +2,13 @@
 The Geographic App module provides a app that can be used to calculate
 information about two Coordinates on Earth.
 
+Batch calculations over many points at once are available through the
+batch_* methods of GeographicApp. These take and return NumPy arrays, which is
+an optional dependency that must be installed separately.
+
+Enums:
+    GeodesicMode  How batch calculations are performed.
+
 Sensors:
     GeographicApp  Produces relevant world-based calculations.
 """
@@ -9,8 +16,14 @@ Sensors:
 from copy import copy
 from numbers import Real
 
+from enum import Enum
 from geographiclib.geodesic import Geodesic
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from pyliner.action import ACTION_CALC_BEARING, ACTION_CALC_DISTANCE, \
     ACTION_CALC_PBD
 from pyliner.intent import IntentFilter
@@ -18,6 +31,26 @@ from pyliner.position import Coordinate
 from pyliner.app import App
 
 
+_WGS84_A = Geodesic.WGS84.a
+_WGS84_E2 = Geodesic.WGS84.f * (2 - Geodesic.WGS84.f)
+
+
+class GeodesicMode(Enum):
+    """How batch geodesic calculations are performed."""
+    EXACT = 'exact'
+    """Solve each geodesic on the WGS84 ellipsoid with geographiclib. Accurate
+    to a few nanometers at any range, but solved one point at a time."""
+    LOCAL = 'local'
+    """Project onto a plane tangent to the ellipsoid at the mean latitude of
+    each pair, using the WGS84 radii of curvature there. Fully vectorized.
+
+    Between latitudes -70 and 70 degrees and out to 10 km, compared to EXACT,
+    distances are within 1 cm, destination points within 5 cm and bearings
+    within 0.001 degrees. Error grows with the cube of the distance and
+    toward the poles. Do not use across the antimeridian or near the poles.
+    """
+
+
 class GeographicApp(App):
     """An App that produces relevant world-based calculations.
 
@@ -108,3 +141,135 @@ class GeographicApp(App):
     @property
     def qualified_name(self):
         return 'com.windhover.pyliner.apps.geographic'
+
+    @staticmethod
+    def batch_bearing(lat1, lon1, lat2, lon2, mode=GeodesicMode.EXACT):
+        """Calculate the bearings from many points to many others in degrees.
+
+        See batch_inverse for arguments.
+
+        Returns:
+            ndarray: Bearing in degrees [0, 360).
+        """
+        return GeographicApp.batch_inverse(lat1, lon1, lat2, lon2, mode)[1]
+
+    @staticmethod
+    def batch_distance(lat1, lon1, lat2, lon2, mode=GeodesicMode.EXACT):
+        """Calculate the distances between many pairs of points.
+
+        See batch_inverse for arguments.
+
+        Returns:
+            ndarray: Distance in meters.
+        """
+        return GeographicApp.batch_inverse(lat1, lon1, lat2, lon2, mode)[0]
+
+    @staticmethod
+    def batch_inverse(lat1, lon1, lat2, lon2, mode=GeodesicMode.EXACT):
+        """Calculate the distance and bearing between many pairs of points.
+
+        Arguments are broadcast against each other, so a single origin may be
+        compared against an array of points.
+
+        Args:
+            lat1 (array_like): Latitude of the first points in degrees.
+            lon1 (array_like): Longitude of the first points in degrees.
+            lat2 (array_like): Latitude of the second points in degrees.
+            lon2 (array_like): Longitude of the second points in degrees.
+            mode (GeodesicMode): How to solve the geodesics.
+
+        Returns:
+            tuple[ndarray, ndarray]: Distance in meters and bearing from the
+                first to the second point in degrees [0, 360).
+        """
+        lat1, lon1, lat2, lon2 = _broadcast(lat1, lon1, lat2, lon2)
+        if mode is GeodesicMode.LOCAL:
+            mean = np.radians((lat1 + lat2) / 2.0)
+            m, n = _radii(mean)
+            north = np.radians(lat2 - lat1) * m
+            east = np.radians(lon2 - lon1) * n
+            # The plane bearing holds at the midpoint. Meridians converge by
+            # dlon * sin(lat) along the path, half of which lies behind it.
+            convergence = (lon2 - lon1) * np.sin(mean) / 2.0
+            return np.hypot(north, east), \
+                (np.degrees(np.arctan2(east, north)) - convergence) % 360
+        elif mode is GeodesicMode.EXACT:
+            distance = np.empty(lat1.shape)
+            bearing = np.empty(lat1.shape)
+            inverse = Geodesic.WGS84.Inverse
+            outmask = Geodesic.DISTANCE | Geodesic.AZIMUTH
+            for index in np.ndindex(lat1.shape):
+                solution = inverse(lat1[index], lon1[index], lat2[index],
+                                   lon2[index], outmask)
+                distance[index] = solution['s12']
+                bearing[index] = solution['azi1']
+            return distance, bearing % 360
+        raise TypeError('mode must be a GeodesicMode.')
+
+    @staticmethod
+    def batch_pbd(lat, lon, bearing, distance, mode=GeodesicMode.EXACT):
+        """Calculate many Place-Bearing-Distance (PBD) points.
+
+        Arguments are broadcast against each other, so a single origin may be
+        projected along many bearings or distances.
+
+        Args:
+            lat (array_like): Origin latitude in degrees.
+            lon (array_like): Origin longitude in degrees.
+            bearing (array_like): Direction in degrees [0, 360).
+            distance (array_like): Distance in meters.
+            mode (GeodesicMode): How to solve the geodesics.
+
+        Returns:
+            tuple[ndarray, ndarray]: Latitude and longitude in degrees.
+        """
+        lat, lon, bearing, distance = _broadcast(lat, lon, bearing, distance)
+        if mode is GeodesicMode.LOCAL:
+            # Estimate the destination from the origin, then project again
+            # from the midpoint with the bearing rotated by the meridian
+            # convergence up to the midpoint.
+            lat2, lon2 = _project(lat, lon, bearing, distance, lat)
+            mean = (lat + lat2) / 2.0
+            convergence = (lon2 - lon) * np.sin(np.radians(mean)) / 2.0
+            return _project(lat, lon, bearing + convergence, distance, mean)
+        elif mode is GeodesicMode.EXACT:
+            lat2 = np.empty(lat.shape)
+            lon2 = np.empty(lat.shape)
+            direct = Geodesic.WGS84.Direct
+            outmask = Geodesic.LATITUDE | Geodesic.LONGITUDE
+            for index in np.ndindex(lat.shape):
+                solution = direct(lat[index], lon[index], bearing[index],
+                                  distance[index], outmask)
+                lat2[index] = solution['lat2']
+                lon2[index] = solution['lon2']
+            return lat2, lon2
+        raise TypeError('mode must be a GeodesicMode.')
+
+
+def _broadcast(*arrays):
+    """Broadcast the arguments to float arrays of one shape."""
+    if np is None:
+        raise ImportError('Batch geodesic calculations require numpy.')
+    return [np.array(array, dtype=float)
+            for array in np.broadcast_arrays(*arrays)]
+
+
+def _project(lat, lon, bearing, distance, at):
+    """Move along the plane tangent at latitude at, all in degrees."""
+    m, n = _radii(np.radians(at))
+    bearing = np.radians(bearing)
+    return lat + np.degrees(distance * np.cos(bearing) / m), \
+        lon + np.degrees(distance * np.sin(bearing) / n)
+
+
+def _radii(latitude):
+    """Meridional radius and radius of the parallel at latitude in radians.
+
+    Returns:
+        tuple[ndarray, ndarray]: Meters per radian of latitude and of
+            longitude.
+    """
+    sin2 = np.sin(latitude) ** 2
+    w = np.sqrt(1 - _WGS84_E2 * sin2)
+    return _WGS84_A * (1 - _WGS84_E2) / w ** 3, \
+        _WGS84_A / w * np.cos(latitude)
@@ -0,0 +1,132 @@
+"""
+The loop_communication module provides a Communication App that is driven by
+an EventLoop instead of its own threads, so one process may drive several
+vehicles from a single loop thread.
+
+Classes:
+    LoopTelemetry  Telemetry whose next update can be waited on as a future.
+
+Services:
+    LoopCommunication  Communication App driven by an EventLoop.
+"""
+
+from pyliner.apps.communication import Communication, _Telemetry
+from pyliner.event_loop import LoopFuture
+from pyliner.util import UDPReceiver
+
+
+class LoopTelemetry(_Telemetry):
+    """Telemetry whose next update can be waited on as a LoopFuture.
+
+    >>> lat = com.telemetry('/Airliner/PX4/VehicleGlobalPosition/Lat')
+    >>> lat.next().add_done_callback(lambda f: vehicle.info(f.result()))
+    """
+
+    def __init__(self, name=None, time=None, value=None, executor=None):
+        super(LoopTelemetry, self).__init__(name, time, value, executor)
+        self._waiters = []
+
+    def next(self):
+        """Return a LoopFuture which is resolved with the next value received.
+
+        Done callbacks run on the thread that received the telemetry, which is
+        the loop thread.
+        """
+        future = LoopFuture()
+        self._waiters.append(future)
+        return future
+
+    def update(self, value, time=None, snapshot=None):
+        super(LoopTelemetry, self).update(value, time, snapshot)
+        if self._waiters:
+            waiters, self._waiters = self._waiters, []
+            for future in waiters:
+                future.set_result(value)
+
+
+class LoopCommunication(Communication):
+    """Communication App that runs on an EventLoop.
+
+    Telemetry is received whenever the loop finds the telemetry socket
+    readable, and control rotation is a timer on the loop, so the App starts
+    no threads of its own. Telemetry items are LoopTelemetry.
+
+    >>> loop = EventLoop()
+    >>> loop.start()
+    >>> rocky = Vehicle('rocky', LoopCommunication(
+    ...     airliner_map, loop, address='10.0.0.2', to_port=5012))
+    >>> bullwinkle = Vehicle('bullwinkle', LoopCommunication(
+    ...     airliner_map, loop, address='10.0.0.3', to_port=5013))
+    """
+
+    def __init__(self, airliner_map, loop, **kwargs):
+        """
+        Args:
+            airliner_map (dict): Airliner Mapping, typically read from a JSON.
+            loop (EventLoop): Loop to receive telemetry and rotate control on.
+            **kwargs: Passed on to Communication. listen is always False.
+        """
+        kwargs['listen'] = False
+        super(LoopCommunication, self).__init__(airliner_map, **kwargs)
+
+        self.loop = loop
+        self.receiver = UDPReceiver(
+            ('0.0.0.0', self.to_port), self._on_recv_batch,
+            name='LoopTelemetryReceiver')
+        self.loop.add_reader(self.receiver.socket,
+                             lambda _: self.receiver.receive())
+
+        self._rotate_timer = None
+        self._rotating = False
+
+    def close(self):
+        """Stop receiving telemetry and close the socket.
+
+        The socket is closed on the loop thread, so the loop is never left
+        reading a closed socket.
+        """
+        def close():
+            self.loop.remove_reader(self.receiver.socket)
+            self.receiver.socket.close()
+        if self.loop.running and not self.loop.in_loop():
+            self.loop.run(close).result()
+        else:
+            close()
+
+    def detach(self):
+        super(LoopCommunication, self).detach()
+        self.close()
+
+    def send_command_async(self, telemetry):
+        """Send a command on the loop thread without blocking the caller.
+
+        Commands sent this way do not need control of the vehicle, as with
+        send_command.
+
+        Returns:
+            LoopFuture: Resolved with the result of send_command.
+        """
+        return self.loop.run(self.send_command, telemetry)
+
+    def _new_telemetry(self, op_path):
+        return LoopTelemetry(name=op_path, executor=self.listener_executor)
+
+    def _rotate_tick(self):
+        if not self._rotating:
+            return
+        try:
+            self.control_rotate()
+        finally:
+            if self._rotating:
+                self._rotate_timer = self.loop.call_later(
+                    Communication.CONTROL_ROTATE_EVERY, self._rotate_tick)
+
+    def _start_control_rotate(self):
+        self._rotating = True
+        self._rotate_timer = self.loop.call_later(
+            Communication.CONTROL_ROTATE_EVERY, self._rotate_tick)
+
+    def _stop_control_rotate(self):
+        self._rotating = False
+        if self._rotate_timer is not None:
+            self._rotate_timer.cancel()
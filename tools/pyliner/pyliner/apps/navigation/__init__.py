@@ -23,9 +23,11 @@ The following modules are also available:
     waypoint  Waypoint used in navigation.
 """
 import math
+import threading
 
 from pyliner.action import ACTION_TELEM, ACTION_GOTO
 from pyliner.app import App
+from pyliner.apps.communication import snapshot_values
 from pyliner.apps.navigation.goto import Goto
 from pyliner.heading import Heading
 from pyliner.apps.navigation.lnav import Lnav
@@ -46,8 +48,13 @@ class Navigation(App):
 
         self.defaults = {}
         self.sleep_time = hertz(10.0)
+        """Longest time navigation waits for new position telemetry before
+        checking its timeout and the vehicle state again."""
         self.telemetry = None
 
+        self._position_seq = 0
+        self._position_update = threading.Condition()
+
     def attach(self, vehicle_wrapper):
         super(Navigation, self).attach(vehicle_wrapper)
         intent = self.vehicle.broadcast(Intent(
@@ -59,14 +66,30 @@ class Navigation(App):
                 'yaw': '/Airliner/PX4/VehicleGlobalPosition/Yaw'
             })).first()
         self.telemetry = intent.result
+        self.telemetry['latitude'].add_listener(self._on_position)
         self.vehicle.add_filter(
             IntentFilter(actions=[ACTION_GOTO]),
             lambda i: self.goto()(**i.data))
 
     def detach(self):
+        self.telemetry['latitude'].remove_listener(self._on_position)
         self.telemetry = None
         super(Navigation, self).detach()
 
+    def _position_value(self, key):
+        """Read a position item as of the packet that last woke waiters.
+
+        Position waiters are notified by the latitude listener, which may run
+        before the other items of the same packet are updated.
+        """
+        return snapshot_values(
+            (self.telemetry['latitude'], self.telemetry[key]))[1]
+
+    def _on_position(self, _):
+        with self._position_update:
+            self._position_seq += 1
+            self._position_update.notify_all()
+
     @property
     def qualified_name(self):
         return 'com.windhover.pyliner.apps.navigation'
@@ -86,7 +109,7 @@ class Navigation(App):
     @property
     def altitude(self):
         """meters"""
-        return self.telemetry['altitude'].value
+        return self._position_value('altitude')
 
     @property
     def heading(self):
@@ -96,20 +119,54 @@ class Navigation(App):
     @property
     def latitude(self):
         """Degrees"""
-        return self.telemetry['latitude'].value
+        return self._position_value('latitude')
 
     @property
     def longitude(self):
         """Degrees"""
-        return self.telemetry['longitude'].value
+        return self._position_value('longitude')
 
     @property
     def position(self):
-        """The spatial state of the vehicle."""
+        """The spatial state of the vehicle, read from a single packet."""
+        latitude, longitude, altitude, yaw = snapshot_values(
+            self.telemetry[key]
+            for key in ('latitude', 'longitude', 'altitude', 'yaw'))
         return Waypoint(
-            self.latitude, self.longitude, self.altitude, self.heading)
+            latitude, longitude, altitude, Heading(math.degrees(yaw)))
+
+    @property
+    def position_seq(self):
+        """Number of position telemetry updates received since attaching."""
+        return self._position_seq
+
+    def wait_position(self, since=None, timeout=None):
+        """Block until position telemetry newer than since is received.
+
+        Args:
+            since (int): A position_seq previously read. If None, wait for the
+                next update.
+            timeout (Real): Seconds to wait at most. If None, wait forever.
+
+        Returns:
+            int: The latest position_seq, equal to since if timed out.
+
+        Note:
+            The timeout is measured on the vehicle clock. On the wall clock
+            the wait is a timed Condition.wait, which on Python 2 polls and
+            may return up to 50ms after position telemetry arrives.
+        """
+        clock = self.vehicle.clock
+        deadline = clock.deadline(timeout)
+        with self._position_update:
+            if since is None:
+                since = self._position_seq
+            while self._position_seq == since:
+                if clock.wait(self._position_update, deadline):
+                    break
+            return self._position_seq
 
     @property
     def yaw(self):
         """The vehicle yaw in clockwise radians from north [-Pi, Pi]."""
-        return self.telemetry['yaw'].value
+        return self._position_value('yaw')
@@ -1,6 +1,4 @@
-import time
 from collections import Iterable
-from datetime import datetime
 from numbers import Real
 
 from pyliner.action import ACTION_CALC_DISTANCE, ACTION_SEND_COMMAND
@@ -24,7 +22,7 @@ class Goto(NavigationFactory):
                 sets the z-axis to 0 and returns.
             timeout (Optional[timedelta]): If not None, the amount of time the
                 method has to complete an operation before raising
-                CommandTimeout. If None the timeout is datetime.max.
+                CommandTimeout. If None there is no timeout.
         """
         # NotSet resolution
         timeout = self.resolve(timeout, 'timeout')
@@ -34,9 +32,8 @@ class Goto(NavigationFactory):
         if not isinstance(tolerance, Real) or tolerance <= 0:
             raise ValueError('Tolerance must be set to a positive real number.')
 
-        # Timeout
-        # TODO Use vehicle time not local
-        timeout = datetime.max if timeout is None else timeout + datetime.now()
+        # Timeout, measured on the vehicle clock
+        timeout = self.nav.vehicle.clock.deadline(timeout)
 
         # Iterate through all given waypoints
         if not isinstance(waypoints, Iterable):
@@ -75,9 +72,7 @@ class Goto(NavigationFactory):
                 block.broadcast(Intent(
                     action=ACTION_SEND_COMMAND,
                     data=block.request(triplet)))
-            while True:
-                if datetime.now() > timeout:
-                    raise CommandTimeout('goto exceeded timeout')
+            for _ in self.position_updates(timeout):
                 if self.nav.vehicle.shutdown:
                     self.nav.vehicle.info('Shutdown interrupted GOTO.')
                     return False
@@ -91,4 +86,5 @@ class Goto(NavigationFactory):
                         'goto expected %s actual %s (%s < %s m)',
                         cur, self.nav.position, distance, tolerance)
                     break
-                time.sleep(self.nav.sleep_time)
+            else:
+                raise CommandTimeout('goto exceeded timeout')
@@ -1,6 +1,4 @@
 import re
-import time
-from datetime import datetime
 from numbers import Real
 
 from pyliner.action import ACTION_CALC_DISTANCE, ACTION_AXIS_SET
@@ -47,12 +45,11 @@ class Lnav(NavigationFactory):
             raise ValueError('Axis must match "{}".'.format(valid))
         neg, axis = axis_match.groups()
 
-        # Timeout
-        # TODO Use vehicle time not local
-        timeout = datetime.max if timeout is None else timeout + datetime.now()
+        # Timeout, measured on the vehicle clock
+        timeout = self.nav.vehicle.clock.deadline(timeout)
 
         original = self.nav.position
-        while datetime.now() < timeout:
+        for _ in self.position_updates(timeout):
             delta = self.broadcast(Intent(
                 action=ACTION_CALC_DISTANCE, data=(original, self.nav.position)
             )).first().result
@@ -66,7 +63,6 @@ class Lnav(NavigationFactory):
             self.debug('lnav toward %.3f actual %.3f (%.3f < %.3f m) %.3f',
                        distance, delta, distance - delta, tolerance, control)
             self.broadcast(Intent(action=ACTION_AXIS_SET, data={axis: control}))
-            time.sleep(self.nav.sleep_time)
         raise CommandTimeout('lnav exceeded timeout')
 
     def backward(self, distance, **kwargs):
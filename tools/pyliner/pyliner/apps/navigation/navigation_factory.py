@@ -45,6 +45,26 @@ class NavigationFactory(Loggable):
     def broadcast(self):
         return self.nav.vehicle.broadcast
 
+    def position_updates(self, deadline):
+        """Yield now, then again whenever new position telemetry arrives.
+
+        Control loops iterate over this instead of sleeping, so they react as
+        soon as a position lands and never recompute on a stale one. While no
+        telemetry arrives the generator still wakes every nav.sleep_time, and
+        yields if the vehicle is shutting down so the caller can stop.
+
+        Args:
+            deadline (float): Stop once the vehicle clock passes this time,
+                as returned by Clock.deadline().
+        """
+        seq = self.nav.position_seq
+        yield
+        while self.nav.vehicle.clock.time() < deadline:
+            latest = self.nav.wait_position(seq, self.nav.sleep_time)
+            if latest != seq or self.nav.vehicle.shutdown:
+                seq = latest
+                yield
+
     def resolve(self, item, name):
         """If item is NotSet fall back on Navigation defaults."""
         try:
@@ -1,5 +1,4 @@
-import time
-from datetime import timedelta, datetime
+from datetime import timedelta
 from numbers import Real
 
 from pyliner.action import ACTION_AXIS_SET
@@ -29,7 +28,7 @@ class Rotate(NavigationFactory):
             direction (Direction): The direction to rotate.
             timeout (Optional[timedelta]): If not None, the amount of time the
                 method has to complete an operation before raising
-                CommandTimeout. If None the timeout is datetime.max.
+                CommandTimeout. If None there is no timeout.
             underflow (Real): If the vehicle over-rotates and is outside of
                 tolerance this is how far the vehicle is allowed to correct
                 the error before resetting to follow the set direction.
@@ -57,15 +56,14 @@ class Rotate(NavigationFactory):
         if not isinstance(underflow, Real) or underflow < 0.0:
             raise ValueError('Underflow must be a non-negative real number.')
 
-        # Timeout
-        # TODO Use vehicle time not local
-        timeout = datetime.max if timeout is None else datetime.now() + timeout
+        # Timeout, measured on the vehicle clock
+        timeout = self.nav.vehicle.clock.deadline(timeout)
 
         original = self.nav.heading
         target = original + by if by else Heading(to)
         tol_range = target.range(tolerance)
 
-        while datetime.now() < timeout:
+        for _ in self.position_updates(timeout):
             current = self.nav.heading
             if current in tol_range:
                 self.info('rotate expected %s actual %s (in %s)',
@@ -77,7 +75,6 @@ class Rotate(NavigationFactory):
             self.debug('rotate toward %.3f current %.3f (%.3f < %.3f) %.3f',
                        target, current, abs(distance), tolerance, control)
             self.broadcast(Intent(action=ACTION_AXIS_SET, data={'r': control}))
-            time.sleep(self.nav.sleep_time)
         raise CommandTimeout('rotate exceeded timeout')
 
     def clockwise(self, degrees, **kwargs):
@@ -1,5 +1,3 @@
-import time
-from datetime import datetime
 from numbers import Real
 
 from pyliner.action import ACTION_AXIS_SET
@@ -28,7 +26,7 @@ class Vnav(NavigationFactory):
                 sets the z-axis to 0 and returns.
             timeout (Optional[timedelta]): If not None, the amount of time the
                 method has to complete an operation before raising
-                CommandTimeout. If None the timeout is datetime.max.
+                CommandTimeout. If None there is no timeout.
         """
         # NotSet resolution
         method = self.resolve(method, 'method')
@@ -45,13 +43,12 @@ class Vnav(NavigationFactory):
         if not isinstance(tolerance, Real) or tolerance <= 0:
             raise ValueError('Tolerance must be set to a positive real number.')
 
-        # Timeout
-        # TODO Use vehicle time not local
-        timeout = datetime.max if timeout is None else timeout + datetime.now()
+        # Timeout, measured on the vehicle clock
+        timeout = self.nav.vehicle.clock.deadline(timeout)
 
         target_altitude = (self.nav.altitude + by) if by else to
 
-        while datetime.now() < timeout:
+        for _ in self.position_updates(timeout):
             difference = abs(target_altitude - self.nav.altitude)
             if difference <= tolerance:
                 self.info('vnav expected %s actual %s (%s < %s m)',
@@ -64,7 +61,6 @@ class Vnav(NavigationFactory):
                        target_altitude, self.nav.altitude,
                        difference, tolerance, control)
             self.broadcast(Intent(action=ACTION_AXIS_SET, data={'z': control}))
-            time.sleep(self.nav.sleep_time)
         raise CommandTimeout('vnav exceeded timeout')
 
     def down(self, distance, **kwargs):
@@ -1,10 +1,78 @@
+"""
+The Time App module keeps a simulated vehicle clock in step with the vehicle.
+
+Apps:
+    TimeApp  Advances a SimulatedClock from received telemetry.
+"""
+
+from pyliner.action import ACTION_TELEM
 from pyliner.app import App
+from pyliner.clock import SimulatedClock
+from pyliner.intent import Intent
+
+TIME_SOURCE = '/Airliner/PX4/VehicleGlobalPosition/Lat'
+"""Default telemetry whose secondary header time drives the clock."""
 
 
 class TimeApp(App):
-    """Vehicle time."""
-    # TODO Implement this. Might be useful.
+    """Vehicle time.
+
+    If the vehicle has a SimulatedClock, every update of the source telemetry
+    advances the clock by the time elapsed between the secondary header times
+    of consecutive packets. The clock therefore runs exactly as fast as the
+    simulator produces telemetry. The first packet only sets the reference,
+    so the clock keeps its own start time.
+
+    With follow=False the clock is left alone, for instance to advance it once
+    per ARTE frame instead:
+    >>> clock = SimulatedClock()
+    >>> vehicle = Vehicle('sim', com, time=TimeApp(follow=False), clock=clock)
+    >>> while flying:
+    ...     arte.step_frame()
+    ...     clock.advance(FRAME_PERIOD)
+
+    With any other clock the App does nothing but report time.
+    """
+
+    def __init__(self, source=TIME_SOURCE, follow=True):
+        """
+        Args:
+            source (str): Op path of telemetry to read header times from.
+            follow (bool): Advance a SimulatedClock from telemetry.
+        """
+        super(TimeApp, self).__init__()
+        self.follow = follow
+        self.source = source
+        self.vehicle_time = None
+        """Secondary header time of the last source packet, in seconds."""
+
+        self._telemetry = None
+
+    def attach(self, vehicle):
+        super(TimeApp, self).attach(vehicle)
+        if self.follow and isinstance(self.vehicle.clock, SimulatedClock):
+            self._telemetry = self.vehicle.broadcast(Intent(
+                action=ACTION_TELEM, data=self.source)).first().result
+            self._telemetry.add_listener(self._on_time)
+
+    def detach(self):
+        if self._telemetry is not None:
+            self._telemetry.remove_listener(self._on_time)
+            self._telemetry = None
+        super(TimeApp, self).detach()
 
     @property
     def qualified_name(self):
         return 'com.windhover.pyliner.apps.time'
+
+    @property
+    def time(self):
+        """Current time on the vehicle clock, in seconds."""
+        return self.vehicle.clock.time()
+
+    def _on_time(self, telemetry):
+        seconds, fraction = telemetry.time
+        now = seconds + fraction
+        if self.vehicle_time is not None and now > self.vehicle_time:
+            self.vehicle.clock.advance(now - self.vehicle_time)
+        self.vehicle_time = now
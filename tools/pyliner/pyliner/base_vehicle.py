@@ -7,17 +7,20 @@ Classes:
 """
 import atexit
 import logging
+import threading
 from abc import ABCMeta
-from collections import defaultdict
+from collections import OrderedDict
 
 from pyliner.action import ACTION_VEHICLE_SHUTDOWN, ACTION_APP_ATTACH, \
     ACTION_APP_DETACH, ACTION_APP_LIST
 from pyliner.app_access import AppAccess
 from pyliner.app import App
+from pyliner.clock import WALL_CLOCK
 from pyliner.intent import Intent, IntentNoReceiverError, IntentExplicitFailure, \
     Broadcaster
 from pyliner.intent import IntentFilter
 from pyliner.intent import IntentFuture
+from pyliner.listener_executor import ListenerExecutor
 from pyliner.util import Loggable
 
 
@@ -29,12 +32,23 @@ class BaseVehicle(Loggable, Broadcaster):
     """
     __metaclass__ = ABCMeta
 
-    def __init__(self, vehicle_id, logger=None):
+    def __init__(self, vehicle_id, logger=None, broadcast_workers=0,
+                 clock=None, flight_log=None):
         """Constructor for BaseVehicle.
 
         Args:
             vehicle_id: Vehicle ID. Should be unique.
             logger: If None, defaults to 'logging.getLogger(vehicle_id)'.
+            broadcast_workers (int): If greater than 0, broadcasts return
+                immediately and Apps handle intents on a pool of this many
+                threads. Each App still handles one intent at a time, in the
+                order they were broadcast. If 0, every App handles the intent
+                on the broadcasting thread before broadcast returns.
+            clock (Clock): Time source for every App on the vehicle. If None,
+                defaults to WALL_CLOCK.
+            flight_log (FlightLog): If not None, record commands, telemetry,
+                and broadcast intents to this log, timestamped on the vehicle
+                clock. The log is closed when the vehicle shuts down.
         """
         logging.basicConfig()
         super(BaseVehicle, self).__init__(
@@ -46,13 +60,27 @@ class BaseVehicle(Loggable, Broadcaster):
         # Instance attributes
         self.apps = {}
         """:type: dict[str, AppAccess]"""
+        self.clock = clock if clock else WALL_CLOCK
+        """:type: Clock"""
+        self.flight_log = flight_log
+        """:type: FlightLog"""
+        if flight_log is not None:
+            flight_log.clock = self.clock
         self.is_shutdown = False
         self.vehicle_id = vehicle_id
 
-        # self._broadcast_pool = Pool() # TODO Python 3
+        self._broadcast_pool = ListenerExecutor(
+            workers=broadcast_workers, name='{}-broadcast'.format(vehicle_id),
+            logger=self.logger) if broadcast_workers > 0 else None
+        """:type: ListenerExecutor"""
         # self._dynamic_filters = set()
-        self._intent_filters = defaultdict(lambda: set())
-        """:type: dict[str, set[AppAccess]]"""
+        self._intent_filters = {}
+        """:type: dict[str, list[AppAccess]]
+        Every AppAccess with a filter for an action, once per filter."""
+        self._routes = {}
+        """:type: dict[str, tuple[AppAccess]]
+        Routing table of action to the distinct Apps that accept it."""
+        self._routes_lock = threading.Lock()
 
         # Register self App
         self.attach_app(VehicleApp())
@@ -65,8 +93,10 @@ class BaseVehicle(Loggable, Broadcaster):
             intent_filter (IntentFilter): The filter to add.
             app (AppAccess): If an intent matches a filter, the app to call.
         """
-        for action in intent_filter.actions:
-            self._intent_filters[action].add(app)
+        with self._routes_lock:
+            for action in set(intent_filter.actions):
+                self._intent_filters.setdefault(action, []).append(app)
+                self._route(action)
 
     def attach_app(self, app):
         """Attach an app to this vehicle.
@@ -86,37 +116,54 @@ class BaseVehicle(Loggable, Broadcaster):
 
     def broadcast(self, intent):
         # type: (Intent) -> IntentFuture
-        """Broadcast an Intent to listening Apps."""
+        """Broadcast an Intent to listening Apps.
+
+        If the vehicle has a broadcast pool the returned future is filled in
+        as Apps respond. Use its first(), recent(), or wait() methods to wait
+        for responses.
+        """
         future = IntentFuture(caused_by=intent)
-        # TODO Multithreading is a headache
-        # threading.Thread(target=self._broadcast_thread, args=(intent, future))\
-        #     .start()
         self._broadcast_thread(intent, future)
         return future
 
     def _broadcast_thread(self, intent, future):
         # type: (Intent, IntentFuture) -> None
-        """Called by broadcast. Broadcasts intents to listening Apps.
-
-        May be in a separate thread.
-        """
-        self.debug('Broadcasting: ' + str(intent))
+        """Called by broadcast. Broadcasts intents to listening Apps."""
+        self.debug('Broadcasting: %s', intent)
+        if self.flight_log is not None:
+            self.flight_log.intent(intent.action)
         if intent.is_explicit():
-            try:
-                self.apps[intent.component].receive(intent, future)
-            except KeyError:
+            app = self.apps.get(intent.component)
+            apps = (app,) if app is not None else ()
+            if not apps:
                 future.failure = IntentExplicitFailure(
                     'There is no App with the name: ' + str(intent.component))
         else:
-            try:
-                intent_filters = self._intent_filters[intent.action]
-            except KeyError:
+            apps = self._routes.get(intent.action)
+            if not apps:
                 future.failure = IntentNoReceiverError(
                     'There are no Apps accepting {}.'.format(intent.action))
-            else:
-                for app in intent_filters:
-                    app.receive(intent, future)
-        future.complete = True
+
+        # Broadcasts made while handling a pooled intent are delivered on the
+        # same thread, so a handler waiting on a response can not deadlock
+        # the pool or wait behind its own App.
+        pool = self._broadcast_pool
+        if not apps or pool is None or pool.in_worker():
+            for app in apps or ():
+                app.receive(intent, future)
+            future.complete = True
+            return
+
+        remaining = [len(apps)]
+        lock = threading.Lock()
+
+        def done():
+            with lock:
+                remaining[0] -= 1
+                if remaining[0] == 0:
+                    future.complete = True
+        for app in apps:
+            pool.submit(app.deliver, (intent, future, done))
 
     def detach_app(self, name):
         """Disable an app by removing it from this vehicle.
@@ -131,11 +178,29 @@ class BaseVehicle(Loggable, Broadcaster):
             raise KeyError('Cannot find App to detach.')
         del self.apps[name]
         app.detach()
+        if self._broadcast_pool is not None:
+            self._broadcast_pool.remove_listener(app.deliver)
 
     def remove_filter(self, intent_filter, app_access):
         """Remove an intent filter from this vehicle."""
-        for action in intent_filter.actions:
-            self._intent_filters[action].remove(app_access)
+        with self._routes_lock:
+            for action in set(intent_filter.actions):
+                self._intent_filters[action].remove(app_access)
+                self._route(action)
+
+    def _route(self, action):
+        """Rebuild the routing table entry for an action.
+
+        The entry is replaced, never modified, so a broadcast in progress on
+        another thread is not affected. Assumes _routes_lock.
+        """
+        apps = self._intent_filters.get(action)
+        if apps:
+            # Keep the order in which Apps first registered for the action.
+            self._routes[action] = tuple(OrderedDict.fromkeys(apps))
+        else:
+            self._intent_filters.pop(action, None)
+            self._routes.pop(action, None)
 
     def shutdown(self):
         """Shutdown all components on vehicle and detach.
@@ -154,6 +219,10 @@ class BaseVehicle(Loggable, Broadcaster):
             self.broadcast(Intent(action=ACTION_VEHICLE_SHUTDOWN)).wait()
             for app in self.apps.values():
                 app.detach()
+            if self._broadcast_pool is not None:
+                self._broadcast_pool.shutdown()
+            if self.flight_log is not None:
+                self.flight_log.close()
         self.info('Shutdown complete.')
 
 
@@ -0,0 +1,154 @@
+"""
+The capture module keeps a record of the raw telemetry received from a vehicle.
+
+By default only the most recent datagrams are kept in memory, so long flights do
+not grow without bound. A CaptureRecorder can additionally be given to spill
+every datagram to disk so a flight may be replayed later.
+
+Recording Format:
+    A capture file starts with the 8-byte MAGIC header. Every record that
+    follows is a big-endian float64 receive time in seconds since the epoch,
+    a big-endian uint32 length, and then that many bytes of the raw datagram.
+
+Classes:
+    CaptureRecorder  Appends datagrams to a capture file.
+    TelemetryCapture  Fixed-size ring buffer of received datagrams.
+
+Methods:
+    read_capture  Yield (time, datagram) records from a capture file.
+"""
+
+import struct
+import threading
+import time
+from collections import deque
+
+from pyliner.pyliner_error import PylinerError
+
+MAGIC = b'PYLCAP\x00\x01'
+_RECORD = struct.Struct('>dI')
+
+
+class CaptureFormatError(PylinerError):
+    """Raised if a capture file is not in the expected format."""
+    pass
+
+
+class CaptureRecorder(object):
+    """Append received datagrams to a capture file.
+
+    May be used as a context manager, which closes the file on exit.
+    """
+
+    def __init__(self, path, flush_every=64):
+        """
+        Args:
+            path (str): File to write. Existing files are overwritten.
+            flush_every (int): Flush the file after this many records.
+        """
+        self.flush_every = flush_every
+        self.path = path
+        self.records = 0
+
+        self._file = open(path, 'wb')
+        self._file.write(MAGIC)
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.path)
+
+    @property
+    def closed(self):
+        return self._file.closed
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def write(self, timestamp, datagram):
+        """Write one record. Does nothing once the recorder is closed."""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(_RECORD.pack(timestamp, len(datagram)))
+            self._file.write(datagram)
+            self.records += 1
+            if self.records % self.flush_every == 0:
+                self._file.flush()
+
+
+class TelemetryCapture(object):
+    """Keep the most recent raw datagrams received from the vehicle.
+
+    Iterating over a capture yields (time, datagram) tuples from oldest to
+    newest. If a recorder is set, every datagram is also written to it.
+    """
+
+    def __init__(self, maxlen=1024, recorder=None):
+        """
+        Args:
+            maxlen (int): Number of datagrams to keep in memory. If 0, nothing
+                is kept in memory.
+            recorder (CaptureRecorder): If not None, spill to this recorder.
+        """
+        self.count = 0
+        self.recorder = recorder
+        """:type: CaptureRecorder"""
+
+        self._buffer = deque(maxlen=maxlen)
+
+    def __iter__(self):
+        return iter(list(self._buffer))
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def __repr__(self):
+        return '{}(maxlen={}, recorder={!r})'.format(
+            self.__class__.__name__, self.maxlen, self.recorder)
+
+    def add(self, datagram, timestamp=None):
+        """Capture a datagram, received at timestamp or now."""
+        if timestamp is None:
+            timestamp = time.time()
+        self.count += 1
+        if self._buffer.maxlen:
+            self._buffer.append((timestamp, datagram))
+        if self.recorder is not None:
+            self.recorder.write(timestamp, datagram)
+
+    def clear(self):
+        self._buffer.clear()
+
+    @property
+    def maxlen(self):
+        return self._buffer.maxlen
+
+
+def read_capture(path):
+    """Yield (time, datagram) records from a capture file in recorded order.
+
+    Raises:
+        CaptureFormatError: If the file is not a capture file. A truncated
+            final record, as left by a crash, is silently dropped.
+    """
+    with open(path, 'rb') as capture:
+        if capture.read(len(MAGIC)) != MAGIC:
+            raise CaptureFormatError(
+                '{} is not a telemetry capture file.'.format(path))
+        while True:
+            header = capture.read(_RECORD.size)
+            if len(header) < _RECORD.size:
+                return
+            timestamp, length = _RECORD.unpack(header)
+            datagram = capture.read(length)
+            if len(datagram) < length:
+                return
+            yield timestamp, datagram
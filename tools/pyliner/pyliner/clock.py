@@ -0,0 +1,183 @@
+"""
+The clock module provides the time source that all pyliner timing reads.
+
+Every vehicle has a clock, the wall clock unless another is given. Periodic
+threads, control rotation, and navigation timeouts all measure time with the
+vehicle's clock, so swapping in a SimulatedClock makes them follow simulated
+time instead. TimeApp advances a SimulatedClock from the time stamped on
+received telemetry, or it may be advanced by hand, for instance once per ARTE
+frame.
+
+Classes:
+    Clock  Base class for a source of time.
+    SimulatedClock  Time that only moves when it is advanced.
+    WallClock  Local system time.
+
+Attributes:
+    WALL_CLOCK  The shared WallClock used when no clock is given.
+"""
+
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+
+
+class Clock(object):
+    """A source of time in seconds."""
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def sleep_until(self, deadline):
+        """Block until time() is at least deadline."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def time(self):
+        """Current time in seconds."""
+        raise NotImplementedError
+
+    def deadline(self, timeout):
+        """Return the time a timeout expires, or infinity if it is None.
+
+        Args:
+            timeout (timedelta | Real): Time from now, in seconds if Real.
+        """
+        if timeout is None:
+            return float('inf')
+        seconds = getattr(timeout, 'total_seconds', None)
+        return self.time() + (seconds() if seconds else timeout)
+
+    def sleep(self, seconds):
+        """Block for seconds of this clock's time."""
+        self.sleep_until(self.time() + seconds)
+
+    def wait(self, condition, deadline):
+        """Wait on a held Condition until notified or time() reaches deadline.
+
+        Like Condition.wait this may return early, so callers should check
+        what they are waiting for in a loop. A timed wait on Python 2 polls,
+        so it may wake up to 50ms after the condition is notified.
+
+        Args:
+            condition (threading.Condition): Condition the caller holds.
+            deadline (float): Time to stop waiting, infinity for never.
+
+        Returns:
+            bool: True if the deadline has passed and waiting should stop.
+        """
+        if deadline == float('inf'):
+            condition.wait()
+        else:
+            condition.wait(max(0.0, deadline - self.time()))
+        return self.time() >= deadline
+
+
+class WallClock(Clock):
+    """Local system time, as given by time.time()."""
+
+    def __repr__(self):
+        return '{}()'.format(self.__class__.__name__)
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def sleep_until(self, deadline):
+        self.sleep(deadline - time.time())
+
+    def time(self):
+        return time.time()
+
+
+class SimulatedClock(Clock):
+    """Time that only moves when it is advanced.
+
+    Sleepers wake as soon as the clock is advanced past their deadline, so a
+    simulation may run as fast as it produces time. Time never runs backward;
+    attempts to set an earlier time are ignored.
+
+    Because nothing moves the clock on its own, a sleeper waits forever if the
+    clock is never advanced again. close() releases every sleeper.
+    """
+
+    def __init__(self, start=0.0):
+        """
+        Args:
+            start (Real): Initial time in seconds.
+        """
+        self.closed = False
+
+        self._changed = threading.Condition()
+        self._time = float(start)
+        self._waiting = {}
+        """:type: dict[threading.Condition, int]
+        Conditions being waited on by wait(), notified as time moves."""
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__.__name__, self._time)
+
+    def advance(self, seconds):
+        """Move time forward by seconds."""
+        with self._changed:
+            self._set(self._time + seconds)
+        self._notify_waiting()
+
+    def close(self):
+        """Wake every sleeper now, and never block again."""
+        with self._changed:
+            self.closed = True
+            self._changed.notify_all()
+        self._notify_waiting()
+
+    def set(self, now):
+        """Move time forward to now."""
+        with self._changed:
+            self._set(now)
+        self._notify_waiting()
+
+    def sleep_until(self, deadline):
+        with self._changed:
+            # Waiting without a timeout wakes as soon as notified, where a
+            # timed wait on Python 2 polls.
+            while self._time < deadline and not self.closed:
+                self._changed.wait()
+
+    def time(self):
+        return self._time
+
+    def wait(self, condition, deadline):
+        """Wait on a held Condition until notified or time reaches deadline.
+
+        The condition is waited on without a timeout and is notified whenever
+        the clock moves, so no thread polls. Once the clock is closed this
+        never blocks and always returns True.
+        """
+        with self._changed:
+            self._waiting[condition] = self._waiting.get(condition, 0) + 1
+        try:
+            # Checked after registering, so a move in between is not missed.
+            if self._time < deadline and not self.closed:
+                condition.wait()
+        finally:
+            with self._changed:
+                self._waiting[condition] -= 1
+                if not self._waiting[condition]:
+                    del self._waiting[condition]
+        return self.closed or self._time >= deadline
+
+    def _notify_waiting(self):
+        # Outside _changed, as waiters hold their condition while they
+        # register with the clock.
+        with self._changed:
+            conditions = list(self._waiting)
+        for condition in conditions:
+            with condition:
+                condition.notify_all()
+
+    def _set(self, now):
+        if now > self._time:
+            self._time = float(now)
+            self._changed.notify_all()
+
+
+WALL_CLOCK = WallClock()
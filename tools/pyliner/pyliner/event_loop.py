@@ -0,0 +1,280 @@
+"""
+The event_loop module runs socket readers and timed callbacks on one thread,
+so one process may drive several vehicles without a thread per vehicle.
+
+Only the standard library is used, so it runs on Python 2.7 which has no
+asyncio. Results of calls made on the loop are LoopFutures, which may be
+waited on or given callbacks in place of awaiting them.
+
+Classes:
+    EventLoop  Single thread running socket readers and timed callbacks.
+    LoopFuture  The eventual result of a call made on an EventLoop.
+    TimerHandle  A callback scheduled on an EventLoop, which may be cancelled.
+"""
+
+import errno
+import fcntl
+import heapq
+import itertools
+import logging
+import os
+import select
+import threading
+
+from pyliner.clock import WALL_CLOCK
+from pyliner.intent import FutureTimeoutError
+
+
+class LoopFuture(object):
+    """The eventual result of a call made on an EventLoop.
+
+    >>> future = loop.run(com.send_command, command)
+    >>> future.add_done_callback(lambda f: vehicle.info(f.result()))
+    """
+
+    def __init__(self):
+        self._callbacks = []
+        self._done = threading.Event()
+        self._exception = None
+        self._lock = threading.Lock()
+        self._result = None
+
+    def __repr__(self):
+        state = 'done' if self.done() else 'pending'
+        return '{}({})'.format(self.__class__.__name__, state)
+
+    def add_done_callback(self, callback):
+        """Call callback with this future once it is done.
+
+        If the future is already done callback is called immediately.
+        """
+        with self._lock:
+            if not self._done.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def done(self):
+        return self._done.is_set()
+
+    def exception(self, timeout=None):
+        """Return the exception the call raised, or None.
+
+        Raises:
+            FutureTimeoutError: If the future is not done within timeout.
+        """
+        if not self._done.wait(timeout):
+            raise FutureTimeoutError()
+        return self._exception
+
+    def result(self, timeout=None):
+        """Return the result of the call, raising its exception if it failed.
+
+        Raises:
+            FutureTimeoutError: If the future is not done within timeout.
+        """
+        if self.exception(timeout) is not None:
+            raise self._exception
+        return self._result
+
+    def set_exception(self, exception):
+        self._finish(None, exception)
+
+    def set_result(self, result):
+        self._finish(result, None)
+
+    def _finish(self, result, exception):
+        with self._lock:
+            if self._done.is_set():
+                raise ValueError('LoopFuture is already done.')
+            self._result = result
+            self._exception = exception
+            self._done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+
+class TimerHandle(object):
+    """A callback scheduled on an EventLoop."""
+    __slots__ = ['args', 'callback', 'cancelled', 'when']
+
+    def __init__(self, when, callback, args):
+        self.args = args
+        self.callback = callback
+        self.cancelled = False
+        self.when = when
+
+    def cancel(self):
+        """Do not call the callback if it has not been called yet."""
+        self.cancelled = True
+
+
+class EventLoop(object):
+    """Run socket readers and timed callbacks on a single thread.
+
+    Readers and timers may be added from any thread. Callbacks run one at a
+    time on the loop thread, so a callback that blocks delays every other
+    reader and timer on the loop. Timers are measured on the wall clock.
+
+    >>> loop = EventLoop()
+    >>> loop.start()
+    >>> loop.call_later(1.0, vehicle.info, 'One second later')
+    """
+
+    def __init__(self, name='EventLoop', logger=None):
+        """
+        Args:
+            name (str): Name of the loop thread.
+            logger (Logger): Logger to use. Default logging.getLogger(name)
+        """
+        self.logger = logger if logger else logging.getLogger(name)
+        self.name = name
+        self.running = False
+
+        self._lock = threading.Lock()
+        self._readers = {}
+        """:type: dict[int, tuple[socket, Callable]]"""
+        self._sequence = itertools.count()
+        self._thread = None
+        """:type: threading.Thread"""
+        self._timers = []
+        """:type: list[tuple[float, int, TimerHandle]]"""
+        self._wake_read, self._wake_write = os.pipe()
+        for fd in (self._wake_read, self._wake_write):
+            fcntl.fcntl(fd, fcntl.F_SETFL,
+                        fcntl.fcntl(fd, fcntl.F_GETFL) | os.O_NONBLOCK)
+
+    def __repr__(self):
+        return '{}({!r}, readers={})'.format(
+            self.__class__.__name__, self.name, len(self._readers))
+
+    def add_reader(self, sock, callback):
+        """Call callback with sock whenever sock is readable."""
+        with self._lock:
+            readers = dict(self._readers)
+            readers[sock.fileno()] = (sock, callback)
+            self._readers = readers
+        self._wake()
+
+    def call_later(self, delay, callback, *args):
+        """Call callback with args on the loop thread after delay seconds.
+
+        Returns:
+            TimerHandle: Handle which may be used to cancel the call.
+        """
+        handle = TimerHandle(WALL_CLOCK.time() + delay, callback, args)
+        with self._lock:
+            heapq.heappush(self._timers,
+                           (handle.when, next(self._sequence), handle))
+        if not self.in_loop():
+            self._wake()
+        return handle
+
+    def call_soon(self, callback, *args):
+        """Call callback with args on the loop thread as soon as possible."""
+        return self.call_later(0, callback, *args)
+
+    def close(self):
+        """Stop the loop and close its wakeup pipe."""
+        self.stop()
+        if self._thread is not None and not self.in_loop():
+            self._thread.join()
+        os.close(self._wake_read)
+        os.close(self._wake_write)
+
+    def in_loop(self):
+        """Return True if called from the loop thread."""
+        return threading.current_thread() is self._thread
+
+    def remove_reader(self, sock):
+        """Stop watching sock. Does nothing if it is not watched."""
+        with self._lock:
+            readers = dict(self._readers)
+            readers.pop(sock.fileno(), None)
+            self._readers = readers
+        self._wake()
+
+    def run(self, callback, *args):
+        """Call callback with args on the loop thread.
+
+        Returns:
+            LoopFuture: Holds the return value or exception of the call.
+        """
+        future = LoopFuture()
+
+        def call():
+            try:
+                result = callback(*args)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+        self.call_soon(call)
+        return future
+
+    def start(self):
+        """Start the loop thread."""
+        self.running = True
+        self._thread = threading.Thread(target=self._run, name=self.name)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stop the loop once the current callback returns."""
+        self.running = False
+        self._wake()
+
+    def _call(self, callback, *args):
+        try:
+            callback(*args)
+        except Exception:
+            self.logger.exception('Unhandled exception in %s', self.name)
+
+    def _drain_wake(self):
+        try:
+            while os.read(self._wake_read, 4096):
+                pass
+        except OSError as e:
+            if e.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                raise
+
+    def _run(self):
+        self.logger.info('Thread %s starting', self.name)
+        while self.running:
+            with self._lock:
+                timeout = max(0.0, self._timers[0][0] - WALL_CLOCK.time()) \
+                    if self._timers else None
+            readers = self._readers
+            try:
+                readable = select.select(
+                    [self._wake_read] + list(readers), [], [], timeout)[0]
+            except select.error as e:
+                if e.args[0] == errno.EINTR:
+                    continue
+                raise
+            for fileno in readable:
+                if fileno == self._wake_read:
+                    self._drain_wake()
+                elif fileno in readers:
+                    sock, callback = readers[fileno]
+                    self._call(callback, sock)
+            for handle in self._take_due():
+                if not handle.cancelled:
+                    self._call(handle.callback, *handle.args)
+        self.logger.info('Thread %s stopped.', self.name)
+
+    def _take_due(self):
+        """Pop every timer which is due."""
+        now = WALL_CLOCK.time()
+        due = []
+        with self._lock:
+            while self._timers and self._timers[0][0] <= now:
+                due.append(heapq.heappop(self._timers)[2])
+        return due
+
+    def _wake(self):
+        try:
+            os.write(self._wake_write, b'\0')
+        except OSError:
+            pass  # Pipe is full, so the loop will wake anyway, or closed.
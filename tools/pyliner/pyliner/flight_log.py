@@ -0,0 +1,396 @@
+"""
+The flight_log module records what a vehicle did during a flight in a compact
+binary log: the commands it sent, the telemetry it received, and the intents
+its Apps broadcast.
+
+Recording an event only appends a tuple to a queue. A writer thread resolves
+message IDs to names, packs the queued events into blocks and writes them, so
+no formatting happens on the threads that send commands or receive telemetry.
+Each block stores its events column by column, which load_flight_log reads
+straight into NumPy arrays. The queue is bounded; events recorded while it is
+full are counted as dropped rather than blocking the caller.
+
+A capture file, written by capture.CaptureRecorder, serves a different purpose.
+It holds only telemetry, record by record in the byte order of the CCSDS
+packets it stores, so a flight can be replayed datagram by datagram. A flight
+log also holds commands and intents and is laid out for analysis. Both may be
+recorded at once.
+
+Log Format:
+    A flight log starts with the 8-byte MAGIC header, followed by blocks. All
+    numbers are little-endian. A block is:
+        uint32 count, uint32 new names, uint32 payload bytes
+        new names, each a uint16 length then that many UTF-8 bytes
+        float64 time[count]  Seconds on the recording clock.
+        uint8 kind[count]  EVENT_COMMAND, EVENT_TELEMETRY, or EVENT_INTENT.
+        uint32 key[count]  Index of the event's name in the name table.
+        uint32 size[count]  Payload bytes of each event.
+        payload bytes  The payloads of the events, in order.
+    Names are added to the name table in the order they are defined, so a key
+    always refers to a name defined in the same or an earlier block.
+
+    Command names are op paths, or stream IDs such as '0x1C4C' for commands
+    sent as raw bytes. Telemetry names are stream IDs and intent names are
+    actions. Commands and telemetry carry the bytes sent or received as
+    payload, intents carry none.
+
+Classes:
+    FlightLog  Asynchronous writer of a flight log.
+    FlightLogArrays  A flight log loaded as NumPy arrays.
+    FlightLogFormatError  Raised if a file is not a flight log.
+    FlightLogWriteError  Raised on close if the writer thread failed.
+
+Methods:
+    load_flight_log  Read a flight log into NumPy arrays.
+    read_flight_log  Yield the events of a flight log.
+"""
+
+import logging
+import struct
+import sys
+import threading
+from array import array
+from collections import deque, namedtuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from pyliner.clock import WALL_CLOCK
+from pyliner.pyliner_error import PylinerError
+
+MAGIC = b'PYLFLT\x00\x01'
+
+EVENT_COMMAND = 1
+EVENT_TELEMETRY = 2
+EVENT_INTENT = 3
+
+FLUSH_EVERY = 0.5
+"""Default seconds between writes of queued events."""
+
+MAX_QUEUED = 65536
+"""Default number of events queued before further events are dropped."""
+
+_BLOCK = struct.Struct('<III')
+_NAME = struct.Struct('<H')
+
+
+class FlightLogFormatError(PylinerError):
+    """Raised if a file is not a flight log."""
+    pass
+
+
+class FlightLogWriteError(PylinerError):
+    """Raised on close if the writer thread failed."""
+    pass
+
+
+class FlightLog(object):
+    """Write a flight log on a background thread.
+
+    record() and the shorthand command(), telemetry(), and intent() may be
+    called from any thread. Events are written in the order they are recorded,
+    at the latest flush_every seconds later. May be used as a context manager,
+    which closes the log on exit.
+
+    If the writer thread fails the error is logged, kept in failure, and
+    raised by close(). No further events are recorded.
+    """
+
+    def __init__(self, path, clock=WALL_CLOCK, block_size=4096,
+                 flush_every=FLUSH_EVERY, payloads=True,
+                 max_queued=MAX_QUEUED, logger=None):
+        """
+        Args:
+            path (str): File to write. Existing files are overwritten.
+            clock (Clock): Clock events are timestamped with if no time is
+                given. Vehicle sets this to its own clock.
+            block_size (int): Wake the writer once this many events are queued.
+            flush_every (Real): Seconds between writes of queued events.
+            payloads (bool): If False, only the size of each payload is kept.
+            max_queued (int): Events recorded while this many are waiting to
+                be written are dropped, and counted in dropped.
+            logger (Logger): Logger to use. Default
+                logging.getLogger('FlightLogWriter')
+        """
+        self.block_size = block_size
+        self.clock = clock
+        self.dropped = 0
+        self.failure = None
+        """:type: Exception
+        The error that stopped the writer thread, if any."""
+        self.flush_every = flush_every
+        self.logger = logger if logger else \
+            logging.getLogger('FlightLogWriter')
+        self.max_queued = max_queued
+        self.path = path
+        self.payloads = payloads
+        self.records = 0
+
+        self._closed = False
+        self._events = deque()
+        self._file = open(path, 'wb')
+        self._file.write(MAGIC)
+        self._mid_names = {}
+        """:type: dict[int, str]"""
+        self._names = {}
+        """:type: dict[str, int]"""
+        self._wake = threading.Event()
+        self._writer = threading.Thread(
+            target=self._run, name='FlightLogWriter')
+        self._writer.daemon = True
+        self._writer.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.path)
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def close(self):
+        """Write every queued event and close the file.
+
+        Raises:
+            FlightLogWriteError: If the writer thread failed.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._writer.join()
+        if self.failure is not None:
+            raise FlightLogWriteError('Writing {} failed: {}'.format(
+                self.path, self.failure))
+
+    def command(self, name, data, time=None):
+        """Record a command sent to op path name as the bytes data.
+
+        If name is None the command is named after the stream ID that data
+        starts with, as for commands sent as raw bytes.
+        """
+        self.record(EVENT_COMMAND, name, data, time)
+
+    def intent(self, action, time=None):
+        """Record that an intent with action was broadcast."""
+        self.record(EVENT_INTENT, action, b'', time)
+
+    def record(self, kind, name, payload=b'', time=None):
+        """Queue one event. Does nothing once the log is closed.
+
+        Args:
+            kind (int): EVENT_COMMAND, EVENT_TELEMETRY, or EVENT_INTENT.
+            name (str|int): Op path, message ID, or action of the event. An
+                int message ID is written as its '0x%04X' name. None names
+                the event after the stream ID at the start of payload.
+            payload (bytes): Bytes sent or received.
+            time (float): Event time. If None, the current clock time.
+        """
+        if self._closed:
+            return
+        if self.failure is not None or len(self._events) >= self.max_queued:
+            self.dropped += 1
+            return
+        self._events.append((self.clock.time() if time is None else time,
+                             kind, name, payload))
+        if len(self._events) >= self.block_size:
+            self._wake.set()
+
+    def telemetry(self, mid, datagram, time=None):
+        """Record a datagram received with stream ID mid."""
+        self.record(EVENT_TELEMETRY, mid, datagram, time)
+
+    def _event_name(self, name, payload):
+        """Resolve a recorded name to the name written to the log."""
+        if name is None:
+            name = struct.unpack('>H', payload[:2])[0] \
+                if len(payload) >= 2 else 0
+        if not isinstance(name, int):
+            return name
+        mid_name = self._mid_names.get(name)
+        if mid_name is None:
+            mid_name = self._mid_names[name] = '0x{:04X}'.format(name)
+        return mid_name
+
+    def _run(self):
+        try:
+            while not self._closed:
+                self._wake.wait(self.flush_every)
+                self._wake.clear()
+                self._write_queued()
+            self._write_queued()
+        except Exception as e:
+            self.failure = e
+            self.logger.exception('Flight log %s stopped recording after %s '
+                                  'events.', self.path, self.records)
+            self._events.clear()
+        finally:
+            self._file.close()
+
+    def _write_block(self, events):
+        times = array('d')
+        kinds = array('B')
+        keys = array('I')
+        sizes = array('I')
+        names = []
+        payloads = []
+        for time, kind, name, payload in events:
+            name = self._event_name(name, payload)
+            key = self._names.get(name)
+            if key is None:
+                key = self._names[name] = len(self._names)
+                names.append(name.encode('utf-8'))
+            times.append(time)
+            kinds.append(kind)
+            keys.append(key)
+            sizes.append(len(payload))
+            if self.payloads:
+                payloads.append(payload)
+        payload = b''.join(payloads)
+
+        parts = [_BLOCK.pack(len(events), len(names), len(payload))]
+        for name in names:
+            parts.append(_NAME.pack(len(name)))
+            parts.append(name)
+        for column in (times, kinds, keys, sizes):
+            if sys.byteorder == 'big':
+                column.byteswap()
+            parts.append(column.tostring())
+        parts.append(payload)
+        self._file.write(b''.join(parts))
+        self.records += len(events)
+
+    def _write_queued(self):
+        events = []
+        while self._events:
+            events.append(self._events.popleft())
+            if len(events) == self.block_size:
+                self._write_block(events)
+                events = []
+        if events:
+            self._write_block(events)
+        self._file.flush()
+
+
+def _read_blocks(path):
+    """Yield (names defined, columns, payload) for each block of a log.
+
+    Columns are (time, kind, key, size) arrays from the array module.
+    """
+    with open(path, 'rb') as log:
+        if log.read(len(MAGIC)) != MAGIC:
+            raise FlightLogFormatError(
+                '{} is not a flight log.'.format(path))
+        while True:
+            header = log.read(_BLOCK.size)
+            if len(header) < _BLOCK.size:
+                return
+            count, name_count, payload_size = _BLOCK.unpack(header)
+            names = []
+            for _ in range(name_count):
+                length = log.read(_NAME.size)
+                if len(length) < _NAME.size:
+                    return
+                name = log.read(_NAME.unpack(length)[0])
+                names.append(name.decode('utf-8'))
+            columns = []
+            for typecode in 'dBII':
+                column = array(typecode)
+                data = log.read(count * column.itemsize)
+                if len(data) < count * column.itemsize:
+                    return
+                column.fromstring(data)
+                if sys.byteorder == 'big':
+                    column.byteswap()
+                columns.append(column)
+            payload = log.read(payload_size)
+            if len(payload) < payload_size:
+                return
+            yield names, columns, payload
+
+
+def read_flight_log(path):
+    """Yield (time, kind, name, payload) events from a flight log in order.
+
+    A log written with payloads=False yields empty payloads.
+
+    Raises:
+        FlightLogFormatError: If the file is not a flight log. A truncated
+            final block, as left by a crash, is silently dropped.
+    """
+    table = []
+    for names, (times, kinds, keys, sizes), payload in _read_blocks(path):
+        table.extend(names)
+        offset = 0
+        for time, kind, key, size in zip(times, kinds, keys, sizes):
+            data = payload[offset:offset + size] if payload else b''
+            offset += size
+            yield time, kind, table[key], data
+
+
+class FlightLogArrays(namedtuple('FlightLogArrays', [
+        'time', 'kind', 'key', 'size', 'names', 'payload', 'offset'])):
+    """A flight log loaded into NumPy arrays, one element per event.
+
+    Attributes:
+        time (ndarray): float64 event times.
+        kind (ndarray): uint8 EVENT_* kinds.
+        key (ndarray): uint32 indices into names.
+        size (ndarray): uint32 payload sizes.
+        names (list[str]): Name table.
+        payload (bytes): Every payload, concatenated in event order. Empty if
+            the log was written without payloads.
+        offset (ndarray): int64 offset of each event's payload.
+    """
+    __slots__ = ()
+
+    def select(self, kind, name=None):
+        """Return a boolean mask of the events of a kind, and name if given."""
+        mask = self.kind == kind
+        if name is not None:
+            key = self.names.index(name) if name in self.names else -1
+            mask &= self.key == key
+        return mask
+
+    def payload_of(self, index):
+        """Return the payload bytes of the event at index."""
+        start = int(self.offset[index])
+        return self.payload[start:start + int(self.size[index])]
+
+
+def load_flight_log(path):
+    """Read a whole flight log into NumPy arrays.
+
+    Returns:
+        FlightLogArrays
+
+    Raises:
+        FlightLogFormatError: If the file is not a flight log.
+    """
+    if np is None:
+        raise ImportError('Loading a flight log requires numpy.')
+    dtypes = (np.float64, np.uint8, np.uint32, np.uint32)
+    names = []
+    columns = ([], [], [], [])
+    payloads = []
+    for block_names, block_columns, payload in _read_blocks(path):
+        names.extend(block_names)
+        for column, block_column, dtype in zip(
+                columns, block_columns, dtypes):
+            column.append(np.frombuffer(block_column, dtype=dtype))
+        payloads.append(payload)
+    time, kind, key, size = [
+        np.concatenate(column) if column else np.empty(0, dtype=dtype)
+        for column, dtype in zip(columns, dtypes)]
+    payload = b''.join(payloads)
+    offset = np.zeros(len(size), dtype=np.int64)
+    if payload:
+        offset[1:] = np.cumsum(size[:-1], dtype=np.int64)
+    return FlightLogArrays(time, kind, key, size, names, payload, offset)
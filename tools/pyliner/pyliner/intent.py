@@ -157,6 +157,8 @@ class IntentFuture(object):
         if value is not True:
             raise ValueError('IntentFuture.complete can only be set to True.')
         self._complete.set()
+        # No more responses can arrive, so stop anyone waiting for the first.
+        self._event_first.set()
 
     def first(self, timeout=None):
         """Return the first response received.
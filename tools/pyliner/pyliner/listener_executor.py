@@ -0,0 +1,190 @@
+"""
+The listener_executor module runs telemetry listeners away from the thread that
+receives telemetry, so slow listeners do not delay later packets.
+
+Every listener has its own bounded queue of pending calls. A small pool of
+worker threads drains the queues, calling each listener in the order its items
+were submitted and never running the same listener on two threads at once.
+When a queue is full the oldest pending item is dropped, or with
+COALESCE_LATEST only the most recent item is ever kept. The queue of a removed
+listener is forgotten once its pending items are delivered.
+
+Classes:
+    ListenerExecutor  Runs listeners on a pool of worker threads.
+    ListenerStats  Counters for one listener.
+    OverflowPolicy  What to do when a listener queue is full.
+"""
+
+import logging
+import threading
+from collections import deque, namedtuple
+
+from enum import Enum
+import queue
+
+ListenerStats = namedtuple(
+    'ListenerStats', ['depth', 'submitted', 'delivered', 'dropped'])
+"""Counters for one listener.
+
+Attributes:
+    depth: Items waiting in the listener queue.
+    submitted: Items ever submitted for the listener.
+    delivered: Items the listener has been called with.
+    dropped: Items discarded because the listener queue was full.
+"""
+
+
+class OverflowPolicy(Enum):
+    """What to do when an item is submitted to a full listener queue."""
+    DROP_OLDEST = 'drop_oldest'
+    """Discard the oldest pending item. Queues hold up to maxsize items."""
+    COALESCE_LATEST = 'coalesce_latest'
+    """Replace the pending item. Queues hold one item regardless of maxsize,
+    so a listener always sees the latest value once it catches up."""
+
+
+class _ListenerQueue(object):
+    """Pending items and counters for one listener."""
+    __slots__ = ['delivered', 'dropped', 'listener', 'pending', 'removed',
+                 'scheduled', 'submitted']
+
+    def __init__(self, listener, maxsize):
+        self.delivered = 0
+        self.dropped = 0
+        self.listener = listener
+        self.pending = deque(maxlen=maxsize)
+        self.removed = False
+        self.scheduled = False
+        self.submitted = 0
+
+
+class ListenerExecutor(object):
+    """Call listeners on a pool of worker threads.
+
+    Pass an executor to Communication to have every telemetry listener and
+    subscription callback run through it:
+    >>> executor = ListenerExecutor(maxsize=8)
+    >>> com = Communication(airliner_map, listener_executor=executor)
+    """
+
+    def __init__(self, workers=1, maxsize=None,
+                 policy=OverflowPolicy.DROP_OLDEST, name='ListenerExecutor',
+                 logger=None):
+        """
+        Args:
+            workers (int): Number of worker threads.
+            maxsize (int): Items each listener queue may hold. If None the
+                queues are unbounded and nothing is ever dropped.
+            policy (OverflowPolicy): What to do when a listener queue is full.
+            name (str): Prefix for the names of the worker threads.
+            logger (Logger): Logger to use. Default logging.getLogger(name)
+        """
+        if not isinstance(policy, OverflowPolicy):
+            raise TypeError('policy must be of type OverflowPolicy.')
+        if policy is OverflowPolicy.COALESCE_LATEST:
+            maxsize = 1
+        self.logger = logger if logger else logging.getLogger(name)
+        self.maxsize = maxsize
+        self.policy = policy
+
+        self._lock = threading.Lock()
+        self._queues = {}
+        """:type: dict[Callable, _ListenerQueue]"""
+        self._ready = queue.Queue()
+        self._workers = []
+        for index in range(workers):
+            worker = threading.Thread(
+                target=self._work, name='{}-{}'.format(name, index))
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+
+    def __repr__(self):
+        return '{}(workers={}, maxsize={}, policy={})'.format(
+            self.__class__.__name__, len(self._workers), self.maxsize,
+            self.policy)
+
+    def in_worker(self):
+        """True if called from one of this executor's worker threads."""
+        return threading.current_thread() in self._workers
+
+    def remove_listener(self, listener):
+        """Forget the queue and counters of a listener that is no longer used.
+
+        Items already pending are still delivered, and the queue is forgotten
+        once it drains. Submitting for the listener again starts a new queue.
+        """
+        with self._lock:
+            lq = self._queues.get(listener)
+            if lq is None:
+                return
+            if lq.scheduled:
+                lq.removed = True
+            else:
+                del self._queues[listener]
+
+    def shutdown(self, wait=False):
+        """Stop the workers once they finish the listener they are calling.
+
+        Items still pending are not delivered.
+        """
+        for _ in self._workers:
+            self._ready.put(None)
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    def stats(self, listener=None):
+        """Return the ListenerStats of one listener, or of every listener.
+
+        Returns:
+            ListenerStats | dict[Callable, ListenerStats]
+        """
+        with self._lock:
+            if listener is not None:
+                return self._stats(self._queues[listener])
+            return {lq.listener: self._stats(lq)
+                    for lq in self._queues.values()}
+
+    def submit(self, listener, item):
+        """Queue a call of listener(item)."""
+        with self._lock:
+            lq = self._queues.get(listener)
+            if lq is None:
+                lq = self._queues[listener] = \
+                    _ListenerQueue(listener, self.maxsize)
+            lq.submitted += 1
+            if len(lq.pending) == lq.pending.maxlen:
+                lq.dropped += 1  # The deque discards the oldest item.
+            lq.pending.append(item)
+            if not lq.scheduled:
+                lq.scheduled = True
+                self._ready.put(lq)
+
+    @staticmethod
+    def _stats(lq):
+        return ListenerStats(
+            len(lq.pending), lq.submitted, lq.delivered, lq.dropped)
+
+    def _work(self):
+        while True:
+            lq = self._ready.get()
+            if lq is None:
+                return
+            with self._lock:
+                item = lq.pending.popleft()
+            try:
+                lq.listener(item)
+            except Exception:
+                self.logger.exception(
+                    'Unhandled exception in listener %s', lq.listener)
+            # Put the listener back at the end of the line so one busy
+            # listener cannot starve the others.
+            with self._lock:
+                lq.delivered += 1
+                if lq.pending:
+                    self._ready.put(lq)
+                else:
+                    lq.scheduled = False
+                    if lq.removed and self._queues.get(lq.listener) is lq:
+                        del self._queues[lq.listener]
@@ -0,0 +1,248 @@
+"""
+The proto_registry module maps Airliner message names to their protobuf message
+classes without importing every generated module up front.
+
+A generated *_pb2 module is imported the first time one of its messages is
+looked up. If a descriptor bundle is given, a serialized FileDescriptorSet
+holding the message definitions, classes are instead built from the bundle
+on first use and no generated modules are imported at all.
+
+The bundle is built from the generated modules by running this module:
+    python -m pyliner.proto_registry [MODULE_DIR] [--out BUNDLE]
+
+Every generated file repeats the definitions of the types it uses, such as
+the CCSDS headers, so the bundle keeps one copy of each type in a file of its
+own. Loading a message then only builds descriptors for the types it uses.
+
+Classes:
+    MessageRegistry  Read-only mapping of message name to message class.
+
+Methods:
+    merge_descriptors  Merge generated file descriptors into one set.
+    read_modules  Read the file descriptors of generated modules.
+"""
+
+import argparse
+import imp
+import threading
+from collections import Mapping, defaultdict
+from glob import glob
+from importlib import import_module
+from os.path import basename, dirname, join, splitext
+
+from google.protobuf import descriptor_pb2, descriptor_pool
+from google.protobuf.message_factory import MessageFactory
+
+
+class MessageRegistry(Mapping):
+    """Read-only mapping of Airliner message name to protobuf message class.
+
+    Classes are loaded the first time they are looked up and cached after.
+    Iterating over the registry or testing membership loads nothing.
+    """
+
+    def __init__(self, messages, bundle=None):
+        """
+        Args:
+            messages (dict[str, tuple[str, str]]): Airliner message name to
+                the module path and class name of its generated class.
+                E.g. {'HS_HkPacket_t': ('pyliner.python_pb.HS_HkPacket_t_pb2',
+                                        'HS_HkPacket_t_pb')}
+            bundle (str): Path of a serialized FileDescriptorSet to build
+                classes from. Messages missing from the bundle fall back to
+                importing their module. If None, modules are always imported.
+        """
+        self.bundle = bundle
+        self.messages = messages
+
+        self._classes = {}
+        """:type: dict[str, type]"""
+        self._factory = None
+        self._lock = threading.Lock()
+
+    def __contains__(self, name):
+        return name in self.messages
+
+    def __getitem__(self, name):
+        try:
+            return self._classes[name]
+        except KeyError:
+            pass
+        module, class_name = self.messages[name]
+        with self._lock:
+            if name not in self._classes:
+                self._classes[name] = self._load(module, class_name)
+        return self._classes[name]
+
+    def __iter__(self):
+        return iter(self.messages)
+
+    def __len__(self):
+        return len(self.messages)
+
+    def __repr__(self):
+        return '{}({} messages, {} loaded, bundle={!r})'.format(
+            self.__class__.__name__, len(self.messages), len(self._classes),
+            self.bundle)
+
+    @property
+    def loaded(self):
+        """Names of the messages whose classes have been loaded."""
+        return set(self._classes)
+
+    def _bundle_factory(self):
+        """Load the bundle into a private pool the first time it is needed."""
+        if self._factory is None:
+            with open(self.bundle, 'rb') as bundle:
+                file_set = descriptor_pb2.FileDescriptorSet.FromString(
+                    bundle.read())
+            pool = descriptor_pool.DescriptorPool()
+            for file_proto in file_set.file:
+                pool.Add(file_proto)
+            self._factory = MessageFactory(pool)
+        return self._factory
+
+    def _load(self, module, class_name):
+        if self.bundle is not None:
+            factory = self._bundle_factory()
+            try:
+                descriptor = factory.pool.FindMessageTypeByName(class_name)
+            except KeyError:
+                pass
+            else:
+                return factory.GetPrototype(descriptor)
+        return getattr(import_module(module), class_name)
+
+
+def _root_name(file_proto):
+    """Name of the message a generated file is named after, e.g.
+    'HS_HkPacket_t_pb' for '_py_HS_HkPacket_t.proto'."""
+    name = splitext(basename(file_proto.name))[0]
+    if name.startswith('_py_'):
+        name = name[len('_py_'):]
+    return name + '_pb'
+
+
+def merge_descriptors(files):
+    """Merge generated file descriptors into one FileDescriptorSet.
+
+    Each distinct message type is written once, in a file of its own that
+    depends on the files of the types its fields use. Dependencies come
+    before the files that use them.
+
+    A few generated files define a type under a name that another file uses
+    for a different definition. A file's own message, the one it is named
+    after, keeps its name. Any other definition that differs from the shared
+    one is put in a package named after its file, and the file's references
+    are rewritten to match.
+
+    Args:
+        files (Iterable[FileDescriptorProto]): Generated file descriptors.
+            Types must be top level and in no package, as the generator
+            writes them.
+
+    Returns:
+        FileDescriptorSet: The merged definitions.
+    """
+    files = list(files)
+    definitions = defaultdict(set)
+    rooted = {}
+    for file_proto in files:
+        root = _root_name(file_proto)
+        for message in file_proto.message_type:
+            data = message.SerializeToString()
+            definitions[message.name].add(data)
+            if message.name == root:
+                rooted[message.name] = data
+    shared = dict(rooted)
+    for name, datas in definitions.items():
+        if name not in shared and len(datas) == 1:
+            shared[name] = next(iter(datas))
+
+    merged = descriptor_pb2.FileDescriptorSet()
+    written = set()
+    for file_proto in files:
+        scope = splitext(basename(file_proto.name))[0]
+        messages = {message.name: message
+                    for message in file_proto.message_type}
+        local = set(name for name, message in messages.items()
+                    if shared.get(name) != message.SerializeToString())
+
+        def file_name(name):
+            return '{}/{}.proto'.format(scope, name) if name in local \
+                else name + '.proto'
+
+        def write(name, path):
+            if file_name(name) in written:
+                return
+            if name in path:
+                raise ValueError('{} depends on itself through {}'.format(
+                    name, ', '.join(path)))
+            message = descriptor_pb2.DescriptorProto()
+            message.CopyFrom(messages[name])
+            dependencies = []
+            for field in message.field:
+                if not field.type_name:
+                    continue
+                used = field.type_name.lstrip('.')
+                if used == name:
+                    continue
+                write(used, path + (name,))
+                if used in local:
+                    field.type_name = '.{}.{}'.format(scope, used)
+                if file_name(used) not in dependencies:
+                    dependencies.append(file_name(used))
+            file_out = merged.file.add(name=file_name(name),
+                                       dependency=dependencies)
+            if name in local:
+                file_out.package = scope
+            file_out.message_type.add().CopyFrom(message)
+            written.add(file_out.name)
+
+        for message in file_proto.message_type:
+            write(message.name, ())
+    return merged
+
+
+def read_modules(paths):
+    """Read the file descriptors of generated *_pb2 modules.
+
+    Args:
+        paths (Iterable[str]): Paths of the modules' source files.
+
+    Returns:
+        list[FileDescriptorProto]
+    """
+    files = []
+    for path in paths:
+        name = '_bundle_' + splitext(basename(path))[0]
+        module = imp.load_source(name, path)
+        files.append(descriptor_pb2.FileDescriptorProto.FromString(
+            module.DESCRIPTOR.serialized_pb))
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Merge the generated message modules into a descriptor '
+                    'bundle that MessageRegistry loads classes from.')
+    parser.add_argument(
+        'modules', nargs='?',
+        default=join(dirname(__file__), 'python_pb'),
+        help='Directory of generated *_pb2 modules. Defaults to the '
+             'pyliner.python_pb package.')
+    parser.add_argument(
+        '--out', help='Bundle to write. Defaults to pyliner_msgs.desc in the '
+                      'module directory, where pyliner_msgs looks for it.')
+    args = parser.parse_args()
+
+    out = args.out or join(args.modules, 'pyliner_msgs.desc')
+    merged = merge_descriptors(
+        read_modules(sorted(glob(join(args.modules, '*_pb2.py')))))
+    with open(out, 'wb') as bundle:
+        bundle.write(merged.SerializeToString())
+    print('Wrote {} types to {}'.format(len(merged.file), out))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,1222 +1,617 @@
 """ This file was autogenerated from template version 0.0.0.1 and autogenerator version 0.0.0.1 """
+from os.path import dirname, isfile, join
 
-from pyliner.python_pb import BAT_HkTlm_t_pb2
-from pyliner.python_pb import BAT_CurrentValueTable_t_pb2
-from pyliner.python_pb import BAT_ConfigTbl_t_pb2
-from pyliner.python_pb import RCIN_HkTlm_t_pb2
-from pyliner.python_pb import RCIN_CustomData_t_pb2
-from pyliner.python_pb import RCIN_Custom_JoystickChannelMapping_t_pb2
-from pyliner.python_pb import HS_MATEntry_t_pb2
-from pyliner.python_pb import HS_EMTEntry_t_pb2
-from pyliner.python_pb import HS_CDSData_t_pb2
-from pyliner.python_pb import HS_XCTEntry_t_pb2
-from pyliner.python_pb import HS_HkPacket_t_pb2
-from pyliner.python_pb import HS_SetUtilParamsCmd_t_pb2
-from pyliner.python_pb import HS_CustomData_t_pb2
-from pyliner.python_pb import HS_SetUtilDiagCmd_t_pb2
-from pyliner.python_pb import HS_AMTEntry_t_pb2
-from pyliner.python_pb import HS_AppData_t_pb2
-from pyliner.python_pb import HS_SetMaxResetsCmd_t_pb2
-from pyliner.python_pb import SIMLIB_PressureAltitudeData_t_pb2
-from pyliner.python_pb import SIMLIB_LibData_t_pb2
-from pyliner.python_pb import SIMLIB_ActuatorControlsData_t_pb2
-from pyliner.python_pb import SIMLIB_AccelData_t_pb2
-from pyliner.python_pb import SIMLIB_DistanceSensorData_t_pb2
-from pyliner.python_pb import SIMLIB_MagData_t_pb2
-from pyliner.python_pb import SIMLIB_TemperatureData_t_pb2
-from pyliner.python_pb import SIMLIB_DiffPressureData_t_pb2
-from pyliner.python_pb import SIMLIB_GyroData_t_pb2
-from pyliner.python_pb import SIMLIB_RCInputData_t_pb2
-from pyliner.python_pb import SIMLIB_GPSData_t_pb2
-from pyliner.python_pb import QAE_ConfigTbl_t_pb2
-from pyliner.python_pb import QAE_CurrentValueTable_t_pb2
-from pyliner.python_pb import QAE_HkTlm_t_pb2
-from pyliner.python_pb import QAE_Params_t_pb2
-from pyliner.python_pb import HK_AppData_t_pb2
-from pyliner.python_pb import HK_HkPacket_t_pb2
-from pyliner.python_pb import MPC_HkTlm_t_pb2
-from pyliner.python_pb import MPC_ConfigTbl_t_pb2
-from pyliner.python_pb import NAV_HkTlm_t_pb2
-from pyliner.python_pb import NAV_Params_t_pb2
-from pyliner.python_pb import NAV_ConfigTbl_t_pb2
-from pyliner.python_pb import NAV_MissionItem_t_pb2
-from pyliner.python_pb import NAV_CurrentValueTable_t_pb2
-from pyliner.python_pb import FM_MoveFileCmd_t_pb2
-from pyliner.python_pb import FM_FileInfoPkt_t_pb2
-from pyliner.python_pb import FM_TableEntry_t_pb2
-from pyliner.python_pb import FM_SetPermCmd_t_pb2
-from pyliner.python_pb import FM_CopyFileCmd_t_pb2
-from pyliner.python_pb import FM_ConcatCmd_t_pb2
-from pyliner.python_pb import FM_GetDirPktCmd_t_pb2
-from pyliner.python_pb import FM_OpenFilesEntry_t_pb2
-from pyliner.python_pb import FM_DirListPkt_t_pb2
-from pyliner.python_pb import FM_ChildQueueEntry_t_pb2
-from pyliner.python_pb import FM_DeleteAllCmd_t_pb2
-from pyliner.python_pb import FM_DeleteDirCmd_t_pb2
-from pyliner.python_pb import FM_DeleteFileCmd_t_pb2
-from pyliner.python_pb import FM_RenameFileCmd_t_pb2
-from pyliner.python_pb import FM_GlobalData_t_pb2
-from pyliner.python_pb import FM_DirListFileStats_t_pb2
-from pyliner.python_pb import FM_HousekeepingPkt_t_pb2
-from pyliner.python_pb import FM_OpenFilesPkt_t_pb2
-from pyliner.python_pb import FM_DirListEntry_t_pb2
-from pyliner.python_pb import FM_DecompressCmd_t_pb2
-from pyliner.python_pb import FM_FreeSpacePktEntry_t_pb2
-from pyliner.python_pb import FM_FreeSpaceTable_t_pb2
-from pyliner.python_pb import FM_GetFileInfoCmd_t_pb2
-from pyliner.python_pb import FM_GetDirFileCmd_t_pb2
-from pyliner.python_pb import FM_FreeSpacePkt_t_pb2
-from pyliner.python_pb import FM_CreateDirCmd_t_pb2
-from pyliner.python_pb import FM_SetTableStateCmd_t_pb2
-from pyliner.python_pb import SIM_HkTlm_t_pb2
-from pyliner.python_pb import SIM_ConfigTbl_t_pb2
-from pyliner.python_pb import LD_HkTlm_t_pb2
-from pyliner.python_pb import LD_Params_t_pb2
-from pyliner.python_pb import LD_CurrentValueTable_t_pb2
-from pyliner.python_pb import LD_ConfigTbl_t_pb2
-from pyliner.python_pb import LC_HkPacket_t_pb2
-from pyliner.python_pb import LC_SetAPPermOff_t_pb2
-from pyliner.python_pb import LC_ResetWPStats_t_pb2
-from pyliner.python_pb import LC_ADTEntry_t_pb2
-from pyliner.python_pb import LC_MessageList_t_pb2
-from pyliner.python_pb import LC_WDTEntry_t_pb2
-from pyliner.python_pb import LC_WRTTransition_t_pb2
-from pyliner.python_pb import LC_MListTag_pb2
-from pyliner.python_pb import LC_SampleAP_t_pb2
-from pyliner.python_pb import LC_SetLCState_t_pb2
-from pyliner.python_pb import LC_AppData_t_pb2
-from pyliner.python_pb import LC_WListTag_pb2
-from pyliner.python_pb import LC_ResetAPStats_t_pb2
-from pyliner.python_pb import LC_WRTEntry_t_pb2
-from pyliner.python_pb import LC_SetAPState_t_pb2
-from pyliner.python_pb import LC_ARTEntry_t_pb2
-from pyliner.python_pb import LC_MultiType_t_pb2
-from pyliner.python_pb import LC_WatchPtList_t_pb2
-from pyliner.python_pb import LC_OperData_t_pb2
-from pyliner.python_pb import AMC_HkTlm_t_pb2
-from pyliner.python_pb import AMC_CurrentValueTable_t_pb2
-from pyliner.python_pb import AMC_PwmConfigTbl_t_pb2
-from pyliner.python_pb import DS_AppFileStatus_t_pb2
-from pyliner.python_pb import DS_DestSizeCmd_t_pb2
-from pyliner.python_pb import DS_CloseFileCmd_t_pb2
-from pyliner.python_pb import DS_AddMidCmd_t_pb2
-from pyliner.python_pb import DS_AppStateCmd_t_pb2
-from pyliner.python_pb import DS_FileInfoPkt_t_pb2
-from pyliner.python_pb import DS_DestTypeCmd_t_pb2
-from pyliner.python_pb import DS_FilterParmsCmd_t_pb2
-from pyliner.python_pb import DS_AppData_t_pb2
-from pyliner.python_pb import DS_PacketEntry_t_pb2
-from pyliner.python_pb import DS_HkPacket_t_pb2
-from pyliner.python_pb import DS_DestExtCmd_t_pb2
-from pyliner.python_pb import DS_DestBaseCmd_t_pb2
-from pyliner.python_pb import DS_HashLink_t_pb2
-from pyliner.python_pb import DS_DestCountCmd_t_pb2
-from pyliner.python_pb import DS_DestStateCmd_t_pb2
-from pyliner.python_pb import DS_DestPathCmd_t_pb2
-from pyliner.python_pb import DS_HashTag_pb2
-from pyliner.python_pb import DS_DestFileTable_t_pb2
-from pyliner.python_pb import DS_FilterTable_t_pb2
-from pyliner.python_pb import DS_FileInfo_t_pb2
-from pyliner.python_pb import DS_FilterParms_t_pb2
-from pyliner.python_pb import DS_FilterTypeCmd_t_pb2
-from pyliner.python_pb import DS_FilterFileCmd_t_pb2
-from pyliner.python_pb import DS_FileHeader_t_pb2
-from pyliner.python_pb import DS_DestAgeCmd_t_pb2
-from pyliner.python_pb import DS_DestFileEntry_t_pb2
-from pyliner.python_pb import TO_OutData_t_pb2
-from pyliner.python_pb import TO_MessageFlowDiagTlm_t_pb2
-from pyliner.python_pb import TO_RemoveMessageFlowCmd_t_pb2
-from pyliner.python_pb import TO_OutputQueue_t_pb2
-from pyliner.python_pb import TO_DisableChannelCmd_t_pb2
-from pyliner.python_pb import TO_PriorityQueue_t_pb2
-from pyliner.python_pb import TO_ChannelDiagTlm_t_pb2
-from pyliner.python_pb import TO_AddMessageFlowCmd_t_pb2
-from pyliner.python_pb import TO_AppCustomData_t_pb2
-from pyliner.python_pb import TO_EnableChannelCmd_t_pb2
-from pyliner.python_pb import TO_QueryMessageFlowCmd_t_pb2
-from pyliner.python_pb import TO_SendDiagCmd_t_pb2
-from pyliner.python_pb import TO_ChannelTbl_t_pb2
-from pyliner.python_pb import TO_AppData_t_pb2
-from pyliner.python_pb import TO_QueryOutputChannelCmd_t_pb2
-from pyliner.python_pb import TO_TlmChannels_t_pb2
-from pyliner.python_pb import TO_ChannelDumpTbl_t_pb2
-from pyliner.python_pb import TO_QueryPriorityQueueCmd_t_pb2
-from pyliner.python_pb import TO_MessageFlow_t_pb2
-from pyliner.python_pb import TO_MessageFlowMetrics_t_pb2
-from pyliner.python_pb import TO_PriorityQueueMetrics_t_pb2
-from pyliner.python_pb import TO_OutputQueueDiagTlm_t_pb2
-from pyliner.python_pb import TO_PriorityDiagTlm_t_pb2
-from pyliner.python_pb import TO_InData_t_pb2
-from pyliner.python_pb import TO_ChannelData_t_pb2
-from pyliner.python_pb import TO_HkTlm_t_pb2
-from pyliner.python_pb import PE_ConfigTbl_t_pb2
-from pyliner.python_pb import PE_Params_t_pb2
-from pyliner.python_pb import PE_HkTlm_t_pb2
-from pyliner.python_pb import MPU9250_HkTlm_t_pb2
-from pyliner.python_pb import MPU9250_Params_t_pb2
-from pyliner.python_pb import MPU9250_CalibrationMsg_t_pb2
-from pyliner.python_pb import MPU9250_DiagPacket_t_pb2
-from pyliner.python_pb import MPU9250_ConversionMsg_t_pb2
-from pyliner.python_pb import MPU9250_ConfigTbl_t_pb2
-from pyliner.python_pb import CI_CmdRegData_t_pb2
-from pyliner.python_pb import CI_InData_t_pb2
-from pyliner.python_pb import CI_CdsTbl_t_pb2
-from pyliner.python_pb import CI_TimeoutTblEntry_t_pb2
-from pyliner.python_pb import CI_AppData_t_pb2
-from pyliner.python_pb import CI_CmdAuthData_t_pb2
-from pyliner.python_pb import CI_ConfigTblEntry_t_pb2
-from pyliner.python_pb import CI_OutData_t_pb2
-from pyliner.python_pb import CI_CmdData_t_pb2
-from pyliner.python_pb import CI_HkTlm_t_pb2
-from pyliner.python_pb import CI_AppCustomData_t_pb2
-from pyliner.python_pb import VC_AppCustomDevice_t_pb2
-from pyliner.python_pb import VC_HkTlm_t_pb2
-from pyliner.python_pb import VC_Transmit_Handle_t_pb2
-from pyliner.python_pb import VC_AppData_t_pb2
-from pyliner.python_pb import VC_Device_Handle_t_pb2
-from pyliner.python_pb import VC_StartStreamCmd_t_pb2
-from pyliner.python_pb import VC_AppCustomData_t_pb2
-from pyliner.python_pb import ULR_ConfigTbl_t_pb2
-from pyliner.python_pb import ULR_HkTlm_t_pb2
-from pyliner.python_pb import ULR_UartMessage_t_pb2
-from pyliner.python_pb import EA_OutData_t_pb2
-from pyliner.python_pb import EA_StartCmd_t_pb2
-from pyliner.python_pb import EA_InData_t_pb2
-from pyliner.python_pb import EA_HkTlm_t_pb2
-from pyliner.python_pb import EA_CdsTbl_t_pb2
-from pyliner.python_pb import EA_ProcData_t_pb2
-from pyliner.python_pb import EA_ChildData_t_pb2
-from pyliner.python_pb import EA_ConfigTblEntry_t_pb2
-from pyliner.python_pb import EA_AppData_t_pb2
-from pyliner.python_pb import VM_Params_t_pb2
-from pyliner.python_pb import VM_HkTlm_t_pb2
-from pyliner.python_pb import VM_ConfigTbl_t_pb2
-from pyliner.python_pb import VM_Modes_pb2
-from pyliner.python_pb import VM_StatusFlags_pb2
-from pyliner.python_pb import PRMLIB_ParamTblData_t_pb2
-from pyliner.python_pb import PRMLIB_ParamData_t_pb2
-from pyliner.python_pb import PRMLIB_AppData_t_pb2
-from pyliner.python_pb import PRMLIB_UpdatedParamMsg_t_pb2
-from pyliner.python_pb import CF_QueueInfoFileEntry_t_pb2
-from pyliner.python_pb import CF_Queue_t_pb2
-from pyliner.python_pb import CF_QueueDirFiles_t_pb2
-from pyliner.python_pb import CF_TransPacket_t_pb2
-from pyliner.python_pb import CF_KickstartCmd_t_pb2
-from pyliner.python_pb import CF_EnDisPollCmd_t_pb2
-from pyliner.python_pb import CF_HkPacket_t_pb2
-from pyliner.python_pb import CF_ChannelData_t_pb2
-from pyliner.python_pb import CF_ConfigPacket_t_pb2
-from pyliner.python_pb import CF_DequeueNodeCmd_t_pb2
-from pyliner.python_pb import CF_CARSCmd_t_pb2
-from pyliner.python_pb import CF_SetPollParamCmd_t_pb2
-from pyliner.python_pb import CF_SetMibParam_t_pb2
-from pyliner.python_pb import CF_MemParams_t_pb2
-from pyliner.python_pb import CF_AutoSuspendEnCmd_t_pb2
-from pyliner.python_pb import CF_EngTransStat_t_pb2
-from pyliner.python_pb import CF_WriteQueueCmd_t_pb2
-from pyliner.python_pb import CF_PurgeQueueCmd_t_pb2
-from pyliner.python_pb import CF_AppData_t_pb2
-from pyliner.python_pb import CF_GiveTakeCmd_t_pb2
-from pyliner.python_pb import CF_GetMibParam_t_pb2
-from pyliner.python_pb import CF_ResetCtrsCmd_t_pb2
-from pyliner.python_pb import CF_WriteActiveTransCmd_t_pb2
-from pyliner.python_pb import CF_QueueEntry_t_pb2
-from pyliner.python_pb import CF_SendTransCmd_t_pb2
-from pyliner.python_pb import CF_PlaybackDirCmd_t_pb2
-from pyliner.python_pb import CF_QuickStatCmd_t_pb2
-from pyliner.python_pb import CF_PlaybackFileCmd_t_pb2
-from pyliner.python_pb import CF_PDU_Hdr_t_pb2
-from pyliner.python_pb import CF_AppTransStat_t_pb2
-from pyliner.python_pb import CF_EnDisDequeueCmd_t_pb2
-from pyliner.python_pb import PBLIB_RegData_t_pb2
-from pyliner.python_pb import PBLIB_AppData_t_pb2
-from pyliner.python_pb import CS_Res_App_Table_Entry_t_pb2
-from pyliner.python_pb import CS_AppNameCmd_t_pb2
-from pyliner.python_pb import CS_OneShotCmd_t_pb2
-from pyliner.python_pb import CS_GetEntryIDCmd_t_pb2
-from pyliner.python_pb import CS_EntryCmd_t_pb2
-from pyliner.python_pb import CS_Def_EepromMemory_Table_Entry_t_pb2
-from pyliner.python_pb import CS_HkPacket_t_pb2
-from pyliner.python_pb import CS_AppData_t_pb2
-from pyliner.python_pb import CS_Def_Tables_Table_Entry_t_pb2
-from pyliner.python_pb import CS_Res_EepromMemory_Table_Entry_t_pb2
-from pyliner.python_pb import CS_Res_Tables_Table_Entry_t_pb2
-from pyliner.python_pb import CS_Def_App_Table_Entry_t_pb2
-from pyliner.python_pb import CS_TableNameCmd_t_pb2
-from pyliner.python_pb import PX4_DistanceSensorMsg_t_pb2
-from pyliner.python_pb import PX4_VehicleGlobalPositionMsg_t_pb2
-from pyliner.python_pb import PX4_SensorCombinedMsg_t_pb2
-from pyliner.python_pb import PX4_EstimatorStatusMsg_t_pb2
-from pyliner.python_pb import PX4_PositionSetpoint_t_pb2
-from pyliner.python_pb import PX4_McAttCtrlStatusMsg_t_pb2
-from pyliner.python_pb import PX4_InputRcMsg_t_pb2
-from pyliner.python_pb import PX4_VehicleAttitudeMsg_t_pb2
-from pyliner.python_pb import PX4_VehicleAttitudeSetpointMsg_t_pb2
-from pyliner.python_pb import PX4_VehicleCommandMsg_t_pb2
-from pyliner.python_pb import PX4_OpticalFlowMsg_t_pb2
-from pyliner.python_pb import PX4_LedControlMsg_t_pb2
-from pyliner.python_pb import PX4_AirspeedMsg_t_pb2
-from pyliner.python_pb import PX4_SafetyMsg_t_pb2
-from pyliner.python_pb import PX4_ActuatorControlsMsg_t_pb2
-from pyliner.python_pb import PX4_BatteryStatusMsg_t_pb2
-from pyliner.python_pb import PX4_VehicleStatusMsg_t_pb2
-from pyliner.python_pb import PX4_PositionSetpointTripletMsg_t_pb2
-from pyliner.python_pb import PX4_VehicleGpsPositionMsg_t_pb2
-from pyliner.python_pb import PX4_VehicleLocalPositionSetpointMsg_t_pb2
-from pyliner.python_pb import PX4_HomePositionMsg_t_pb2
-from pyliner.python_pb import PX4_VehicleLocalPositionMsg_t_pb2
-from pyliner.python_pb import PX4_TelemetryStatusMsg_t_pb2
-from pyliner.python_pb import PX4_SaturationStatus_t_pb2
-from pyliner.python_pb import PX4_VehicleRatesSetpointMsg_t_pb2
-from pyliner.python_pb import PX4_VehicleLandDetectedMsg_t_pb2
-from pyliner.python_pb import PX4_MissionMsg_t_pb2
-from pyliner.python_pb import PX4_MissionResultMsg_t_pb2
-from pyliner.python_pb import PX4_RcChannelsMsg_t_pb2
-from pyliner.python_pb import PX4_SensorMagMsg_t_pb2
-from pyliner.python_pb import PX4_GpsInjectDataMsg_t_pb2
-from pyliner.python_pb import PX4_ControlStateMsg_t_pb2
-from pyliner.python_pb import PX4_SubsystemInfoMsg_t_pb2
-from pyliner.python_pb import PX4_ManualControlSetpointMsg_t_pb2
-from pyliner.python_pb import PX4_VehicleGlobalVelocitySetpointMsg_t_pb2
-from pyliner.python_pb import PX4_SensorBaroMsg_t_pb2
-from pyliner.python_pb import PX4_SensorAccelMsg_t_pb2
-from pyliner.python_pb import PX4_VehicleControlModeMsg_t_pb2
-from pyliner.python_pb import PX4_DifferentialPressureMsg_t_pb2
-from pyliner.python_pb import PX4_SensorGyroMsg_t_pb2
-from pyliner.python_pb import PX4_MultirotorMotorLimitsMsg_t_pb2
-from pyliner.python_pb import PX4_ActuatorArmedMsg_t_pb2
-from pyliner.python_pb import PX4_ActuatorOutputsMsg_t_pb2
-from pyliner.python_pb import PX4_SensorCorrectionMsg_t_pb2
-from pyliner.python_pb import PX4_CommanderStateMsg_t_pb2
-from pyliner.python_pb import PX4_SatelliteInfoMsg_t_pb2
-from pyliner.python_pb import GPS_NAV_STATUS_t_pb2
-from pyliner.python_pb import GPS_NAV_ODO_t_pb2
-from pyliner.python_pb import GPS_NAV_GEOFENCE_t_pb2
-from pyliner.python_pb import GPS_CFG_TMODE3_t_pb2
-from pyliner.python_pb import GPS_NAV_SBAS_t_pb2
-from pyliner.python_pb import GPS_NAV_TIMEUTC_t_pb2
-from pyliner.python_pb import GPS_NAV_SVINFO_P2_t_pb2
-from pyliner.python_pb import GPS_ParserStatus_t_pb2
-from pyliner.python_pb import GPS_NAV_PVT_t_pb2
-from pyliner.python_pb import GPS_NAV_POSLLH_t_pb2
-from pyliner.python_pb import GPS_ConfigTbl_t_pb2
-from pyliner.python_pb import GPS_CurrentValueTable_t_pb2
-from pyliner.python_pb import GPS_NAV_EOE_t_pb2
-from pyliner.python_pb import GPS_NAV_ORB_t_pb2
-from pyliner.python_pb import GPS_ACK_NAK_t_pb2
-from pyliner.python_pb import GPS_MON_HW_t_pb2
-from pyliner.python_pb import GPS_NAV_SOL_t_pb2
-from pyliner.python_pb import GPS_HkTlm_t_pb2
-from pyliner.python_pb import GPS_NAV_SVINFO_Combined_t_pb2
-from pyliner.python_pb import GPS_CFG_MSG_t_pb2
-from pyliner.python_pb import GPS_CFG_NAV5_t_pb2
-from pyliner.python_pb import GPS_NAV_ATT_t_pb2
-from pyliner.python_pb import GPS_AppCustomData_t_pb2
-from pyliner.python_pb import GPS_CFG_PRT_t_pb2
-from pyliner.python_pb import GPS_NAV_AOPSTATUS_t_pb2
-from pyliner.python_pb import GPS_NAV_POSECEF_t_pb2
-from pyliner.python_pb import GPS_CFG_SBAS_t_pb2
-from pyliner.python_pb import GPS_Checksum_t_pb2
-from pyliner.python_pb import GPS_DeviceMessage_t_pb2
-from pyliner.python_pb import GPS_NAV_SVINFO_P1_t_pb2
-from pyliner.python_pb import GPS_ACK_ACK_t_pb2
-from pyliner.python_pb import GPS_Header_t_pb2
-from pyliner.python_pb import GPS_NAV_DOP_t_pb2
-from pyliner.python_pb import GPS_NAV_SAT_t_pb2
-from pyliner.python_pb import MD_CmdJam_t_pb2
-from pyliner.python_pb import MD_pb2
-from pyliner.python_pb import MD_AppData_t_pb2
-from pyliner.python_pb import MD_DwellControlEntry_t_pb2
-from pyliner.python_pb import MD_CmdHandlerTblRec_t_pb2
-from pyliner.python_pb import MD_DwellPkt_t_pb2
-from pyliner.python_pb import MD_DwellTableLoad_t_pb2
-from pyliner.python_pb import MD_DwellPacketControl_t_pb2
-from pyliner.python_pb import MD_TableLoadEntry_t_pb2
-from pyliner.python_pb import MD_CmdSetSignature_t_pb2
-from pyliner.python_pb import MD_CmdStartStop_t_pb2
-from pyliner.python_pb import MD_HkTlm_t_pb2
-from pyliner.python_pb import MM_DumpInEventCmd_t_pb2
-from pyliner.python_pb import MM_HkPacket_t_pb2
-from pyliner.python_pb import MM_AppData_t_pb2
-from pyliner.python_pb import MM_LoadDumpFileHeader_t_pb2
-from pyliner.python_pb import MM_PeekCmd_t_pb2
-from pyliner.python_pb import MM_EepromWriteEnaCmd_t_pb2
-from pyliner.python_pb import MM_LoadMemFromFileCmd_t_pb2
-from pyliner.python_pb import MM_EepromWriteDisCmd_t_pb2
-from pyliner.python_pb import MM_LookupSymCmd_t_pb2
-from pyliner.python_pb import MM_FillMemCmd_t_pb2
-from pyliner.python_pb import MM_PokeCmd_t_pb2
-from pyliner.python_pb import MM_LoadMemWIDCmd_t_pb2
-from pyliner.python_pb import MM_DumpMemToFileCmd_t_pb2
-from pyliner.python_pb import MM_SymTblToFileCmd_t_pb2
-from pyliner.python_pb import LGC_ConfigTbl_t_pb2
-from pyliner.python_pb import LGC_CurrentValueTable_t_pb2
-from pyliner.python_pb import LGC_HkTlm_t_pb2
-from pyliner.python_pb import RGBLED_Device_Settings_t_pb2
-from pyliner.python_pb import RGBLED_CurrentValueTable_t_pb2
-from pyliner.python_pb import RGBLED_HkTlm_t_pb2
-from pyliner.python_pb import RGBLED_AppCustomData_t_pb2
-from pyliner.python_pb import CFE_ES_AppNameCmd_t_pb2
-from pyliner.python_pb import CFE_ES_CDSVariables_t_pb2
-from pyliner.python_pb import CFE_TIME_StateCmd_t_pb2
-from pyliner.python_pb import CFE_TBL_BufParams_t_pb2
-from pyliner.python_pb import CFE_TBL_CallbackFuncPtr_t_pb2
-from pyliner.python_pb import CFE_SB_Msg_t_pb2
-from pyliner.python_pb import CFE_ES_PerfLogDump_t_pb2
-from pyliner.python_pb import CFE_EVS_AppDataCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_FS_Decompress_State_t_pb2
-from pyliner.python_pb import CFE_SB_CmdHdr_t_pb2
-from pyliner.python_pb import CFE_SB_RoutingFileEntry_t_pb2
-from pyliner.python_pb import CFE_EVS_TlmPkt_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_OneAppTlm_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_SetMaxPRCountCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_PerfStopCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_CDSPool_t_pb2
-from pyliner.python_pb import CFE_ES_AppReloadCmd_t_pb2
-from pyliner.python_pb import CFE_EVS_AppNameCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_StartAppCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_EVS_GlobalData_t_pb2
-from pyliner.python_pb import CFE_TIME_LeapsCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_CDS_RegRec_t_pb2
-from pyliner.python_pb import CFE_ES_QueryAllCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_ERLog_t_pb2
-from pyliner.python_pb import CFE_ES_QueryAllTasksCmd_t_pb2
-from pyliner.python_pb import CFE_ES_WriteERlogCmd_t_pb2
-from pyliner.python_pb import CFE_EVS_BitMaskCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_PerfDataEntry_t_pb2
-from pyliner.python_pb import CFE_SB_MsgPtr_t_pb2
-from pyliner.python_pb import CFE_ES_PerfMetaData_t_pb2
-from pyliner.python_pb import CFE_SB_MsgPayloadPtr_t_pb2
-from pyliner.python_pb import CFE_SB_Qos_t_pb2
-from pyliner.python_pb import CFE_EVS_AppNameBitMaskCmd_t_pb2
-from pyliner.python_pb import CFE_EVS_AppDataCmd_t_pb2
-from pyliner.python_pb import CFE_TBL_DumpCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_PerfSetTrigMaskCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_ResetVariables_t_pb2
-from pyliner.python_pb import CFE_EVS_BitMaskCmd_t_pb2
-from pyliner.python_pb import CFE_ES_OverWriteSysLogCmd_t_pb2
-from pyliner.python_pb import CFE_PSP_MemTable_t_pb2
-from pyliner.python_pb import CFE_EVS_AppNameEventIDCmd_t_pb2
-from pyliner.python_pb import CFE_SB_EventBuf_t_pb2
-from pyliner.python_pb import CFE_TBL_Info_t_pb2
-from pyliner.python_pb import CFE_ES_PerfStopCmd_t_pb2
-from pyliner.python_pb import CFE_ES_AppState_t_pb2
-from pyliner.python_pb import CFE_ES_QueryAllCmd_t_pb2
-from pyliner.python_pb import CFE_ES_MainTaskInfo_t_pb2
-from pyliner.python_pb import CFE_SB_EnRoutCmd_t_pb2
-from pyliner.python_pb import CFE_SB_SenderId_t_pb2
-from pyliner.python_pb import CFE_TIME_SignalCmd_t_pb2
-from pyliner.python_pb import CFE_EVS_ModeCmd_t_pb2
-from pyliner.python_pb import CFE_TBL_ActivateCmd_t_pb2
-from pyliner.python_pb import CFE_EVS_LogFileCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_PerfStartCmd_t_pb2
-from pyliner.python_pb import CFE_TIME_SignalCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_EVS_AppNameEventIDMaskCmd_t_pb2
-from pyliner.python_pb import CFE_TBL_RegistryRec_t_pb2
-from pyliner.python_pb import CFE_TIME_NoArgsCmd_t_pb2
-from pyliner.python_pb import CFE_TBL_TlmRegCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_TIME_TaskData_t_pb2
-from pyliner.python_pb import CFE_ES_WriteERlogCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_TIME_HkPacket_Payload_t_pb2
-from pyliner.python_pb import CFE_TBL_LoadBuff_t_pb2
-from pyliner.python_pb import CFE_ES_PoolStatsTlm_t_pb2
-from pyliner.python_pb import CFE_ES_QueryAllTasksCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_RestartCmd_t_pb2
-from pyliner.python_pb import CFE_TBL_HkPacket_Payload_t_pb2
-from pyliner.python_pb import CFE_EVS_Packet_Payload_t_pb2
-from pyliner.python_pb import CFE_EVS_AppDataFile_t_pb2
-from pyliner.python_pb import CFE_TIME_SysTime_t_pb2
-from pyliner.python_pb import CFE_TIME_DiagPacket_Payload_t_pb2
-from pyliner.python_pb import CFE_TBL_TblRegPacket_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_OverWriteSysLogCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_SB_StatMsg_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_MemPoolStats_t_pb2
-from pyliner.python_pb import CFE_SB_WriteFileInfoCmd_t_pb2
-from pyliner.python_pb import CFE_TBL_ValidateCmd_t_pb2
-from pyliner.python_pb import CFE_ES_PoolStatsTlm_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_DeleteCDSCmd_t_pb2
-from pyliner.python_pb import CFE_SB_ZeroCopyD_t_pb2
-from pyliner.python_pb import CFE_SB_BufferD_t_pb2
-from pyliner.python_pb import CFE_TIME_SynchCallbackRegEntry_t_pb2
-from pyliner.python_pb import CFE_ES_NoArgsCmd_t_pb2
-from pyliner.python_pb import CFE_EVS_AppNameEventIDCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_TIME_FakeToneCmd_t_pb2
-from pyliner.python_pb import CFE_ES_TaskInfo_t_pb2
-from pyliner.python_pb import CFE_TBL_NotifyCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_EVS_PacketID_t_pb2
-from pyliner.python_pb import CFE_FS_t_pb2
-from pyliner.python_pb import CFE_PSP_ExceptionContext_t_pb2
-from pyliner.python_pb import CFE_TBL_DelCDSCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_AppInfo_t_pb2
-from pyliner.python_pb import CFE_ES_StartAppCmd_t_pb2
-from pyliner.python_pb import CFE_ES_ShellCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_TaskRecord_t_pb2
-from pyliner.python_pb import CFE_ES_CDSRegDumpRec_t_pb2
-from pyliner.python_pb import CFE_SB_MsgMapFileEntry_t_pb2
-from pyliner.python_pb import CFE_TBL_NotifyCmd_t_pb2
-from pyliner.python_pb import CFE_ES_EarlyInitFuncPtr_t_pb2
-from pyliner.python_pb import CFE_TBL_AccessDescriptor_t_pb2
-from pyliner.python_pb import CFE_ES_LibRecord_t_pb2
-from pyliner.python_pb import CFE_SB_TlmHdr_t_pb2
-from pyliner.python_pb import CFE_TIME_ResetVars_t_pb2
-from pyliner.python_pb import CFE_TBL_MsgProcFuncPtr_t_pb2
-from pyliner.python_pb import CFE_TBL_CritRegRec_t_pb2
-from pyliner.python_pb import CFE_ES_DeleteCDSCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_EVS_LogFileCmd_t_pb2
-from pyliner.python_pb import CFE_ES_AppNameCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_TIME_TimeCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_DumpCDSRegCmd_t_pb2
-from pyliner.python_pb import CFE_EVS_AppNameBitMaskCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_AppRecord_t_pb2
-from pyliner.python_pb import CFE_SB_StatMsg_t_pb2
-from pyliner.python_pb import CFE_TBL_DumpControl_t_pb2
-from pyliner.python_pb import CFE_SB_RouteEntry_t_pb2
-from pyliner.python_pb import CFE_ES_DumpCDSRegCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_BlockStats_t_pb2
-from pyliner.python_pb import CFE_PSP_CommandData_t_pb2
-from pyliner.python_pb import CFE_TIME_SynchCallbackPtr_t_pb2
-from pyliner.python_pb import CFE_SB_MemParams_t_pb2
-from pyliner.python_pb import CFE_SB_PrevSubMsg_t_pb2
-from pyliner.python_pb import CFE_EVS_Log_t_pb2
-from pyliner.python_pb import CFE_TBL_DumpRegCmd_t_pb2
-from pyliner.python_pb import CFE_SB_EnRoutCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_WriteSyslogCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_ResetData_t_pb2
-from pyliner.python_pb import CFE_ES_PerfSetFilterMaskCmd_t_pb2
-from pyliner.python_pb import CFE_ES_PerfStartCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_EVS_AppNameEventIDMaskCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_ShellPacket_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_PerfData_t_pb2
-from pyliner.python_pb import CFE_FS_Header_t_pb2
-from pyliner.python_pb import CFE_TBL_ValidationResult_t_pb2
-from pyliner.python_pb import CFE_ES_AppStartParams_t_pb2
-from pyliner.python_pb import CFE_TBL_TaskData_t_pb2
-from pyliner.python_pb import CFE_ES_ShellCmd_t_pb2
-from pyliner.python_pb import CFE_TBL_HkPacket_t_pb2
-from pyliner.python_pb import CFE_TIME_SourceCmd_t_pb2
-from pyliner.python_pb import CFE_ES_TlmPoolStatsCmd_t_pb2
-from pyliner.python_pb import CFE_SB_HKMsg_t_pb2
-from pyliner.python_pb import CFE_ES_GenCounterRecord_t_pb2
-from pyliner.python_pb import CFE_SB_SendErrEventBuf_t_pb2
-from pyliner.python_pb import CFE_TIME_1HzAdjCmd_t_pb2
-from pyliner.python_pb import CFE_SB_SubEntries_t_pb2
-from pyliner.python_pb import CFE_ES_CDSBlockSizeDesc_t_pb2
-from pyliner.python_pb import CFE_TIME_1HzCmd_t_pb2
-from pyliner.python_pb import CFE_TIME_StateCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_TIME_ToneDataCmd_t_pb2
-from pyliner.python_pb import CFE_EVS_AppNameCmd_t_pb2
-from pyliner.python_pb import CFE_ES_HkPacket_t_pb2
-from pyliner.python_pb import CFE_SB_PrevSubMsg_Payload_t_pb2
-from pyliner.python_pb import CFE_TIME_HkPacket_t_pb2
-from pyliner.python_pb import CFE_TBL_NoArgsCmd_t_pb2
-from pyliner.python_pb import CFE_SB_WriteFileInfoCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_WriteSyslogCmd_t_pb2
-from pyliner.python_pb import CFE_TIME_Reference_t_pb2
-from pyliner.python_pb import CFE_TBL_DumpRegCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_TBL_AbortLdCmd_t_pb2
-from pyliner.python_pb import CFE_SB_PipeD_t_pb2
-from pyliner.python_pb import CFE_ES_Global_t_pb2
-from pyliner.python_pb import CFE_ES_FuncPtrUnion_t_pb2
-from pyliner.python_pb import CFE_TBL_RegDumpRec_t_pb2
-from pyliner.python_pb import CFE_ES_PerfSetFilterMaskCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_PerfSetTrigMaskCmd_t_pb2
-from pyliner.python_pb import CFE_ES_ChildTaskMainFuncPtr_t_pb2
-from pyliner.python_pb import CFE_ES_TaskData_t_pb2
-from pyliner.python_pb import CFE_TBL_AbortLdCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_EVS_TlmPkt_t_pb2
-from pyliner.python_pb import CFE_TIME_TimeCmd_t_pb2
-from pyliner.python_pb import CFE_ES_AppReloadCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_SB_SubRprtMsg_Payload_t_pb2
-from pyliner.python_pb import CFE_TIME_1HzAdjCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_PSP_GlobalData_t_pb2
-from pyliner.python_pb import CFE_ES_ObjectTable_t_pb2
-from pyliner.python_pb import CFE_EVS_Packet_t_pb2
-from pyliner.python_pb import CFE_TBL_DelCDSCmd_t_pb2
-from pyliner.python_pb import CFE_ES_HkPacket_Payload_t_pb2
-from pyliner.python_pb import CFE_TIME_LeapsCmd_t_pb2
-from pyliner.python_pb import CFE_TIME_SourceCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_EVS_AppTlmData_t_pb2
-from pyliner.python_pb import CFE_ES_SetMaxPRCountCmd_t_pb2
-from pyliner.python_pb import CFE_SB_HKMsg_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_DebugVariables_t_pb2
-from pyliner.python_pb import CFE_TBL_TblRegPacket_t_pb2
-from pyliner.python_pb import CFE_TIME_DiagPacket_t_pb2
-from pyliner.python_pb import CFE_ES_OneAppTlm_t_pb2
-from pyliner.python_pb import CFE_ES_ShellPacket_t_pb2
-from pyliner.python_pb import CFE_TBL_File_Hdr_t_pb2
-from pyliner.python_pb import CFE_TIME_ToneSignalCmd_t_pb2
-from pyliner.python_pb import CFE_TIME_ToneDataCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_LibraryEntryFuncPtr_t_pb2
-from pyliner.python_pb import CFE_ES_TlmPoolStatsCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_ES_RestartCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_TBL_DumpCmd_t_pb2
-from pyliner.python_pb import CFE_SB_PipeDepthStats_t_pb2
-from pyliner.python_pb import CFE_SB_SubRprtMsg_t_pb2
-from pyliner.python_pb import CFE_TBL_CmdHandlerTblRec_t_pb2
-from pyliner.python_pb import CFE_TBL_LoadCmd_t_pb2
-from pyliner.python_pb import CFE_TBL_LoadCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_SB_DestinationD_t_pb2
-from pyliner.python_pb import CFE_ES_MainAppFuncPtr_t_pb2
-from pyliner.python_pb import CFE_ES_CDSBlockDesc_t_pb2
-from pyliner.python_pb import CFE_EVS_BinFilter_t_pb2
-from pyliner.python_pb import CFE_TBL_ActivateCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_TBL_ValidateCmd_Payload_t_pb2
-from pyliner.python_pb import CFE_EVS_ModeCmd_Payload_t_pb2
-from pyliner.python_pb import HMC5883_Params_t_pb2
-from pyliner.python_pb import HMC5883_CalibrationMsg_t_pb2
-from pyliner.python_pb import HMC5883_AppCustomData_t_pb2
-from pyliner.python_pb import HMC5883_ConfigTbl_t_pb2
-from pyliner.python_pb import HMC5883_ConversionMsg_t_pb2
-from pyliner.python_pb import HMC5883_HkTlm_t_pb2
-from pyliner.python_pb import HMC5883_DiagPacket_t_pb2
-from pyliner.python_pb import MAC_CurrentValueTable_t_pb2
-from pyliner.python_pb import MAC_HkTlm_t_pb2
-from pyliner.python_pb import MAC_ParamTbl_t_pb2
-from pyliner.python_pb import MAC_Params_t_pb2
-from pyliner.python_pb import MS5611_HkTlm_t_pb2
-from pyliner.python_pb import MS5611_ConfigTbl_t_pb2
-from pyliner.python_pb import MS5611_DiagPacket_t_pb2
-from pyliner.python_pb import MS5611_Params_t_pb2
-from pyliner.python_pb import MS5611_AppCustomData_t_pb2
-from pyliner.python_pb import SC_RtsCmd_t_pb2
-from pyliner.python_pb import SC_SetContinueAtsOnFailureCmd_t_pb2
-from pyliner.python_pb import SC_AtsInfoTable_t_pb2
-from pyliner.python_pb import SC_HkTlm_t_pb2
-from pyliner.python_pb import SC_AtpControlBlock_t_pb2
-from pyliner.python_pb import SC_RtsEntryHeader_t_pb2
-from pyliner.python_pb import SC_OperData_t_pb2
-from pyliner.python_pb import SC_AtsEntryHeader_t_pb2
-from pyliner.python_pb import SC_StartAtsCmd_t_pb2
-from pyliner.python_pb import SC_JumpAtsCmd_t_pb2
-from pyliner.python_pb import SC_RtsInfoEntry_t_pb2
-from pyliner.python_pb import SC_AppendAtsCmd_t_pb2
-from pyliner.python_pb import SC_RtsGrpCmd_t_pb2
-from pyliner.python_pb import SC_AppData_t_pb2
-from pyliner.python_pb import SC_RtpControlBlock_t_pb2
-from pyliner.python_pb import SENS_ConfigTbl_t_pb2
-from pyliner.python_pb import SENS_CurrentValueTable_t_pb2
-from pyliner.python_pb import SENS_HkTlm_t_pb2
-from pyliner.python_pb import SCH_DeadlineTable_t_pb2
-from pyliner.python_pb import SCH_ScheduleEntry_t_pb2
-from pyliner.python_pb import SCH_HkPacket_t_pb2
-from pyliner.python_pb import SCH_LibData_t_pb2
-from pyliner.python_pb import SCH_ActivityDeadlineStatus_t_pb2
-from pyliner.python_pb import SCH_SlotDeadlineStatus_t_pb2
-from pyliner.python_pb import SCH_MessageEntry_t_pb2
-from pyliner.python_pb import SCH_GroupCmd_t_pb2
-from pyliner.python_pb import SCH_EntryCmd_t_pb2
-from pyliner.python_pb import SCH_ActivityDoneMsg_t_pb2
-from pyliner.python_pb import SCH_AppData_t_pb2
-from pyliner.python_pb import SCH_DiagPacket_t_pb2
+from pyliner.proto_registry import MessageRegistry
 
+BUNDLE = join(dirname(__file__), 'pyliner_msgs.desc')
 
-proto_msg_map = {
-    "BAT_HkTlm_t": BAT_HkTlm_t_pb2.BAT_HkTlm_t_pb,
-    "BAT_CurrentValueTable_t": BAT_CurrentValueTable_t_pb2.BAT_CurrentValueTable_t_pb,
-    "BAT_ConfigTbl_t": BAT_ConfigTbl_t_pb2.BAT_ConfigTbl_t_pb,
-    "RCIN_HkTlm_t": RCIN_HkTlm_t_pb2.RCIN_HkTlm_t_pb,
-    "RCIN_CustomData_t": RCIN_CustomData_t_pb2.RCIN_CustomData_t_pb,
-    "RCIN_Custom_JoystickChannelMapping_t": RCIN_Custom_JoystickChannelMapping_t_pb2.RCIN_Custom_JoystickChannelMapping_t_pb,
-    "HS_MATEntry_t": HS_MATEntry_t_pb2.HS_MATEntry_t_pb,
-    "HS_EMTEntry_t": HS_EMTEntry_t_pb2.HS_EMTEntry_t_pb,
-    "HS_CDSData_t": HS_CDSData_t_pb2.HS_CDSData_t_pb,
-    "HS_XCTEntry_t": HS_XCTEntry_t_pb2.HS_XCTEntry_t_pb,
-    "HS_HkPacket_t": HS_HkPacket_t_pb2.HS_HkPacket_t_pb,
-    "HS_SetUtilParamsCmd_t": HS_SetUtilParamsCmd_t_pb2.HS_SetUtilParamsCmd_t_pb,
-    "HS_CustomData_t": HS_CustomData_t_pb2.HS_CustomData_t_pb,
-    "HS_SetUtilDiagCmd_t": HS_SetUtilDiagCmd_t_pb2.HS_SetUtilDiagCmd_t_pb,
-    "HS_AMTEntry_t": HS_AMTEntry_t_pb2.HS_AMTEntry_t_pb,
-    "HS_AppData_t": HS_AppData_t_pb2.HS_AppData_t_pb,
-    "HS_SetMaxResetsCmd_t": HS_SetMaxResetsCmd_t_pb2.HS_SetMaxResetsCmd_t_pb,
-    "SIMLIB_PressureAltitudeData_t": SIMLIB_PressureAltitudeData_t_pb2.SIMLIB_PressureAltitudeData_t_pb,
-    "SIMLIB_LibData_t": SIMLIB_LibData_t_pb2.SIMLIB_LibData_t_pb,
-    "SIMLIB_ActuatorControlsData_t": SIMLIB_ActuatorControlsData_t_pb2.SIMLIB_ActuatorControlsData_t_pb,
-    "SIMLIB_AccelData_t": SIMLIB_AccelData_t_pb2.SIMLIB_AccelData_t_pb,
-    "SIMLIB_DistanceSensorData_t": SIMLIB_DistanceSensorData_t_pb2.SIMLIB_DistanceSensorData_t_pb,
-    "SIMLIB_MagData_t": SIMLIB_MagData_t_pb2.SIMLIB_MagData_t_pb,
-    "SIMLIB_TemperatureData_t": SIMLIB_TemperatureData_t_pb2.SIMLIB_TemperatureData_t_pb,
-    "SIMLIB_DiffPressureData_t": SIMLIB_DiffPressureData_t_pb2.SIMLIB_DiffPressureData_t_pb,
-    "SIMLIB_GyroData_t": SIMLIB_GyroData_t_pb2.SIMLIB_GyroData_t_pb,
-    "SIMLIB_RCInputData_t": SIMLIB_RCInputData_t_pb2.SIMLIB_RCInputData_t_pb,
-    "SIMLIB_GPSData_t": SIMLIB_GPSData_t_pb2.SIMLIB_GPSData_t_pb,
-    "QAE_ConfigTbl_t": QAE_ConfigTbl_t_pb2.QAE_ConfigTbl_t_pb,
-    "QAE_CurrentValueTable_t": QAE_CurrentValueTable_t_pb2.QAE_CurrentValueTable_t_pb,
-    "QAE_HkTlm_t": QAE_HkTlm_t_pb2.QAE_HkTlm_t_pb,
-    "QAE_Params_t": QAE_Params_t_pb2.QAE_Params_t_pb,
-    "HK_AppData_t": HK_AppData_t_pb2.HK_AppData_t_pb,
-    "HK_HkPacket_t": HK_HkPacket_t_pb2.HK_HkPacket_t_pb,
-    "MPC_HkTlm_t": MPC_HkTlm_t_pb2.MPC_HkTlm_t_pb,
-    "MPC_ConfigTbl_t": MPC_ConfigTbl_t_pb2.MPC_ConfigTbl_t_pb,
-    "NAV_HkTlm_t": NAV_HkTlm_t_pb2.NAV_HkTlm_t_pb,
-    "NAV_Params_t": NAV_Params_t_pb2.NAV_Params_t_pb,
-    "NAV_ConfigTbl_t": NAV_ConfigTbl_t_pb2.NAV_ConfigTbl_t_pb,
-    "NAV_MissionItem_t": NAV_MissionItem_t_pb2.NAV_MissionItem_t_pb,
-    "NAV_CurrentValueTable_t": NAV_CurrentValueTable_t_pb2.NAV_CurrentValueTable_t_pb,
-    "FM_MoveFileCmd_t": FM_MoveFileCmd_t_pb2.FM_MoveFileCmd_t_pb,
-    "FM_FileInfoPkt_t": FM_FileInfoPkt_t_pb2.FM_FileInfoPkt_t_pb,
-    "FM_TableEntry_t": FM_TableEntry_t_pb2.FM_TableEntry_t_pb,
-    "FM_SetPermCmd_t": FM_SetPermCmd_t_pb2.FM_SetPermCmd_t_pb,
-    "FM_CopyFileCmd_t": FM_CopyFileCmd_t_pb2.FM_CopyFileCmd_t_pb,
-    "FM_ConcatCmd_t": FM_ConcatCmd_t_pb2.FM_ConcatCmd_t_pb,
-    "FM_GetDirPktCmd_t": FM_GetDirPktCmd_t_pb2.FM_GetDirPktCmd_t_pb,
-    "FM_OpenFilesEntry_t": FM_OpenFilesEntry_t_pb2.FM_OpenFilesEntry_t_pb,
-    "FM_DirListPkt_t": FM_DirListPkt_t_pb2.FM_DirListPkt_t_pb,
-    "FM_ChildQueueEntry_t": FM_ChildQueueEntry_t_pb2.FM_ChildQueueEntry_t_pb,
-    "FM_DeleteAllCmd_t": FM_DeleteAllCmd_t_pb2.FM_DeleteAllCmd_t_pb,
-    "FM_DeleteDirCmd_t": FM_DeleteDirCmd_t_pb2.FM_DeleteDirCmd_t_pb,
-    "FM_DeleteFileCmd_t": FM_DeleteFileCmd_t_pb2.FM_DeleteFileCmd_t_pb,
-    "FM_RenameFileCmd_t": FM_RenameFileCmd_t_pb2.FM_RenameFileCmd_t_pb,
-    "FM_GlobalData_t": FM_GlobalData_t_pb2.FM_GlobalData_t_pb,
-    "FM_DirListFileStats_t": FM_DirListFileStats_t_pb2.FM_DirListFileStats_t_pb,
-    "FM_HousekeepingPkt_t": FM_HousekeepingPkt_t_pb2.FM_HousekeepingPkt_t_pb,
-    "FM_OpenFilesPkt_t": FM_OpenFilesPkt_t_pb2.FM_OpenFilesPkt_t_pb,
-    "FM_DirListEntry_t": FM_DirListEntry_t_pb2.FM_DirListEntry_t_pb,
-    "FM_DecompressCmd_t": FM_DecompressCmd_t_pb2.FM_DecompressCmd_t_pb,
-    "FM_FreeSpacePktEntry_t": FM_FreeSpacePktEntry_t_pb2.FM_FreeSpacePktEntry_t_pb,
-    "FM_FreeSpaceTable_t": FM_FreeSpaceTable_t_pb2.FM_FreeSpaceTable_t_pb,
-    "FM_GetFileInfoCmd_t": FM_GetFileInfoCmd_t_pb2.FM_GetFileInfoCmd_t_pb,
-    "FM_GetDirFileCmd_t": FM_GetDirFileCmd_t_pb2.FM_GetDirFileCmd_t_pb,
-    "FM_FreeSpacePkt_t": FM_FreeSpacePkt_t_pb2.FM_FreeSpacePkt_t_pb,
-    "FM_CreateDirCmd_t": FM_CreateDirCmd_t_pb2.FM_CreateDirCmd_t_pb,
-    "FM_SetTableStateCmd_t": FM_SetTableStateCmd_t_pb2.FM_SetTableStateCmd_t_pb,
-    "SIM_HkTlm_t": SIM_HkTlm_t_pb2.SIM_HkTlm_t_pb,
-    "SIM_ConfigTbl_t": SIM_ConfigTbl_t_pb2.SIM_ConfigTbl_t_pb,
-    "LD_HkTlm_t": LD_HkTlm_t_pb2.LD_HkTlm_t_pb,
-    "LD_Params_t": LD_Params_t_pb2.LD_Params_t_pb,
-    "LD_CurrentValueTable_t": LD_CurrentValueTable_t_pb2.LD_CurrentValueTable_t_pb,
-    "LD_ConfigTbl_t": LD_ConfigTbl_t_pb2.LD_ConfigTbl_t_pb,
-    "LC_HkPacket_t": LC_HkPacket_t_pb2.LC_HkPacket_t_pb,
-    "LC_SetAPPermOff_t": LC_SetAPPermOff_t_pb2.LC_SetAPPermOff_t_pb,
-    "LC_ResetWPStats_t": LC_ResetWPStats_t_pb2.LC_ResetWPStats_t_pb,
-    "LC_ADTEntry_t": LC_ADTEntry_t_pb2.LC_ADTEntry_t_pb,
-    "LC_MessageList_t": LC_MessageList_t_pb2.LC_MessageList_t_pb,
-    "LC_WDTEntry_t": LC_WDTEntry_t_pb2.LC_WDTEntry_t_pb,
-    "LC_WRTTransition_t": LC_WRTTransition_t_pb2.LC_WRTTransition_t_pb,
-    "LC_MListTag": LC_MListTag_pb2.LC_MListTag_pb,
-    "LC_SampleAP_t": LC_SampleAP_t_pb2.LC_SampleAP_t_pb,
-    "LC_SetLCState_t": LC_SetLCState_t_pb2.LC_SetLCState_t_pb,
-    "LC_AppData_t": LC_AppData_t_pb2.LC_AppData_t_pb,
-    "LC_WListTag": LC_WListTag_pb2.LC_WListTag_pb,
-    "LC_ResetAPStats_t": LC_ResetAPStats_t_pb2.LC_ResetAPStats_t_pb,
-    "LC_WRTEntry_t": LC_WRTEntry_t_pb2.LC_WRTEntry_t_pb,
-    "LC_SetAPState_t": LC_SetAPState_t_pb2.LC_SetAPState_t_pb,
-    "LC_ARTEntry_t": LC_ARTEntry_t_pb2.LC_ARTEntry_t_pb,
-    "LC_MultiType_t": LC_MultiType_t_pb2.LC_MultiType_t_pb,
-    "LC_WatchPtList_t": LC_WatchPtList_t_pb2.LC_WatchPtList_t_pb,
-    "LC_OperData_t": LC_OperData_t_pb2.LC_OperData_t_pb,
-    "AMC_HkTlm_t": AMC_HkTlm_t_pb2.AMC_HkTlm_t_pb,
-    "AMC_CurrentValueTable_t": AMC_CurrentValueTable_t_pb2.AMC_CurrentValueTable_t_pb,
-    "AMC_PwmConfigTbl_t": AMC_PwmConfigTbl_t_pb2.AMC_PwmConfigTbl_t_pb,
-    "DS_AppFileStatus_t": DS_AppFileStatus_t_pb2.DS_AppFileStatus_t_pb,
-    "DS_DestSizeCmd_t": DS_DestSizeCmd_t_pb2.DS_DestSizeCmd_t_pb,
-    "DS_CloseFileCmd_t": DS_CloseFileCmd_t_pb2.DS_CloseFileCmd_t_pb,
-    "DS_AddMidCmd_t": DS_AddMidCmd_t_pb2.DS_AddMidCmd_t_pb,
-    "DS_AppStateCmd_t": DS_AppStateCmd_t_pb2.DS_AppStateCmd_t_pb,
-    "DS_FileInfoPkt_t": DS_FileInfoPkt_t_pb2.DS_FileInfoPkt_t_pb,
-    "DS_DestTypeCmd_t": DS_DestTypeCmd_t_pb2.DS_DestTypeCmd_t_pb,
-    "DS_FilterParmsCmd_t": DS_FilterParmsCmd_t_pb2.DS_FilterParmsCmd_t_pb,
-    "DS_AppData_t": DS_AppData_t_pb2.DS_AppData_t_pb,
-    "DS_PacketEntry_t": DS_PacketEntry_t_pb2.DS_PacketEntry_t_pb,
-    "DS_HkPacket_t": DS_HkPacket_t_pb2.DS_HkPacket_t_pb,
-    "DS_DestExtCmd_t": DS_DestExtCmd_t_pb2.DS_DestExtCmd_t_pb,
-    "DS_DestBaseCmd_t": DS_DestBaseCmd_t_pb2.DS_DestBaseCmd_t_pb,
-    "DS_HashLink_t": DS_HashLink_t_pb2.DS_HashLink_t_pb,
-    "DS_DestCountCmd_t": DS_DestCountCmd_t_pb2.DS_DestCountCmd_t_pb,
-    "DS_DestStateCmd_t": DS_DestStateCmd_t_pb2.DS_DestStateCmd_t_pb,
-    "DS_DestPathCmd_t": DS_DestPathCmd_t_pb2.DS_DestPathCmd_t_pb,
-    "DS_HashTag": DS_HashTag_pb2.DS_HashTag_pb,
-    "DS_DestFileTable_t": DS_DestFileTable_t_pb2.DS_DestFileTable_t_pb,
-    "DS_FilterTable_t": DS_FilterTable_t_pb2.DS_FilterTable_t_pb,
-    "DS_FileInfo_t": DS_FileInfo_t_pb2.DS_FileInfo_t_pb,
-    "DS_FilterParms_t": DS_FilterParms_t_pb2.DS_FilterParms_t_pb,
-    "DS_FilterTypeCmd_t": DS_FilterTypeCmd_t_pb2.DS_FilterTypeCmd_t_pb,
-    "DS_FilterFileCmd_t": DS_FilterFileCmd_t_pb2.DS_FilterFileCmd_t_pb,
-    "DS_FileHeader_t": DS_FileHeader_t_pb2.DS_FileHeader_t_pb,
-    "DS_DestAgeCmd_t": DS_DestAgeCmd_t_pb2.DS_DestAgeCmd_t_pb,
-    "DS_DestFileEntry_t": DS_DestFileEntry_t_pb2.DS_DestFileEntry_t_pb,
-    "TO_OutData_t": TO_OutData_t_pb2.TO_OutData_t_pb,
-    "TO_MessageFlowDiagTlm_t": TO_MessageFlowDiagTlm_t_pb2.TO_MessageFlowDiagTlm_t_pb,
-    "TO_RemoveMessageFlowCmd_t": TO_RemoveMessageFlowCmd_t_pb2.TO_RemoveMessageFlowCmd_t_pb,
-    "TO_OutputQueue_t": TO_OutputQueue_t_pb2.TO_OutputQueue_t_pb,
-    "TO_DisableChannelCmd_t": TO_DisableChannelCmd_t_pb2.TO_DisableChannelCmd_t_pb,
-    "TO_PriorityQueue_t": TO_PriorityQueue_t_pb2.TO_PriorityQueue_t_pb,
-    "TO_ChannelDiagTlm_t": TO_ChannelDiagTlm_t_pb2.TO_ChannelDiagTlm_t_pb,
-    "TO_AddMessageFlowCmd_t": TO_AddMessageFlowCmd_t_pb2.TO_AddMessageFlowCmd_t_pb,
-    "TO_AppCustomData_t": TO_AppCustomData_t_pb2.TO_AppCustomData_t_pb,
-    "TO_EnableChannelCmd_t": TO_EnableChannelCmd_t_pb2.TO_EnableChannelCmd_t_pb,
-    "TO_QueryMessageFlowCmd_t": TO_QueryMessageFlowCmd_t_pb2.TO_QueryMessageFlowCmd_t_pb,
-    "TO_SendDiagCmd_t": TO_SendDiagCmd_t_pb2.TO_SendDiagCmd_t_pb,
-    "TO_ChannelTbl_t": TO_ChannelTbl_t_pb2.TO_ChannelTbl_t_pb,
-    "TO_AppData_t": TO_AppData_t_pb2.TO_AppData_t_pb,
-    "TO_QueryOutputChannelCmd_t": TO_QueryOutputChannelCmd_t_pb2.TO_QueryOutputChannelCmd_t_pb,
-    "TO_TlmChannels_t": TO_TlmChannels_t_pb2.TO_TlmChannels_t_pb,
-    "TO_ChannelDumpTbl_t": TO_ChannelDumpTbl_t_pb2.TO_ChannelDumpTbl_t_pb,
-    "TO_QueryPriorityQueueCmd_t": TO_QueryPriorityQueueCmd_t_pb2.TO_QueryPriorityQueueCmd_t_pb,
-    "TO_MessageFlow_t": TO_MessageFlow_t_pb2.TO_MessageFlow_t_pb,
-    "TO_MessageFlowMetrics_t": TO_MessageFlowMetrics_t_pb2.TO_MessageFlowMetrics_t_pb,
-    "TO_PriorityQueueMetrics_t": TO_PriorityQueueMetrics_t_pb2.TO_PriorityQueueMetrics_t_pb,
-    "TO_OutputQueueDiagTlm_t": TO_OutputQueueDiagTlm_t_pb2.TO_OutputQueueDiagTlm_t_pb,
-    "TO_PriorityDiagTlm_t": TO_PriorityDiagTlm_t_pb2.TO_PriorityDiagTlm_t_pb,
-    "TO_InData_t": TO_InData_t_pb2.TO_InData_t_pb,
-    "TO_ChannelData_t": TO_ChannelData_t_pb2.TO_ChannelData_t_pb,
-    "TO_HkTlm_t": TO_HkTlm_t_pb2.TO_HkTlm_t_pb,
-    "PE_ConfigTbl_t": PE_ConfigTbl_t_pb2.PE_ConfigTbl_t_pb,
-    "PE_Params_t": PE_Params_t_pb2.PE_Params_t_pb,
-    "PE_HkTlm_t": PE_HkTlm_t_pb2.PE_HkTlm_t_pb,
-    "MPU9250_HkTlm_t": MPU9250_HkTlm_t_pb2.MPU9250_HkTlm_t_pb,
-    "MPU9250_Params_t": MPU9250_Params_t_pb2.MPU9250_Params_t_pb,
-    "MPU9250_CalibrationMsg_t": MPU9250_CalibrationMsg_t_pb2.MPU9250_CalibrationMsg_t_pb,
-    "MPU9250_DiagPacket_t": MPU9250_DiagPacket_t_pb2.MPU9250_DiagPacket_t_pb,
-    "MPU9250_ConversionMsg_t": MPU9250_ConversionMsg_t_pb2.MPU9250_ConversionMsg_t_pb,
-    "MPU9250_ConfigTbl_t": MPU9250_ConfigTbl_t_pb2.MPU9250_ConfigTbl_t_pb,
-    "CI_CmdRegData_t": CI_CmdRegData_t_pb2.CI_CmdRegData_t_pb,
-    "CI_InData_t": CI_InData_t_pb2.CI_InData_t_pb,
-    "CI_CdsTbl_t": CI_CdsTbl_t_pb2.CI_CdsTbl_t_pb,
-    "CI_TimeoutTblEntry_t": CI_TimeoutTblEntry_t_pb2.CI_TimeoutTblEntry_t_pb,
-    "CI_AppData_t": CI_AppData_t_pb2.CI_AppData_t_pb,
-    "CI_CmdAuthData_t": CI_CmdAuthData_t_pb2.CI_CmdAuthData_t_pb,
-    "CI_ConfigTblEntry_t": CI_ConfigTblEntry_t_pb2.CI_ConfigTblEntry_t_pb,
-    "CI_OutData_t": CI_OutData_t_pb2.CI_OutData_t_pb,
-    "CI_CmdData_t": CI_CmdData_t_pb2.CI_CmdData_t_pb,
-    "CI_HkTlm_t": CI_HkTlm_t_pb2.CI_HkTlm_t_pb,
-    "CI_AppCustomData_t": CI_AppCustomData_t_pb2.CI_AppCustomData_t_pb,
-    "VC_AppCustomDevice_t": VC_AppCustomDevice_t_pb2.VC_AppCustomDevice_t_pb,
-    "VC_HkTlm_t": VC_HkTlm_t_pb2.VC_HkTlm_t_pb,
-    "VC_Transmit_Handle_t": VC_Transmit_Handle_t_pb2.VC_Transmit_Handle_t_pb,
-    "VC_AppData_t": VC_AppData_t_pb2.VC_AppData_t_pb,
-    "VC_Device_Handle_t": VC_Device_Handle_t_pb2.VC_Device_Handle_t_pb,
-    "VC_StartStreamCmd_t": VC_StartStreamCmd_t_pb2.VC_StartStreamCmd_t_pb,
-    "VC_AppCustomData_t": VC_AppCustomData_t_pb2.VC_AppCustomData_t_pb,
-    "ULR_ConfigTbl_t": ULR_ConfigTbl_t_pb2.ULR_ConfigTbl_t_pb,
-    "ULR_HkTlm_t": ULR_HkTlm_t_pb2.ULR_HkTlm_t_pb,
-    "ULR_UartMessage_t": ULR_UartMessage_t_pb2.ULR_UartMessage_t_pb,
-    "EA_OutData_t": EA_OutData_t_pb2.EA_OutData_t_pb,
-    "EA_StartCmd_t": EA_StartCmd_t_pb2.EA_StartCmd_t_pb,
-    "EA_InData_t": EA_InData_t_pb2.EA_InData_t_pb,
-    "EA_HkTlm_t": EA_HkTlm_t_pb2.EA_HkTlm_t_pb,
-    "EA_CdsTbl_t": EA_CdsTbl_t_pb2.EA_CdsTbl_t_pb,
-    "EA_ProcData_t": EA_ProcData_t_pb2.EA_ProcData_t_pb,
-    "EA_ChildData_t": EA_ChildData_t_pb2.EA_ChildData_t_pb,
-    "EA_ConfigTblEntry_t": EA_ConfigTblEntry_t_pb2.EA_ConfigTblEntry_t_pb,
-    "EA_AppData_t": EA_AppData_t_pb2.EA_AppData_t_pb,
-    "VM_Params_t": VM_Params_t_pb2.VM_Params_t_pb,
-    "VM_HkTlm_t": VM_HkTlm_t_pb2.VM_HkTlm_t_pb,
-    "VM_ConfigTbl_t": VM_ConfigTbl_t_pb2.VM_ConfigTbl_t_pb,
-    "VM_Modes": VM_Modes_pb2.VM_Modes_pb,
-    "VM_StatusFlags": VM_StatusFlags_pb2.VM_StatusFlags_pb,
-    "PRMLIB_ParamTblData_t": PRMLIB_ParamTblData_t_pb2.PRMLIB_ParamTblData_t_pb,
-    "PRMLIB_ParamData_t": PRMLIB_ParamData_t_pb2.PRMLIB_ParamData_t_pb,
-    "PRMLIB_AppData_t": PRMLIB_AppData_t_pb2.PRMLIB_AppData_t_pb,
-    "PRMLIB_UpdatedParamMsg_t": PRMLIB_UpdatedParamMsg_t_pb2.PRMLIB_UpdatedParamMsg_t_pb,
-    "CF_QueueInfoFileEntry_t": CF_QueueInfoFileEntry_t_pb2.CF_QueueInfoFileEntry_t_pb,
-    "CF_Queue_t": CF_Queue_t_pb2.CF_Queue_t_pb,
-    "CF_QueueDirFiles_t": CF_QueueDirFiles_t_pb2.CF_QueueDirFiles_t_pb,
-    "CF_TransPacket_t": CF_TransPacket_t_pb2.CF_TransPacket_t_pb,
-    "CF_KickstartCmd_t": CF_KickstartCmd_t_pb2.CF_KickstartCmd_t_pb,
-    "CF_EnDisPollCmd_t": CF_EnDisPollCmd_t_pb2.CF_EnDisPollCmd_t_pb,
-    "CF_HkPacket_t": CF_HkPacket_t_pb2.CF_HkPacket_t_pb,
-    "CF_ChannelData_t": CF_ChannelData_t_pb2.CF_ChannelData_t_pb,
-    "CF_ConfigPacket_t": CF_ConfigPacket_t_pb2.CF_ConfigPacket_t_pb,
-    "CF_DequeueNodeCmd_t": CF_DequeueNodeCmd_t_pb2.CF_DequeueNodeCmd_t_pb,
-    "CF_CARSCmd_t": CF_CARSCmd_t_pb2.CF_CARSCmd_t_pb,
-    "CF_SetPollParamCmd_t": CF_SetPollParamCmd_t_pb2.CF_SetPollParamCmd_t_pb,
-    "CF_SetMibParam_t": CF_SetMibParam_t_pb2.CF_SetMibParam_t_pb,
-    "CF_MemParams_t": CF_MemParams_t_pb2.CF_MemParams_t_pb,
-    "CF_AutoSuspendEnCmd_t": CF_AutoSuspendEnCmd_t_pb2.CF_AutoSuspendEnCmd_t_pb,
-    "CF_EngTransStat_t": CF_EngTransStat_t_pb2.CF_EngTransStat_t_pb,
-    "CF_WriteQueueCmd_t": CF_WriteQueueCmd_t_pb2.CF_WriteQueueCmd_t_pb,
-    "CF_PurgeQueueCmd_t": CF_PurgeQueueCmd_t_pb2.CF_PurgeQueueCmd_t_pb,
-    "CF_AppData_t": CF_AppData_t_pb2.CF_AppData_t_pb,
-    "CF_GiveTakeCmd_t": CF_GiveTakeCmd_t_pb2.CF_GiveTakeCmd_t_pb,
-    "CF_GetMibParam_t": CF_GetMibParam_t_pb2.CF_GetMibParam_t_pb,
-    "CF_ResetCtrsCmd_t": CF_ResetCtrsCmd_t_pb2.CF_ResetCtrsCmd_t_pb,
-    "CF_WriteActiveTransCmd_t": CF_WriteActiveTransCmd_t_pb2.CF_WriteActiveTransCmd_t_pb,
-    "CF_QueueEntry_t": CF_QueueEntry_t_pb2.CF_QueueEntry_t_pb,
-    "CF_SendTransCmd_t": CF_SendTransCmd_t_pb2.CF_SendTransCmd_t_pb,
-    "CF_PlaybackDirCmd_t": CF_PlaybackDirCmd_t_pb2.CF_PlaybackDirCmd_t_pb,
-    "CF_QuickStatCmd_t": CF_QuickStatCmd_t_pb2.CF_QuickStatCmd_t_pb,
-    "CF_PlaybackFileCmd_t": CF_PlaybackFileCmd_t_pb2.CF_PlaybackFileCmd_t_pb,
-    "CF_PDU_Hdr_t": CF_PDU_Hdr_t_pb2.CF_PDU_Hdr_t_pb,
-    "CF_AppTransStat_t": CF_AppTransStat_t_pb2.CF_AppTransStat_t_pb,
-    "CF_EnDisDequeueCmd_t": CF_EnDisDequeueCmd_t_pb2.CF_EnDisDequeueCmd_t_pb,
-    "PBLIB_RegData_t": PBLIB_RegData_t_pb2.PBLIB_RegData_t_pb,
-    "PBLIB_AppData_t": PBLIB_AppData_t_pb2.PBLIB_AppData_t_pb,
-    "CS_Res_App_Table_Entry_t": CS_Res_App_Table_Entry_t_pb2.CS_Res_App_Table_Entry_t_pb,
-    "CS_AppNameCmd_t": CS_AppNameCmd_t_pb2.CS_AppNameCmd_t_pb,
-    "CS_OneShotCmd_t": CS_OneShotCmd_t_pb2.CS_OneShotCmd_t_pb,
-    "CS_GetEntryIDCmd_t": CS_GetEntryIDCmd_t_pb2.CS_GetEntryIDCmd_t_pb,
-    "CS_EntryCmd_t": CS_EntryCmd_t_pb2.CS_EntryCmd_t_pb,
-    "CS_Def_EepromMemory_Table_Entry_t": CS_Def_EepromMemory_Table_Entry_t_pb2.CS_Def_EepromMemory_Table_Entry_t_pb,
-    "CS_HkPacket_t": CS_HkPacket_t_pb2.CS_HkPacket_t_pb,
-    "CS_AppData_t": CS_AppData_t_pb2.CS_AppData_t_pb,
-    "CS_Def_Tables_Table_Entry_t": CS_Def_Tables_Table_Entry_t_pb2.CS_Def_Tables_Table_Entry_t_pb,
-    "CS_Res_EepromMemory_Table_Entry_t": CS_Res_EepromMemory_Table_Entry_t_pb2.CS_Res_EepromMemory_Table_Entry_t_pb,
-    "CS_Res_Tables_Table_Entry_t": CS_Res_Tables_Table_Entry_t_pb2.CS_Res_Tables_Table_Entry_t_pb,
-    "CS_Def_App_Table_Entry_t": CS_Def_App_Table_Entry_t_pb2.CS_Def_App_Table_Entry_t_pb,
-    "CS_TableNameCmd_t": CS_TableNameCmd_t_pb2.CS_TableNameCmd_t_pb,
-    "PX4_DistanceSensorMsg_t": PX4_DistanceSensorMsg_t_pb2.PX4_DistanceSensorMsg_t_pb,
-    "PX4_VehicleGlobalPositionMsg_t": PX4_VehicleGlobalPositionMsg_t_pb2.PX4_VehicleGlobalPositionMsg_t_pb,
-    "PX4_SensorCombinedMsg_t": PX4_SensorCombinedMsg_t_pb2.PX4_SensorCombinedMsg_t_pb,
-    "PX4_EstimatorStatusMsg_t": PX4_EstimatorStatusMsg_t_pb2.PX4_EstimatorStatusMsg_t_pb,
-    "PX4_PositionSetpoint_t": PX4_PositionSetpoint_t_pb2.PX4_PositionSetpoint_t_pb,
-    "PX4_McAttCtrlStatusMsg_t": PX4_McAttCtrlStatusMsg_t_pb2.PX4_McAttCtrlStatusMsg_t_pb,
-    "PX4_InputRcMsg_t": PX4_InputRcMsg_t_pb2.PX4_InputRcMsg_t_pb,
-    "PX4_VehicleAttitudeMsg_t": PX4_VehicleAttitudeMsg_t_pb2.PX4_VehicleAttitudeMsg_t_pb,
-    "PX4_VehicleAttitudeSetpointMsg_t": PX4_VehicleAttitudeSetpointMsg_t_pb2.PX4_VehicleAttitudeSetpointMsg_t_pb,
-    "PX4_VehicleCommandMsg_t": PX4_VehicleCommandMsg_t_pb2.PX4_VehicleCommandMsg_t_pb,
-    "PX4_OpticalFlowMsg_t": PX4_OpticalFlowMsg_t_pb2.PX4_OpticalFlowMsg_t_pb,
-    "PX4_LedControlMsg_t": PX4_LedControlMsg_t_pb2.PX4_LedControlMsg_t_pb,
-    "PX4_AirspeedMsg_t": PX4_AirspeedMsg_t_pb2.PX4_AirspeedMsg_t_pb,
-    "PX4_SafetyMsg_t": PX4_SafetyMsg_t_pb2.PX4_SafetyMsg_t_pb,
-    "PX4_ActuatorControlsMsg_t": PX4_ActuatorControlsMsg_t_pb2.PX4_ActuatorControlsMsg_t_pb,
-    "PX4_BatteryStatusMsg_t": PX4_BatteryStatusMsg_t_pb2.PX4_BatteryStatusMsg_t_pb,
-    "PX4_VehicleStatusMsg_t": PX4_VehicleStatusMsg_t_pb2.PX4_VehicleStatusMsg_t_pb,
-    "PX4_PositionSetpointTripletMsg_t": PX4_PositionSetpointTripletMsg_t_pb2.PX4_PositionSetpointTripletMsg_t_pb,
-    "PX4_VehicleGpsPositionMsg_t": PX4_VehicleGpsPositionMsg_t_pb2.PX4_VehicleGpsPositionMsg_t_pb,
-    "PX4_VehicleLocalPositionSetpointMsg_t": PX4_VehicleLocalPositionSetpointMsg_t_pb2.PX4_VehicleLocalPositionSetpointMsg_t_pb,
-    "PX4_HomePositionMsg_t": PX4_HomePositionMsg_t_pb2.PX4_HomePositionMsg_t_pb,
-    "PX4_VehicleLocalPositionMsg_t": PX4_VehicleLocalPositionMsg_t_pb2.PX4_VehicleLocalPositionMsg_t_pb,
-    "PX4_TelemetryStatusMsg_t": PX4_TelemetryStatusMsg_t_pb2.PX4_TelemetryStatusMsg_t_pb,
-    "PX4_SaturationStatus_t": PX4_SaturationStatus_t_pb2.PX4_SaturationStatus_t_pb,
-    "PX4_VehicleRatesSetpointMsg_t": PX4_VehicleRatesSetpointMsg_t_pb2.PX4_VehicleRatesSetpointMsg_t_pb,
-    "PX4_VehicleLandDetectedMsg_t": PX4_VehicleLandDetectedMsg_t_pb2.PX4_VehicleLandDetectedMsg_t_pb,
-    "PX4_MissionMsg_t": PX4_MissionMsg_t_pb2.PX4_MissionMsg_t_pb,
-    "PX4_MissionResultMsg_t": PX4_MissionResultMsg_t_pb2.PX4_MissionResultMsg_t_pb,
-    "PX4_RcChannelsMsg_t": PX4_RcChannelsMsg_t_pb2.PX4_RcChannelsMsg_t_pb,
-    "PX4_SensorMagMsg_t": PX4_SensorMagMsg_t_pb2.PX4_SensorMagMsg_t_pb,
-    "PX4_GpsInjectDataMsg_t": PX4_GpsInjectDataMsg_t_pb2.PX4_GpsInjectDataMsg_t_pb,
-    "PX4_ControlStateMsg_t": PX4_ControlStateMsg_t_pb2.PX4_ControlStateMsg_t_pb,
-    "PX4_SubsystemInfoMsg_t": PX4_SubsystemInfoMsg_t_pb2.PX4_SubsystemInfoMsg_t_pb,
-    "PX4_ManualControlSetpointMsg_t": PX4_ManualControlSetpointMsg_t_pb2.PX4_ManualControlSetpointMsg_t_pb,
-    "PX4_VehicleGlobalVelocitySetpointMsg_t": PX4_VehicleGlobalVelocitySetpointMsg_t_pb2.PX4_VehicleGlobalVelocitySetpointMsg_t_pb,
-    "PX4_SensorBaroMsg_t": PX4_SensorBaroMsg_t_pb2.PX4_SensorBaroMsg_t_pb,
-    "PX4_SensorAccelMsg_t": PX4_SensorAccelMsg_t_pb2.PX4_SensorAccelMsg_t_pb,
-    "PX4_VehicleControlModeMsg_t": PX4_VehicleControlModeMsg_t_pb2.PX4_VehicleControlModeMsg_t_pb,
-    "PX4_DifferentialPressureMsg_t": PX4_DifferentialPressureMsg_t_pb2.PX4_DifferentialPressureMsg_t_pb,
-    "PX4_SensorGyroMsg_t": PX4_SensorGyroMsg_t_pb2.PX4_SensorGyroMsg_t_pb,
-    "PX4_MultirotorMotorLimitsMsg_t": PX4_MultirotorMotorLimitsMsg_t_pb2.PX4_MultirotorMotorLimitsMsg_t_pb,
-    "PX4_ActuatorArmedMsg_t": PX4_ActuatorArmedMsg_t_pb2.PX4_ActuatorArmedMsg_t_pb,
-    "PX4_ActuatorOutputsMsg_t": PX4_ActuatorOutputsMsg_t_pb2.PX4_ActuatorOutputsMsg_t_pb,
-    "PX4_SensorCorrectionMsg_t": PX4_SensorCorrectionMsg_t_pb2.PX4_SensorCorrectionMsg_t_pb,
-    "PX4_CommanderStateMsg_t": PX4_CommanderStateMsg_t_pb2.PX4_CommanderStateMsg_t_pb,
-    "PX4_SatelliteInfoMsg_t": PX4_SatelliteInfoMsg_t_pb2.PX4_SatelliteInfoMsg_t_pb,
-    "GPS_NAV_STATUS_t": GPS_NAV_STATUS_t_pb2.GPS_NAV_STATUS_t_pb,
-    "GPS_NAV_ODO_t": GPS_NAV_ODO_t_pb2.GPS_NAV_ODO_t_pb,
-    "GPS_NAV_GEOFENCE_t": GPS_NAV_GEOFENCE_t_pb2.GPS_NAV_GEOFENCE_t_pb,
-    "GPS_CFG_TMODE3_t": GPS_CFG_TMODE3_t_pb2.GPS_CFG_TMODE3_t_pb,
-    "GPS_NAV_SBAS_t": GPS_NAV_SBAS_t_pb2.GPS_NAV_SBAS_t_pb,
-    "GPS_NAV_TIMEUTC_t": GPS_NAV_TIMEUTC_t_pb2.GPS_NAV_TIMEUTC_t_pb,
-    "GPS_NAV_SVINFO_P2_t": GPS_NAV_SVINFO_P2_t_pb2.GPS_NAV_SVINFO_P2_t_pb,
-    "GPS_ParserStatus_t": GPS_ParserStatus_t_pb2.GPS_ParserStatus_t_pb,
-    "GPS_NAV_PVT_t": GPS_NAV_PVT_t_pb2.GPS_NAV_PVT_t_pb,
-    "GPS_NAV_POSLLH_t": GPS_NAV_POSLLH_t_pb2.GPS_NAV_POSLLH_t_pb,
-    "GPS_ConfigTbl_t": GPS_ConfigTbl_t_pb2.GPS_ConfigTbl_t_pb,
-    "GPS_CurrentValueTable_t": GPS_CurrentValueTable_t_pb2.GPS_CurrentValueTable_t_pb,
-    "GPS_NAV_EOE_t": GPS_NAV_EOE_t_pb2.GPS_NAV_EOE_t_pb,
-    "GPS_NAV_ORB_t": GPS_NAV_ORB_t_pb2.GPS_NAV_ORB_t_pb,
-    "GPS_ACK_NAK_t": GPS_ACK_NAK_t_pb2.GPS_ACK_NAK_t_pb,
-    "GPS_MON_HW_t": GPS_MON_HW_t_pb2.GPS_MON_HW_t_pb,
-    "GPS_NAV_SOL_t": GPS_NAV_SOL_t_pb2.GPS_NAV_SOL_t_pb,
-    "GPS_HkTlm_t": GPS_HkTlm_t_pb2.GPS_HkTlm_t_pb,
-    "GPS_NAV_SVINFO_Combined_t": GPS_NAV_SVINFO_Combined_t_pb2.GPS_NAV_SVINFO_Combined_t_pb,
-    "GPS_CFG_MSG_t": GPS_CFG_MSG_t_pb2.GPS_CFG_MSG_t_pb,
-    "GPS_CFG_NAV5_t": GPS_CFG_NAV5_t_pb2.GPS_CFG_NAV5_t_pb,
-    "GPS_NAV_ATT_t": GPS_NAV_ATT_t_pb2.GPS_NAV_ATT_t_pb,
-    "GPS_AppCustomData_t": GPS_AppCustomData_t_pb2.GPS_AppCustomData_t_pb,
-    "GPS_CFG_PRT_t": GPS_CFG_PRT_t_pb2.GPS_CFG_PRT_t_pb,
-    "GPS_NAV_AOPSTATUS_t": GPS_NAV_AOPSTATUS_t_pb2.GPS_NAV_AOPSTATUS_t_pb,
-    "GPS_NAV_POSECEF_t": GPS_NAV_POSECEF_t_pb2.GPS_NAV_POSECEF_t_pb,
-    "GPS_CFG_SBAS_t": GPS_CFG_SBAS_t_pb2.GPS_CFG_SBAS_t_pb,
-    "GPS_Checksum_t": GPS_Checksum_t_pb2.GPS_Checksum_t_pb,
-    "GPS_DeviceMessage_t": GPS_DeviceMessage_t_pb2.GPS_DeviceMessage_t_pb,
-    "GPS_NAV_SVINFO_P1_t": GPS_NAV_SVINFO_P1_t_pb2.GPS_NAV_SVINFO_P1_t_pb,
-    "GPS_ACK_ACK_t": GPS_ACK_ACK_t_pb2.GPS_ACK_ACK_t_pb,
-    "GPS_Header_t": GPS_Header_t_pb2.GPS_Header_t_pb,
-    "GPS_NAV_DOP_t": GPS_NAV_DOP_t_pb2.GPS_NAV_DOP_t_pb,
-    "GPS_NAV_SAT_t": GPS_NAV_SAT_t_pb2.GPS_NAV_SAT_t_pb,
-    "MD_CmdJam_t": MD_CmdJam_t_pb2.MD_CmdJam_t_pb,
-    "MD": MD_pb2.MD_pb,
-    "MD_AppData_t": MD_AppData_t_pb2.MD_AppData_t_pb,
-    "MD_DwellControlEntry_t": MD_DwellControlEntry_t_pb2.MD_DwellControlEntry_t_pb,
-    "MD_CmdHandlerTblRec_t": MD_CmdHandlerTblRec_t_pb2.MD_CmdHandlerTblRec_t_pb,
-    "MD_DwellPkt_t": MD_DwellPkt_t_pb2.MD_DwellPkt_t_pb,
-    "MD_DwellTableLoad_t": MD_DwellTableLoad_t_pb2.MD_DwellTableLoad_t_pb,
-    "MD_DwellPacketControl_t": MD_DwellPacketControl_t_pb2.MD_DwellPacketControl_t_pb,
-    "MD_TableLoadEntry_t": MD_TableLoadEntry_t_pb2.MD_TableLoadEntry_t_pb,
-    "MD_CmdSetSignature_t": MD_CmdSetSignature_t_pb2.MD_CmdSetSignature_t_pb,
-    "MD_CmdStartStop_t": MD_CmdStartStop_t_pb2.MD_CmdStartStop_t_pb,
-    "MD_HkTlm_t": MD_HkTlm_t_pb2.MD_HkTlm_t_pb,
-    "MM_DumpInEventCmd_t": MM_DumpInEventCmd_t_pb2.MM_DumpInEventCmd_t_pb,
-    "MM_HkPacket_t": MM_HkPacket_t_pb2.MM_HkPacket_t_pb,
-    "MM_AppData_t": MM_AppData_t_pb2.MM_AppData_t_pb,
-    "MM_LoadDumpFileHeader_t": MM_LoadDumpFileHeader_t_pb2.MM_LoadDumpFileHeader_t_pb,
-    "MM_PeekCmd_t": MM_PeekCmd_t_pb2.MM_PeekCmd_t_pb,
-    "MM_EepromWriteEnaCmd_t": MM_EepromWriteEnaCmd_t_pb2.MM_EepromWriteEnaCmd_t_pb,
-    "MM_LoadMemFromFileCmd_t": MM_LoadMemFromFileCmd_t_pb2.MM_LoadMemFromFileCmd_t_pb,
-    "MM_EepromWriteDisCmd_t": MM_EepromWriteDisCmd_t_pb2.MM_EepromWriteDisCmd_t_pb,
-    "MM_LookupSymCmd_t": MM_LookupSymCmd_t_pb2.MM_LookupSymCmd_t_pb,
-    "MM_FillMemCmd_t": MM_FillMemCmd_t_pb2.MM_FillMemCmd_t_pb,
-    "MM_PokeCmd_t": MM_PokeCmd_t_pb2.MM_PokeCmd_t_pb,
-    "MM_LoadMemWIDCmd_t": MM_LoadMemWIDCmd_t_pb2.MM_LoadMemWIDCmd_t_pb,
-    "MM_DumpMemToFileCmd_t": MM_DumpMemToFileCmd_t_pb2.MM_DumpMemToFileCmd_t_pb,
-    "MM_SymTblToFileCmd_t": MM_SymTblToFileCmd_t_pb2.MM_SymTblToFileCmd_t_pb,
-    "LGC_ConfigTbl_t": LGC_ConfigTbl_t_pb2.LGC_ConfigTbl_t_pb,
-    "LGC_CurrentValueTable_t": LGC_CurrentValueTable_t_pb2.LGC_CurrentValueTable_t_pb,
-    "LGC_HkTlm_t": LGC_HkTlm_t_pb2.LGC_HkTlm_t_pb,
-    "RGBLED_Device_Settings_t": RGBLED_Device_Settings_t_pb2.RGBLED_Device_Settings_t_pb,
-    "RGBLED_CurrentValueTable_t": RGBLED_CurrentValueTable_t_pb2.RGBLED_CurrentValueTable_t_pb,
-    "RGBLED_HkTlm_t": RGBLED_HkTlm_t_pb2.RGBLED_HkTlm_t_pb,
-    "RGBLED_AppCustomData_t": RGBLED_AppCustomData_t_pb2.RGBLED_AppCustomData_t_pb,
-    "CFE_ES_AppNameCmd_t": CFE_ES_AppNameCmd_t_pb2.CFE_ES_AppNameCmd_t_pb,
-    "CFE_ES_CDSVariables_t": CFE_ES_CDSVariables_t_pb2.CFE_ES_CDSVariables_t_pb,
-    "CFE_TIME_StateCmd_t": CFE_TIME_StateCmd_t_pb2.CFE_TIME_StateCmd_t_pb,
-    "CFE_TBL_BufParams_t": CFE_TBL_BufParams_t_pb2.CFE_TBL_BufParams_t_pb,
-    "CFE_TBL_CallbackFuncPtr_t": CFE_TBL_CallbackFuncPtr_t_pb2.CFE_TBL_CallbackFuncPtr_t_pb,
-    "CFE_SB_Msg_t": CFE_SB_Msg_t_pb2.CFE_SB_Msg_t_pb,
-    "CFE_ES_PerfLogDump_t": CFE_ES_PerfLogDump_t_pb2.CFE_ES_PerfLogDump_t_pb,
-    "CFE_EVS_AppDataCmd_Payload_t": CFE_EVS_AppDataCmd_Payload_t_pb2.CFE_EVS_AppDataCmd_Payload_t_pb,
-    "CFE_FS_Decompress_State_t": CFE_FS_Decompress_State_t_pb2.CFE_FS_Decompress_State_t_pb,
-    "CFE_SB_CmdHdr_t": CFE_SB_CmdHdr_t_pb2.CFE_SB_CmdHdr_t_pb,
-    "CFE_SB_RoutingFileEntry_t": CFE_SB_RoutingFileEntry_t_pb2.CFE_SB_RoutingFileEntry_t_pb,
-    "CFE_EVS_TlmPkt_Payload_t": CFE_EVS_TlmPkt_Payload_t_pb2.CFE_EVS_TlmPkt_Payload_t_pb,
-    "CFE_ES_OneAppTlm_Payload_t": CFE_ES_OneAppTlm_Payload_t_pb2.CFE_ES_OneAppTlm_Payload_t_pb,
-    "CFE_ES_SetMaxPRCountCmd_Payload_t": CFE_ES_SetMaxPRCountCmd_Payload_t_pb2.CFE_ES_SetMaxPRCountCmd_Payload_t_pb,
-    "CFE_ES_PerfStopCmd_Payload_t": CFE_ES_PerfStopCmd_Payload_t_pb2.CFE_ES_PerfStopCmd_Payload_t_pb,
-    "CFE_ES_CDSPool_t": CFE_ES_CDSPool_t_pb2.CFE_ES_CDSPool_t_pb,
-    "CFE_ES_AppReloadCmd_t": CFE_ES_AppReloadCmd_t_pb2.CFE_ES_AppReloadCmd_t_pb,
-    "CFE_EVS_AppNameCmd_Payload_t": CFE_EVS_AppNameCmd_Payload_t_pb2.CFE_EVS_AppNameCmd_Payload_t_pb,
-    "CFE_ES_StartAppCmd_Payload_t": CFE_ES_StartAppCmd_Payload_t_pb2.CFE_ES_StartAppCmd_Payload_t_pb,
-    "CFE_EVS_GlobalData_t": CFE_EVS_GlobalData_t_pb2.CFE_EVS_GlobalData_t_pb,
-    "CFE_TIME_LeapsCmd_Payload_t": CFE_TIME_LeapsCmd_Payload_t_pb2.CFE_TIME_LeapsCmd_Payload_t_pb,
-    "CFE_ES_CDS_RegRec_t": CFE_ES_CDS_RegRec_t_pb2.CFE_ES_CDS_RegRec_t_pb,
-    "CFE_ES_QueryAllCmd_Payload_t": CFE_ES_QueryAllCmd_Payload_t_pb2.CFE_ES_QueryAllCmd_Payload_t_pb,
-    "CFE_ES_ERLog_t": CFE_ES_ERLog_t_pb2.CFE_ES_ERLog_t_pb,
-    "CFE_ES_QueryAllTasksCmd_t": CFE_ES_QueryAllTasksCmd_t_pb2.CFE_ES_QueryAllTasksCmd_t_pb,
-    "CFE_ES_WriteERlogCmd_t": CFE_ES_WriteERlogCmd_t_pb2.CFE_ES_WriteERlogCmd_t_pb,
-    "CFE_EVS_BitMaskCmd_Payload_t": CFE_EVS_BitMaskCmd_Payload_t_pb2.CFE_EVS_BitMaskCmd_Payload_t_pb,
-    "CFE_ES_PerfDataEntry_t": CFE_ES_PerfDataEntry_t_pb2.CFE_ES_PerfDataEntry_t_pb,
-    "CFE_SB_MsgPtr_t": CFE_SB_MsgPtr_t_pb2.CFE_SB_MsgPtr_t_pb,
-    "CFE_ES_PerfMetaData_t": CFE_ES_PerfMetaData_t_pb2.CFE_ES_PerfMetaData_t_pb,
-    "CFE_SB_MsgPayloadPtr_t": CFE_SB_MsgPayloadPtr_t_pb2.CFE_SB_MsgPayloadPtr_t_pb,
-    "CFE_SB_Qos_t": CFE_SB_Qos_t_pb2.CFE_SB_Qos_t_pb,
-    "CFE_EVS_AppNameBitMaskCmd_t": CFE_EVS_AppNameBitMaskCmd_t_pb2.CFE_EVS_AppNameBitMaskCmd_t_pb,
-    "CFE_EVS_AppDataCmd_t": CFE_EVS_AppDataCmd_t_pb2.CFE_EVS_AppDataCmd_t_pb,
-    "CFE_TBL_DumpCmd_Payload_t": CFE_TBL_DumpCmd_Payload_t_pb2.CFE_TBL_DumpCmd_Payload_t_pb,
-    "CFE_ES_PerfSetTrigMaskCmd_Payload_t": CFE_ES_PerfSetTrigMaskCmd_Payload_t_pb2.CFE_ES_PerfSetTrigMaskCmd_Payload_t_pb,
-    "CFE_ES_ResetVariables_t": CFE_ES_ResetVariables_t_pb2.CFE_ES_ResetVariables_t_pb,
-    "CFE_EVS_BitMaskCmd_t": CFE_EVS_BitMaskCmd_t_pb2.CFE_EVS_BitMaskCmd_t_pb,
-    "CFE_ES_OverWriteSysLogCmd_t": CFE_ES_OverWriteSysLogCmd_t_pb2.CFE_ES_OverWriteSysLogCmd_t_pb,
-    "CFE_PSP_MemTable_t": CFE_PSP_MemTable_t_pb2.CFE_PSP_MemTable_t_pb,
-    "CFE_EVS_AppNameEventIDCmd_t": CFE_EVS_AppNameEventIDCmd_t_pb2.CFE_EVS_AppNameEventIDCmd_t_pb,
-    "CFE_SB_EventBuf_t": CFE_SB_EventBuf_t_pb2.CFE_SB_EventBuf_t_pb,
-    "CFE_TBL_Info_t": CFE_TBL_Info_t_pb2.CFE_TBL_Info_t_pb,
-    "CFE_ES_PerfStopCmd_t": CFE_ES_PerfStopCmd_t_pb2.CFE_ES_PerfStopCmd_t_pb,
-    "CFE_ES_AppState_t": CFE_ES_AppState_t_pb2.CFE_ES_AppState_t_pb,
-    "CFE_ES_QueryAllCmd_t": CFE_ES_QueryAllCmd_t_pb2.CFE_ES_QueryAllCmd_t_pb,
-    "CFE_ES_MainTaskInfo_t": CFE_ES_MainTaskInfo_t_pb2.CFE_ES_MainTaskInfo_t_pb,
-    "CFE_SB_EnRoutCmd_t": CFE_SB_EnRoutCmd_t_pb2.CFE_SB_EnRoutCmd_t_pb,
-    "CFE_SB_SenderId_t": CFE_SB_SenderId_t_pb2.CFE_SB_SenderId_t_pb,
-    "CFE_TIME_SignalCmd_t": CFE_TIME_SignalCmd_t_pb2.CFE_TIME_SignalCmd_t_pb,
-    "CFE_EVS_ModeCmd_t": CFE_EVS_ModeCmd_t_pb2.CFE_EVS_ModeCmd_t_pb,
-    "CFE_TBL_ActivateCmd_t": CFE_TBL_ActivateCmd_t_pb2.CFE_TBL_ActivateCmd_t_pb,
-    "CFE_EVS_LogFileCmd_Payload_t": CFE_EVS_LogFileCmd_Payload_t_pb2.CFE_EVS_LogFileCmd_Payload_t_pb,
-    "CFE_ES_PerfStartCmd_t": CFE_ES_PerfStartCmd_t_pb2.CFE_ES_PerfStartCmd_t_pb,
-    "CFE_TIME_SignalCmd_Payload_t": CFE_TIME_SignalCmd_Payload_t_pb2.CFE_TIME_SignalCmd_Payload_t_pb,
-    "CFE_EVS_AppNameEventIDMaskCmd_t": CFE_EVS_AppNameEventIDMaskCmd_t_pb2.CFE_EVS_AppNameEventIDMaskCmd_t_pb,
-    "CFE_TBL_RegistryRec_t": CFE_TBL_RegistryRec_t_pb2.CFE_TBL_RegistryRec_t_pb,
-    "CFE_TIME_NoArgsCmd_t": CFE_TIME_NoArgsCmd_t_pb2.CFE_TIME_NoArgsCmd_t_pb,
-    "CFE_TBL_TlmRegCmd_Payload_t": CFE_TBL_TlmRegCmd_Payload_t_pb2.CFE_TBL_TlmRegCmd_Payload_t_pb,
-    "CFE_TIME_TaskData_t": CFE_TIME_TaskData_t_pb2.CFE_TIME_TaskData_t_pb,
-    "CFE_ES_WriteERlogCmd_Payload_t": CFE_ES_WriteERlogCmd_Payload_t_pb2.CFE_ES_WriteERlogCmd_Payload_t_pb,
-    "CFE_TIME_HkPacket_Payload_t": CFE_TIME_HkPacket_Payload_t_pb2.CFE_TIME_HkPacket_Payload_t_pb,
-    "CFE_TBL_LoadBuff_t": CFE_TBL_LoadBuff_t_pb2.CFE_TBL_LoadBuff_t_pb,
-    "CFE_ES_PoolStatsTlm_t": CFE_ES_PoolStatsTlm_t_pb2.CFE_ES_PoolStatsTlm_t_pb,
-    "CFE_ES_QueryAllTasksCmd_Payload_t": CFE_ES_QueryAllTasksCmd_Payload_t_pb2.CFE_ES_QueryAllTasksCmd_Payload_t_pb,
-    "CFE_ES_RestartCmd_t": CFE_ES_RestartCmd_t_pb2.CFE_ES_RestartCmd_t_pb,
-    "CFE_TBL_HkPacket_Payload_t": CFE_TBL_HkPacket_Payload_t_pb2.CFE_TBL_HkPacket_Payload_t_pb,
-    "CFE_EVS_Packet_Payload_t": CFE_EVS_Packet_Payload_t_pb2.CFE_EVS_Packet_Payload_t_pb,
-    "CFE_EVS_AppDataFile_t": CFE_EVS_AppDataFile_t_pb2.CFE_EVS_AppDataFile_t_pb,
-    "CFE_TIME_SysTime_t": CFE_TIME_SysTime_t_pb2.CFE_TIME_SysTime_t_pb,
-    "CFE_TIME_DiagPacket_Payload_t": CFE_TIME_DiagPacket_Payload_t_pb2.CFE_TIME_DiagPacket_Payload_t_pb,
-    "CFE_TBL_TblRegPacket_Payload_t": CFE_TBL_TblRegPacket_Payload_t_pb2.CFE_TBL_TblRegPacket_Payload_t_pb,
-    "CFE_ES_OverWriteSysLogCmd_Payload_t": CFE_ES_OverWriteSysLogCmd_Payload_t_pb2.CFE_ES_OverWriteSysLogCmd_Payload_t_pb,
-    "CFE_SB_StatMsg_Payload_t": CFE_SB_StatMsg_Payload_t_pb2.CFE_SB_StatMsg_Payload_t_pb,
-    "CFE_ES_MemPoolStats_t": CFE_ES_MemPoolStats_t_pb2.CFE_ES_MemPoolStats_t_pb,
-    "CFE_SB_WriteFileInfoCmd_t": CFE_SB_WriteFileInfoCmd_t_pb2.CFE_SB_WriteFileInfoCmd_t_pb,
-    "CFE_TBL_ValidateCmd_t": CFE_TBL_ValidateCmd_t_pb2.CFE_TBL_ValidateCmd_t_pb,
-    "CFE_ES_PoolStatsTlm_Payload_t": CFE_ES_PoolStatsTlm_Payload_t_pb2.CFE_ES_PoolStatsTlm_Payload_t_pb,
-    "CFE_ES_DeleteCDSCmd_t": CFE_ES_DeleteCDSCmd_t_pb2.CFE_ES_DeleteCDSCmd_t_pb,
-    "CFE_SB_ZeroCopyD_t": CFE_SB_ZeroCopyD_t_pb2.CFE_SB_ZeroCopyD_t_pb,
-    "CFE_SB_BufferD_t": CFE_SB_BufferD_t_pb2.CFE_SB_BufferD_t_pb,
-    "CFE_TIME_SynchCallbackRegEntry_t": CFE_TIME_SynchCallbackRegEntry_t_pb2.CFE_TIME_SynchCallbackRegEntry_t_pb,
-    "CFE_ES_NoArgsCmd_t": CFE_ES_NoArgsCmd_t_pb2.CFE_ES_NoArgsCmd_t_pb,
-    "CFE_EVS_AppNameEventIDCmd_Payload_t": CFE_EVS_AppNameEventIDCmd_Payload_t_pb2.CFE_EVS_AppNameEventIDCmd_Payload_t_pb,
-    "CFE_TIME_FakeToneCmd_t": CFE_TIME_FakeToneCmd_t_pb2.CFE_TIME_FakeToneCmd_t_pb,
-    "CFE_ES_TaskInfo_t": CFE_ES_TaskInfo_t_pb2.CFE_ES_TaskInfo_t_pb,
-    "CFE_TBL_NotifyCmd_Payload_t": CFE_TBL_NotifyCmd_Payload_t_pb2.CFE_TBL_NotifyCmd_Payload_t_pb,
-    "CFE_EVS_PacketID_t": CFE_EVS_PacketID_t_pb2.CFE_EVS_PacketID_t_pb,
-    "CFE_FS_t": CFE_FS_t_pb2.CFE_FS_t_pb,
-    "CFE_PSP_ExceptionContext_t": CFE_PSP_ExceptionContext_t_pb2.CFE_PSP_ExceptionContext_t_pb,
-    "CFE_TBL_DelCDSCmd_Payload_t": CFE_TBL_DelCDSCmd_Payload_t_pb2.CFE_TBL_DelCDSCmd_Payload_t_pb,
-    "CFE_ES_AppInfo_t": CFE_ES_AppInfo_t_pb2.CFE_ES_AppInfo_t_pb,
-    "CFE_ES_StartAppCmd_t": CFE_ES_StartAppCmd_t_pb2.CFE_ES_StartAppCmd_t_pb,
-    "CFE_ES_ShellCmd_Payload_t": CFE_ES_ShellCmd_Payload_t_pb2.CFE_ES_ShellCmd_Payload_t_pb,
-    "CFE_ES_TaskRecord_t": CFE_ES_TaskRecord_t_pb2.CFE_ES_TaskRecord_t_pb,
-    "CFE_ES_CDSRegDumpRec_t": CFE_ES_CDSRegDumpRec_t_pb2.CFE_ES_CDSRegDumpRec_t_pb,
-    "CFE_SB_MsgMapFileEntry_t": CFE_SB_MsgMapFileEntry_t_pb2.CFE_SB_MsgMapFileEntry_t_pb,
-    "CFE_TBL_NotifyCmd_t": CFE_TBL_NotifyCmd_t_pb2.CFE_TBL_NotifyCmd_t_pb,
-    "CFE_ES_EarlyInitFuncPtr_t": CFE_ES_EarlyInitFuncPtr_t_pb2.CFE_ES_EarlyInitFuncPtr_t_pb,
-    "CFE_TBL_AccessDescriptor_t": CFE_TBL_AccessDescriptor_t_pb2.CFE_TBL_AccessDescriptor_t_pb,
-    "CFE_ES_LibRecord_t": CFE_ES_LibRecord_t_pb2.CFE_ES_LibRecord_t_pb,
-    "CFE_SB_TlmHdr_t": CFE_SB_TlmHdr_t_pb2.CFE_SB_TlmHdr_t_pb,
-    "CFE_TIME_ResetVars_t": CFE_TIME_ResetVars_t_pb2.CFE_TIME_ResetVars_t_pb,
-    "CFE_TBL_MsgProcFuncPtr_t": CFE_TBL_MsgProcFuncPtr_t_pb2.CFE_TBL_MsgProcFuncPtr_t_pb,
-    "CFE_TBL_CritRegRec_t": CFE_TBL_CritRegRec_t_pb2.CFE_TBL_CritRegRec_t_pb,
-    "CFE_ES_DeleteCDSCmd_Payload_t": CFE_ES_DeleteCDSCmd_Payload_t_pb2.CFE_ES_DeleteCDSCmd_Payload_t_pb,
-    "CFE_EVS_LogFileCmd_t": CFE_EVS_LogFileCmd_t_pb2.CFE_EVS_LogFileCmd_t_pb,
-    "CFE_ES_AppNameCmd_Payload_t": CFE_ES_AppNameCmd_Payload_t_pb2.CFE_ES_AppNameCmd_Payload_t_pb,
-    "CFE_TIME_TimeCmd_Payload_t": CFE_TIME_TimeCmd_Payload_t_pb2.CFE_TIME_TimeCmd_Payload_t_pb,
-    "CFE_ES_DumpCDSRegCmd_t": CFE_ES_DumpCDSRegCmd_t_pb2.CFE_ES_DumpCDSRegCmd_t_pb,
-    "CFE_EVS_AppNameBitMaskCmd_Payload_t": CFE_EVS_AppNameBitMaskCmd_Payload_t_pb2.CFE_EVS_AppNameBitMaskCmd_Payload_t_pb,
-    "CFE_ES_AppRecord_t": CFE_ES_AppRecord_t_pb2.CFE_ES_AppRecord_t_pb,
-    "CFE_SB_StatMsg_t": CFE_SB_StatMsg_t_pb2.CFE_SB_StatMsg_t_pb,
-    "CFE_TBL_DumpControl_t": CFE_TBL_DumpControl_t_pb2.CFE_TBL_DumpControl_t_pb,
-    "CFE_SB_RouteEntry_t": CFE_SB_RouteEntry_t_pb2.CFE_SB_RouteEntry_t_pb,
-    "CFE_ES_DumpCDSRegCmd_Payload_t": CFE_ES_DumpCDSRegCmd_Payload_t_pb2.CFE_ES_DumpCDSRegCmd_Payload_t_pb,
-    "CFE_ES_BlockStats_t": CFE_ES_BlockStats_t_pb2.CFE_ES_BlockStats_t_pb,
-    "CFE_PSP_CommandData_t": CFE_PSP_CommandData_t_pb2.CFE_PSP_CommandData_t_pb,
-    "CFE_TIME_SynchCallbackPtr_t": CFE_TIME_SynchCallbackPtr_t_pb2.CFE_TIME_SynchCallbackPtr_t_pb,
-    "CFE_SB_MemParams_t": CFE_SB_MemParams_t_pb2.CFE_SB_MemParams_t_pb,
-    "CFE_SB_PrevSubMsg_t": CFE_SB_PrevSubMsg_t_pb2.CFE_SB_PrevSubMsg_t_pb,
-    "CFE_EVS_Log_t": CFE_EVS_Log_t_pb2.CFE_EVS_Log_t_pb,
-    "CFE_TBL_DumpRegCmd_t": CFE_TBL_DumpRegCmd_t_pb2.CFE_TBL_DumpRegCmd_t_pb,
-    "CFE_SB_EnRoutCmd_Payload_t": CFE_SB_EnRoutCmd_Payload_t_pb2.CFE_SB_EnRoutCmd_Payload_t_pb,
-    "CFE_ES_WriteSyslogCmd_Payload_t": CFE_ES_WriteSyslogCmd_Payload_t_pb2.CFE_ES_WriteSyslogCmd_Payload_t_pb,
-    "CFE_ES_ResetData_t": CFE_ES_ResetData_t_pb2.CFE_ES_ResetData_t_pb,
-    "CFE_ES_PerfSetFilterMaskCmd_t": CFE_ES_PerfSetFilterMaskCmd_t_pb2.CFE_ES_PerfSetFilterMaskCmd_t_pb,
-    "CFE_ES_PerfStartCmd_Payload_t": CFE_ES_PerfStartCmd_Payload_t_pb2.CFE_ES_PerfStartCmd_Payload_t_pb,
-    "CFE_EVS_AppNameEventIDMaskCmd_Payload_t": CFE_EVS_AppNameEventIDMaskCmd_Payload_t_pb2.CFE_EVS_AppNameEventIDMaskCmd_Payload_t_pb,
-    "CFE_ES_ShellPacket_Payload_t": CFE_ES_ShellPacket_Payload_t_pb2.CFE_ES_ShellPacket_Payload_t_pb,
-    "CFE_ES_PerfData_t": CFE_ES_PerfData_t_pb2.CFE_ES_PerfData_t_pb,
-    "CFE_FS_Header_t": CFE_FS_Header_t_pb2.CFE_FS_Header_t_pb,
-    "CFE_TBL_ValidationResult_t": CFE_TBL_ValidationResult_t_pb2.CFE_TBL_ValidationResult_t_pb,
-    "CFE_ES_AppStartParams_t": CFE_ES_AppStartParams_t_pb2.CFE_ES_AppStartParams_t_pb,
-    "CFE_TBL_TaskData_t": CFE_TBL_TaskData_t_pb2.CFE_TBL_TaskData_t_pb,
-    "CFE_ES_ShellCmd_t": CFE_ES_ShellCmd_t_pb2.CFE_ES_ShellCmd_t_pb,
-    "CFE_TBL_HkPacket_t": CFE_TBL_HkPacket_t_pb2.CFE_TBL_HkPacket_t_pb,
-    "CFE_TIME_SourceCmd_t": CFE_TIME_SourceCmd_t_pb2.CFE_TIME_SourceCmd_t_pb,
-    "CFE_ES_TlmPoolStatsCmd_t": CFE_ES_TlmPoolStatsCmd_t_pb2.CFE_ES_TlmPoolStatsCmd_t_pb,
-    "CFE_SB_HKMsg_t": CFE_SB_HKMsg_t_pb2.CFE_SB_HKMsg_t_pb,
-    "CFE_ES_GenCounterRecord_t": CFE_ES_GenCounterRecord_t_pb2.CFE_ES_GenCounterRecord_t_pb,
-    "CFE_SB_SendErrEventBuf_t": CFE_SB_SendErrEventBuf_t_pb2.CFE_SB_SendErrEventBuf_t_pb,
-    "CFE_TIME_1HzAdjCmd_t": CFE_TIME_1HzAdjCmd_t_pb2.CFE_TIME_1HzAdjCmd_t_pb,
-    "CFE_SB_SubEntries_t": CFE_SB_SubEntries_t_pb2.CFE_SB_SubEntries_t_pb,
-    "CFE_ES_CDSBlockSizeDesc_t": CFE_ES_CDSBlockSizeDesc_t_pb2.CFE_ES_CDSBlockSizeDesc_t_pb,
-    "CFE_TIME_1HzCmd_t": CFE_TIME_1HzCmd_t_pb2.CFE_TIME_1HzCmd_t_pb,
-    "CFE_TIME_StateCmd_Payload_t": CFE_TIME_StateCmd_Payload_t_pb2.CFE_TIME_StateCmd_Payload_t_pb,
-    "CFE_TIME_ToneDataCmd_t": CFE_TIME_ToneDataCmd_t_pb2.CFE_TIME_ToneDataCmd_t_pb,
-    "CFE_EVS_AppNameCmd_t": CFE_EVS_AppNameCmd_t_pb2.CFE_EVS_AppNameCmd_t_pb,
-    "CFE_ES_HkPacket_t": CFE_ES_HkPacket_t_pb2.CFE_ES_HkPacket_t_pb,
-    "CFE_SB_PrevSubMsg_Payload_t": CFE_SB_PrevSubMsg_Payload_t_pb2.CFE_SB_PrevSubMsg_Payload_t_pb,
-    "CFE_TIME_HkPacket_t": CFE_TIME_HkPacket_t_pb2.CFE_TIME_HkPacket_t_pb,
-    "CFE_TBL_NoArgsCmd_t": CFE_TBL_NoArgsCmd_t_pb2.CFE_TBL_NoArgsCmd_t_pb,
-    "CFE_SB_WriteFileInfoCmd_Payload_t": CFE_SB_WriteFileInfoCmd_Payload_t_pb2.CFE_SB_WriteFileInfoCmd_Payload_t_pb,
-    "CFE_ES_WriteSyslogCmd_t": CFE_ES_WriteSyslogCmd_t_pb2.CFE_ES_WriteSyslogCmd_t_pb,
-    "CFE_TIME_Reference_t": CFE_TIME_Reference_t_pb2.CFE_TIME_Reference_t_pb,
-    "CFE_TBL_DumpRegCmd_Payload_t": CFE_TBL_DumpRegCmd_Payload_t_pb2.CFE_TBL_DumpRegCmd_Payload_t_pb,
-    "CFE_TBL_AbortLdCmd_t": CFE_TBL_AbortLdCmd_t_pb2.CFE_TBL_AbortLdCmd_t_pb,
-    "CFE_SB_PipeD_t": CFE_SB_PipeD_t_pb2.CFE_SB_PipeD_t_pb,
-    "CFE_ES_Global_t": CFE_ES_Global_t_pb2.CFE_ES_Global_t_pb,
-    "CFE_ES_FuncPtrUnion_t": CFE_ES_FuncPtrUnion_t_pb2.CFE_ES_FuncPtrUnion_t_pb,
-    "CFE_TBL_RegDumpRec_t": CFE_TBL_RegDumpRec_t_pb2.CFE_TBL_RegDumpRec_t_pb,
-    "CFE_ES_PerfSetFilterMaskCmd_Payload_t": CFE_ES_PerfSetFilterMaskCmd_Payload_t_pb2.CFE_ES_PerfSetFilterMaskCmd_Payload_t_pb,
-    "CFE_ES_PerfSetTrigMaskCmd_t": CFE_ES_PerfSetTrigMaskCmd_t_pb2.CFE_ES_PerfSetTrigMaskCmd_t_pb,
-    "CFE_ES_ChildTaskMainFuncPtr_t": CFE_ES_ChildTaskMainFuncPtr_t_pb2.CFE_ES_ChildTaskMainFuncPtr_t_pb,
-    "CFE_ES_TaskData_t": CFE_ES_TaskData_t_pb2.CFE_ES_TaskData_t_pb,
-    "CFE_TBL_AbortLdCmd_Payload_t": CFE_TBL_AbortLdCmd_Payload_t_pb2.CFE_TBL_AbortLdCmd_Payload_t_pb,
-    "CFE_EVS_TlmPkt_t": CFE_EVS_TlmPkt_t_pb2.CFE_EVS_TlmPkt_t_pb,
-    "CFE_TIME_TimeCmd_t": CFE_TIME_TimeCmd_t_pb2.CFE_TIME_TimeCmd_t_pb,
-    "CFE_ES_AppReloadCmd_Payload_t": CFE_ES_AppReloadCmd_Payload_t_pb2.CFE_ES_AppReloadCmd_Payload_t_pb,
-    "CFE_SB_SubRprtMsg_Payload_t": CFE_SB_SubRprtMsg_Payload_t_pb2.CFE_SB_SubRprtMsg_Payload_t_pb,
-    "CFE_TIME_1HzAdjCmd_Payload_t": CFE_TIME_1HzAdjCmd_Payload_t_pb2.CFE_TIME_1HzAdjCmd_Payload_t_pb,
-    "CFE_PSP_GlobalData_t": CFE_PSP_GlobalData_t_pb2.CFE_PSP_GlobalData_t_pb,
-    "CFE_ES_ObjectTable_t": CFE_ES_ObjectTable_t_pb2.CFE_ES_ObjectTable_t_pb,
-    "CFE_EVS_Packet_t": CFE_EVS_Packet_t_pb2.CFE_EVS_Packet_t_pb,
-    "CFE_TBL_DelCDSCmd_t": CFE_TBL_DelCDSCmd_t_pb2.CFE_TBL_DelCDSCmd_t_pb,
-    "CFE_ES_HkPacket_Payload_t": CFE_ES_HkPacket_Payload_t_pb2.CFE_ES_HkPacket_Payload_t_pb,
-    "CFE_TIME_LeapsCmd_t": CFE_TIME_LeapsCmd_t_pb2.CFE_TIME_LeapsCmd_t_pb,
-    "CFE_TIME_SourceCmd_Payload_t": CFE_TIME_SourceCmd_Payload_t_pb2.CFE_TIME_SourceCmd_Payload_t_pb,
-    "CFE_EVS_AppTlmData_t": CFE_EVS_AppTlmData_t_pb2.CFE_EVS_AppTlmData_t_pb,
-    "CFE_ES_SetMaxPRCountCmd_t": CFE_ES_SetMaxPRCountCmd_t_pb2.CFE_ES_SetMaxPRCountCmd_t_pb,
-    "CFE_SB_HKMsg_Payload_t": CFE_SB_HKMsg_Payload_t_pb2.CFE_SB_HKMsg_Payload_t_pb,
-    "CFE_ES_DebugVariables_t": CFE_ES_DebugVariables_t_pb2.CFE_ES_DebugVariables_t_pb,
-    "CFE_TBL_TblRegPacket_t": CFE_TBL_TblRegPacket_t_pb2.CFE_TBL_TblRegPacket_t_pb,
-    "CFE_TIME_DiagPacket_t": CFE_TIME_DiagPacket_t_pb2.CFE_TIME_DiagPacket_t_pb,
-    "CFE_ES_OneAppTlm_t": CFE_ES_OneAppTlm_t_pb2.CFE_ES_OneAppTlm_t_pb,
-    "CFE_ES_ShellPacket_t": CFE_ES_ShellPacket_t_pb2.CFE_ES_ShellPacket_t_pb,
-    "CFE_TBL_File_Hdr_t": CFE_TBL_File_Hdr_t_pb2.CFE_TBL_File_Hdr_t_pb,
-    "CFE_TIME_ToneSignalCmd_t": CFE_TIME_ToneSignalCmd_t_pb2.CFE_TIME_ToneSignalCmd_t_pb,
-    "CFE_TIME_ToneDataCmd_Payload_t": CFE_TIME_ToneDataCmd_Payload_t_pb2.CFE_TIME_ToneDataCmd_Payload_t_pb,
-    "CFE_ES_LibraryEntryFuncPtr_t": CFE_ES_LibraryEntryFuncPtr_t_pb2.CFE_ES_LibraryEntryFuncPtr_t_pb,
-    "CFE_ES_TlmPoolStatsCmd_Payload_t": CFE_ES_TlmPoolStatsCmd_Payload_t_pb2.CFE_ES_TlmPoolStatsCmd_Payload_t_pb,
-    "CFE_ES_RestartCmd_Payload_t": CFE_ES_RestartCmd_Payload_t_pb2.CFE_ES_RestartCmd_Payload_t_pb,
-    "CFE_TBL_DumpCmd_t": CFE_TBL_DumpCmd_t_pb2.CFE_TBL_DumpCmd_t_pb,
-    "CFE_SB_PipeDepthStats_t": CFE_SB_PipeDepthStats_t_pb2.CFE_SB_PipeDepthStats_t_pb,
-    "CFE_SB_SubRprtMsg_t": CFE_SB_SubRprtMsg_t_pb2.CFE_SB_SubRprtMsg_t_pb,
-    "CFE_TBL_CmdHandlerTblRec_t": CFE_TBL_CmdHandlerTblRec_t_pb2.CFE_TBL_CmdHandlerTblRec_t_pb,
-    "CFE_TBL_LoadCmd_t": CFE_TBL_LoadCmd_t_pb2.CFE_TBL_LoadCmd_t_pb,
-    "CFE_TBL_LoadCmd_Payload_t": CFE_TBL_LoadCmd_Payload_t_pb2.CFE_TBL_LoadCmd_Payload_t_pb,
-    "CFE_SB_DestinationD_t": CFE_SB_DestinationD_t_pb2.CFE_SB_DestinationD_t_pb,
-    "CFE_ES_MainAppFuncPtr_t": CFE_ES_MainAppFuncPtr_t_pb2.CFE_ES_MainAppFuncPtr_t_pb,
-    "CFE_ES_CDSBlockDesc_t": CFE_ES_CDSBlockDesc_t_pb2.CFE_ES_CDSBlockDesc_t_pb,
-    "CFE_EVS_BinFilter_t": CFE_EVS_BinFilter_t_pb2.CFE_EVS_BinFilter_t_pb,
-    "CFE_TBL_ActivateCmd_Payload_t": CFE_TBL_ActivateCmd_Payload_t_pb2.CFE_TBL_ActivateCmd_Payload_t_pb,
-    "CFE_TBL_ValidateCmd_Payload_t": CFE_TBL_ValidateCmd_Payload_t_pb2.CFE_TBL_ValidateCmd_Payload_t_pb,
-    "CFE_EVS_ModeCmd_Payload_t": CFE_EVS_ModeCmd_Payload_t_pb2.CFE_EVS_ModeCmd_Payload_t_pb,
-    "HMC5883_Params_t": HMC5883_Params_t_pb2.HMC5883_Params_t_pb,
-    "HMC5883_CalibrationMsg_t": HMC5883_CalibrationMsg_t_pb2.HMC5883_CalibrationMsg_t_pb,
-    "HMC5883_AppCustomData_t": HMC5883_AppCustomData_t_pb2.HMC5883_AppCustomData_t_pb,
-    "HMC5883_ConfigTbl_t": HMC5883_ConfigTbl_t_pb2.HMC5883_ConfigTbl_t_pb,
-    "HMC5883_ConversionMsg_t": HMC5883_ConversionMsg_t_pb2.HMC5883_ConversionMsg_t_pb,
-    "HMC5883_HkTlm_t": HMC5883_HkTlm_t_pb2.HMC5883_HkTlm_t_pb,
-    "HMC5883_DiagPacket_t": HMC5883_DiagPacket_t_pb2.HMC5883_DiagPacket_t_pb,
-    "MAC_CurrentValueTable_t": MAC_CurrentValueTable_t_pb2.MAC_CurrentValueTable_t_pb,
-    "MAC_HkTlm_t": MAC_HkTlm_t_pb2.MAC_HkTlm_t_pb,
-    "MAC_ParamTbl_t": MAC_ParamTbl_t_pb2.MAC_ParamTbl_t_pb,
-    "MAC_Params_t": MAC_Params_t_pb2.MAC_Params_t_pb,
-    "MS5611_HkTlm_t": MS5611_HkTlm_t_pb2.MS5611_HkTlm_t_pb,
-    "MS5611_ConfigTbl_t": MS5611_ConfigTbl_t_pb2.MS5611_ConfigTbl_t_pb,
-    "MS5611_DiagPacket_t": MS5611_DiagPacket_t_pb2.MS5611_DiagPacket_t_pb,
-    "MS5611_Params_t": MS5611_Params_t_pb2.MS5611_Params_t_pb,
-    "MS5611_AppCustomData_t": MS5611_AppCustomData_t_pb2.MS5611_AppCustomData_t_pb,
-    "SC_RtsCmd_t": SC_RtsCmd_t_pb2.SC_RtsCmd_t_pb,
-    "SC_SetContinueAtsOnFailureCmd_t": SC_SetContinueAtsOnFailureCmd_t_pb2.SC_SetContinueAtsOnFailureCmd_t_pb,
-    "SC_AtsInfoTable_t": SC_AtsInfoTable_t_pb2.SC_AtsInfoTable_t_pb,
-    "SC_HkTlm_t": SC_HkTlm_t_pb2.SC_HkTlm_t_pb,
-    "SC_AtpControlBlock_t": SC_AtpControlBlock_t_pb2.SC_AtpControlBlock_t_pb,
-    "SC_RtsEntryHeader_t": SC_RtsEntryHeader_t_pb2.SC_RtsEntryHeader_t_pb,
-    "SC_OperData_t": SC_OperData_t_pb2.SC_OperData_t_pb,
-    "SC_AtsEntryHeader_t": SC_AtsEntryHeader_t_pb2.SC_AtsEntryHeader_t_pb,
-    "SC_StartAtsCmd_t": SC_StartAtsCmd_t_pb2.SC_StartAtsCmd_t_pb,
-    "SC_JumpAtsCmd_t": SC_JumpAtsCmd_t_pb2.SC_JumpAtsCmd_t_pb,
-    "SC_RtsInfoEntry_t": SC_RtsInfoEntry_t_pb2.SC_RtsInfoEntry_t_pb,
-    "SC_AppendAtsCmd_t": SC_AppendAtsCmd_t_pb2.SC_AppendAtsCmd_t_pb,
-    "SC_RtsGrpCmd_t": SC_RtsGrpCmd_t_pb2.SC_RtsGrpCmd_t_pb,
-    "SC_AppData_t": SC_AppData_t_pb2.SC_AppData_t_pb,
-    "SC_RtpControlBlock_t": SC_RtpControlBlock_t_pb2.SC_RtpControlBlock_t_pb,
-    "SENS_ConfigTbl_t": SENS_ConfigTbl_t_pb2.SENS_ConfigTbl_t_pb,
-    "SENS_CurrentValueTable_t": SENS_CurrentValueTable_t_pb2.SENS_CurrentValueTable_t_pb,
-    "SENS_HkTlm_t": SENS_HkTlm_t_pb2.SENS_HkTlm_t_pb,
-    "SCH_DeadlineTable_t": SCH_DeadlineTable_t_pb2.SCH_DeadlineTable_t_pb,
-    "SCH_ScheduleEntry_t": SCH_ScheduleEntry_t_pb2.SCH_ScheduleEntry_t_pb,
-    "SCH_HkPacket_t": SCH_HkPacket_t_pb2.SCH_HkPacket_t_pb,
-    "SCH_LibData_t": SCH_LibData_t_pb2.SCH_LibData_t_pb,
-    "SCH_ActivityDeadlineStatus_t": SCH_ActivityDeadlineStatus_t_pb2.SCH_ActivityDeadlineStatus_t_pb,
-    "SCH_SlotDeadlineStatus_t": SCH_SlotDeadlineStatus_t_pb2.SCH_SlotDeadlineStatus_t_pb,
-    "SCH_MessageEntry_t": SCH_MessageEntry_t_pb2.SCH_MessageEntry_t_pb,
-    "SCH_GroupCmd_t": SCH_GroupCmd_t_pb2.SCH_GroupCmd_t_pb,
-    "SCH_EntryCmd_t": SCH_EntryCmd_t_pb2.SCH_EntryCmd_t_pb,
-    "SCH_ActivityDoneMsg_t": SCH_ActivityDoneMsg_t_pb2.SCH_ActivityDoneMsg_t_pb,
-    "SCH_AppData_t": SCH_AppData_t_pb2.SCH_AppData_t_pb,
-    "SCH_DiagPacket_t": SCH_DiagPacket_t_pb2.SCH_DiagPacket_t_pb,
-}
+proto_msg_map = MessageRegistry({
+    "BAT_HkTlm_t": ("pyliner.python_pb.BAT_HkTlm_t_pb2", "BAT_HkTlm_t_pb"),
+    "BAT_CurrentValueTable_t": ("pyliner.python_pb.BAT_CurrentValueTable_t_pb2", "BAT_CurrentValueTable_t_pb"),
+    "BAT_ConfigTbl_t": ("pyliner.python_pb.BAT_ConfigTbl_t_pb2", "BAT_ConfigTbl_t_pb"),
+    "RCIN_HkTlm_t": ("pyliner.python_pb.RCIN_HkTlm_t_pb2", "RCIN_HkTlm_t_pb"),
+    "RCIN_CustomData_t": ("pyliner.python_pb.RCIN_CustomData_t_pb2", "RCIN_CustomData_t_pb"),
+    "RCIN_Custom_JoystickChannelMapping_t": ("pyliner.python_pb.RCIN_Custom_JoystickChannelMapping_t_pb2", "RCIN_Custom_JoystickChannelMapping_t_pb"),
+    "HS_MATEntry_t": ("pyliner.python_pb.HS_MATEntry_t_pb2", "HS_MATEntry_t_pb"),
+    "HS_EMTEntry_t": ("pyliner.python_pb.HS_EMTEntry_t_pb2", "HS_EMTEntry_t_pb"),
+    "HS_CDSData_t": ("pyliner.python_pb.HS_CDSData_t_pb2", "HS_CDSData_t_pb"),
+    "HS_XCTEntry_t": ("pyliner.python_pb.HS_XCTEntry_t_pb2", "HS_XCTEntry_t_pb"),
+    "HS_HkPacket_t": ("pyliner.python_pb.HS_HkPacket_t_pb2", "HS_HkPacket_t_pb"),
+    "HS_SetUtilParamsCmd_t": ("pyliner.python_pb.HS_SetUtilParamsCmd_t_pb2", "HS_SetUtilParamsCmd_t_pb"),
+    "HS_CustomData_t": ("pyliner.python_pb.HS_CustomData_t_pb2", "HS_CustomData_t_pb"),
+    "HS_SetUtilDiagCmd_t": ("pyliner.python_pb.HS_SetUtilDiagCmd_t_pb2", "HS_SetUtilDiagCmd_t_pb"),
+    "HS_AMTEntry_t": ("pyliner.python_pb.HS_AMTEntry_t_pb2", "HS_AMTEntry_t_pb"),
+    "HS_AppData_t": ("pyliner.python_pb.HS_AppData_t_pb2", "HS_AppData_t_pb"),
+    "HS_SetMaxResetsCmd_t": ("pyliner.python_pb.HS_SetMaxResetsCmd_t_pb2", "HS_SetMaxResetsCmd_t_pb"),
+    "SIMLIB_PressureAltitudeData_t": ("pyliner.python_pb.SIMLIB_PressureAltitudeData_t_pb2", "SIMLIB_PressureAltitudeData_t_pb"),
+    "SIMLIB_LibData_t": ("pyliner.python_pb.SIMLIB_LibData_t_pb2", "SIMLIB_LibData_t_pb"),
+    "SIMLIB_ActuatorControlsData_t": ("pyliner.python_pb.SIMLIB_ActuatorControlsData_t_pb2", "SIMLIB_ActuatorControlsData_t_pb"),
+    "SIMLIB_AccelData_t": ("pyliner.python_pb.SIMLIB_AccelData_t_pb2", "SIMLIB_AccelData_t_pb"),
+    "SIMLIB_DistanceSensorData_t": ("pyliner.python_pb.SIMLIB_DistanceSensorData_t_pb2", "SIMLIB_DistanceSensorData_t_pb"),
+    "SIMLIB_MagData_t": ("pyliner.python_pb.SIMLIB_MagData_t_pb2", "SIMLIB_MagData_t_pb"),
+    "SIMLIB_TemperatureData_t": ("pyliner.python_pb.SIMLIB_TemperatureData_t_pb2", "SIMLIB_TemperatureData_t_pb"),
+    "SIMLIB_DiffPressureData_t": ("pyliner.python_pb.SIMLIB_DiffPressureData_t_pb2", "SIMLIB_DiffPressureData_t_pb"),
+    "SIMLIB_GyroData_t": ("pyliner.python_pb.SIMLIB_GyroData_t_pb2", "SIMLIB_GyroData_t_pb"),
+    "SIMLIB_RCInputData_t": ("pyliner.python_pb.SIMLIB_RCInputData_t_pb2", "SIMLIB_RCInputData_t_pb"),
+    "SIMLIB_GPSData_t": ("pyliner.python_pb.SIMLIB_GPSData_t_pb2", "SIMLIB_GPSData_t_pb"),
+    "QAE_ConfigTbl_t": ("pyliner.python_pb.QAE_ConfigTbl_t_pb2", "QAE_ConfigTbl_t_pb"),
+    "QAE_CurrentValueTable_t": ("pyliner.python_pb.QAE_CurrentValueTable_t_pb2", "QAE_CurrentValueTable_t_pb"),
+    "QAE_HkTlm_t": ("pyliner.python_pb.QAE_HkTlm_t_pb2", "QAE_HkTlm_t_pb"),
+    "QAE_Params_t": ("pyliner.python_pb.QAE_Params_t_pb2", "QAE_Params_t_pb"),
+    "HK_AppData_t": ("pyliner.python_pb.HK_AppData_t_pb2", "HK_AppData_t_pb"),
+    "HK_HkPacket_t": ("pyliner.python_pb.HK_HkPacket_t_pb2", "HK_HkPacket_t_pb"),
+    "MPC_HkTlm_t": ("pyliner.python_pb.MPC_HkTlm_t_pb2", "MPC_HkTlm_t_pb"),
+    "MPC_ConfigTbl_t": ("pyliner.python_pb.MPC_ConfigTbl_t_pb2", "MPC_ConfigTbl_t_pb"),
+    "NAV_HkTlm_t": ("pyliner.python_pb.NAV_HkTlm_t_pb2", "NAV_HkTlm_t_pb"),
+    "NAV_Params_t": ("pyliner.python_pb.NAV_Params_t_pb2", "NAV_Params_t_pb"),
+    "NAV_ConfigTbl_t": ("pyliner.python_pb.NAV_ConfigTbl_t_pb2", "NAV_ConfigTbl_t_pb"),
+    "NAV_MissionItem_t": ("pyliner.python_pb.NAV_MissionItem_t_pb2", "NAV_MissionItem_t_pb"),
+    "NAV_CurrentValueTable_t": ("pyliner.python_pb.NAV_CurrentValueTable_t_pb2", "NAV_CurrentValueTable_t_pb"),
+    "FM_MoveFileCmd_t": ("pyliner.python_pb.FM_MoveFileCmd_t_pb2", "FM_MoveFileCmd_t_pb"),
+    "FM_FileInfoPkt_t": ("pyliner.python_pb.FM_FileInfoPkt_t_pb2", "FM_FileInfoPkt_t_pb"),
+    "FM_TableEntry_t": ("pyliner.python_pb.FM_TableEntry_t_pb2", "FM_TableEntry_t_pb"),
+    "FM_SetPermCmd_t": ("pyliner.python_pb.FM_SetPermCmd_t_pb2", "FM_SetPermCmd_t_pb"),
+    "FM_CopyFileCmd_t": ("pyliner.python_pb.FM_CopyFileCmd_t_pb2", "FM_CopyFileCmd_t_pb"),
+    "FM_ConcatCmd_t": ("pyliner.python_pb.FM_ConcatCmd_t_pb2", "FM_ConcatCmd_t_pb"),
+    "FM_GetDirPktCmd_t": ("pyliner.python_pb.FM_GetDirPktCmd_t_pb2", "FM_GetDirPktCmd_t_pb"),
+    "FM_OpenFilesEntry_t": ("pyliner.python_pb.FM_OpenFilesEntry_t_pb2", "FM_OpenFilesEntry_t_pb"),
+    "FM_DirListPkt_t": ("pyliner.python_pb.FM_DirListPkt_t_pb2", "FM_DirListPkt_t_pb"),
+    "FM_ChildQueueEntry_t": ("pyliner.python_pb.FM_ChildQueueEntry_t_pb2", "FM_ChildQueueEntry_t_pb"),
+    "FM_DeleteAllCmd_t": ("pyliner.python_pb.FM_DeleteAllCmd_t_pb2", "FM_DeleteAllCmd_t_pb"),
+    "FM_DeleteDirCmd_t": ("pyliner.python_pb.FM_DeleteDirCmd_t_pb2", "FM_DeleteDirCmd_t_pb"),
+    "FM_DeleteFileCmd_t": ("pyliner.python_pb.FM_DeleteFileCmd_t_pb2", "FM_DeleteFileCmd_t_pb"),
+    "FM_RenameFileCmd_t": ("pyliner.python_pb.FM_RenameFileCmd_t_pb2", "FM_RenameFileCmd_t_pb"),
+    "FM_GlobalData_t": ("pyliner.python_pb.FM_GlobalData_t_pb2", "FM_GlobalData_t_pb"),
+    "FM_DirListFileStats_t": ("pyliner.python_pb.FM_DirListFileStats_t_pb2", "FM_DirListFileStats_t_pb"),
+    "FM_HousekeepingPkt_t": ("pyliner.python_pb.FM_HousekeepingPkt_t_pb2", "FM_HousekeepingPkt_t_pb"),
+    "FM_OpenFilesPkt_t": ("pyliner.python_pb.FM_OpenFilesPkt_t_pb2", "FM_OpenFilesPkt_t_pb"),
+    "FM_DirListEntry_t": ("pyliner.python_pb.FM_DirListEntry_t_pb2", "FM_DirListEntry_t_pb"),
+    "FM_DecompressCmd_t": ("pyliner.python_pb.FM_DecompressCmd_t_pb2", "FM_DecompressCmd_t_pb"),
+    "FM_FreeSpacePktEntry_t": ("pyliner.python_pb.FM_FreeSpacePktEntry_t_pb2", "FM_FreeSpacePktEntry_t_pb"),
+    "FM_FreeSpaceTable_t": ("pyliner.python_pb.FM_FreeSpaceTable_t_pb2", "FM_FreeSpaceTable_t_pb"),
+    "FM_GetFileInfoCmd_t": ("pyliner.python_pb.FM_GetFileInfoCmd_t_pb2", "FM_GetFileInfoCmd_t_pb"),
+    "FM_GetDirFileCmd_t": ("pyliner.python_pb.FM_GetDirFileCmd_t_pb2", "FM_GetDirFileCmd_t_pb"),
+    "FM_FreeSpacePkt_t": ("pyliner.python_pb.FM_FreeSpacePkt_t_pb2", "FM_FreeSpacePkt_t_pb"),
+    "FM_CreateDirCmd_t": ("pyliner.python_pb.FM_CreateDirCmd_t_pb2", "FM_CreateDirCmd_t_pb"),
+    "FM_SetTableStateCmd_t": ("pyliner.python_pb.FM_SetTableStateCmd_t_pb2", "FM_SetTableStateCmd_t_pb"),
+    "SIM_HkTlm_t": ("pyliner.python_pb.SIM_HkTlm_t_pb2", "SIM_HkTlm_t_pb"),
+    "SIM_ConfigTbl_t": ("pyliner.python_pb.SIM_ConfigTbl_t_pb2", "SIM_ConfigTbl_t_pb"),
+    "LD_HkTlm_t": ("pyliner.python_pb.LD_HkTlm_t_pb2", "LD_HkTlm_t_pb"),
+    "LD_Params_t": ("pyliner.python_pb.LD_Params_t_pb2", "LD_Params_t_pb"),
+    "LD_CurrentValueTable_t": ("pyliner.python_pb.LD_CurrentValueTable_t_pb2", "LD_CurrentValueTable_t_pb"),
+    "LD_ConfigTbl_t": ("pyliner.python_pb.LD_ConfigTbl_t_pb2", "LD_ConfigTbl_t_pb"),
+    "LC_HkPacket_t": ("pyliner.python_pb.LC_HkPacket_t_pb2", "LC_HkPacket_t_pb"),
+    "LC_SetAPPermOff_t": ("pyliner.python_pb.LC_SetAPPermOff_t_pb2", "LC_SetAPPermOff_t_pb"),
+    "LC_ResetWPStats_t": ("pyliner.python_pb.LC_ResetWPStats_t_pb2", "LC_ResetWPStats_t_pb"),
+    "LC_ADTEntry_t": ("pyliner.python_pb.LC_ADTEntry_t_pb2", "LC_ADTEntry_t_pb"),
+    "LC_MessageList_t": ("pyliner.python_pb.LC_MessageList_t_pb2", "LC_MessageList_t_pb"),
+    "LC_WDTEntry_t": ("pyliner.python_pb.LC_WDTEntry_t_pb2", "LC_WDTEntry_t_pb"),
+    "LC_WRTTransition_t": ("pyliner.python_pb.LC_WRTTransition_t_pb2", "LC_WRTTransition_t_pb"),
+    "LC_MListTag": ("pyliner.python_pb.LC_MListTag_pb2", "LC_MListTag_pb"),
+    "LC_SampleAP_t": ("pyliner.python_pb.LC_SampleAP_t_pb2", "LC_SampleAP_t_pb"),
+    "LC_SetLCState_t": ("pyliner.python_pb.LC_SetLCState_t_pb2", "LC_SetLCState_t_pb"),
+    "LC_AppData_t": ("pyliner.python_pb.LC_AppData_t_pb2", "LC_AppData_t_pb"),
+    "LC_WListTag": ("pyliner.python_pb.LC_WListTag_pb2", "LC_WListTag_pb"),
+    "LC_ResetAPStats_t": ("pyliner.python_pb.LC_ResetAPStats_t_pb2", "LC_ResetAPStats_t_pb"),
+    "LC_WRTEntry_t": ("pyliner.python_pb.LC_WRTEntry_t_pb2", "LC_WRTEntry_t_pb"),
+    "LC_SetAPState_t": ("pyliner.python_pb.LC_SetAPState_t_pb2", "LC_SetAPState_t_pb"),
+    "LC_ARTEntry_t": ("pyliner.python_pb.LC_ARTEntry_t_pb2", "LC_ARTEntry_t_pb"),
+    "LC_MultiType_t": ("pyliner.python_pb.LC_MultiType_t_pb2", "LC_MultiType_t_pb"),
+    "LC_WatchPtList_t": ("pyliner.python_pb.LC_WatchPtList_t_pb2", "LC_WatchPtList_t_pb"),
+    "LC_OperData_t": ("pyliner.python_pb.LC_OperData_t_pb2", "LC_OperData_t_pb"),
+    "AMC_HkTlm_t": ("pyliner.python_pb.AMC_HkTlm_t_pb2", "AMC_HkTlm_t_pb"),
+    "AMC_CurrentValueTable_t": ("pyliner.python_pb.AMC_CurrentValueTable_t_pb2", "AMC_CurrentValueTable_t_pb"),
+    "AMC_PwmConfigTbl_t": ("pyliner.python_pb.AMC_PwmConfigTbl_t_pb2", "AMC_PwmConfigTbl_t_pb"),
+    "DS_AppFileStatus_t": ("pyliner.python_pb.DS_AppFileStatus_t_pb2", "DS_AppFileStatus_t_pb"),
+    "DS_DestSizeCmd_t": ("pyliner.python_pb.DS_DestSizeCmd_t_pb2", "DS_DestSizeCmd_t_pb"),
+    "DS_CloseFileCmd_t": ("pyliner.python_pb.DS_CloseFileCmd_t_pb2", "DS_CloseFileCmd_t_pb"),
+    "DS_AddMidCmd_t": ("pyliner.python_pb.DS_AddMidCmd_t_pb2", "DS_AddMidCmd_t_pb"),
+    "DS_AppStateCmd_t": ("pyliner.python_pb.DS_AppStateCmd_t_pb2", "DS_AppStateCmd_t_pb"),
+    "DS_FileInfoPkt_t": ("pyliner.python_pb.DS_FileInfoPkt_t_pb2", "DS_FileInfoPkt_t_pb"),
+    "DS_DestTypeCmd_t": ("pyliner.python_pb.DS_DestTypeCmd_t_pb2", "DS_DestTypeCmd_t_pb"),
+    "DS_FilterParmsCmd_t": ("pyliner.python_pb.DS_FilterParmsCmd_t_pb2", "DS_FilterParmsCmd_t_pb"),
+    "DS_AppData_t": ("pyliner.python_pb.DS_AppData_t_pb2", "DS_AppData_t_pb"),
+    "DS_PacketEntry_t": ("pyliner.python_pb.DS_PacketEntry_t_pb2", "DS_PacketEntry_t_pb"),
+    "DS_HkPacket_t": ("pyliner.python_pb.DS_HkPacket_t_pb2", "DS_HkPacket_t_pb"),
+    "DS_DestExtCmd_t": ("pyliner.python_pb.DS_DestExtCmd_t_pb2", "DS_DestExtCmd_t_pb"),
+    "DS_DestBaseCmd_t": ("pyliner.python_pb.DS_DestBaseCmd_t_pb2", "DS_DestBaseCmd_t_pb"),
+    "DS_HashLink_t": ("pyliner.python_pb.DS_HashLink_t_pb2", "DS_HashLink_t_pb"),
+    "DS_DestCountCmd_t": ("pyliner.python_pb.DS_DestCountCmd_t_pb2", "DS_DestCountCmd_t_pb"),
+    "DS_DestStateCmd_t": ("pyliner.python_pb.DS_DestStateCmd_t_pb2", "DS_DestStateCmd_t_pb"),
+    "DS_DestPathCmd_t": ("pyliner.python_pb.DS_DestPathCmd_t_pb2", "DS_DestPathCmd_t_pb"),
+    "DS_HashTag": ("pyliner.python_pb.DS_HashTag_pb2", "DS_HashTag_pb"),
+    "DS_DestFileTable_t": ("pyliner.python_pb.DS_DestFileTable_t_pb2", "DS_DestFileTable_t_pb"),
+    "DS_FilterTable_t": ("pyliner.python_pb.DS_FilterTable_t_pb2", "DS_FilterTable_t_pb"),
+    "DS_FileInfo_t": ("pyliner.python_pb.DS_FileInfo_t_pb2", "DS_FileInfo_t_pb"),
+    "DS_FilterParms_t": ("pyliner.python_pb.DS_FilterParms_t_pb2", "DS_FilterParms_t_pb"),
+    "DS_FilterTypeCmd_t": ("pyliner.python_pb.DS_FilterTypeCmd_t_pb2", "DS_FilterTypeCmd_t_pb"),
+    "DS_FilterFileCmd_t": ("pyliner.python_pb.DS_FilterFileCmd_t_pb2", "DS_FilterFileCmd_t_pb"),
+    "DS_FileHeader_t": ("pyliner.python_pb.DS_FileHeader_t_pb2", "DS_FileHeader_t_pb"),
+    "DS_DestAgeCmd_t": ("pyliner.python_pb.DS_DestAgeCmd_t_pb2", "DS_DestAgeCmd_t_pb"),
+    "DS_DestFileEntry_t": ("pyliner.python_pb.DS_DestFileEntry_t_pb2", "DS_DestFileEntry_t_pb"),
+    "TO_OutData_t": ("pyliner.python_pb.TO_OutData_t_pb2", "TO_OutData_t_pb"),
+    "TO_MessageFlowDiagTlm_t": ("pyliner.python_pb.TO_MessageFlowDiagTlm_t_pb2", "TO_MessageFlowDiagTlm_t_pb"),
+    "TO_RemoveMessageFlowCmd_t": ("pyliner.python_pb.TO_RemoveMessageFlowCmd_t_pb2", "TO_RemoveMessageFlowCmd_t_pb"),
+    "TO_OutputQueue_t": ("pyliner.python_pb.TO_OutputQueue_t_pb2", "TO_OutputQueue_t_pb"),
+    "TO_DisableChannelCmd_t": ("pyliner.python_pb.TO_DisableChannelCmd_t_pb2", "TO_DisableChannelCmd_t_pb"),
+    "TO_PriorityQueue_t": ("pyliner.python_pb.TO_PriorityQueue_t_pb2", "TO_PriorityQueue_t_pb"),
+    "TO_ChannelDiagTlm_t": ("pyliner.python_pb.TO_ChannelDiagTlm_t_pb2", "TO_ChannelDiagTlm_t_pb"),
+    "TO_AddMessageFlowCmd_t": ("pyliner.python_pb.TO_AddMessageFlowCmd_t_pb2", "TO_AddMessageFlowCmd_t_pb"),
+    "TO_AppCustomData_t": ("pyliner.python_pb.TO_AppCustomData_t_pb2", "TO_AppCustomData_t_pb"),
+    "TO_EnableChannelCmd_t": ("pyliner.python_pb.TO_EnableChannelCmd_t_pb2", "TO_EnableChannelCmd_t_pb"),
+    "TO_QueryMessageFlowCmd_t": ("pyliner.python_pb.TO_QueryMessageFlowCmd_t_pb2", "TO_QueryMessageFlowCmd_t_pb"),
+    "TO_SendDiagCmd_t": ("pyliner.python_pb.TO_SendDiagCmd_t_pb2", "TO_SendDiagCmd_t_pb"),
+    "TO_ChannelTbl_t": ("pyliner.python_pb.TO_ChannelTbl_t_pb2", "TO_ChannelTbl_t_pb"),
+    "TO_AppData_t": ("pyliner.python_pb.TO_AppData_t_pb2", "TO_AppData_t_pb"),
+    "TO_QueryOutputChannelCmd_t": ("pyliner.python_pb.TO_QueryOutputChannelCmd_t_pb2", "TO_QueryOutputChannelCmd_t_pb"),
+    "TO_TlmChannels_t": ("pyliner.python_pb.TO_TlmChannels_t_pb2", "TO_TlmChannels_t_pb"),
+    "TO_ChannelDumpTbl_t": ("pyliner.python_pb.TO_ChannelDumpTbl_t_pb2", "TO_ChannelDumpTbl_t_pb"),
+    "TO_QueryPriorityQueueCmd_t": ("pyliner.python_pb.TO_QueryPriorityQueueCmd_t_pb2", "TO_QueryPriorityQueueCmd_t_pb"),
+    "TO_MessageFlow_t": ("pyliner.python_pb.TO_MessageFlow_t_pb2", "TO_MessageFlow_t_pb"),
+    "TO_MessageFlowMetrics_t": ("pyliner.python_pb.TO_MessageFlowMetrics_t_pb2", "TO_MessageFlowMetrics_t_pb"),
+    "TO_PriorityQueueMetrics_t": ("pyliner.python_pb.TO_PriorityQueueMetrics_t_pb2", "TO_PriorityQueueMetrics_t_pb"),
+    "TO_OutputQueueDiagTlm_t": ("pyliner.python_pb.TO_OutputQueueDiagTlm_t_pb2", "TO_OutputQueueDiagTlm_t_pb"),
+    "TO_PriorityDiagTlm_t": ("pyliner.python_pb.TO_PriorityDiagTlm_t_pb2", "TO_PriorityDiagTlm_t_pb"),
+    "TO_InData_t": ("pyliner.python_pb.TO_InData_t_pb2", "TO_InData_t_pb"),
+    "TO_ChannelData_t": ("pyliner.python_pb.TO_ChannelData_t_pb2", "TO_ChannelData_t_pb"),
+    "TO_HkTlm_t": ("pyliner.python_pb.TO_HkTlm_t_pb2", "TO_HkTlm_t_pb"),
+    "PE_ConfigTbl_t": ("pyliner.python_pb.PE_ConfigTbl_t_pb2", "PE_ConfigTbl_t_pb"),
+    "PE_Params_t": ("pyliner.python_pb.PE_Params_t_pb2", "PE_Params_t_pb"),
+    "PE_HkTlm_t": ("pyliner.python_pb.PE_HkTlm_t_pb2", "PE_HkTlm_t_pb"),
+    "MPU9250_HkTlm_t": ("pyliner.python_pb.MPU9250_HkTlm_t_pb2", "MPU9250_HkTlm_t_pb"),
+    "MPU9250_Params_t": ("pyliner.python_pb.MPU9250_Params_t_pb2", "MPU9250_Params_t_pb"),
+    "MPU9250_CalibrationMsg_t": ("pyliner.python_pb.MPU9250_CalibrationMsg_t_pb2", "MPU9250_CalibrationMsg_t_pb"),
+    "MPU9250_DiagPacket_t": ("pyliner.python_pb.MPU9250_DiagPacket_t_pb2", "MPU9250_DiagPacket_t_pb"),
+    "MPU9250_ConversionMsg_t": ("pyliner.python_pb.MPU9250_ConversionMsg_t_pb2", "MPU9250_ConversionMsg_t_pb"),
+    "MPU9250_ConfigTbl_t": ("pyliner.python_pb.MPU9250_ConfigTbl_t_pb2", "MPU9250_ConfigTbl_t_pb"),
+    "CI_CmdRegData_t": ("pyliner.python_pb.CI_CmdRegData_t_pb2", "CI_CmdRegData_t_pb"),
+    "CI_InData_t": ("pyliner.python_pb.CI_InData_t_pb2", "CI_InData_t_pb"),
+    "CI_CdsTbl_t": ("pyliner.python_pb.CI_CdsTbl_t_pb2", "CI_CdsTbl_t_pb"),
+    "CI_TimeoutTblEntry_t": ("pyliner.python_pb.CI_TimeoutTblEntry_t_pb2", "CI_TimeoutTblEntry_t_pb"),
+    "CI_AppData_t": ("pyliner.python_pb.CI_AppData_t_pb2", "CI_AppData_t_pb"),
+    "CI_CmdAuthData_t": ("pyliner.python_pb.CI_CmdAuthData_t_pb2", "CI_CmdAuthData_t_pb"),
+    "CI_ConfigTblEntry_t": ("pyliner.python_pb.CI_ConfigTblEntry_t_pb2", "CI_ConfigTblEntry_t_pb"),
+    "CI_OutData_t": ("pyliner.python_pb.CI_OutData_t_pb2", "CI_OutData_t_pb"),
+    "CI_CmdData_t": ("pyliner.python_pb.CI_CmdData_t_pb2", "CI_CmdData_t_pb"),
+    "CI_HkTlm_t": ("pyliner.python_pb.CI_HkTlm_t_pb2", "CI_HkTlm_t_pb"),
+    "CI_AppCustomData_t": ("pyliner.python_pb.CI_AppCustomData_t_pb2", "CI_AppCustomData_t_pb"),
+    "VC_AppCustomDevice_t": ("pyliner.python_pb.VC_AppCustomDevice_t_pb2", "VC_AppCustomDevice_t_pb"),
+    "VC_HkTlm_t": ("pyliner.python_pb.VC_HkTlm_t_pb2", "VC_HkTlm_t_pb"),
+    "VC_Transmit_Handle_t": ("pyliner.python_pb.VC_Transmit_Handle_t_pb2", "VC_Transmit_Handle_t_pb"),
+    "VC_AppData_t": ("pyliner.python_pb.VC_AppData_t_pb2", "VC_AppData_t_pb"),
+    "VC_Device_Handle_t": ("pyliner.python_pb.VC_Device_Handle_t_pb2", "VC_Device_Handle_t_pb"),
+    "VC_StartStreamCmd_t": ("pyliner.python_pb.VC_StartStreamCmd_t_pb2", "VC_StartStreamCmd_t_pb"),
+    "VC_AppCustomData_t": ("pyliner.python_pb.VC_AppCustomData_t_pb2", "VC_AppCustomData_t_pb"),
+    "ULR_ConfigTbl_t": ("pyliner.python_pb.ULR_ConfigTbl_t_pb2", "ULR_ConfigTbl_t_pb"),
+    "ULR_HkTlm_t": ("pyliner.python_pb.ULR_HkTlm_t_pb2", "ULR_HkTlm_t_pb"),
+    "ULR_UartMessage_t": ("pyliner.python_pb.ULR_UartMessage_t_pb2", "ULR_UartMessage_t_pb"),
+    "EA_OutData_t": ("pyliner.python_pb.EA_OutData_t_pb2", "EA_OutData_t_pb"),
+    "EA_StartCmd_t": ("pyliner.python_pb.EA_StartCmd_t_pb2", "EA_StartCmd_t_pb"),
+    "EA_InData_t": ("pyliner.python_pb.EA_InData_t_pb2", "EA_InData_t_pb"),
+    "EA_HkTlm_t": ("pyliner.python_pb.EA_HkTlm_t_pb2", "EA_HkTlm_t_pb"),
+    "EA_CdsTbl_t": ("pyliner.python_pb.EA_CdsTbl_t_pb2", "EA_CdsTbl_t_pb"),
+    "EA_ProcData_t": ("pyliner.python_pb.EA_ProcData_t_pb2", "EA_ProcData_t_pb"),
+    "EA_ChildData_t": ("pyliner.python_pb.EA_ChildData_t_pb2", "EA_ChildData_t_pb"),
+    "EA_ConfigTblEntry_t": ("pyliner.python_pb.EA_ConfigTblEntry_t_pb2", "EA_ConfigTblEntry_t_pb"),
+    "EA_AppData_t": ("pyliner.python_pb.EA_AppData_t_pb2", "EA_AppData_t_pb"),
+    "VM_Params_t": ("pyliner.python_pb.VM_Params_t_pb2", "VM_Params_t_pb"),
+    "VM_HkTlm_t": ("pyliner.python_pb.VM_HkTlm_t_pb2", "VM_HkTlm_t_pb"),
+    "VM_ConfigTbl_t": ("pyliner.python_pb.VM_ConfigTbl_t_pb2", "VM_ConfigTbl_t_pb"),
+    "VM_Modes": ("pyliner.python_pb.VM_Modes_pb2", "VM_Modes_pb"),
+    "VM_StatusFlags": ("pyliner.python_pb.VM_StatusFlags_pb2", "VM_StatusFlags_pb"),
+    "PRMLIB_ParamTblData_t": ("pyliner.python_pb.PRMLIB_ParamTblData_t_pb2", "PRMLIB_ParamTblData_t_pb"),
+    "PRMLIB_ParamData_t": ("pyliner.python_pb.PRMLIB_ParamData_t_pb2", "PRMLIB_ParamData_t_pb"),
+    "PRMLIB_AppData_t": ("pyliner.python_pb.PRMLIB_AppData_t_pb2", "PRMLIB_AppData_t_pb"),
+    "PRMLIB_UpdatedParamMsg_t": ("pyliner.python_pb.PRMLIB_UpdatedParamMsg_t_pb2", "PRMLIB_UpdatedParamMsg_t_pb"),
+    "CF_QueueInfoFileEntry_t": ("pyliner.python_pb.CF_QueueInfoFileEntry_t_pb2", "CF_QueueInfoFileEntry_t_pb"),
+    "CF_Queue_t": ("pyliner.python_pb.CF_Queue_t_pb2", "CF_Queue_t_pb"),
+    "CF_QueueDirFiles_t": ("pyliner.python_pb.CF_QueueDirFiles_t_pb2", "CF_QueueDirFiles_t_pb"),
+    "CF_TransPacket_t": ("pyliner.python_pb.CF_TransPacket_t_pb2", "CF_TransPacket_t_pb"),
+    "CF_KickstartCmd_t": ("pyliner.python_pb.CF_KickstartCmd_t_pb2", "CF_KickstartCmd_t_pb"),
+    "CF_EnDisPollCmd_t": ("pyliner.python_pb.CF_EnDisPollCmd_t_pb2", "CF_EnDisPollCmd_t_pb"),
+    "CF_HkPacket_t": ("pyliner.python_pb.CF_HkPacket_t_pb2", "CF_HkPacket_t_pb"),
+    "CF_ChannelData_t": ("pyliner.python_pb.CF_ChannelData_t_pb2", "CF_ChannelData_t_pb"),
+    "CF_ConfigPacket_t": ("pyliner.python_pb.CF_ConfigPacket_t_pb2", "CF_ConfigPacket_t_pb"),
+    "CF_DequeueNodeCmd_t": ("pyliner.python_pb.CF_DequeueNodeCmd_t_pb2", "CF_DequeueNodeCmd_t_pb"),
+    "CF_CARSCmd_t": ("pyliner.python_pb.CF_CARSCmd_t_pb2", "CF_CARSCmd_t_pb"),
+    "CF_SetPollParamCmd_t": ("pyliner.python_pb.CF_SetPollParamCmd_t_pb2", "CF_SetPollParamCmd_t_pb"),
+    "CF_SetMibParam_t": ("pyliner.python_pb.CF_SetMibParam_t_pb2", "CF_SetMibParam_t_pb"),
+    "CF_MemParams_t": ("pyliner.python_pb.CF_MemParams_t_pb2", "CF_MemParams_t_pb"),
+    "CF_AutoSuspendEnCmd_t": ("pyliner.python_pb.CF_AutoSuspendEnCmd_t_pb2", "CF_AutoSuspendEnCmd_t_pb"),
+    "CF_EngTransStat_t": ("pyliner.python_pb.CF_EngTransStat_t_pb2", "CF_EngTransStat_t_pb"),
+    "CF_WriteQueueCmd_t": ("pyliner.python_pb.CF_WriteQueueCmd_t_pb2", "CF_WriteQueueCmd_t_pb"),
+    "CF_PurgeQueueCmd_t": ("pyliner.python_pb.CF_PurgeQueueCmd_t_pb2", "CF_PurgeQueueCmd_t_pb"),
+    "CF_AppData_t": ("pyliner.python_pb.CF_AppData_t_pb2", "CF_AppData_t_pb"),
+    "CF_GiveTakeCmd_t": ("pyliner.python_pb.CF_GiveTakeCmd_t_pb2", "CF_GiveTakeCmd_t_pb"),
+    "CF_GetMibParam_t": ("pyliner.python_pb.CF_GetMibParam_t_pb2", "CF_GetMibParam_t_pb"),
+    "CF_ResetCtrsCmd_t": ("pyliner.python_pb.CF_ResetCtrsCmd_t_pb2", "CF_ResetCtrsCmd_t_pb"),
+    "CF_WriteActiveTransCmd_t": ("pyliner.python_pb.CF_WriteActiveTransCmd_t_pb2", "CF_WriteActiveTransCmd_t_pb"),
+    "CF_QueueEntry_t": ("pyliner.python_pb.CF_QueueEntry_t_pb2", "CF_QueueEntry_t_pb"),
+    "CF_SendTransCmd_t": ("pyliner.python_pb.CF_SendTransCmd_t_pb2", "CF_SendTransCmd_t_pb"),
+    "CF_PlaybackDirCmd_t": ("pyliner.python_pb.CF_PlaybackDirCmd_t_pb2", "CF_PlaybackDirCmd_t_pb"),
+    "CF_QuickStatCmd_t": ("pyliner.python_pb.CF_QuickStatCmd_t_pb2", "CF_QuickStatCmd_t_pb"),
+    "CF_PlaybackFileCmd_t": ("pyliner.python_pb.CF_PlaybackFileCmd_t_pb2", "CF_PlaybackFileCmd_t_pb"),
+    "CF_PDU_Hdr_t": ("pyliner.python_pb.CF_PDU_Hdr_t_pb2", "CF_PDU_Hdr_t_pb"),
+    "CF_AppTransStat_t": ("pyliner.python_pb.CF_AppTransStat_t_pb2", "CF_AppTransStat_t_pb"),
+    "CF_EnDisDequeueCmd_t": ("pyliner.python_pb.CF_EnDisDequeueCmd_t_pb2", "CF_EnDisDequeueCmd_t_pb"),
+    "PBLIB_RegData_t": ("pyliner.python_pb.PBLIB_RegData_t_pb2", "PBLIB_RegData_t_pb"),
+    "PBLIB_AppData_t": ("pyliner.python_pb.PBLIB_AppData_t_pb2", "PBLIB_AppData_t_pb"),
+    "CS_Res_App_Table_Entry_t": ("pyliner.python_pb.CS_Res_App_Table_Entry_t_pb2", "CS_Res_App_Table_Entry_t_pb"),
+    "CS_AppNameCmd_t": ("pyliner.python_pb.CS_AppNameCmd_t_pb2", "CS_AppNameCmd_t_pb"),
+    "CS_OneShotCmd_t": ("pyliner.python_pb.CS_OneShotCmd_t_pb2", "CS_OneShotCmd_t_pb"),
+    "CS_GetEntryIDCmd_t": ("pyliner.python_pb.CS_GetEntryIDCmd_t_pb2", "CS_GetEntryIDCmd_t_pb"),
+    "CS_EntryCmd_t": ("pyliner.python_pb.CS_EntryCmd_t_pb2", "CS_EntryCmd_t_pb"),
+    "CS_Def_EepromMemory_Table_Entry_t": ("pyliner.python_pb.CS_Def_EepromMemory_Table_Entry_t_pb2", "CS_Def_EepromMemory_Table_Entry_t_pb"),
+    "CS_HkPacket_t": ("pyliner.python_pb.CS_HkPacket_t_pb2", "CS_HkPacket_t_pb"),
+    "CS_AppData_t": ("pyliner.python_pb.CS_AppData_t_pb2", "CS_AppData_t_pb"),
+    "CS_Def_Tables_Table_Entry_t": ("pyliner.python_pb.CS_Def_Tables_Table_Entry_t_pb2", "CS_Def_Tables_Table_Entry_t_pb"),
+    "CS_Res_EepromMemory_Table_Entry_t": ("pyliner.python_pb.CS_Res_EepromMemory_Table_Entry_t_pb2", "CS_Res_EepromMemory_Table_Entry_t_pb"),
+    "CS_Res_Tables_Table_Entry_t": ("pyliner.python_pb.CS_Res_Tables_Table_Entry_t_pb2", "CS_Res_Tables_Table_Entry_t_pb"),
+    "CS_Def_App_Table_Entry_t": ("pyliner.python_pb.CS_Def_App_Table_Entry_t_pb2", "CS_Def_App_Table_Entry_t_pb"),
+    "CS_TableNameCmd_t": ("pyliner.python_pb.CS_TableNameCmd_t_pb2", "CS_TableNameCmd_t_pb"),
+    "PX4_DistanceSensorMsg_t": ("pyliner.python_pb.PX4_DistanceSensorMsg_t_pb2", "PX4_DistanceSensorMsg_t_pb"),
+    "PX4_VehicleGlobalPositionMsg_t": ("pyliner.python_pb.PX4_VehicleGlobalPositionMsg_t_pb2", "PX4_VehicleGlobalPositionMsg_t_pb"),
+    "PX4_SensorCombinedMsg_t": ("pyliner.python_pb.PX4_SensorCombinedMsg_t_pb2", "PX4_SensorCombinedMsg_t_pb"),
+    "PX4_EstimatorStatusMsg_t": ("pyliner.python_pb.PX4_EstimatorStatusMsg_t_pb2", "PX4_EstimatorStatusMsg_t_pb"),
+    "PX4_PositionSetpoint_t": ("pyliner.python_pb.PX4_PositionSetpoint_t_pb2", "PX4_PositionSetpoint_t_pb"),
+    "PX4_McAttCtrlStatusMsg_t": ("pyliner.python_pb.PX4_McAttCtrlStatusMsg_t_pb2", "PX4_McAttCtrlStatusMsg_t_pb"),
+    "PX4_InputRcMsg_t": ("pyliner.python_pb.PX4_InputRcMsg_t_pb2", "PX4_InputRcMsg_t_pb"),
+    "PX4_VehicleAttitudeMsg_t": ("pyliner.python_pb.PX4_VehicleAttitudeMsg_t_pb2", "PX4_VehicleAttitudeMsg_t_pb"),
+    "PX4_VehicleAttitudeSetpointMsg_t": ("pyliner.python_pb.PX4_VehicleAttitudeSetpointMsg_t_pb2", "PX4_VehicleAttitudeSetpointMsg_t_pb"),
+    "PX4_VehicleCommandMsg_t": ("pyliner.python_pb.PX4_VehicleCommandMsg_t_pb2", "PX4_VehicleCommandMsg_t_pb"),
+    "PX4_OpticalFlowMsg_t": ("pyliner.python_pb.PX4_OpticalFlowMsg_t_pb2", "PX4_OpticalFlowMsg_t_pb"),
+    "PX4_LedControlMsg_t": ("pyliner.python_pb.PX4_LedControlMsg_t_pb2", "PX4_LedControlMsg_t_pb"),
+    "PX4_AirspeedMsg_t": ("pyliner.python_pb.PX4_AirspeedMsg_t_pb2", "PX4_AirspeedMsg_t_pb"),
+    "PX4_SafetyMsg_t": ("pyliner.python_pb.PX4_SafetyMsg_t_pb2", "PX4_SafetyMsg_t_pb"),
+    "PX4_ActuatorControlsMsg_t": ("pyliner.python_pb.PX4_ActuatorControlsMsg_t_pb2", "PX4_ActuatorControlsMsg_t_pb"),
+    "PX4_BatteryStatusMsg_t": ("pyliner.python_pb.PX4_BatteryStatusMsg_t_pb2", "PX4_BatteryStatusMsg_t_pb"),
+    "PX4_VehicleStatusMsg_t": ("pyliner.python_pb.PX4_VehicleStatusMsg_t_pb2", "PX4_VehicleStatusMsg_t_pb"),
+    "PX4_PositionSetpointTripletMsg_t": ("pyliner.python_pb.PX4_PositionSetpointTripletMsg_t_pb2", "PX4_PositionSetpointTripletMsg_t_pb"),
+    "PX4_VehicleGpsPositionMsg_t": ("pyliner.python_pb.PX4_VehicleGpsPositionMsg_t_pb2", "PX4_VehicleGpsPositionMsg_t_pb"),
+    "PX4_VehicleLocalPositionSetpointMsg_t": ("pyliner.python_pb.PX4_VehicleLocalPositionSetpointMsg_t_pb2", "PX4_VehicleLocalPositionSetpointMsg_t_pb"),
+    "PX4_HomePositionMsg_t": ("pyliner.python_pb.PX4_HomePositionMsg_t_pb2", "PX4_HomePositionMsg_t_pb"),
+    "PX4_VehicleLocalPositionMsg_t": ("pyliner.python_pb.PX4_VehicleLocalPositionMsg_t_pb2", "PX4_VehicleLocalPositionMsg_t_pb"),
+    "PX4_TelemetryStatusMsg_t": ("pyliner.python_pb.PX4_TelemetryStatusMsg_t_pb2", "PX4_TelemetryStatusMsg_t_pb"),
+    "PX4_SaturationStatus_t": ("pyliner.python_pb.PX4_SaturationStatus_t_pb2", "PX4_SaturationStatus_t_pb"),
+    "PX4_VehicleRatesSetpointMsg_t": ("pyliner.python_pb.PX4_VehicleRatesSetpointMsg_t_pb2", "PX4_VehicleRatesSetpointMsg_t_pb"),
+    "PX4_VehicleLandDetectedMsg_t": ("pyliner.python_pb.PX4_VehicleLandDetectedMsg_t_pb2", "PX4_VehicleLandDetectedMsg_t_pb"),
+    "PX4_MissionMsg_t": ("pyliner.python_pb.PX4_MissionMsg_t_pb2", "PX4_MissionMsg_t_pb"),
+    "PX4_MissionResultMsg_t": ("pyliner.python_pb.PX4_MissionResultMsg_t_pb2", "PX4_MissionResultMsg_t_pb"),
+    "PX4_RcChannelsMsg_t": ("pyliner.python_pb.PX4_RcChannelsMsg_t_pb2", "PX4_RcChannelsMsg_t_pb"),
+    "PX4_SensorMagMsg_t": ("pyliner.python_pb.PX4_SensorMagMsg_t_pb2", "PX4_SensorMagMsg_t_pb"),
+    "PX4_GpsInjectDataMsg_t": ("pyliner.python_pb.PX4_GpsInjectDataMsg_t_pb2", "PX4_GpsInjectDataMsg_t_pb"),
+    "PX4_ControlStateMsg_t": ("pyliner.python_pb.PX4_ControlStateMsg_t_pb2", "PX4_ControlStateMsg_t_pb"),
+    "PX4_SubsystemInfoMsg_t": ("pyliner.python_pb.PX4_SubsystemInfoMsg_t_pb2", "PX4_SubsystemInfoMsg_t_pb"),
+    "PX4_ManualControlSetpointMsg_t": ("pyliner.python_pb.PX4_ManualControlSetpointMsg_t_pb2", "PX4_ManualControlSetpointMsg_t_pb"),
+    "PX4_VehicleGlobalVelocitySetpointMsg_t": ("pyliner.python_pb.PX4_VehicleGlobalVelocitySetpointMsg_t_pb2", "PX4_VehicleGlobalVelocitySetpointMsg_t_pb"),
+    "PX4_SensorBaroMsg_t": ("pyliner.python_pb.PX4_SensorBaroMsg_t_pb2", "PX4_SensorBaroMsg_t_pb"),
+    "PX4_SensorAccelMsg_t": ("pyliner.python_pb.PX4_SensorAccelMsg_t_pb2", "PX4_SensorAccelMsg_t_pb"),
+    "PX4_VehicleControlModeMsg_t": ("pyliner.python_pb.PX4_VehicleControlModeMsg_t_pb2", "PX4_VehicleControlModeMsg_t_pb"),
+    "PX4_DifferentialPressureMsg_t": ("pyliner.python_pb.PX4_DifferentialPressureMsg_t_pb2", "PX4_DifferentialPressureMsg_t_pb"),
+    "PX4_SensorGyroMsg_t": ("pyliner.python_pb.PX4_SensorGyroMsg_t_pb2", "PX4_SensorGyroMsg_t_pb"),
+    "PX4_MultirotorMotorLimitsMsg_t": ("pyliner.python_pb.PX4_MultirotorMotorLimitsMsg_t_pb2", "PX4_MultirotorMotorLimitsMsg_t_pb"),
+    "PX4_ActuatorArmedMsg_t": ("pyliner.python_pb.PX4_ActuatorArmedMsg_t_pb2", "PX4_ActuatorArmedMsg_t_pb"),
+    "PX4_ActuatorOutputsMsg_t": ("pyliner.python_pb.PX4_ActuatorOutputsMsg_t_pb2", "PX4_ActuatorOutputsMsg_t_pb"),
+    "PX4_SensorCorrectionMsg_t": ("pyliner.python_pb.PX4_SensorCorrectionMsg_t_pb2", "PX4_SensorCorrectionMsg_t_pb"),
+    "PX4_CommanderStateMsg_t": ("pyliner.python_pb.PX4_CommanderStateMsg_t_pb2", "PX4_CommanderStateMsg_t_pb"),
+    "PX4_SatelliteInfoMsg_t": ("pyliner.python_pb.PX4_SatelliteInfoMsg_t_pb2", "PX4_SatelliteInfoMsg_t_pb"),
+    "GPS_NAV_STATUS_t": ("pyliner.python_pb.GPS_NAV_STATUS_t_pb2", "GPS_NAV_STATUS_t_pb"),
+    "GPS_NAV_ODO_t": ("pyliner.python_pb.GPS_NAV_ODO_t_pb2", "GPS_NAV_ODO_t_pb"),
+    "GPS_NAV_GEOFENCE_t": ("pyliner.python_pb.GPS_NAV_GEOFENCE_t_pb2", "GPS_NAV_GEOFENCE_t_pb"),
+    "GPS_CFG_TMODE3_t": ("pyliner.python_pb.GPS_CFG_TMODE3_t_pb2", "GPS_CFG_TMODE3_t_pb"),
+    "GPS_NAV_SBAS_t": ("pyliner.python_pb.GPS_NAV_SBAS_t_pb2", "GPS_NAV_SBAS_t_pb"),
+    "GPS_NAV_TIMEUTC_t": ("pyliner.python_pb.GPS_NAV_TIMEUTC_t_pb2", "GPS_NAV_TIMEUTC_t_pb"),
+    "GPS_NAV_SVINFO_P2_t": ("pyliner.python_pb.GPS_NAV_SVINFO_P2_t_pb2", "GPS_NAV_SVINFO_P2_t_pb"),
+    "GPS_ParserStatus_t": ("pyliner.python_pb.GPS_ParserStatus_t_pb2", "GPS_ParserStatus_t_pb"),
+    "GPS_NAV_PVT_t": ("pyliner.python_pb.GPS_NAV_PVT_t_pb2", "GPS_NAV_PVT_t_pb"),
+    "GPS_NAV_POSLLH_t": ("pyliner.python_pb.GPS_NAV_POSLLH_t_pb2", "GPS_NAV_POSLLH_t_pb"),
+    "GPS_ConfigTbl_t": ("pyliner.python_pb.GPS_ConfigTbl_t_pb2", "GPS_ConfigTbl_t_pb"),
+    "GPS_CurrentValueTable_t": ("pyliner.python_pb.GPS_CurrentValueTable_t_pb2", "GPS_CurrentValueTable_t_pb"),
+    "GPS_NAV_EOE_t": ("pyliner.python_pb.GPS_NAV_EOE_t_pb2", "GPS_NAV_EOE_t_pb"),
+    "GPS_NAV_ORB_t": ("pyliner.python_pb.GPS_NAV_ORB_t_pb2", "GPS_NAV_ORB_t_pb"),
+    "GPS_ACK_NAK_t": ("pyliner.python_pb.GPS_ACK_NAK_t_pb2", "GPS_ACK_NAK_t_pb"),
+    "GPS_MON_HW_t": ("pyliner.python_pb.GPS_MON_HW_t_pb2", "GPS_MON_HW_t_pb"),
+    "GPS_NAV_SOL_t": ("pyliner.python_pb.GPS_NAV_SOL_t_pb2", "GPS_NAV_SOL_t_pb"),
+    "GPS_HkTlm_t": ("pyliner.python_pb.GPS_HkTlm_t_pb2", "GPS_HkTlm_t_pb"),
+    "GPS_NAV_SVINFO_Combined_t": ("pyliner.python_pb.GPS_NAV_SVINFO_Combined_t_pb2", "GPS_NAV_SVINFO_Combined_t_pb"),
+    "GPS_CFG_MSG_t": ("pyliner.python_pb.GPS_CFG_MSG_t_pb2", "GPS_CFG_MSG_t_pb"),
+    "GPS_CFG_NAV5_t": ("pyliner.python_pb.GPS_CFG_NAV5_t_pb2", "GPS_CFG_NAV5_t_pb"),
+    "GPS_NAV_ATT_t": ("pyliner.python_pb.GPS_NAV_ATT_t_pb2", "GPS_NAV_ATT_t_pb"),
+    "GPS_AppCustomData_t": ("pyliner.python_pb.GPS_AppCustomData_t_pb2", "GPS_AppCustomData_t_pb"),
+    "GPS_CFG_PRT_t": ("pyliner.python_pb.GPS_CFG_PRT_t_pb2", "GPS_CFG_PRT_t_pb"),
+    "GPS_NAV_AOPSTATUS_t": ("pyliner.python_pb.GPS_NAV_AOPSTATUS_t_pb2", "GPS_NAV_AOPSTATUS_t_pb"),
+    "GPS_NAV_POSECEF_t": ("pyliner.python_pb.GPS_NAV_POSECEF_t_pb2", "GPS_NAV_POSECEF_t_pb"),
+    "GPS_CFG_SBAS_t": ("pyliner.python_pb.GPS_CFG_SBAS_t_pb2", "GPS_CFG_SBAS_t_pb"),
+    "GPS_Checksum_t": ("pyliner.python_pb.GPS_Checksum_t_pb2", "GPS_Checksum_t_pb"),
+    "GPS_DeviceMessage_t": ("pyliner.python_pb.GPS_DeviceMessage_t_pb2", "GPS_DeviceMessage_t_pb"),
+    "GPS_NAV_SVINFO_P1_t": ("pyliner.python_pb.GPS_NAV_SVINFO_P1_t_pb2", "GPS_NAV_SVINFO_P1_t_pb"),
+    "GPS_ACK_ACK_t": ("pyliner.python_pb.GPS_ACK_ACK_t_pb2", "GPS_ACK_ACK_t_pb"),
+    "GPS_Header_t": ("pyliner.python_pb.GPS_Header_t_pb2", "GPS_Header_t_pb"),
+    "GPS_NAV_DOP_t": ("pyliner.python_pb.GPS_NAV_DOP_t_pb2", "GPS_NAV_DOP_t_pb"),
+    "GPS_NAV_SAT_t": ("pyliner.python_pb.GPS_NAV_SAT_t_pb2", "GPS_NAV_SAT_t_pb"),
+    "MD_CmdJam_t": ("pyliner.python_pb.MD_CmdJam_t_pb2", "MD_CmdJam_t_pb"),
+    "MD": ("pyliner.python_pb.MD_pb2", "MD_pb"),
+    "MD_AppData_t": ("pyliner.python_pb.MD_AppData_t_pb2", "MD_AppData_t_pb"),
+    "MD_DwellControlEntry_t": ("pyliner.python_pb.MD_DwellControlEntry_t_pb2", "MD_DwellControlEntry_t_pb"),
+    "MD_CmdHandlerTblRec_t": ("pyliner.python_pb.MD_CmdHandlerTblRec_t_pb2", "MD_CmdHandlerTblRec_t_pb"),
+    "MD_DwellPkt_t": ("pyliner.python_pb.MD_DwellPkt_t_pb2", "MD_DwellPkt_t_pb"),
+    "MD_DwellTableLoad_t": ("pyliner.python_pb.MD_DwellTableLoad_t_pb2", "MD_DwellTableLoad_t_pb"),
+    "MD_DwellPacketControl_t": ("pyliner.python_pb.MD_DwellPacketControl_t_pb2", "MD_DwellPacketControl_t_pb"),
+    "MD_TableLoadEntry_t": ("pyliner.python_pb.MD_TableLoadEntry_t_pb2", "MD_TableLoadEntry_t_pb"),
+    "MD_CmdSetSignature_t": ("pyliner.python_pb.MD_CmdSetSignature_t_pb2", "MD_CmdSetSignature_t_pb"),
+    "MD_CmdStartStop_t": ("pyliner.python_pb.MD_CmdStartStop_t_pb2", "MD_CmdStartStop_t_pb"),
+    "MD_HkTlm_t": ("pyliner.python_pb.MD_HkTlm_t_pb2", "MD_HkTlm_t_pb"),
+    "MM_DumpInEventCmd_t": ("pyliner.python_pb.MM_DumpInEventCmd_t_pb2", "MM_DumpInEventCmd_t_pb"),
+    "MM_HkPacket_t": ("pyliner.python_pb.MM_HkPacket_t_pb2", "MM_HkPacket_t_pb"),
+    "MM_AppData_t": ("pyliner.python_pb.MM_AppData_t_pb2", "MM_AppData_t_pb"),
+    "MM_LoadDumpFileHeader_t": ("pyliner.python_pb.MM_LoadDumpFileHeader_t_pb2", "MM_LoadDumpFileHeader_t_pb"),
+    "MM_PeekCmd_t": ("pyliner.python_pb.MM_PeekCmd_t_pb2", "MM_PeekCmd_t_pb"),
+    "MM_EepromWriteEnaCmd_t": ("pyliner.python_pb.MM_EepromWriteEnaCmd_t_pb2", "MM_EepromWriteEnaCmd_t_pb"),
+    "MM_LoadMemFromFileCmd_t": ("pyliner.python_pb.MM_LoadMemFromFileCmd_t_pb2", "MM_LoadMemFromFileCmd_t_pb"),
+    "MM_EepromWriteDisCmd_t": ("pyliner.python_pb.MM_EepromWriteDisCmd_t_pb2", "MM_EepromWriteDisCmd_t_pb"),
+    "MM_LookupSymCmd_t": ("pyliner.python_pb.MM_LookupSymCmd_t_pb2", "MM_LookupSymCmd_t_pb"),
+    "MM_FillMemCmd_t": ("pyliner.python_pb.MM_FillMemCmd_t_pb2", "MM_FillMemCmd_t_pb"),
+    "MM_PokeCmd_t": ("pyliner.python_pb.MM_PokeCmd_t_pb2", "MM_PokeCmd_t_pb"),
+    "MM_LoadMemWIDCmd_t": ("pyliner.python_pb.MM_LoadMemWIDCmd_t_pb2", "MM_LoadMemWIDCmd_t_pb"),
+    "MM_DumpMemToFileCmd_t": ("pyliner.python_pb.MM_DumpMemToFileCmd_t_pb2", "MM_DumpMemToFileCmd_t_pb"),
+    "MM_SymTblToFileCmd_t": ("pyliner.python_pb.MM_SymTblToFileCmd_t_pb2", "MM_SymTblToFileCmd_t_pb"),
+    "LGC_ConfigTbl_t": ("pyliner.python_pb.LGC_ConfigTbl_t_pb2", "LGC_ConfigTbl_t_pb"),
+    "LGC_CurrentValueTable_t": ("pyliner.python_pb.LGC_CurrentValueTable_t_pb2", "LGC_CurrentValueTable_t_pb"),
+    "LGC_HkTlm_t": ("pyliner.python_pb.LGC_HkTlm_t_pb2", "LGC_HkTlm_t_pb"),
+    "RGBLED_Device_Settings_t": ("pyliner.python_pb.RGBLED_Device_Settings_t_pb2", "RGBLED_Device_Settings_t_pb"),
+    "RGBLED_CurrentValueTable_t": ("pyliner.python_pb.RGBLED_CurrentValueTable_t_pb2", "RGBLED_CurrentValueTable_t_pb"),
+    "RGBLED_HkTlm_t": ("pyliner.python_pb.RGBLED_HkTlm_t_pb2", "RGBLED_HkTlm_t_pb"),
+    "RGBLED_AppCustomData_t": ("pyliner.python_pb.RGBLED_AppCustomData_t_pb2", "RGBLED_AppCustomData_t_pb"),
+    "CFE_ES_AppNameCmd_t": ("pyliner.python_pb.CFE_ES_AppNameCmd_t_pb2", "CFE_ES_AppNameCmd_t_pb"),
+    "CFE_ES_CDSVariables_t": ("pyliner.python_pb.CFE_ES_CDSVariables_t_pb2", "CFE_ES_CDSVariables_t_pb"),
+    "CFE_TIME_StateCmd_t": ("pyliner.python_pb.CFE_TIME_StateCmd_t_pb2", "CFE_TIME_StateCmd_t_pb"),
+    "CFE_TBL_BufParams_t": ("pyliner.python_pb.CFE_TBL_BufParams_t_pb2", "CFE_TBL_BufParams_t_pb"),
+    "CFE_TBL_CallbackFuncPtr_t": ("pyliner.python_pb.CFE_TBL_CallbackFuncPtr_t_pb2", "CFE_TBL_CallbackFuncPtr_t_pb"),
+    "CFE_SB_Msg_t": ("pyliner.python_pb.CFE_SB_Msg_t_pb2", "CFE_SB_Msg_t_pb"),
+    "CFE_ES_PerfLogDump_t": ("pyliner.python_pb.CFE_ES_PerfLogDump_t_pb2", "CFE_ES_PerfLogDump_t_pb"),
+    "CFE_EVS_AppDataCmd_Payload_t": ("pyliner.python_pb.CFE_EVS_AppDataCmd_Payload_t_pb2", "CFE_EVS_AppDataCmd_Payload_t_pb"),
+    "CFE_FS_Decompress_State_t": ("pyliner.python_pb.CFE_FS_Decompress_State_t_pb2", "CFE_FS_Decompress_State_t_pb"),
+    "CFE_SB_CmdHdr_t": ("pyliner.python_pb.CFE_SB_CmdHdr_t_pb2", "CFE_SB_CmdHdr_t_pb"),
+    "CFE_SB_RoutingFileEntry_t": ("pyliner.python_pb.CFE_SB_RoutingFileEntry_t_pb2", "CFE_SB_RoutingFileEntry_t_pb"),
+    "CFE_EVS_TlmPkt_Payload_t": ("pyliner.python_pb.CFE_EVS_TlmPkt_Payload_t_pb2", "CFE_EVS_TlmPkt_Payload_t_pb"),
+    "CFE_ES_OneAppTlm_Payload_t": ("pyliner.python_pb.CFE_ES_OneAppTlm_Payload_t_pb2", "CFE_ES_OneAppTlm_Payload_t_pb"),
+    "CFE_ES_SetMaxPRCountCmd_Payload_t": ("pyliner.python_pb.CFE_ES_SetMaxPRCountCmd_Payload_t_pb2", "CFE_ES_SetMaxPRCountCmd_Payload_t_pb"),
+    "CFE_ES_PerfStopCmd_Payload_t": ("pyliner.python_pb.CFE_ES_PerfStopCmd_Payload_t_pb2", "CFE_ES_PerfStopCmd_Payload_t_pb"),
+    "CFE_ES_CDSPool_t": ("pyliner.python_pb.CFE_ES_CDSPool_t_pb2", "CFE_ES_CDSPool_t_pb"),
+    "CFE_ES_AppReloadCmd_t": ("pyliner.python_pb.CFE_ES_AppReloadCmd_t_pb2", "CFE_ES_AppReloadCmd_t_pb"),
+    "CFE_EVS_AppNameCmd_Payload_t": ("pyliner.python_pb.CFE_EVS_AppNameCmd_Payload_t_pb2", "CFE_EVS_AppNameCmd_Payload_t_pb"),
+    "CFE_ES_StartAppCmd_Payload_t": ("pyliner.python_pb.CFE_ES_StartAppCmd_Payload_t_pb2", "CFE_ES_StartAppCmd_Payload_t_pb"),
+    "CFE_EVS_GlobalData_t": ("pyliner.python_pb.CFE_EVS_GlobalData_t_pb2", "CFE_EVS_GlobalData_t_pb"),
+    "CFE_TIME_LeapsCmd_Payload_t": ("pyliner.python_pb.CFE_TIME_LeapsCmd_Payload_t_pb2", "CFE_TIME_LeapsCmd_Payload_t_pb"),
+    "CFE_ES_CDS_RegRec_t": ("pyliner.python_pb.CFE_ES_CDS_RegRec_t_pb2", "CFE_ES_CDS_RegRec_t_pb"),
+    "CFE_ES_QueryAllCmd_Payload_t": ("pyliner.python_pb.CFE_ES_QueryAllCmd_Payload_t_pb2", "CFE_ES_QueryAllCmd_Payload_t_pb"),
+    "CFE_ES_ERLog_t": ("pyliner.python_pb.CFE_ES_ERLog_t_pb2", "CFE_ES_ERLog_t_pb"),
+    "CFE_ES_QueryAllTasksCmd_t": ("pyliner.python_pb.CFE_ES_QueryAllTasksCmd_t_pb2", "CFE_ES_QueryAllTasksCmd_t_pb"),
+    "CFE_ES_WriteERlogCmd_t": ("pyliner.python_pb.CFE_ES_WriteERlogCmd_t_pb2", "CFE_ES_WriteERlogCmd_t_pb"),
+    "CFE_EVS_BitMaskCmd_Payload_t": ("pyliner.python_pb.CFE_EVS_BitMaskCmd_Payload_t_pb2", "CFE_EVS_BitMaskCmd_Payload_t_pb"),
+    "CFE_ES_PerfDataEntry_t": ("pyliner.python_pb.CFE_ES_PerfDataEntry_t_pb2", "CFE_ES_PerfDataEntry_t_pb"),
+    "CFE_SB_MsgPtr_t": ("pyliner.python_pb.CFE_SB_MsgPtr_t_pb2", "CFE_SB_MsgPtr_t_pb"),
+    "CFE_ES_PerfMetaData_t": ("pyliner.python_pb.CFE_ES_PerfMetaData_t_pb2", "CFE_ES_PerfMetaData_t_pb"),
+    "CFE_SB_MsgPayloadPtr_t": ("pyliner.python_pb.CFE_SB_MsgPayloadPtr_t_pb2", "CFE_SB_MsgPayloadPtr_t_pb"),
+    "CFE_SB_Qos_t": ("pyliner.python_pb.CFE_SB_Qos_t_pb2", "CFE_SB_Qos_t_pb"),
+    "CFE_EVS_AppNameBitMaskCmd_t": ("pyliner.python_pb.CFE_EVS_AppNameBitMaskCmd_t_pb2", "CFE_EVS_AppNameBitMaskCmd_t_pb"),
+    "CFE_EVS_AppDataCmd_t": ("pyliner.python_pb.CFE_EVS_AppDataCmd_t_pb2", "CFE_EVS_AppDataCmd_t_pb"),
+    "CFE_TBL_DumpCmd_Payload_t": ("pyliner.python_pb.CFE_TBL_DumpCmd_Payload_t_pb2", "CFE_TBL_DumpCmd_Payload_t_pb"),
+    "CFE_ES_PerfSetTrigMaskCmd_Payload_t": ("pyliner.python_pb.CFE_ES_PerfSetTrigMaskCmd_Payload_t_pb2", "CFE_ES_PerfSetTrigMaskCmd_Payload_t_pb"),
+    "CFE_ES_ResetVariables_t": ("pyliner.python_pb.CFE_ES_ResetVariables_t_pb2", "CFE_ES_ResetVariables_t_pb"),
+    "CFE_EVS_BitMaskCmd_t": ("pyliner.python_pb.CFE_EVS_BitMaskCmd_t_pb2", "CFE_EVS_BitMaskCmd_t_pb"),
+    "CFE_ES_OverWriteSysLogCmd_t": ("pyliner.python_pb.CFE_ES_OverWriteSysLogCmd_t_pb2", "CFE_ES_OverWriteSysLogCmd_t_pb"),
+    "CFE_PSP_MemTable_t": ("pyliner.python_pb.CFE_PSP_MemTable_t_pb2", "CFE_PSP_MemTable_t_pb"),
+    "CFE_EVS_AppNameEventIDCmd_t": ("pyliner.python_pb.CFE_EVS_AppNameEventIDCmd_t_pb2", "CFE_EVS_AppNameEventIDCmd_t_pb"),
+    "CFE_SB_EventBuf_t": ("pyliner.python_pb.CFE_SB_EventBuf_t_pb2", "CFE_SB_EventBuf_t_pb"),
+    "CFE_TBL_Info_t": ("pyliner.python_pb.CFE_TBL_Info_t_pb2", "CFE_TBL_Info_t_pb"),
+    "CFE_ES_PerfStopCmd_t": ("pyliner.python_pb.CFE_ES_PerfStopCmd_t_pb2", "CFE_ES_PerfStopCmd_t_pb"),
+    "CFE_ES_AppState_t": ("pyliner.python_pb.CFE_ES_AppState_t_pb2", "CFE_ES_AppState_t_pb"),
+    "CFE_ES_QueryAllCmd_t": ("pyliner.python_pb.CFE_ES_QueryAllCmd_t_pb2", "CFE_ES_QueryAllCmd_t_pb"),
+    "CFE_ES_MainTaskInfo_t": ("pyliner.python_pb.CFE_ES_MainTaskInfo_t_pb2", "CFE_ES_MainTaskInfo_t_pb"),
+    "CFE_SB_EnRoutCmd_t": ("pyliner.python_pb.CFE_SB_EnRoutCmd_t_pb2", "CFE_SB_EnRoutCmd_t_pb"),
+    "CFE_SB_SenderId_t": ("pyliner.python_pb.CFE_SB_SenderId_t_pb2", "CFE_SB_SenderId_t_pb"),
+    "CFE_TIME_SignalCmd_t": ("pyliner.python_pb.CFE_TIME_SignalCmd_t_pb2", "CFE_TIME_SignalCmd_t_pb"),
+    "CFE_EVS_ModeCmd_t": ("pyliner.python_pb.CFE_EVS_ModeCmd_t_pb2", "CFE_EVS_ModeCmd_t_pb"),
+    "CFE_TBL_ActivateCmd_t": ("pyliner.python_pb.CFE_TBL_ActivateCmd_t_pb2", "CFE_TBL_ActivateCmd_t_pb"),
+    "CFE_EVS_LogFileCmd_Payload_t": ("pyliner.python_pb.CFE_EVS_LogFileCmd_Payload_t_pb2", "CFE_EVS_LogFileCmd_Payload_t_pb"),
+    "CFE_ES_PerfStartCmd_t": ("pyliner.python_pb.CFE_ES_PerfStartCmd_t_pb2", "CFE_ES_PerfStartCmd_t_pb"),
+    "CFE_TIME_SignalCmd_Payload_t": ("pyliner.python_pb.CFE_TIME_SignalCmd_Payload_t_pb2", "CFE_TIME_SignalCmd_Payload_t_pb"),
+    "CFE_EVS_AppNameEventIDMaskCmd_t": ("pyliner.python_pb.CFE_EVS_AppNameEventIDMaskCmd_t_pb2", "CFE_EVS_AppNameEventIDMaskCmd_t_pb"),
+    "CFE_TBL_RegistryRec_t": ("pyliner.python_pb.CFE_TBL_RegistryRec_t_pb2", "CFE_TBL_RegistryRec_t_pb"),
+    "CFE_TIME_NoArgsCmd_t": ("pyliner.python_pb.CFE_TIME_NoArgsCmd_t_pb2", "CFE_TIME_NoArgsCmd_t_pb"),
+    "CFE_TBL_TlmRegCmd_Payload_t": ("pyliner.python_pb.CFE_TBL_TlmRegCmd_Payload_t_pb2", "CFE_TBL_TlmRegCmd_Payload_t_pb"),
+    "CFE_TIME_TaskData_t": ("pyliner.python_pb.CFE_TIME_TaskData_t_pb2", "CFE_TIME_TaskData_t_pb"),
+    "CFE_ES_WriteERlogCmd_Payload_t": ("pyliner.python_pb.CFE_ES_WriteERlogCmd_Payload_t_pb2", "CFE_ES_WriteERlogCmd_Payload_t_pb"),
+    "CFE_TIME_HkPacket_Payload_t": ("pyliner.python_pb.CFE_TIME_HkPacket_Payload_t_pb2", "CFE_TIME_HkPacket_Payload_t_pb"),
+    "CFE_TBL_LoadBuff_t": ("pyliner.python_pb.CFE_TBL_LoadBuff_t_pb2", "CFE_TBL_LoadBuff_t_pb"),
+    "CFE_ES_PoolStatsTlm_t": ("pyliner.python_pb.CFE_ES_PoolStatsTlm_t_pb2", "CFE_ES_PoolStatsTlm_t_pb"),
+    "CFE_ES_QueryAllTasksCmd_Payload_t": ("pyliner.python_pb.CFE_ES_QueryAllTasksCmd_Payload_t_pb2", "CFE_ES_QueryAllTasksCmd_Payload_t_pb"),
+    "CFE_ES_RestartCmd_t": ("pyliner.python_pb.CFE_ES_RestartCmd_t_pb2", "CFE_ES_RestartCmd_t_pb"),
+    "CFE_TBL_HkPacket_Payload_t": ("pyliner.python_pb.CFE_TBL_HkPacket_Payload_t_pb2", "CFE_TBL_HkPacket_Payload_t_pb"),
+    "CFE_EVS_Packet_Payload_t": ("pyliner.python_pb.CFE_EVS_Packet_Payload_t_pb2", "CFE_EVS_Packet_Payload_t_pb"),
+    "CFE_EVS_AppDataFile_t": ("pyliner.python_pb.CFE_EVS_AppDataFile_t_pb2", "CFE_EVS_AppDataFile_t_pb"),
+    "CFE_TIME_SysTime_t": ("pyliner.python_pb.CFE_TIME_SysTime_t_pb2", "CFE_TIME_SysTime_t_pb"),
+    "CFE_TIME_DiagPacket_Payload_t": ("pyliner.python_pb.CFE_TIME_DiagPacket_Payload_t_pb2", "CFE_TIME_DiagPacket_Payload_t_pb"),
+    "CFE_TBL_TblRegPacket_Payload_t": ("pyliner.python_pb.CFE_TBL_TblRegPacket_Payload_t_pb2", "CFE_TBL_TblRegPacket_Payload_t_pb"),
+    "CFE_ES_OverWriteSysLogCmd_Payload_t": ("pyliner.python_pb.CFE_ES_OverWriteSysLogCmd_Payload_t_pb2", "CFE_ES_OverWriteSysLogCmd_Payload_t_pb"),
+    "CFE_SB_StatMsg_Payload_t": ("pyliner.python_pb.CFE_SB_StatMsg_Payload_t_pb2", "CFE_SB_StatMsg_Payload_t_pb"),
+    "CFE_ES_MemPoolStats_t": ("pyliner.python_pb.CFE_ES_MemPoolStats_t_pb2", "CFE_ES_MemPoolStats_t_pb"),
+    "CFE_SB_WriteFileInfoCmd_t": ("pyliner.python_pb.CFE_SB_WriteFileInfoCmd_t_pb2", "CFE_SB_WriteFileInfoCmd_t_pb"),
+    "CFE_TBL_ValidateCmd_t": ("pyliner.python_pb.CFE_TBL_ValidateCmd_t_pb2", "CFE_TBL_ValidateCmd_t_pb"),
+    "CFE_ES_PoolStatsTlm_Payload_t": ("pyliner.python_pb.CFE_ES_PoolStatsTlm_Payload_t_pb2", "CFE_ES_PoolStatsTlm_Payload_t_pb"),
+    "CFE_ES_DeleteCDSCmd_t": ("pyliner.python_pb.CFE_ES_DeleteCDSCmd_t_pb2", "CFE_ES_DeleteCDSCmd_t_pb"),
+    "CFE_SB_ZeroCopyD_t": ("pyliner.python_pb.CFE_SB_ZeroCopyD_t_pb2", "CFE_SB_ZeroCopyD_t_pb"),
+    "CFE_SB_BufferD_t": ("pyliner.python_pb.CFE_SB_BufferD_t_pb2", "CFE_SB_BufferD_t_pb"),
+    "CFE_TIME_SynchCallbackRegEntry_t": ("pyliner.python_pb.CFE_TIME_SynchCallbackRegEntry_t_pb2", "CFE_TIME_SynchCallbackRegEntry_t_pb"),
+    "CFE_ES_NoArgsCmd_t": ("pyliner.python_pb.CFE_ES_NoArgsCmd_t_pb2", "CFE_ES_NoArgsCmd_t_pb"),
+    "CFE_EVS_AppNameEventIDCmd_Payload_t": ("pyliner.python_pb.CFE_EVS_AppNameEventIDCmd_Payload_t_pb2", "CFE_EVS_AppNameEventIDCmd_Payload_t_pb"),
+    "CFE_TIME_FakeToneCmd_t": ("pyliner.python_pb.CFE_TIME_FakeToneCmd_t_pb2", "CFE_TIME_FakeToneCmd_t_pb"),
+    "CFE_ES_TaskInfo_t": ("pyliner.python_pb.CFE_ES_TaskInfo_t_pb2", "CFE_ES_TaskInfo_t_pb"),
+    "CFE_TBL_NotifyCmd_Payload_t": ("pyliner.python_pb.CFE_TBL_NotifyCmd_Payload_t_pb2", "CFE_TBL_NotifyCmd_Payload_t_pb"),
+    "CFE_EVS_PacketID_t": ("pyliner.python_pb.CFE_EVS_PacketID_t_pb2", "CFE_EVS_PacketID_t_pb"),
+    "CFE_FS_t": ("pyliner.python_pb.CFE_FS_t_pb2", "CFE_FS_t_pb"),
+    "CFE_PSP_ExceptionContext_t": ("pyliner.python_pb.CFE_PSP_ExceptionContext_t_pb2", "CFE_PSP_ExceptionContext_t_pb"),
+    "CFE_TBL_DelCDSCmd_Payload_t": ("pyliner.python_pb.CFE_TBL_DelCDSCmd_Payload_t_pb2", "CFE_TBL_DelCDSCmd_Payload_t_pb"),
+    "CFE_ES_AppInfo_t": ("pyliner.python_pb.CFE_ES_AppInfo_t_pb2", "CFE_ES_AppInfo_t_pb"),
+    "CFE_ES_StartAppCmd_t": ("pyliner.python_pb.CFE_ES_StartAppCmd_t_pb2", "CFE_ES_StartAppCmd_t_pb"),
+    "CFE_ES_ShellCmd_Payload_t": ("pyliner.python_pb.CFE_ES_ShellCmd_Payload_t_pb2", "CFE_ES_ShellCmd_Payload_t_pb"),
+    "CFE_ES_TaskRecord_t": ("pyliner.python_pb.CFE_ES_TaskRecord_t_pb2", "CFE_ES_TaskRecord_t_pb"),
+    "CFE_ES_CDSRegDumpRec_t": ("pyliner.python_pb.CFE_ES_CDSRegDumpRec_t_pb2", "CFE_ES_CDSRegDumpRec_t_pb"),
+    "CFE_SB_MsgMapFileEntry_t": ("pyliner.python_pb.CFE_SB_MsgMapFileEntry_t_pb2", "CFE_SB_MsgMapFileEntry_t_pb"),
+    "CFE_TBL_NotifyCmd_t": ("pyliner.python_pb.CFE_TBL_NotifyCmd_t_pb2", "CFE_TBL_NotifyCmd_t_pb"),
+    "CFE_ES_EarlyInitFuncPtr_t": ("pyliner.python_pb.CFE_ES_EarlyInitFuncPtr_t_pb2", "CFE_ES_EarlyInitFuncPtr_t_pb"),
+    "CFE_TBL_AccessDescriptor_t": ("pyliner.python_pb.CFE_TBL_AccessDescriptor_t_pb2", "CFE_TBL_AccessDescriptor_t_pb"),
+    "CFE_ES_LibRecord_t": ("pyliner.python_pb.CFE_ES_LibRecord_t_pb2", "CFE_ES_LibRecord_t_pb"),
+    "CFE_SB_TlmHdr_t": ("pyliner.python_pb.CFE_SB_TlmHdr_t_pb2", "CFE_SB_TlmHdr_t_pb"),
+    "CFE_TIME_ResetVars_t": ("pyliner.python_pb.CFE_TIME_ResetVars_t_pb2", "CFE_TIME_ResetVars_t_pb"),
+    "CFE_TBL_MsgProcFuncPtr_t": ("pyliner.python_pb.CFE_TBL_MsgProcFuncPtr_t_pb2", "CFE_TBL_MsgProcFuncPtr_t_pb"),
+    "CFE_TBL_CritRegRec_t": ("pyliner.python_pb.CFE_TBL_CritRegRec_t_pb2", "CFE_TBL_CritRegRec_t_pb"),
+    "CFE_ES_DeleteCDSCmd_Payload_t": ("pyliner.python_pb.CFE_ES_DeleteCDSCmd_Payload_t_pb2", "CFE_ES_DeleteCDSCmd_Payload_t_pb"),
+    "CFE_EVS_LogFileCmd_t": ("pyliner.python_pb.CFE_EVS_LogFileCmd_t_pb2", "CFE_EVS_LogFileCmd_t_pb"),
+    "CFE_ES_AppNameCmd_Payload_t": ("pyliner.python_pb.CFE_ES_AppNameCmd_Payload_t_pb2", "CFE_ES_AppNameCmd_Payload_t_pb"),
+    "CFE_TIME_TimeCmd_Payload_t": ("pyliner.python_pb.CFE_TIME_TimeCmd_Payload_t_pb2", "CFE_TIME_TimeCmd_Payload_t_pb"),
+    "CFE_ES_DumpCDSRegCmd_t": ("pyliner.python_pb.CFE_ES_DumpCDSRegCmd_t_pb2", "CFE_ES_DumpCDSRegCmd_t_pb"),
+    "CFE_EVS_AppNameBitMaskCmd_Payload_t": ("pyliner.python_pb.CFE_EVS_AppNameBitMaskCmd_Payload_t_pb2", "CFE_EVS_AppNameBitMaskCmd_Payload_t_pb"),
+    "CFE_ES_AppRecord_t": ("pyliner.python_pb.CFE_ES_AppRecord_t_pb2", "CFE_ES_AppRecord_t_pb"),
+    "CFE_SB_StatMsg_t": ("pyliner.python_pb.CFE_SB_StatMsg_t_pb2", "CFE_SB_StatMsg_t_pb"),
+    "CFE_TBL_DumpControl_t": ("pyliner.python_pb.CFE_TBL_DumpControl_t_pb2", "CFE_TBL_DumpControl_t_pb"),
+    "CFE_SB_RouteEntry_t": ("pyliner.python_pb.CFE_SB_RouteEntry_t_pb2", "CFE_SB_RouteEntry_t_pb"),
+    "CFE_ES_DumpCDSRegCmd_Payload_t": ("pyliner.python_pb.CFE_ES_DumpCDSRegCmd_Payload_t_pb2", "CFE_ES_DumpCDSRegCmd_Payload_t_pb"),
+    "CFE_ES_BlockStats_t": ("pyliner.python_pb.CFE_ES_BlockStats_t_pb2", "CFE_ES_BlockStats_t_pb"),
+    "CFE_PSP_CommandData_t": ("pyliner.python_pb.CFE_PSP_CommandData_t_pb2", "CFE_PSP_CommandData_t_pb"),
+    "CFE_TIME_SynchCallbackPtr_t": ("pyliner.python_pb.CFE_TIME_SynchCallbackPtr_t_pb2", "CFE_TIME_SynchCallbackPtr_t_pb"),
+    "CFE_SB_MemParams_t": ("pyliner.python_pb.CFE_SB_MemParams_t_pb2", "CFE_SB_MemParams_t_pb"),
+    "CFE_SB_PrevSubMsg_t": ("pyliner.python_pb.CFE_SB_PrevSubMsg_t_pb2", "CFE_SB_PrevSubMsg_t_pb"),
+    "CFE_EVS_Log_t": ("pyliner.python_pb.CFE_EVS_Log_t_pb2", "CFE_EVS_Log_t_pb"),
+    "CFE_TBL_DumpRegCmd_t": ("pyliner.python_pb.CFE_TBL_DumpRegCmd_t_pb2", "CFE_TBL_DumpRegCmd_t_pb"),
+    "CFE_SB_EnRoutCmd_Payload_t": ("pyliner.python_pb.CFE_SB_EnRoutCmd_Payload_t_pb2", "CFE_SB_EnRoutCmd_Payload_t_pb"),
+    "CFE_ES_WriteSyslogCmd_Payload_t": ("pyliner.python_pb.CFE_ES_WriteSyslogCmd_Payload_t_pb2", "CFE_ES_WriteSyslogCmd_Payload_t_pb"),
+    "CFE_ES_ResetData_t": ("pyliner.python_pb.CFE_ES_ResetData_t_pb2", "CFE_ES_ResetData_t_pb"),
+    "CFE_ES_PerfSetFilterMaskCmd_t": ("pyliner.python_pb.CFE_ES_PerfSetFilterMaskCmd_t_pb2", "CFE_ES_PerfSetFilterMaskCmd_t_pb"),
+    "CFE_ES_PerfStartCmd_Payload_t": ("pyliner.python_pb.CFE_ES_PerfStartCmd_Payload_t_pb2", "CFE_ES_PerfStartCmd_Payload_t_pb"),
+    "CFE_EVS_AppNameEventIDMaskCmd_Payload_t": ("pyliner.python_pb.CFE_EVS_AppNameEventIDMaskCmd_Payload_t_pb2", "CFE_EVS_AppNameEventIDMaskCmd_Payload_t_pb"),
+    "CFE_ES_ShellPacket_Payload_t": ("pyliner.python_pb.CFE_ES_ShellPacket_Payload_t_pb2", "CFE_ES_ShellPacket_Payload_t_pb"),
+    "CFE_ES_PerfData_t": ("pyliner.python_pb.CFE_ES_PerfData_t_pb2", "CFE_ES_PerfData_t_pb"),
+    "CFE_FS_Header_t": ("pyliner.python_pb.CFE_FS_Header_t_pb2", "CFE_FS_Header_t_pb"),
+    "CFE_TBL_ValidationResult_t": ("pyliner.python_pb.CFE_TBL_ValidationResult_t_pb2", "CFE_TBL_ValidationResult_t_pb"),
+    "CFE_ES_AppStartParams_t": ("pyliner.python_pb.CFE_ES_AppStartParams_t_pb2", "CFE_ES_AppStartParams_t_pb"),
+    "CFE_TBL_TaskData_t": ("pyliner.python_pb.CFE_TBL_TaskData_t_pb2", "CFE_TBL_TaskData_t_pb"),
+    "CFE_ES_ShellCmd_t": ("pyliner.python_pb.CFE_ES_ShellCmd_t_pb2", "CFE_ES_ShellCmd_t_pb"),
+    "CFE_TBL_HkPacket_t": ("pyliner.python_pb.CFE_TBL_HkPacket_t_pb2", "CFE_TBL_HkPacket_t_pb"),
+    "CFE_TIME_SourceCmd_t": ("pyliner.python_pb.CFE_TIME_SourceCmd_t_pb2", "CFE_TIME_SourceCmd_t_pb"),
+    "CFE_ES_TlmPoolStatsCmd_t": ("pyliner.python_pb.CFE_ES_TlmPoolStatsCmd_t_pb2", "CFE_ES_TlmPoolStatsCmd_t_pb"),
+    "CFE_SB_HKMsg_t": ("pyliner.python_pb.CFE_SB_HKMsg_t_pb2", "CFE_SB_HKMsg_t_pb"),
+    "CFE_ES_GenCounterRecord_t": ("pyliner.python_pb.CFE_ES_GenCounterRecord_t_pb2", "CFE_ES_GenCounterRecord_t_pb"),
+    "CFE_SB_SendErrEventBuf_t": ("pyliner.python_pb.CFE_SB_SendErrEventBuf_t_pb2", "CFE_SB_SendErrEventBuf_t_pb"),
+    "CFE_TIME_1HzAdjCmd_t": ("pyliner.python_pb.CFE_TIME_1HzAdjCmd_t_pb2", "CFE_TIME_1HzAdjCmd_t_pb"),
+    "CFE_SB_SubEntries_t": ("pyliner.python_pb.CFE_SB_SubEntries_t_pb2", "CFE_SB_SubEntries_t_pb"),
+    "CFE_ES_CDSBlockSizeDesc_t": ("pyliner.python_pb.CFE_ES_CDSBlockSizeDesc_t_pb2", "CFE_ES_CDSBlockSizeDesc_t_pb"),
+    "CFE_TIME_1HzCmd_t": ("pyliner.python_pb.CFE_TIME_1HzCmd_t_pb2", "CFE_TIME_1HzCmd_t_pb"),
+    "CFE_TIME_StateCmd_Payload_t": ("pyliner.python_pb.CFE_TIME_StateCmd_Payload_t_pb2", "CFE_TIME_StateCmd_Payload_t_pb"),
+    "CFE_TIME_ToneDataCmd_t": ("pyliner.python_pb.CFE_TIME_ToneDataCmd_t_pb2", "CFE_TIME_ToneDataCmd_t_pb"),
+    "CFE_EVS_AppNameCmd_t": ("pyliner.python_pb.CFE_EVS_AppNameCmd_t_pb2", "CFE_EVS_AppNameCmd_t_pb"),
+    "CFE_ES_HkPacket_t": ("pyliner.python_pb.CFE_ES_HkPacket_t_pb2", "CFE_ES_HkPacket_t_pb"),
+    "CFE_SB_PrevSubMsg_Payload_t": ("pyliner.python_pb.CFE_SB_PrevSubMsg_Payload_t_pb2", "CFE_SB_PrevSubMsg_Payload_t_pb"),
+    "CFE_TIME_HkPacket_t": ("pyliner.python_pb.CFE_TIME_HkPacket_t_pb2", "CFE_TIME_HkPacket_t_pb"),
+    "CFE_TBL_NoArgsCmd_t": ("pyliner.python_pb.CFE_TBL_NoArgsCmd_t_pb2", "CFE_TBL_NoArgsCmd_t_pb"),
+    "CFE_SB_WriteFileInfoCmd_Payload_t": ("pyliner.python_pb.CFE_SB_WriteFileInfoCmd_Payload_t_pb2", "CFE_SB_WriteFileInfoCmd_Payload_t_pb"),
+    "CFE_ES_WriteSyslogCmd_t": ("pyliner.python_pb.CFE_ES_WriteSyslogCmd_t_pb2", "CFE_ES_WriteSyslogCmd_t_pb"),
+    "CFE_TIME_Reference_t": ("pyliner.python_pb.CFE_TIME_Reference_t_pb2", "CFE_TIME_Reference_t_pb"),
+    "CFE_TBL_DumpRegCmd_Payload_t": ("pyliner.python_pb.CFE_TBL_DumpRegCmd_Payload_t_pb2", "CFE_TBL_DumpRegCmd_Payload_t_pb"),
+    "CFE_TBL_AbortLdCmd_t": ("pyliner.python_pb.CFE_TBL_AbortLdCmd_t_pb2", "CFE_TBL_AbortLdCmd_t_pb"),
+    "CFE_SB_PipeD_t": ("pyliner.python_pb.CFE_SB_PipeD_t_pb2", "CFE_SB_PipeD_t_pb"),
+    "CFE_ES_Global_t": ("pyliner.python_pb.CFE_ES_Global_t_pb2", "CFE_ES_Global_t_pb"),
+    "CFE_ES_FuncPtrUnion_t": ("pyliner.python_pb.CFE_ES_FuncPtrUnion_t_pb2", "CFE_ES_FuncPtrUnion_t_pb"),
+    "CFE_TBL_RegDumpRec_t": ("pyliner.python_pb.CFE_TBL_RegDumpRec_t_pb2", "CFE_TBL_RegDumpRec_t_pb"),
+    "CFE_ES_PerfSetFilterMaskCmd_Payload_t": ("pyliner.python_pb.CFE_ES_PerfSetFilterMaskCmd_Payload_t_pb2", "CFE_ES_PerfSetFilterMaskCmd_Payload_t_pb"),
+    "CFE_ES_PerfSetTrigMaskCmd_t": ("pyliner.python_pb.CFE_ES_PerfSetTrigMaskCmd_t_pb2", "CFE_ES_PerfSetTrigMaskCmd_t_pb"),
+    "CFE_ES_ChildTaskMainFuncPtr_t": ("pyliner.python_pb.CFE_ES_ChildTaskMainFuncPtr_t_pb2", "CFE_ES_ChildTaskMainFuncPtr_t_pb"),
+    "CFE_ES_TaskData_t": ("pyliner.python_pb.CFE_ES_TaskData_t_pb2", "CFE_ES_TaskData_t_pb"),
+    "CFE_TBL_AbortLdCmd_Payload_t": ("pyliner.python_pb.CFE_TBL_AbortLdCmd_Payload_t_pb2", "CFE_TBL_AbortLdCmd_Payload_t_pb"),
+    "CFE_EVS_TlmPkt_t": ("pyliner.python_pb.CFE_EVS_TlmPkt_t_pb2", "CFE_EVS_TlmPkt_t_pb"),
+    "CFE_TIME_TimeCmd_t": ("pyliner.python_pb.CFE_TIME_TimeCmd_t_pb2", "CFE_TIME_TimeCmd_t_pb"),
+    "CFE_ES_AppReloadCmd_Payload_t": ("pyliner.python_pb.CFE_ES_AppReloadCmd_Payload_t_pb2", "CFE_ES_AppReloadCmd_Payload_t_pb"),
+    "CFE_SB_SubRprtMsg_Payload_t": ("pyliner.python_pb.CFE_SB_SubRprtMsg_Payload_t_pb2", "CFE_SB_SubRprtMsg_Payload_t_pb"),
+    "CFE_TIME_1HzAdjCmd_Payload_t": ("pyliner.python_pb.CFE_TIME_1HzAdjCmd_Payload_t_pb2", "CFE_TIME_1HzAdjCmd_Payload_t_pb"),
+    "CFE_PSP_GlobalData_t": ("pyliner.python_pb.CFE_PSP_GlobalData_t_pb2", "CFE_PSP_GlobalData_t_pb"),
+    "CFE_ES_ObjectTable_t": ("pyliner.python_pb.CFE_ES_ObjectTable_t_pb2", "CFE_ES_ObjectTable_t_pb"),
+    "CFE_EVS_Packet_t": ("pyliner.python_pb.CFE_EVS_Packet_t_pb2", "CFE_EVS_Packet_t_pb"),
+    "CFE_TBL_DelCDSCmd_t": ("pyliner.python_pb.CFE_TBL_DelCDSCmd_t_pb2", "CFE_TBL_DelCDSCmd_t_pb"),
+    "CFE_ES_HkPacket_Payload_t": ("pyliner.python_pb.CFE_ES_HkPacket_Payload_t_pb2", "CFE_ES_HkPacket_Payload_t_pb"),
+    "CFE_TIME_LeapsCmd_t": ("pyliner.python_pb.CFE_TIME_LeapsCmd_t_pb2", "CFE_TIME_LeapsCmd_t_pb"),
+    "CFE_TIME_SourceCmd_Payload_t": ("pyliner.python_pb.CFE_TIME_SourceCmd_Payload_t_pb2", "CFE_TIME_SourceCmd_Payload_t_pb"),
+    "CFE_EVS_AppTlmData_t": ("pyliner.python_pb.CFE_EVS_AppTlmData_t_pb2", "CFE_EVS_AppTlmData_t_pb"),
+    "CFE_ES_SetMaxPRCountCmd_t": ("pyliner.python_pb.CFE_ES_SetMaxPRCountCmd_t_pb2", "CFE_ES_SetMaxPRCountCmd_t_pb"),
+    "CFE_SB_HKMsg_Payload_t": ("pyliner.python_pb.CFE_SB_HKMsg_Payload_t_pb2", "CFE_SB_HKMsg_Payload_t_pb"),
+    "CFE_ES_DebugVariables_t": ("pyliner.python_pb.CFE_ES_DebugVariables_t_pb2", "CFE_ES_DebugVariables_t_pb"),
+    "CFE_TBL_TblRegPacket_t": ("pyliner.python_pb.CFE_TBL_TblRegPacket_t_pb2", "CFE_TBL_TblRegPacket_t_pb"),
+    "CFE_TIME_DiagPacket_t": ("pyliner.python_pb.CFE_TIME_DiagPacket_t_pb2", "CFE_TIME_DiagPacket_t_pb"),
+    "CFE_ES_OneAppTlm_t": ("pyliner.python_pb.CFE_ES_OneAppTlm_t_pb2", "CFE_ES_OneAppTlm_t_pb"),
+    "CFE_ES_ShellPacket_t": ("pyliner.python_pb.CFE_ES_ShellPacket_t_pb2", "CFE_ES_ShellPacket_t_pb"),
+    "CFE_TBL_File_Hdr_t": ("pyliner.python_pb.CFE_TBL_File_Hdr_t_pb2", "CFE_TBL_File_Hdr_t_pb"),
+    "CFE_TIME_ToneSignalCmd_t": ("pyliner.python_pb.CFE_TIME_ToneSignalCmd_t_pb2", "CFE_TIME_ToneSignalCmd_t_pb"),
+    "CFE_TIME_ToneDataCmd_Payload_t": ("pyliner.python_pb.CFE_TIME_ToneDataCmd_Payload_t_pb2", "CFE_TIME_ToneDataCmd_Payload_t_pb"),
+    "CFE_ES_LibraryEntryFuncPtr_t": ("pyliner.python_pb.CFE_ES_LibraryEntryFuncPtr_t_pb2", "CFE_ES_LibraryEntryFuncPtr_t_pb"),
+    "CFE_ES_TlmPoolStatsCmd_Payload_t": ("pyliner.python_pb.CFE_ES_TlmPoolStatsCmd_Payload_t_pb2", "CFE_ES_TlmPoolStatsCmd_Payload_t_pb"),
+    "CFE_ES_RestartCmd_Payload_t": ("pyliner.python_pb.CFE_ES_RestartCmd_Payload_t_pb2", "CFE_ES_RestartCmd_Payload_t_pb"),
+    "CFE_TBL_DumpCmd_t": ("pyliner.python_pb.CFE_TBL_DumpCmd_t_pb2", "CFE_TBL_DumpCmd_t_pb"),
+    "CFE_SB_PipeDepthStats_t": ("pyliner.python_pb.CFE_SB_PipeDepthStats_t_pb2", "CFE_SB_PipeDepthStats_t_pb"),
+    "CFE_SB_SubRprtMsg_t": ("pyliner.python_pb.CFE_SB_SubRprtMsg_t_pb2", "CFE_SB_SubRprtMsg_t_pb"),
+    "CFE_TBL_CmdHandlerTblRec_t": ("pyliner.python_pb.CFE_TBL_CmdHandlerTblRec_t_pb2", "CFE_TBL_CmdHandlerTblRec_t_pb"),
+    "CFE_TBL_LoadCmd_t": ("pyliner.python_pb.CFE_TBL_LoadCmd_t_pb2", "CFE_TBL_LoadCmd_t_pb"),
+    "CFE_TBL_LoadCmd_Payload_t": ("pyliner.python_pb.CFE_TBL_LoadCmd_Payload_t_pb2", "CFE_TBL_LoadCmd_Payload_t_pb"),
+    "CFE_SB_DestinationD_t": ("pyliner.python_pb.CFE_SB_DestinationD_t_pb2", "CFE_SB_DestinationD_t_pb"),
+    "CFE_ES_MainAppFuncPtr_t": ("pyliner.python_pb.CFE_ES_MainAppFuncPtr_t_pb2", "CFE_ES_MainAppFuncPtr_t_pb"),
+    "CFE_ES_CDSBlockDesc_t": ("pyliner.python_pb.CFE_ES_CDSBlockDesc_t_pb2", "CFE_ES_CDSBlockDesc_t_pb"),
+    "CFE_EVS_BinFilter_t": ("pyliner.python_pb.CFE_EVS_BinFilter_t_pb2", "CFE_EVS_BinFilter_t_pb"),
+    "CFE_TBL_ActivateCmd_Payload_t": ("pyliner.python_pb.CFE_TBL_ActivateCmd_Payload_t_pb2", "CFE_TBL_ActivateCmd_Payload_t_pb"),
+    "CFE_TBL_ValidateCmd_Payload_t": ("pyliner.python_pb.CFE_TBL_ValidateCmd_Payload_t_pb2", "CFE_TBL_ValidateCmd_Payload_t_pb"),
+    "CFE_EVS_ModeCmd_Payload_t": ("pyliner.python_pb.CFE_EVS_ModeCmd_Payload_t_pb2", "CFE_EVS_ModeCmd_Payload_t_pb"),
+    "HMC5883_Params_t": ("pyliner.python_pb.HMC5883_Params_t_pb2", "HMC5883_Params_t_pb"),
+    "HMC5883_CalibrationMsg_t": ("pyliner.python_pb.HMC5883_CalibrationMsg_t_pb2", "HMC5883_CalibrationMsg_t_pb"),
+    "HMC5883_AppCustomData_t": ("pyliner.python_pb.HMC5883_AppCustomData_t_pb2", "HMC5883_AppCustomData_t_pb"),
+    "HMC5883_ConfigTbl_t": ("pyliner.python_pb.HMC5883_ConfigTbl_t_pb2", "HMC5883_ConfigTbl_t_pb"),
+    "HMC5883_ConversionMsg_t": ("pyliner.python_pb.HMC5883_ConversionMsg_t_pb2", "HMC5883_ConversionMsg_t_pb"),
+    "HMC5883_HkTlm_t": ("pyliner.python_pb.HMC5883_HkTlm_t_pb2", "HMC5883_HkTlm_t_pb"),
+    "HMC5883_DiagPacket_t": ("pyliner.python_pb.HMC5883_DiagPacket_t_pb2", "HMC5883_DiagPacket_t_pb"),
+    "MAC_CurrentValueTable_t": ("pyliner.python_pb.MAC_CurrentValueTable_t_pb2", "MAC_CurrentValueTable_t_pb"),
+    "MAC_HkTlm_t": ("pyliner.python_pb.MAC_HkTlm_t_pb2", "MAC_HkTlm_t_pb"),
+    "MAC_ParamTbl_t": ("pyliner.python_pb.MAC_ParamTbl_t_pb2", "MAC_ParamTbl_t_pb"),
+    "MAC_Params_t": ("pyliner.python_pb.MAC_Params_t_pb2", "MAC_Params_t_pb"),
+    "MS5611_HkTlm_t": ("pyliner.python_pb.MS5611_HkTlm_t_pb2", "MS5611_HkTlm_t_pb"),
+    "MS5611_ConfigTbl_t": ("pyliner.python_pb.MS5611_ConfigTbl_t_pb2", "MS5611_ConfigTbl_t_pb"),
+    "MS5611_DiagPacket_t": ("pyliner.python_pb.MS5611_DiagPacket_t_pb2", "MS5611_DiagPacket_t_pb"),
+    "MS5611_Params_t": ("pyliner.python_pb.MS5611_Params_t_pb2", "MS5611_Params_t_pb"),
+    "MS5611_AppCustomData_t": ("pyliner.python_pb.MS5611_AppCustomData_t_pb2", "MS5611_AppCustomData_t_pb"),
+    "SC_RtsCmd_t": ("pyliner.python_pb.SC_RtsCmd_t_pb2", "SC_RtsCmd_t_pb"),
+    "SC_SetContinueAtsOnFailureCmd_t": ("pyliner.python_pb.SC_SetContinueAtsOnFailureCmd_t_pb2", "SC_SetContinueAtsOnFailureCmd_t_pb"),
+    "SC_AtsInfoTable_t": ("pyliner.python_pb.SC_AtsInfoTable_t_pb2", "SC_AtsInfoTable_t_pb"),
+    "SC_HkTlm_t": ("pyliner.python_pb.SC_HkTlm_t_pb2", "SC_HkTlm_t_pb"),
+    "SC_AtpControlBlock_t": ("pyliner.python_pb.SC_AtpControlBlock_t_pb2", "SC_AtpControlBlock_t_pb"),
+    "SC_RtsEntryHeader_t": ("pyliner.python_pb.SC_RtsEntryHeader_t_pb2", "SC_RtsEntryHeader_t_pb"),
+    "SC_OperData_t": ("pyliner.python_pb.SC_OperData_t_pb2", "SC_OperData_t_pb"),
+    "SC_AtsEntryHeader_t": ("pyliner.python_pb.SC_AtsEntryHeader_t_pb2", "SC_AtsEntryHeader_t_pb"),
+    "SC_StartAtsCmd_t": ("pyliner.python_pb.SC_StartAtsCmd_t_pb2", "SC_StartAtsCmd_t_pb"),
+    "SC_JumpAtsCmd_t": ("pyliner.python_pb.SC_JumpAtsCmd_t_pb2", "SC_JumpAtsCmd_t_pb"),
+    "SC_RtsInfoEntry_t": ("pyliner.python_pb.SC_RtsInfoEntry_t_pb2", "SC_RtsInfoEntry_t_pb"),
+    "SC_AppendAtsCmd_t": ("pyliner.python_pb.SC_AppendAtsCmd_t_pb2", "SC_AppendAtsCmd_t_pb"),
+    "SC_RtsGrpCmd_t": ("pyliner.python_pb.SC_RtsGrpCmd_t_pb2", "SC_RtsGrpCmd_t_pb"),
+    "SC_AppData_t": ("pyliner.python_pb.SC_AppData_t_pb2", "SC_AppData_t_pb"),
+    "SC_RtpControlBlock_t": ("pyliner.python_pb.SC_RtpControlBlock_t_pb2", "SC_RtpControlBlock_t_pb"),
+    "SENS_ConfigTbl_t": ("pyliner.python_pb.SENS_ConfigTbl_t_pb2", "SENS_ConfigTbl_t_pb"),
+    "SENS_CurrentValueTable_t": ("pyliner.python_pb.SENS_CurrentValueTable_t_pb2", "SENS_CurrentValueTable_t_pb"),
+    "SENS_HkTlm_t": ("pyliner.python_pb.SENS_HkTlm_t_pb2", "SENS_HkTlm_t_pb"),
+    "SCH_DeadlineTable_t": ("pyliner.python_pb.SCH_DeadlineTable_t_pb2", "SCH_DeadlineTable_t_pb"),
+    "SCH_ScheduleEntry_t": ("pyliner.python_pb.SCH_ScheduleEntry_t_pb2", "SCH_ScheduleEntry_t_pb"),
+    "SCH_HkPacket_t": ("pyliner.python_pb.SCH_HkPacket_t_pb2", "SCH_HkPacket_t_pb"),
+    "SCH_LibData_t": ("pyliner.python_pb.SCH_LibData_t_pb2", "SCH_LibData_t_pb"),
+    "SCH_ActivityDeadlineStatus_t": ("pyliner.python_pb.SCH_ActivityDeadlineStatus_t_pb2", "SCH_ActivityDeadlineStatus_t_pb"),
+    "SCH_SlotDeadlineStatus_t": ("pyliner.python_pb.SCH_SlotDeadlineStatus_t_pb2", "SCH_SlotDeadlineStatus_t_pb"),
+    "SCH_MessageEntry_t": ("pyliner.python_pb.SCH_MessageEntry_t_pb2", "SCH_MessageEntry_t_pb"),
+    "SCH_GroupCmd_t": ("pyliner.python_pb.SCH_GroupCmd_t_pb2", "SCH_GroupCmd_t_pb"),
+    "SCH_EntryCmd_t": ("pyliner.python_pb.SCH_EntryCmd_t_pb2", "SCH_EntryCmd_t_pb"),
+    "SCH_ActivityDoneMsg_t": ("pyliner.python_pb.SCH_ActivityDoneMsg_t_pb2", "SCH_ActivityDoneMsg_t_pb"),
+    "SCH_AppData_t": ("pyliner.python_pb.SCH_AppData_t_pb2", "SCH_AppData_t_pb"),
+    "SCH_DiagPacket_t": ("pyliner.python_pb.SCH_DiagPacket_t_pb2", "SCH_DiagPacket_t_pb"),
+}, bundle=BUNDLE if isfile(BUNDLE) else None)
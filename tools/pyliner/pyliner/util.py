@@ -22,18 +22,19 @@ Classes:
         handler with the new key as an argument.
      Loggable  Mixin class that provides basic logging methods.
      OverlayDict  Dict where key lookups search multiple dicts.
-     RealTimeOverrun  Raised when a RealTimeThread took too long to execute.
      RealTimeThread  Thread which calls its target periodically.
      StreamLogger  Intercepts IO to a stream and logs it.
      ThreadedUDPRequestHandler  Sends UDP requests to a custom callback.
+     UDPReceiver  Thread which drains a UDP socket and passes on batches.
 """
 
+import errno
 import json
 import logging
+import select
 import socket
 import sys
 import threading
-import time
 from collections import Iterator, Iterable
 from datetime import datetime
 from os.path import join
@@ -42,7 +43,7 @@ from orderedset import OrderedSet
 import queue
 import socketserver
 
-from pyliner.pyliner_error import PylinerError
+from pyliner.clock import WALL_CLOCK
 
 
 class CallableDefaultDict(dict):
@@ -123,14 +124,12 @@ class OverlayDict(object):
         raise KeyError(item)
 
 
-class RealTimeOverrun(PylinerError):
-    """Raised when a RealTimeThread took too long to execute."""
-
-
 class RealTimeThread(threading.Thread):
     """Executes a callback function every x-seconds.
 
-    Optionally takes callbacks for exception and last-pass handling.
+    Optionally takes callbacks for exception and last-pass handling. If a call
+    runs late, because the target overran or the clock jumped ahead, the periods
+    missed are skipped and the next call is one period after the late one.
 
     Exceptions may occur in Python 2.7 during interpreter shutdown, as threads
     are left alive until the process closes, during which time the thread is
@@ -138,7 +137,8 @@ class RealTimeThread(threading.Thread):
     """
 
     def __init__(self, target, every=1, args=(), kwargs=None, exception=None,
-                 finalize=None, name=None, logger=None, daemon=True):
+                 finalize=None, name=None, logger=None, daemon=True,
+                 clock=None):
         """
         Args:
             target (Callable): This method will be called with no arguments
@@ -154,12 +154,15 @@ class RealTimeThread(threading.Thread):
             name (str): The name of the thread. Default is autogenerated.
             logger (Logger): Logger to use. Default logging.getLogger(self.name)
             daemon (bool): Whether the thread is a daemon or not.
+            clock (Clock): Clock that every is measured on. Default
+                WALL_CLOCK.
         """
         super(RealTimeThread, self).__init__(
             target=target, name=name, args=args, kwargs=kwargs)
         self.daemon = daemon  # Attribute of Thread
 
         # Instance Attributes
+        self.clock = clock if clock else WALL_CLOCK
         self.exception = exception if exception else \
             lambda e: self.logger.exception(
                 'Unhandled exception in thread %s', self.name)
@@ -173,18 +176,20 @@ class RealTimeThread(threading.Thread):
         """Do not call this directly. Use PeriodicExecutor.start()"""
         self.logger.info('Thread %s starting', self.name)
         self.running = True
-        start_time = time.time()
+        start_time = self.clock.time()
         try:
             while self.running:
                 self._Thread__target(
                     *self._Thread__args, **self._Thread__kwargs)
                 start_time += self.every
-                sleep_time = start_time - time.time()
-                if sleep_time < 0:
-                    raise RealTimeOverrun(
-                        '{} took too long ({}s)'
-                        .format(self.name, self.every - sleep_time))
-                time.sleep(sleep_time)
+                now = self.clock.time()
+                if start_time < now:
+                    # The target overran or the clock jumped ahead. Skip the
+                    # missed periods rather than calling target to catch up.
+                    self.logger.debug('Thread %s fell %ss behind, resyncing',
+                                      self.name, now - start_time)
+                    start_time = now + self.every
+                self.clock.sleep_until(start_time)
         except Exception as e:
             if callable(self.exception):
                 self.exception(e)
@@ -241,6 +246,131 @@ class ThreadedUDPRequestHandler(socketserver.BaseRequestHandler):
         self.callback(self.request)
 
 
+class UDPReceiver(threading.Thread):
+    """Receives datagrams on a single bound UDP socket.
+
+    Every time the socket becomes readable all pending datagrams, up to
+    batch_size, are read with recvfrom_into into one preallocated buffer and
+    the whole batch is passed to the callback as a list of
+    (datagram, address) tuples. This avoids socketserver's per-datagram
+    handler object and buffer allocation.
+
+    Instead of starting the thread, an EventLoop may call receive() whenever
+    the socket is readable.
+    """
+
+    def __init__(self, address, callback, batch_size=64, buffer_size=65535,
+                 timeout=0.5, name=None, logger=None, daemon=True):
+        """
+        Args:
+            address (tuple): (host, port) to bind. Port 0 binds any free port.
+            callback (Callable): Called with each list of received datagrams.
+            batch_size (int): Maximum number of datagrams per batch.
+            buffer_size (int): Size of the receive buffer, the largest
+                datagram that can be received without truncation.
+            timeout (Real): Seconds to wait for data before checking whether
+                the thread has been stopped.
+            name (str): The name of the thread. Default is autogenerated.
+            logger (Logger): Logger to use. Default logging.getLogger(self.name)
+            daemon (bool): Whether the thread is a daemon or not.
+        """
+        super(UDPReceiver, self).__init__(name=name)
+        self.daemon = daemon  # Attribute of Thread
+
+        self.batch_size = batch_size
+        self.batches = 0
+        self.callback = callback
+        self.datagrams = 0
+        self.logger = logger if logger else logging.getLogger(self.name)
+        self.running = False
+        self.timeout = timeout
+
+        self.socket = init_socket()
+        self.socket.bind(address)
+        self.socket.setblocking(False)
+
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+
+    @property
+    def server_address(self):
+        """The (host, port) the socket is actually bound to."""
+        return self.socket.getsockname()
+
+    def close(self):
+        """Stop the thread and close the socket."""
+        self.stop()
+        self.socket.close()
+
+    def drain(self):
+        """Read every pending datagram, up to batch_size, without blocking.
+
+        Returns:
+            list[tuple[bytes, tuple]]: The (datagram, address) pairs read.
+        """
+        batch = []
+        while len(batch) < self.batch_size:
+            try:
+                size, address = self.socket.recvfrom_into(self._buffer)
+            except socket.error as e:
+                if e.args[0] in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    break
+                raise
+            batch.append((self._view[:size].tobytes(), address))
+        return batch
+
+    def receive(self):
+        """Drain the socket and pass the batch to the callback, if any.
+
+        Used in place of start() when an EventLoop watches the socket.
+
+        Returns:
+            int: The number of datagrams received.
+        """
+        batch = self.drain()
+        if batch:
+            self.batches += 1
+            self.datagrams += len(batch)
+            self.callback(batch)
+        return len(batch)
+
+    def run(self):
+        """Do not call this directly. Use UDPReceiver.start()"""
+        self.logger.info('Thread %s starting', self.name)
+        while self.running:
+            try:
+                readable = select.select(
+                    [self.socket], [], [], self.timeout)[0]
+                batch = self.drain() if readable else None
+            except (select.error, socket.error, ValueError):
+                if not self.running:
+                    break  # Socket was closed underneath us.
+                self.logger.exception('Error receiving on %s', self.name)
+                continue
+            if not batch:
+                continue
+            self.batches += 1
+            self.datagrams += len(batch)
+            try:
+                self.callback(batch)
+            except Exception:
+                self.logger.exception(
+                    'Unhandled exception in thread %s', self.name)
+        self.logger.info('Thread %s stopped.', self.name)
+
+    def start(self):
+        self.running = True
+        super(UDPReceiver, self).start()
+
+    def stop(self):
+        """Stops the thread from receiving.
+
+        The thread exits the next time it wakes up, at most timeout seconds
+        later.
+        """
+        self.running = False
+
+
 def enable_logging(log_dir=None, log_file=None, script=None, level=logging.INFO,
                    filemode='a', stdin=logging.INFO, stdout=logging.INFO,
                    stderr=logging.ERROR):
@@ -20,7 +20,8 @@ class Vehicle(BaseVehicle):
     """
 
     def __init__(self, vehicle_id, communication, geographic=None, time=None,
-                 logger=None):
+                 logger=None, broadcast_workers=0, clock=None,
+                 flight_log=None):
         """Create an instance of Pyliner.
 
         Args:
@@ -30,9 +31,17 @@ class Vehicle(BaseVehicle):
                 is given the option to use a custom class if they desire.
             geographic: If None, defaults to Geographic().
             logger: If None, defaults to 'logging.getLogger(vehicle_id)'.
-            time: If None, default to TimeSensor().
+            time: If None, default to TimeApp().
+            broadcast_workers (int): Threads that Apps handle intents on. If
+                0, intents are handled on the broadcasting thread.
+            clock (Clock): Time source for all Apps. If None, defaults to the
+                wall clock. Give a SimulatedClock to follow the time stamped
+                on received telemetry instead.
+            flight_log (FlightLog): If not None, record commands, telemetry,
+                and intents to this binary log.
         """
-        super(Vehicle, self).__init__(vehicle_id, logger)
+        super(Vehicle, self).__init__(
+            vehicle_id, logger, broadcast_workers, clock, flight_log)
 
         # Attributes
         self.atp_override = None
@@ -49,7 +58,7 @@ class Vehicle(BaseVehicle):
         # Attach defaults
         self.attach_app(communication)
         self.attach_app(geographic)
-        # self.attach_app(time)
+        self.attach_app(time)
         self.attach_app(geofence)
         self.attach_app(controller)
         self.attach_app(flight_director)
@@ -9,6 +9,9 @@ setup(
     url='windhoverlabs.com',
     license='3BSD-3-Clause',
     packages=find_packages(),
+    package_data={
+        'pyliner.python_pb': ['pyliner_msgs.desc']
+    },
     install_requires=[
         'enum34',
         'future',
@@ -17,6 +20,9 @@ setup(
         'protobuf',
         'sortedcontainers'
     ],
+    extras_require={
+        'numpy': ['numpy']
+    },
     entry_points={
         'console_scripts': [
             'pyliner = pyliner.__main__:main'
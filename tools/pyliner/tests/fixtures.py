@@ -0,0 +1,108 @@
+"""Telemetry, Airliner map, and App fixtures shared by the tests."""
+
+from pyliner.action import ACTION_SEND_BYTES
+from pyliner.app import App
+from pyliner.arte_ccsds import CCSDS_TlmPkt_t
+from pyliner.intent import Intent
+from pyliner.python_pb import pyliner_msgs
+
+GLOBAL_POSITION_MID = 0x0A19
+HK_MID = 0x0800
+
+AIRLINER_MAP = {
+    'Airliner': {
+        'apps': {
+            'CFE_ES': {
+                'app_ops_name': 'ES',
+                'operations': {
+                    'HK': {
+                        'airliner_msg': 'CFE_ES_HkPacket_t',
+                        'airliner_cc': -1,
+                        'airliner_mid': '0x0800'},
+                },
+                'proto_msgs': {
+                    'CFE_ES_HkPacket_t': {
+                        'operational_names': {
+                            'CmdCounter': {
+                                'field_path': 'Payload.CmdCounter'}}}
+                }
+            },
+            'PX4': {
+                'app_ops_name': 'PX4',
+                'operations': {
+                    'VehicleGlobalPosition': {
+                        'airliner_msg': 'PX4_VehicleGlobalPositionMsg_t',
+                        'airliner_cc': -1,
+                        'airliner_mid': '0x0A19'},
+                    'ManualSetpoint': {
+                        'airliner_msg': 'PX4_ManualControlSetpointMsg_t',
+                        'airliner_cc': 0,
+                        'airliner_mid': '0x1C4C'},
+                    'NoMid': {
+                        'airliner_msg': 'PX4_VehicleGlobalPositionMsg_t',
+                        'airliner_cc': -1,
+                        'airliner_mid': ''},
+                },
+                'proto_msgs': {
+                    'PX4_VehicleGlobalPositionMsg_t': {
+                        'operational_names': {
+                            'Lat': {'field_path': 'Lat'},
+                            'Lon': {'field_path': 'Lon'},
+                            'Alt': {'field_path': 'Alt'},
+                            'Yaw': {'field_path': 'Yaw'},
+                            'VelN': {'field_path': 'VelN'},
+                            'VelE': {'field_path': 'VelE'},
+                            'VelD': {'field_path': 'VelD'}}},
+                    'PX4_ManualControlSetpointMsg_t': {
+                        'operational_names': {
+                            field.name: {'field_path': field.name}
+                            for field in pyliner_msgs.proto_msg_map[
+                                'PX4_ManualControlSetpointMsg_t'
+                            ].DESCRIPTOR.fields
+                            if field.label == field.LABEL_REQUIRED}}
+                }
+            }
+        }
+    }
+}
+
+
+def filled(msg_name, **values):
+    """Return a protobuf message with every required field set."""
+    msg = pyliner_msgs.proto_msg_map[msg_name]()
+    for field in msg.DESCRIPTOR.fields:
+        if field.label == field.LABEL_REQUIRED:
+            setattr(msg, field.name, values.get(field.name, 0))
+    return msg
+
+
+def datagram(mid, payload, seconds=10):
+    """Build a raw telemetry datagram as the TO socket would deliver it."""
+    header = CCSDS_TlmPkt_t()
+    header.clear_packet()
+    header.init_packet()
+    header.PriHdr.StreamId.data = mid
+    header.SecHdr.set_time(seconds, 0)
+    body = payload.SerializeToString()
+    header.set_user_data_length(len(body))
+    return header.get_encoded() + body, None
+
+
+class Commander(App):
+    """An App that sends raw bytes under its own control block."""
+
+    def __init__(self, name):
+        super(Commander, self).__init__()
+        self.name = name
+
+    @property
+    def qualified_name(self):
+        return self.name
+
+    def send(self):
+        """Send one command in its own control block, returning the token."""
+        with self.control_block() as block:
+            block.broadcast(Intent(
+                action=ACTION_SEND_BYTES,
+                data=block.request(self.name))).first()
+            return block.token
@@ -0,0 +1,107 @@
+import threading
+import unittest
+
+from pyliner.app import App
+from pyliner.base_vehicle import BaseVehicle
+from pyliner.intent import Intent, IntentFilter, IntentNoReceiverError, \
+    FutureTimeoutError
+
+
+class EchoApp(App):
+    def __init__(self, name):
+        super(EchoApp, self).__init__()
+        self.name = name
+
+    @property
+    def qualified_name(self):
+        return self.name
+
+
+class TestRouting(unittest.TestCase):
+    def setUp(self):
+        self.vehicle = BaseVehicle('test_routing')
+        self.a = EchoApp('a')
+        self.b = EchoApp('b')
+        self.vehicle.attach_app(self.a)
+        self.vehicle.attach_app(self.b)
+
+    def tearDown(self):
+        self.vehicle.shutdown()
+
+    def results(self, intent):
+        future = self.vehicle.broadcast(intent)
+        return sorted(response.result for response in future.responses)
+
+    def test_filtered(self):
+        self.a.vehicle.add_filter(IntentFilter(['ping']), lambda i: 'a')
+        self.b.vehicle.add_filter(IntentFilter(['ping', 'pong']),
+                                  lambda i: 'b')
+        self.assertEqual(['a', 'b'], self.results(Intent('ping')))
+        self.assertEqual(['b'], self.results(Intent('pong')))
+        self.assertEqual(['a'], self.results(Intent('ping', component='a')))
+
+    def test_one_call_per_filter(self):
+        self.a.vehicle.add_filter(IntentFilter(['ping', 'ping']),
+                                  lambda i: 1)
+        second = self.a.vehicle.add_filter(IntentFilter(['ping']),
+                                           lambda i: 2)
+        self.assertEqual([1, 2], self.results(Intent('ping')))
+        self.assertEqual(1, len(self.vehicle._routes['ping']))
+
+        # Removing one filter leaves the App routed for its other filter.
+        self.a.vehicle.remove_filter(second)
+        self.assertEqual([1], self.results(Intent('ping')))
+
+    def test_no_receiver(self):
+        remove = self.a.vehicle.add_filter(IntentFilter(['ping']), lambda i: 1)
+        self.a.vehicle.remove_filter(remove)
+        self.assertNotIn('ping', self.vehicle._routes)
+        future = self.vehicle.broadcast(Intent('ping'))
+        self.assertIsInstance(future.failure, IntentNoReceiverError)
+        self.assertTrue(future.complete)
+
+
+class TestPooledBroadcast(unittest.TestCase):
+    def setUp(self):
+        self.vehicle = BaseVehicle('test_pooled', broadcast_workers=2)
+        self.fast = EchoApp('fast')
+        self.slow = EchoApp('slow')
+        self.vehicle.attach_app(self.fast)
+        self.vehicle.attach_app(self.slow)
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+        self.vehicle.shutdown()
+
+    def test_parallel(self):
+        def slow(intent):
+            self.release.wait(5)
+            return 'slow'
+        self.slow.vehicle.add_filter(IntentFilter(['ping']), slow)
+        self.fast.vehicle.add_filter(IntentFilter(['ping']), lambda i: 'fast')
+
+        future = self.vehicle.broadcast(Intent('ping'))
+        self.assertEqual('fast', future.first(5).result)
+        self.assertFalse(future.complete)
+
+        self.release.set()
+        future.wait(5)
+        self.assertTrue(future.complete)
+        self.assertEqual('slow', future.recent().result)
+
+    def test_nested(self):
+        self.fast.vehicle.add_filter(IntentFilter(['inner']), lambda i: 1)
+        self.fast.vehicle.add_filter(
+            IntentFilter(['outer']),
+            lambda i: self.fast.vehicle.broadcast(
+                Intent('inner')).first(5).result + 1)
+        self.assertEqual(
+            2, self.vehicle.broadcast(Intent('outer')).first(5).result)
+
+    def test_no_response(self):
+        self.fast.vehicle.add_filter(IntentFilter(['ping']), lambda i: None)
+        future = self.vehicle.broadcast(Intent('ping'))
+        future.wait(5)
+        # A complete future with no responses does not wait out the timeout.
+        self.assertRaises(FutureTimeoutError, future.first, 60)
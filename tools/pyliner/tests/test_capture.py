@@ -0,0 +1,54 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from pyliner.capture import CaptureFormatError, CaptureRecorder, \
+    TelemetryCapture, read_capture
+
+
+class TestTelemetryCapture(unittest.TestCase):
+    def test_bounded(self):
+        capture = TelemetryCapture(maxlen=3)
+        for i in range(10):
+            capture.add(b'packet%d' % i, timestamp=float(i))
+        self.assertEqual(3, len(capture))
+        self.assertEqual(10, capture.count)
+        self.assertEqual([(7.0, b'packet7'), (8.0, b'packet8'),
+                          (9.0, b'packet9')], list(capture))
+
+    def test_no_memory(self):
+        capture = TelemetryCapture(maxlen=0)
+        capture.add(b'packet')
+        self.assertEqual(0, len(capture))
+        self.assertEqual(1, capture.count)
+
+
+class TestCaptureRecorder(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'flight.cap')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        records = [(1.5, b'\x08\x00abc'), (2.25, b''), (3.0, b'\xff' * 300)]
+        with CaptureRecorder(self.path) as recorder:
+            capture = TelemetryCapture(maxlen=1, recorder=recorder)
+            for timestamp, datagram in records:
+                capture.add(datagram, timestamp)
+        self.assertEqual(records, list(read_capture(self.path)))
+
+    def test_truncated(self):
+        with CaptureRecorder(self.path) as recorder:
+            recorder.write(1.0, b'complete')
+            recorder.write(2.0, b'truncated')
+        with open(self.path, 'r+b') as capture:
+            capture.truncate(os.path.getsize(self.path) - 3)
+        self.assertEqual([(1.0, b'complete')], list(read_capture(self.path)))
+
+    def test_bad_magic(self):
+        with open(self.path, 'wb') as capture:
+            capture.write(b'not a capture')
+        self.assertRaises(CaptureFormatError, list, read_capture(self.path))
@@ -0,0 +1,144 @@
+import threading
+import time
+import unittest
+from datetime import timedelta
+
+from pyliner.apps.communication import Communication
+from pyliner.apps.navigation import Navigation
+from pyliner.apps.navigation.command_timeout import CommandTimeout
+from pyliner.apps.navigation.control import constant
+from pyliner.apps.time_app import TimeApp
+from pyliner.base_vehicle import BaseVehicle
+from pyliner.clock import SimulatedClock, WallClock
+from pyliner.util import RealTimeThread
+from tests.fixtures import AIRLINER_MAP, GLOBAL_POSITION_MID, \
+    datagram, filled
+
+
+class TestSimulatedClock(unittest.TestCase):
+    def test_advance(self):
+        clock = SimulatedClock(5)
+        clock.advance(2.5)
+        self.assertEqual(7.5, clock.time())
+        clock.set(7)  # Never backward.
+        self.assertEqual(7.5, clock.time())
+        self.assertEqual(9.5, clock.deadline(timedelta(seconds=2)))
+        self.assertEqual(float('inf'), clock.deadline(None))
+
+    def test_sleep_wakes_on_advance(self):
+        clock = SimulatedClock()
+        woke = threading.Event()
+        sleeper = threading.Thread(
+            target=lambda: (clock.sleep_until(10), woke.set()))
+        sleeper.daemon = True
+        sleeper.start()
+        clock.advance(9)
+        self.assertFalse(woke.wait(0.05))
+        clock.advance(1)
+        self.assertTrue(woke.wait(5))
+
+    def test_close_releases_sleepers(self):
+        clock = SimulatedClock()
+        sleeper = threading.Thread(target=clock.sleep, args=(1,))
+        sleeper.daemon = True
+        sleeper.start()
+        clock.close()
+        sleeper.join(5)
+        self.assertFalse(sleeper.is_alive())
+
+    def test_wait_wakes_on_advance(self):
+        clock = SimulatedClock()
+        condition = threading.Condition()
+
+        def wait():
+            with condition:
+                while not clock.wait(condition, 10):
+                    pass
+        waiter = threading.Thread(target=wait)
+        waiter.daemon = True
+        waiter.start()
+        clock.advance(9)
+        waiter.join(0.05)
+        self.assertTrue(waiter.is_alive())
+        clock.advance(1)
+        waiter.join(5)
+        self.assertFalse(waiter.is_alive())
+
+    def test_real_time_thread(self):
+        clock = SimulatedClock()
+        ticks = []
+        thread = RealTimeThread(lambda: ticks.append(clock.time()), every=60,
+                                clock=clock)
+        thread.start()
+        for _ in range(3):
+            time.sleep(0.02)
+            clock.advance(60)
+        time.sleep(0.02)
+        thread.stop()
+        clock.close()
+        thread.join(5)
+        self.assertEqual([0, 60, 120, 180], ticks[:4])
+
+    def test_wall_clock(self):
+        clock = WallClock()
+        start = clock.time()
+        clock.sleep_until(start + 0.01)
+        self.assertGreaterEqual(clock.time(), start + 0.01)
+
+
+class TestSimulatedVehicle(unittest.TestCase):
+    def setUp(self):
+        self.clock = SimulatedClock()
+        self.vehicle = BaseVehicle('test_clock', clock=self.clock)
+        self.com = Communication(AIRLINER_MAP, listen=False)
+        self.time = TimeApp()
+        self.nav = Navigation()
+        for app in (self.com, self.time, self.nav):
+            self.vehicle.attach_app(app)
+        self.nav.defaults.update(
+            {'method': constant(1.0), 'tolerance': 0.5, 'timeout': None})
+        self.nav.sleep_time = 0.05
+
+    def tearDown(self):
+        self.vehicle.shutdown()
+        self.clock.close()
+
+    def send(self, seconds):
+        self.com._on_recv_telemetry(datagram(
+            GLOBAL_POSITION_MID, filled('PX4_VehicleGlobalPositionMsg_t'),
+            seconds=seconds))
+
+    def test_follows_header_time(self):
+        self.send(1000)
+        self.assertEqual(0, self.clock.time())
+        self.send(1002)
+        self.send(1003)
+        self.assertEqual(3, self.clock.time())
+        self.assertEqual(3, self.time.time)
+
+    def test_navigation_timeout(self):
+        self.send(1000)
+        climb = threading.Thread(target=self.assertRaises, args=(
+            CommandTimeout, self.nav.vnav().to, 5.0, timedelta(minutes=5)))
+        climb.start()
+        # Five simulated minutes pass in a fraction of a second.
+        for second in range(1001, 1302, 50):
+            time.sleep(0.01)
+            self.send(second)
+        climb.join(5)
+        self.assertFalse(climb.is_alive())
+
+    def test_wait_position_timeout(self):
+        seq = self.nav.position_seq
+        results = []
+        waiter = threading.Thread(target=lambda: results.append(
+            self.nav.wait_position(seq, timeout=1.0)))
+        waiter.daemon = True
+        waiter.start()
+        # Only simulated time counts toward the timeout.
+        waiter.join(0.1)
+        self.assertTrue(waiter.is_alive())
+        self.clock.advance(1.0)
+        waiter.join(5)
+        self.assertFalse(waiter.is_alive())
+        self.assertEqual([seq], results)
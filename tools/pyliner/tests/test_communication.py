@@ -0,0 +1,288 @@
+import threading
+import unittest
+
+from pyliner.apps.communication import Communication, _FieldPath, \
+    InvalidOperationException, InvalidCommandException, TelemetryHub, \
+    snapshot_values
+from pyliner.arte_ccsds import CCSDS_CmdPkt_t
+from pyliner.base_vehicle import BaseVehicle
+from pyliner.python_pb import pyliner_msgs
+from pyliner.util import init_socket
+from tests.fixtures import AIRLINER_MAP, GLOBAL_POSITION_MID, HK_MID, \
+    datagram, filled
+
+class TestCommunication(unittest.TestCase):
+    def setUp(self):
+        self.vehicle = BaseVehicle('test_communication')
+        self.com = Communication(AIRLINER_MAP, to_port=0)
+        self.vehicle.attach_app(self.com)
+
+    def tearDown(self):
+        self.vehicle.shutdown()
+        self.com.tlm_listener.close()
+
+    def test_dispatch_by_mid(self):
+        lat = self.com.telemetry('/Airliner/PX4/VehicleGlobalPosition/Lat')
+        lon = self.com.telemetry('/Airliner/PX4/VehicleGlobalPosition/Lon')
+        hk = self.com.telemetry('/Airliner/ES/HK/CmdCounter')
+
+        self.assertEqual(
+            2, len(self.com.subscriptions.by_mid[GLOBAL_POSITION_MID]))
+        self.assertEqual(1, len(self.com.subscriptions.by_mid[HK_MID]))
+
+        self.com._on_recv_telemetry(datagram(
+            GLOBAL_POSITION_MID, filled('PX4_VehicleGlobalPositionMsg_t',
+                                        Lat=12.5, Lon=-45.25)))
+        self.assertEqual(12.5, lat.value)
+        self.assertEqual(-45.25, lon.value)
+        self.assertIsNone(hk.value)
+
+    def test_unknown_mid_ignored(self):
+        lat = self.com.telemetry('/Airliner/PX4/VehicleGlobalPosition/Lat')
+        self.com._on_recv_telemetry(datagram(
+            0x0123, filled('PX4_VehicleGlobalPositionMsg_t', Lat=1.0)))
+        self.assertIsNone(lat.value)
+
+    def test_subscribe_without_mid(self):
+        tlm = self.com.telemetry('/Airliner/PX4/NoMid/Lat')
+        self.assertIsNone(tlm.value)
+        self.assertNotIn(None, self.com.subscriptions.by_mid)
+
+    def test_decode_once(self):
+        paths = ['/Airliner/PX4/VehicleGlobalPosition/Lat',
+                 '/Airliner/PX4/VehicleGlobalPosition/Lon',
+                 '/Airliner/PX4/VehicleGlobalPosition/Alt']
+        lat, lon, alt = self.com.telemetry(paths)
+
+        created = []
+
+        def factory(msg):
+            created.append(msg)
+            return pyliner_msgs.proto_msg_map[msg]()
+        self.com._proto_obj_factory = factory
+
+        self.com._on_recv_telemetry(datagram(
+            GLOBAL_POSITION_MID, filled('PX4_VehicleGlobalPositionMsg_t',
+                                        Lat=1.5, Lon=2.5, Alt=100.0)))
+        self.assertEqual(['PX4_VehicleGlobalPositionMsg_t'], created)
+        self.assertEqual((1.5, 2.5, 100.0), (lat.value, lon.value, alt.value))
+
+    def test_listener_called_once(self):
+        lat = self.com.telemetry('/Airliner/PX4/VehicleGlobalPosition/Lat')
+        calls = []
+        lat.add_listener(lambda t: calls.append(t))
+        self.com._on_recv_telemetry(datagram(
+            GLOBAL_POSITION_MID, filled('PX4_VehicleGlobalPositionMsg_t')))
+        self.assertEqual([lat], calls)
+
+    def test_receive_over_socket(self):
+        lat = self.com.telemetry('/Airliner/PX4/VehicleGlobalPosition/Lat')
+        received = threading.Event()
+        lat.add_listener(lambda t: received.set())
+
+        sender = init_socket()
+        port = self.com.tlm_listener.server_address[1]
+        sender.sendto(datagram(GLOBAL_POSITION_MID, filled(
+            'PX4_VehicleGlobalPositionMsg_t', Lat=33.5))[0],
+            ('127.0.0.1', port))
+        sender.close()
+
+        self.assertTrue(received.wait(5))
+        self.assertEqual(33.5, lat.value)
+        self.assertEqual(1, self.com.capture.count)
+
+    def test_snapshot(self):
+        paths = ['/Airliner/PX4/VehicleGlobalPosition/Lat',
+                 '/Airliner/PX4/VehicleGlobalPosition/Lon',
+                 '/Airliner/ES/HK/CmdCounter']
+        lat, lon, hk = self.com.telemetry(paths)
+        self.assertIsNone(self.com.snapshot(paths[0]))
+        self.assertEqual([None, None, None], snapshot_values([lat, lon, hk]))
+
+        seen = []
+        lat.add_listener(lambda t: seen.append(
+            (t.seq, snapshot_values([lat, lon]))))
+        for value in (1.0, 2.0):
+            self.com._on_recv_telemetry(datagram(
+                GLOBAL_POSITION_MID, filled('PX4_VehicleGlobalPositionMsg_t',
+                                            Lat=value, Lon=-value)))
+
+        snapshot = self.com.snapshot(paths[0])
+        self.assertIs(snapshot, lat.snapshot)
+        self.assertEqual((GLOBAL_POSITION_MID, 2), (snapshot.mid, snapshot.seq))
+        self.assertEqual(-2.0, snapshot[paths[1]])
+        self.assertNotIn(paths[2], snapshot)
+        # The snapshot is published before any listener runs, so lon is
+        # consistent with lat even before its own telemetry is updated.
+        self.assertEqual([(1, [1.0, -1.0]), (2, [2.0, -2.0])], seen)
+        self.assertEqual([2.0, -2.0, None], snapshot_values([lat, lon, hk]))
+        self.assertRaises(InvalidOperationException, self.com.snapshot,
+                          '/Airliner/PX4/Nope')
+
+    def test_prepared_command(self):
+        prepared = self.com.prepare('/Airliner/PX4/ManualSetpoint', ['X'])
+        self.assertIs(prepared, self.com.prepare(
+            '/Airliner/PX4/ManualSetpoint', ['X']))
+
+        names = [name for name in self.com._ops
+                 if name.startswith('/Airliner/PX4/ManualSetpoint/')]
+        args = {name.rsplit('/', 1)[1]: 0 for name in names}
+        prepared = self.com.prepare('/Airliner/PX4/ManualSetpoint', args)
+
+        args.update(X=0.25, ArmSwitch=3)
+        first = prepared.serialize(args)
+        args.update(X=-0.5)
+        second = prepared.serialize(args)
+
+        header = CCSDS_CmdPkt_t()
+        header.set_decoded(second[:8])
+        self.assertEqual(0x1C4C, header.PriHdr.StreamId.data)
+        self.assertEqual(len(second) - 8, header.get_user_data_length())
+
+        msg = pyliner_msgs.proto_msg_map['PX4_ManualControlSetpointMsg_t']()
+        msg.ParseFromString(first[8:])
+        self.assertEqual((0.25, 3), (msg.X, msg.ArmSwitch))
+        msg.ParseFromString(second[8:])
+        self.assertEqual((-0.5, 3), (msg.X, msg.ArmSwitch))
+
+        self.assertEqual(second, self.com._serialize({
+            'name': '/Airliner/PX4/ManualSetpoint',
+            'args': [{'name': k, 'value': v} for k, v in args.items()]}))
+
+    def test_prepared_command_errors(self):
+        self.assertRaises(InvalidCommandException, self.com.prepare,
+                          '/Airliner/PX4/Nope')
+        self.assertRaises(InvalidCommandException, self.com.prepare,
+                          '/Airliner/PX4/ManualSetpoint', ['Nope'])
+        prepared = self.com.prepare('/Airliner/PX4/ManualSetpoint', ['X'])
+        self.assertRaises(InvalidCommandException, prepared.serialize,
+                          {'Z': 0.0})
+        with self.assertRaises(InvalidCommandException) as context:
+            prepared.serialize({'X': 'fast'})
+        self.assertIn('argument X of /Airliner/PX4/ManualSetpoint',
+                      str(context.exception))
+
+    def test_op_index(self):
+        operation = self.com._ops['/Airliner/PX4/VehicleGlobalPosition/Lat']
+        self.assertEqual(GLOBAL_POSITION_MID, operation.mid)
+        self.assertEqual(-1, operation.cc)
+        self.assertEqual('Lat', operation.field.path)
+        self.assertIs(pyliner_msgs.proto_msg_map[
+            'PX4_VehicleGlobalPositionMsg_t'], operation.proto)
+
+        self.assertEqual('Payload.CmdCounter',
+                         self.com._get_op_attr('/Airliner/ES/HK/CmdCounter'))
+        self.assertEqual(0, self.com._get_airliner_op(
+            '/Airliner/PX4/ManualSetpoint')['airliner_cc'])
+        self.assertIsNone(self.com._get_airliner_op('/Airliner/PX4/Nope'))
+
+    def test_subscribe_invalid(self):
+        self.assertRaises(InvalidOperationException, self.com.telemetry,
+                          '/Airliner/PX4/VehicleGlobalPosition/Nope')
+
+    def test_shared_handles(self):
+        nav = self.com.telemetry({
+            'latitude': '/Airliner/PX4/VehicleGlobalPosition/Lat',
+            'altitude': '/Airliner/PX4/VehicleGlobalPosition/Alt'})
+        fence = self.com.telemetry([
+            '/Airliner/PX4/VehicleGlobalPosition/Lat',
+            '/Airliner/PX4/VehicleGlobalPosition/Lon',
+            '/Airliner/PX4/VehicleGlobalPosition/Alt'])
+        self.assertIs(nav['latitude'], fence[0])
+        self.assertIs(nav['altitude'], fence[2])
+        self.assertIs(fence[1], self.com.subscribe(
+            '/Airliner/PX4/VehicleGlobalPosition/Lon'))
+        self.assertEqual(3, len(self.com.subscriptions))
+        self.assertEqual(
+            3, len(self.com.subscriptions.by_mid[GLOBAL_POSITION_MID]))
+
+    def test_subscribe_batch_atomic(self):
+        self.assertRaises(InvalidOperationException, self.com.telemetry, [
+            '/Airliner/PX4/VehicleGlobalPosition/Lat',
+            '/Airliner/PX4/VehicleGlobalPosition/Nope'])
+        self.assertEqual(0, len(self.com.subscriptions))
+        self.assertNotIn(GLOBAL_POSITION_MID, self.com.subscriptions.by_mid)
+
+    def test_subscribe_callback(self):
+        path = '/Airliner/PX4/VehicleGlobalPosition/Lat'
+        calls = []
+        lat = self.com.subscribe(path, calls.append)
+        self.com.subscribe(path, calls.append)
+        self.com._on_recv_telemetry(datagram(
+            GLOBAL_POSITION_MID, filled('PX4_VehicleGlobalPositionMsg_t')))
+        self.assertEqual([lat, lat], calls)
+
+        self.com.unsubscribe(path, calls.append)
+        self.com._on_recv_telemetry(datagram(
+            GLOBAL_POSITION_MID, filled('PX4_VehicleGlobalPositionMsg_t')))
+        self.assertEqual(2, len(calls))
+
+
+class TestTelemetryHub(unittest.TestCase):
+    def setUp(self):
+        self.hub = TelemetryHub(AIRLINER_MAP, to_port=0)
+        self.vehicles = [BaseVehicle('hub_a'), BaseVehicle('hub_b')]
+        self.senders = [init_socket(), init_socket()]
+        self.coms = []
+        for vehicle, sender in zip(self.vehicles, self.senders):
+            sender.bind(('127.0.0.1', 0))
+            com = self.hub.communication(sender.getsockname())
+            vehicle.attach_app(com)
+            self.coms.append(com)
+
+    def tearDown(self):
+        for vehicle, sender in zip(self.vehicles, self.senders):
+            vehicle.shutdown()
+            sender.close()
+        self.hub.close()
+
+    def test_shared_index(self):
+        self.assertIs(self.hub.ops, self.coms[0]._ops)
+        self.assertIs(self.hub.ops, self.coms[1]._ops)
+        self.assertIsNone(self.coms[0].tlm_listener)
+        with self.assertRaises(TypeError):
+            self.hub.ops['x'] = None
+
+    def test_demultiplex(self):
+        path = '/Airliner/PX4/VehicleGlobalPosition/Lat'
+        lats = [com.telemetry(path) for com in self.coms]
+        received = threading.Event()
+        lats[1].add_listener(lambda t: received.set())
+
+        port = self.hub.receiver.server_address[1]
+        for lat, sender in zip((1.0, 2.0), self.senders):
+            sender.sendto(datagram(GLOBAL_POSITION_MID, filled(
+                'PX4_VehicleGlobalPositionMsg_t', Lat=lat))[0],
+                ('127.0.0.1', port))
+        self.assertTrue(received.wait(5))
+        self.assertEqual([1.0, 2.0], [lat.value for lat in lats])
+
+    def test_host_route(self):
+        com = self.coms[0]
+        self.hub.add('10.0.0.9', com)
+        data, _ = datagram(GLOBAL_POSITION_MID, filled(
+            'PX4_VehicleGlobalPositionMsg_t'))
+        self.hub._on_recv_batch([(data, ('10.0.0.9', 1234))])
+        self.assertEqual(1, com.capture.count)
+
+        self.hub.remove('10.0.0.9')
+        self.hub._on_recv_batch([(data, ('10.0.0.9', 1234))])
+        self.assertEqual(1, com.capture.count)
+        self.assertEqual(1, self.hub.unrouted)
+
+
+class TestFieldPath(unittest.TestCase):
+    def test_nested(self):
+        msg = pyliner_msgs.proto_msg_map['CFE_ES_HkPacket_t']()
+        field = _FieldPath('Payload.CmdCounter')
+        field.set(msg, 7)
+        self.assertEqual(7, msg.Payload.CmdCounter)
+        self.assertEqual(7, field.get(msg))
+
+    def test_indexed(self):
+        msg = filled('PX4_VehicleGlobalPositionMsg_t')
+        msg.DeltaLatLon.extend([0.0, 0.0])
+        field = _FieldPath('DeltaLatLon[1]')
+        field.set(msg, 2.5)
+        self.assertEqual([0.0, 2.5], list(msg.DeltaLatLon))
+        self.assertEqual(2.5, field.get(msg))
@@ -0,0 +1,91 @@
+import threading
+import time
+import unittest
+
+from pyliner.action import ACTION_SEND_BYTES
+from pyliner.apps.communication import CommandAuthorizationError, \
+    Communication
+from pyliner.base_vehicle import BaseVehicle
+from pyliner.clock import SimulatedClock
+from pyliner.intent import Intent
+from tests.fixtures import AIRLINER_MAP, Commander
+
+
+class TestControlLease(unittest.TestCase):
+    def setUp(self):
+        self.clock = SimulatedClock()
+        self.vehicle = BaseVehicle('test_control', clock=self.clock)
+        self.com = Communication(AIRLINER_MAP, listen=False)
+        self.a = Commander('a')
+        self.b = Commander('b')
+        for app in (self.com, self.a, self.b):
+            self.vehicle.attach_app(app)
+        self.sent = []
+        self.com.send_bytes = lambda message: self.sent.append(message) or True
+
+    def tearDown(self):
+        self.clock.close()
+        self.vehicle.shutdown()
+
+    def test_lease_reused(self):
+        lease = self.a.send()
+        self.clock.advance(Communication.CONTROL_LEASE / 2.0)
+        self.assertIs(lease, self.a.send())
+        self.clock.advance(Communication.CONTROL_LEASE / 2.0)
+        self.assertIs(lease, self.a.send())  # Renewed by the last use.
+        self.assertIs(lease, self.com.control_current)
+        self.assertEqual(['a'] * 3, self.sent)
+
+    def test_expired_lease_refused(self):
+        lease = self.a.send()
+        self.clock.advance(Communication.CONTROL_LEASE)
+        self.assertFalse(lease.renew())
+        response = self.vehicle.broadcast(Intent(
+            action=ACTION_SEND_BYTES, data=lease.request('late'))).first()
+        self.assertIsInstance(response.exception, CommandAuthorizationError)
+        self.assertIsNone(self.com.control_current)
+
+        # The next block requests control again.
+        self.assertIsNot(lease, self.a.send())
+        self.assertEqual(['a', 'a'], self.sent)
+
+    def test_waiting_app_granted_on_expiry(self):
+        self.a.send()
+        sender = threading.Thread(target=self.b.send)
+        sender.daemon = True
+        sender.start()
+        # Step time until the rotation thread hands over the idle lease.
+        for _ in range(20):
+            sender.join(0.05)
+            if not sender.is_alive():
+                break
+            self.clock.advance(Communication.CONTROL_ROTATE_EVERY)
+        self.assertFalse(sender.is_alive())
+        self.assertEqual(['a', 'b'], self.sent)
+        self.assertEqual('b', self.com.control_current.app_name)
+
+    def test_release_control(self):
+        lease = self.a.send()
+        self.a.release_control()
+        self.assertTrue(lease.ended)
+        self.assertIsNone(self.com.control_current)
+        self.b.send()
+        self.assertEqual('b', self.com.control_current.app_name)
+
+    def test_idle_lease_rotated_out(self):
+        self.a.send()  # a keeps an idle lease, outside any control block.
+        sender = threading.Thread(target=self.b.send)
+        sender.daemon = True
+        sender.start()
+        while self.com.control_queue.empty():
+            time.sleep(0.005)
+        self.clock.advance(Communication.CONTROL_ROTATE_EVERY)
+        sender.join(5)
+        self.assertFalse(sender.is_alive())
+        # a was not requeued, so b keeps control through later rotations.
+        for _ in range(3):
+            self.clock.advance(Communication.CONTROL_ROTATE_EVERY)
+            time.sleep(0.05)
+        self.assertEqual('b', self.com.control_current.app_name)
+        self.assertTrue(self.com.control_queue.empty())
+        self.assertEqual(['a', 'b'], self.sent)
@@ -0,0 +1,125 @@
+import threading
+import time
+import unittest
+
+from pyliner.app_access import InvalidStateError
+from pyliner.apps.communication import Communication
+from pyliner.apps.flight_director import FlightDirector
+from pyliner.base_vehicle import BaseVehicle
+from pyliner.clock import SimulatedClock
+from pyliner.python_pb import pyliner_msgs
+from tests.fixtures import AIRLINER_MAP
+
+
+def wait_for(condition, timeout=5.0):
+    end = time.time() + timeout
+    while not condition() and time.time() < end:
+        time.sleep(0.005)
+    return condition()
+
+
+class TestFlightDirector(unittest.TestCase):
+    def setUp(self):
+        self.clock = SimulatedClock()
+        self.vehicle = BaseVehicle('test_flight_director', clock=self.clock)
+        self.com = Communication(AIRLINER_MAP, listen=False)
+        self.fd = FlightDirector()
+        self.vehicle.attach_app(self.com)
+        self.vehicle.attach_app(self.fd)
+        self.sent = []
+        self.com.send_bytes = lambda message: self.sent.append(message) or True
+
+    def tearDown(self):
+        self.clock.close()
+        self.vehicle.shutdown()
+
+    def setpoint(self, index=-1):
+        msg = pyliner_msgs.proto_msg_map['PX4_ManualControlSetpointMsg_t']()
+        msg.ParseFromString(self.sent[index][8:])
+        return msg
+
+    def test_setter_sends(self):
+        self.fd.x = 0.5
+        lease = self.com.control_current
+        self.fd.set(y=-0.25, z=1.0)
+        self.assertEqual(2, len(self.sent))
+        self.assertEqual((0.5, -0.25, 1.0), (
+            self.setpoint().X, self.setpoint().Y, self.setpoint().Z))
+        # Both sends used the same lease.
+        self.assertIs(lease, self.com.control_current)
+        self.assertEqual(self.fd.qualified_name, lease.app_name)
+
+    def test_streaming(self):
+        self.fd.start_streaming(every=0.02)
+        self.assertTrue(self.fd.streaming)
+        self.assertEqual(self.fd.qualified_name,
+                         self.com.control_current.app_name)
+        self.assertTrue(wait_for(lambda: len(self.sent) == 1))
+
+        # Setters only update the state sent on the next tick.
+        self.fd.x = 0.5
+        self.fd.set(y=-0.25)
+        self.assertEqual(1, len(self.sent))
+        self.clock.advance(0.02)
+        self.assertTrue(wait_for(lambda: len(self.sent) == 2))
+        self.assertEqual((0.5, -0.25), (self.setpoint().X, self.setpoint().Y))
+        self.clock.advance(0.02)
+        self.assertTrue(wait_for(lambda: len(self.sent) == 3))
+
+        self.assertRaises(InvalidStateError, self.fd.start_streaming)
+        self.fd.stop_streaming()
+        self.assertFalse(self.fd.streaming)
+        self.assertIsNone(self.com.control_current)
+        self.clock.advance(1.0)
+        time.sleep(0.05)
+        self.assertEqual(3, len(self.sent))
+
+        self.fd.r = 0.75
+        self.assertEqual(4, len(self.sent))
+        self.assertEqual((0.5, 0.75), (self.setpoint().X, self.setpoint().R))
+
+    def test_streaming_clock_jump(self):
+        self.fd.start_streaming(every=0.02)
+        self.assertTrue(wait_for(lambda: len(self.sent) == 1))
+        # A jump of several periods sends at most once and keeps streaming.
+        # The jump sends nothing if it lands before the stream next sleeps.
+        self.clock.advance(0.1)
+        time.sleep(0.05)
+        sent = len(self.sent)
+        self.assertLessEqual(sent, 2)
+        self.clock.advance(0.02)
+        self.assertTrue(wait_for(lambda: len(self.sent) == sent + 1))
+        self.assertTrue(self.fd.streaming)
+        self.fd.stop_streaming()
+
+    def test_detach_while_streaming(self):
+        self.fd.start_streaming(every=0.02)
+        self.assertTrue(wait_for(lambda: len(self.sent) == 1))
+        self.vehicle.detach_app(self.fd.qualified_name)
+        self.assertFalse(self.fd.streaming)
+        self.assertIsNone(self.com.control_current)
+
+    def test_shutdown_while_streaming(self):
+        self.fd.start_streaming(every=0.02)
+        self.assertTrue(wait_for(lambda: len(self.sent) == 1))
+        self.vehicle.shutdown()
+        self.assertFalse(self.fd.streaming)
+        self.clock.advance(1.0)
+        time.sleep(0.05)
+        self.assertEqual(1, len(self.sent))
+
+    def test_stop_streaming_while_revoked(self):
+        self.fd.start_streaming(every=0.02)
+        self.assertTrue(wait_for(lambda: len(self.sent) == 1))
+        with self.com.control_lock:
+            self.com.control_revoke()
+            # As if rotated out, waiting to be granted control again.
+            self.com.control_queue.put(self.fd.qualified_name)
+        stopper = threading.Thread(target=self.fd.stop_streaming)
+        stopper.daemon = True
+        stopper.start()
+        stopper.join(5)
+        self.assertFalse(stopper.is_alive())
+        self.assertFalse(self.fd.streaming)
+        self.assertIsNone(self.com.control_current)
+        self.assertTrue(self.com.control_queue.empty())
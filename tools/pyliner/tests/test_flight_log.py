@@ -0,0 +1,155 @@
+import os
+import shutil
+import tempfile
+import unittest
+from os.path import join
+
+from pyliner.action import ACTION_CONTROL_REQUEST
+from pyliner.apps.communication import Communication
+from pyliner.apps.flight_director import FlightDirector
+from pyliner.base_vehicle import BaseVehicle
+from pyliner.clock import SimulatedClock
+from pyliner.flight_log import EVENT_COMMAND, EVENT_INTENT, EVENT_TELEMETRY, \
+    FlightLog, FlightLogFormatError, FlightLogWriteError, load_flight_log, \
+    np, read_flight_log
+from tests.fixtures import AIRLINER_MAP, GLOBAL_POSITION_MID, \
+    datagram, filled
+
+
+class TestFlightLog(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = join(self.dir, 'flight.log')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def write(self, **kwargs):
+        with FlightLog(self.path, block_size=3, **kwargs) as log:
+            for index in range(5):
+                log.command('/Airliner/PX4/ManualSetpoint', b'c' * index,
+                            time=index)
+            log.telemetry(GLOBAL_POSITION_MID, b'tlm', time=5)
+            log.intent(ACTION_CONTROL_REQUEST, time=6)
+        self.assertEqual(7, log.records)
+
+    def test_round_trip(self):
+        self.write()
+        events = list(read_flight_log(self.path))
+        self.assertEqual(7, len(events))
+        self.assertEqual((4.0, EVENT_COMMAND, '/Airliner/PX4/ManualSetpoint',
+                          b'cccc'), events[4])
+        self.assertEqual((5.0, EVENT_TELEMETRY, '0x0A19', b'tlm'), events[5])
+        self.assertEqual((6.0, EVENT_INTENT, ACTION_CONTROL_REQUEST, b''),
+                         events[6])
+
+    def test_without_payloads(self):
+        self.write(payloads=False)
+        self.assertEqual([b''] * 7, [event[3] for event in
+                                     read_flight_log(self.path)])
+
+    def test_truncated(self):
+        self.write()
+        events = list(read_flight_log(self.path))
+        with open(self.path, 'rb+') as log:
+            log.truncate(os.path.getsize(self.path) - 1)
+        # Only the last block, holding the intent, is dropped.
+        truncated = list(read_flight_log(self.path))
+        self.assertLess(len(truncated), len(events))
+        self.assertEqual(events[:len(truncated)], truncated)
+
+    def test_not_a_log(self):
+        with open(self.path, 'wb') as log:
+            log.write(b'PYLCAP\x00\x01')
+        self.assertRaises(FlightLogFormatError, list,
+                          read_flight_log(self.path))
+
+    def test_raw_command_named_by_stream_id(self):
+        with FlightLog(self.path) as log:
+            log.command(None, b'\x1c\x4c\x00', time=0)
+            log.command(None, b'', time=1)
+        self.assertEqual(['0x1C4C', '0x0000'],
+                         [event[2] for event in read_flight_log(self.path)])
+
+    def test_dropped_when_full(self):
+        log = FlightLog(self.path, block_size=100, flush_every=60,
+                        max_queued=3)
+        for index in range(5):
+            log.telemetry(GLOBAL_POSITION_MID, b'tlm', time=index)
+        log.close()
+        self.assertEqual(2, log.dropped)
+        self.assertEqual([0, 1, 2], [event[0] for event in
+                                     read_flight_log(self.path)])
+
+    def test_writer_failure(self):
+        log = FlightLog(self.path, block_size=1, flush_every=60)
+        log._file.close()
+        log.telemetry(GLOBAL_POSITION_MID, b'tlm', time=0)
+        log._writer.join(5)
+        self.assertFalse(log._writer.is_alive())
+        self.assertIsInstance(log.failure, ValueError)
+        # Nothing is queued once the writer has stopped.
+        log.telemetry(GLOBAL_POSITION_MID, b'tlm', time=1)
+        self.assertEqual(1, log.dropped)
+        self.assertRaises(FlightLogWriteError, log.close)
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_load(self):
+        self.write()
+        arrays = load_flight_log(self.path)
+        self.assertEqual(list(range(7)), arrays.time.tolist())
+        self.assertEqual(5, arrays.select(EVENT_COMMAND).sum())
+        self.assertEqual([5], list(np.flatnonzero(
+            arrays.select(EVENT_TELEMETRY, '0x0A19'))))
+        self.assertEqual(0, arrays.select(EVENT_TELEMETRY, '0x0001').sum())
+        self.assertEqual([0, 1, 2, 3, 4, 3, 0], arrays.size.tolist())
+        self.assertEqual(b'ccc', arrays.payload_of(3))
+        self.assertEqual(b'tlm', arrays.payload_of(5))
+
+
+class TestVehicleFlightLog(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = join(self.dir, 'flight.log')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_vehicle_records(self):
+        clock = SimulatedClock(100.0)
+        log = FlightLog(self.path)
+        vehicle = BaseVehicle('test_flight_log', clock=clock, flight_log=log)
+        com = Communication(AIRLINER_MAP, listen=False)
+        fd = FlightDirector()
+        try:
+            vehicle.attach_app(com)
+            vehicle.attach_app(fd)
+            com.send_bytes = lambda message: True
+            fd.x = 0.5
+            com._on_recv_telemetry(datagram(
+                GLOBAL_POSITION_MID, filled('PX4_VehicleGlobalPositionMsg_t')))
+        finally:
+            clock.close()
+            vehicle.shutdown()
+        self.assertTrue(log.closed)
+
+        events = list(read_flight_log(self.path))
+        self.assertEqual({100.0}, set(event[0] for event in events))
+        commands = [event for event in events if event[1] == EVENT_COMMAND]
+        self.assertEqual(['/Airliner/PX4/ManualSetpoint'],
+                         [event[2] for event in commands])
+        telemetry = [event for event in events
+                     if event[1] == EVENT_TELEMETRY]
+        self.assertEqual(['0x0A19'], [event[2] for event in telemetry])
+        self.assertIn(ACTION_CONTROL_REQUEST,
+                      [event[2] for event in events
+                       if event[1] == EVENT_INTENT])
+
+    def test_unattached_communication(self):
+        com = Communication(AIRLINER_MAP, listen=False)
+        sent = []
+        com.send_bytes = lambda message: sent.append(message) or True
+        com._on_recv_telemetry(datagram(
+            GLOBAL_POSITION_MID, filled('PX4_VehicleGlobalPositionMsg_t')))
+        self.assertTrue(com._send_logged_bytes(b'\x1c\x4c'))
+        self.assertEqual([b'\x1c\x4c'], sent)
@@ -1,9 +1,35 @@
+import random
 import unittest
 
-from pyliner.apps.geofence import Geofence, LayerKind
-from pyliner.apps.geofence.volume import Box, VerticalCylinder
+from pyliner.action import ACTION_FENCE_WARNING, ACTION_RTL
+from pyliner.app import App
+from pyliner.apps.communication import Communication
+from pyliner.apps.geofence import Geofence, Layer, LayerKind
+from pyliner.apps.geofence.index import GridIndex
+from pyliner.apps.geofence.volume import Box, Corridor, PolygonPrism, \
+    VerticalCylinder
 from pyliner.apps.geographic_app import GeographicApp
+from pyliner.base_vehicle import BaseVehicle
+from pyliner.intent import IntentFilter
 from pyliner.position import Position, Coordinate
+from tests.fixtures import AIRLINER_MAP, GLOBAL_POSITION_MID, \
+    datagram, filled
+
+
+class IntentRecorder(App):
+    def __init__(self, *actions):
+        super(IntentRecorder, self).__init__()
+        self.actions = actions
+        self.intents = []
+
+    def attach(self, vehicle):
+        super(IntentRecorder, self).attach(vehicle)
+        self.vehicle.add_filter(IntentFilter(self.actions),
+                                self.intents.append)
+
+    @property
+    def qualified_name(self):
+        return 'intent_recorder'
 
 
 class TestGeofence(unittest.TestCase):
@@ -80,3 +106,254 @@ class TestCylinder(unittest.TestCase):
         # Check position
         self.assertIn(in_bound, cylinder.bounding_box)
         self.assertNotIn(in_bound, cylinder)
+
+    def test_bounding_box_cached(self):
+        geo = GeographicApp()
+        cylinder = VerticalCylinder(geo, Coordinate(2, 4), 500, 250, 750)
+        box = cylinder.bounding_box
+        self.assertIs(box, cylinder.bounding_box)
+
+        cylinder.radius = 1000
+        self.assertIsNot(box, cylinder.bounding_box)
+        self.assertGreater(cylinder.bounding_box.max_latitude,
+                           box.max_latitude)
+
+    def test_bounding_box_widest_point(self):
+        geo = GeographicApp()
+        center = Coordinate(70, 10)
+        cylinder = VerticalCylinder(geo, center, 50000, 0, 100)
+        box = cylinder.bounding_box
+        for bearing in range(0, 360, 2):
+            edge = Position.from_coordinate(
+                geo.pbd(center, bearing, 49999), 50)
+            self.assertIn(edge, box)
+
+    def test_bounding_box_pole(self):
+        geo = GeographicApp()
+        cylinder = VerticalCylinder(geo, Coordinate(89.99, 0), 5000, 0, 100)
+        box = cylinder.bounding_box
+        self.assertEqual(box.max_latitude, 90)
+        self.assertEqual(box.min_longitude, -180)
+        self.assertEqual(box.max_longitude, 180)
+        self.assertIn(Position(89.99, 170, 50), cylinder)
+
+
+class TestPolygonPrism(unittest.TestCase):
+    def setUp(self):
+        # A U shape open to the north.
+        self.u = PolygonPrism(GeographicApp(), [
+            Coordinate(0, 0), Coordinate(0, 3), Coordinate(3, 3),
+            Coordinate(3, 2), Coordinate(1, 2), Coordinate(1, 1),
+            Coordinate(3, 1), Coordinate(3, 0)], 0, 100)
+
+    def test_concave(self):
+        self.assertIn(Position(0.5, 1.5, 50), self.u)
+        self.assertIn(Position(2, 0.5, 50), self.u)
+        self.assertIn(Position(2, 2.5, 50), self.u)
+        self.assertNotIn(Position(2, 1.5, 50), self.u)
+        self.assertNotIn(Position(-0.5, 1.5, 50), self.u)
+        self.assertNotIn(Position(0.5, 1.5, 150), self.u)
+
+    def test_matches_brute_force(self):
+        rand = random.Random(1)
+        vertices = []
+        for i in range(300):
+            bearing = 360.0 * i / 300
+            distance = rand.uniform(500, 2000)
+            vertices.append(GeographicApp.pbd(
+                Coordinate(47, 8), bearing, distance))
+        prism = PolygonPrism(GeographicApp(), vertices, 0, 100)
+        ring = vertices + vertices[:1]
+
+        def brute(point):
+            inside = False
+            for a, b in zip(ring, ring[1:]):
+                if (a.latitude > point.latitude) != \
+                        (b.latitude > point.latitude):
+                    cross = a.longitude + (point.latitude - a.latitude) * \
+                        (b.longitude - a.longitude) / \
+                        (b.latitude - a.latitude)
+                    if point.longitude < cross:
+                        inside = not inside
+            return inside
+
+        for _ in range(500):
+            point = Position(rand.uniform(46.97, 47.03),
+                             rand.uniform(7.96, 8.04), 50)
+            self.assertEqual(point in prism, brute(point))
+
+    def test_layer(self):
+        layer = Layer('site', LayerKind.ADDITIVE)
+        layer.add(self.u)
+        self.assertIn(Position(0.5, 1.5, 50), layer)
+        self.assertNotIn(Position(2, 1.5, 50), layer)
+
+
+class TestCorridor(unittest.TestCase):
+    def test_corridor(self):
+        geo = GeographicApp()
+        start = Coordinate(40, -80)
+        turn = geo.pbd(start, 90, 5000)
+        end = geo.pbd(turn, 0, 5000)
+        corridor = Corridor(geo, [start, turn, end], 200, 0, 500)
+
+        on_leg = geo.pbd(start, 90, 2500)
+        self.assertIn(Position.from_coordinate(on_leg, 100), corridor)
+        self.assertIn(Position.from_coordinate(
+            geo.pbd(on_leg, 0, 95), 100), corridor)
+        self.assertNotIn(Position.from_coordinate(
+            geo.pbd(on_leg, 0, 105), 100), corridor)
+        self.assertNotIn(Position.from_coordinate(on_leg, 600), corridor)
+
+        # Rounded ends.
+        self.assertIn(Position.from_coordinate(
+            geo.pbd(end, 45, 95), 100), corridor)
+        self.assertNotIn(Position.from_coordinate(
+            geo.pbd(end, 45, 105), 100), corridor)
+        # Inside the corner but away from both legs.
+        self.assertNotIn(Position.from_coordinate(
+            geo.pbd(geo.pbd(start, 90, 2500), 0, 2500), 100), corridor)
+
+        for bearing in range(0, 360, 10):
+            edge = geo.pbd(turn, bearing, 99)
+            self.assertIn(Position.from_coordinate(edge, 100),
+                          corridor.bounding_box)
+
+
+class TestLayerIndex(unittest.TestCase):
+    def setUp(self):
+        self.geo = GeographicApp()
+        rand = random.Random(0)
+        self.cylinders = [VerticalCylinder(
+            self.geo, Coordinate(rand.uniform(40, 41), rand.uniform(-80, -79)),
+            rand.uniform(100, 3000), 0, 1000) for _ in range(200)]
+        self.layer = Layer('no-fly', LayerKind.SUBTRACTIVE)
+        self.layer.update(self.cylinders)
+        self.points = [Position(rand.uniform(39.9, 41.1),
+                                rand.uniform(-80.1, -78.9), 500)
+                       for _ in range(500)]
+
+    def test_matches_brute_force(self):
+        for point in self.points:
+            self.assertEqual(
+                point in self.layer,
+                any(point in cylinder for cylinder in self.cylinders))
+
+    def test_candidates(self):
+        index = self.layer.index
+        self.assertEqual(len(index), 200)
+        for point in self.points:
+            self.assertLess(len(index.candidates(point)), 60)
+
+    def test_rebuilt_on_change(self):
+        point = Position(45, 45, 500)
+        index = self.layer.index
+        self.assertNotIn(point, self.layer)
+
+        cylinder = VerticalCylinder(self.geo, point, 100, 0, 1000)
+        self.layer.add(cylinder)
+        self.assertIsNot(index, self.layer.index)
+        self.assertIn(point, self.layer)
+
+        self.layer.discard(cylinder)
+        self.assertNotIn(point, self.layer)
+        self.assertIn(self.cylinders[0], self.layer)
+
+    def test_rebuilt_on_operators(self):
+        point = Position(45, 45, 500)
+        cylinder = VerticalCylinder(self.geo, point, 100, 0, 1000)
+        others = set(self.cylinders)
+        changes = [
+            (lambda layer: layer.__ior__({cylinder}), True),
+            (lambda layer: layer.__isub__({cylinder}), False),
+            (lambda layer: layer.symmetric_difference_update([cylinder]),
+             True),
+            (lambda layer: layer.__iand__(others), False),
+            (lambda layer: layer.__ixor__({cylinder}), True),
+            (lambda layer: layer.difference_update([cylinder]), False),
+            (lambda layer: layer.update([cylinder]), True),
+            (lambda layer: layer.intersection_update(others), False)]
+        for change, inside in changes:
+            self.layer.index  # Build the index before every change.
+            self.layer.bounding_box
+            self.assertIs(self.layer, change(self.layer) or self.layer)
+            self.assertEqual(inside, point in self.layer)
+            self.assertEqual(inside, point in self.layer.bounding_box)
+        self.layer |= {cylinder}
+        self.assertIn(point, self.layer)
+
+    def test_large_volume(self):
+        index = GridIndex([Box(Position(-10, -10, 0), Position(10, 10, 10))],
+                          cell_size=0.5, max_cells=16)
+        self.assertEqual(len(index.candidates(Position(50, 50, 0))), 1)
+
+
+class TestGeofenceLayers(unittest.TestCase):
+    def test_topmost_layer_decides(self):
+        fence = Geofence()
+        fence.add_layer(0, 'base', LayerKind.ADDITIVE).add(
+            Box(Position(0, 0, 0), Position(10, 10, 100)))
+        fence.add_layer(1, 'hole', LayerKind.SUBTRACTIVE).add(
+            Box(Position(4, 4, 0), Position(6, 6, 100)))
+        fence.add_layer(2, 'island', LayerKind.ADDITIVE).add(
+            Box(Position(5, 5, 0), Position(5.5, 5.5, 100)))
+
+        self.assertIn(Position(1, 1, 50), fence)
+        self.assertNotIn(Position(4.5, 4.5, 50), fence)
+        self.assertIn(Position(5.2, 5.2, 50), fence)
+        self.assertNotIn(Position(20, 20, 50), fence)
+
+
+class TestPredictiveGeofence(unittest.TestCase):
+    def setUp(self):
+        self.vehicle = BaseVehicle('test_geofence')
+        self.com = Communication(AIRLINER_MAP, listen=False)
+        self.fence = Geofence(check_every=None, horizon=2.0)
+        self.recorder = IntentRecorder(ACTION_FENCE_WARNING, ACTION_RTL)
+        for app in (self.com, self.recorder, self.fence):
+            self.vehicle.attach_app(app)
+        self.fence.add_layer(0, 'base', LayerKind.ADDITIVE).add(
+            Box(Position(0, 0, 0), Position(0.001, 0.001, 100)))
+        self.fence.enabled = True
+
+    def tearDown(self):
+        self.vehicle.shutdown()
+
+    def send(self, latitude, north=0.0, east=0.0, down=0.0):
+        self.com._on_recv_telemetry(datagram(
+            GLOBAL_POSITION_MID, filled(
+                'PX4_VehicleGlobalPositionMsg_t', Lat=latitude,
+                Lon=0.0005, Alt=50, VelN=north, VelE=east, VelD=down)))
+
+    def actions(self):
+        self.vehicle.shutdown()  # Wait for the broadcasts to be delivered.
+        return [intent.action for intent in self.recorder.intents]
+
+    def test_warning_before_breach(self):
+        # About 11 m from the northern edge.
+        self.send(0.0009, north=1.0)
+        self.send(0.0009, north=15.0)
+        self.send(0.0009, north=15.0)
+        self.assertEqual([ACTION_FENCE_WARNING], self.actions())
+        warning = self.recorder.intents[0].data
+        self.assertGreater(warning.position.latitude, 0.001)
+        self.assertLessEqual(warning.time, 1.0)
+
+    def test_warning_rearms(self):
+        self.send(0.0009, north=15.0)
+        self.send(0.0009, north=-15.0)
+        self.send(0.0009, east=0.0, down=30.0)
+        self.assertEqual([ACTION_FENCE_WARNING] * 2, self.actions())
+
+    def test_breach(self):
+        self.send(0.0011, north=15.0)
+        self.assertEqual([ACTION_RTL], self.actions())
+
+    def test_predict_breach(self):
+        position = Position(0.0005, 0.0005, 50)
+        self.assertIsNone(self.fence.predict_breach(position, 0, 0, 0))
+        self.assertIsNone(self.fence.predict_breach(position, 10, 10, -10))
+        warning = self.fence.predict_breach(position, 0, 0, -30)
+        # Checked every 5 m, so the first point above 100 m is 55 m up.
+        self.assertAlmostEqual(warning.time, 55 / 30.0)
+        self.assertGreater(warning.position.altitude, 100)
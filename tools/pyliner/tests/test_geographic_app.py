@@ -0,0 +1,61 @@
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from pyliner.apps.geographic_app import GeographicApp, GeodesicMode
+from pyliner.position import Coordinate
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        random = np.random.RandomState(0)
+        self.lat = random.uniform(-70, 70, 200)
+        self.lon = random.uniform(-170, 170, 200)
+        self.bearing = random.uniform(0, 360, 200)
+        self.distance = random.uniform(0, 10000, 200)
+
+    def test_exact_matches_scalar(self):
+        lat2, lon2 = GeographicApp.batch_pbd(
+            self.lat, self.lon, self.bearing, self.distance)
+        distance, bearing = GeographicApp.batch_inverse(
+            self.lat, self.lon, lat2, lon2)
+        for i in range(0, 200, 20):
+            start = Coordinate(self.lat[i], self.lon[i])
+            end = GeographicApp.pbd(start, self.bearing[i], self.distance[i])
+            self.assertAlmostEqual(end.latitude, lat2[i])
+            self.assertAlmostEqual(end.longitude, lon2[i])
+            self.assertAlmostEqual(
+                GeographicApp.distance(start, end), distance[i], places=6)
+        np.testing.assert_allclose(distance, self.distance, atol=1e-6)
+        self.assertTrue(np.all((bearing >= 0) & (bearing < 360)))
+
+    def test_broadcast(self):
+        distance = GeographicApp.batch_distance(
+            0, 0, [0, 1, 0], [1, 0, 0], GeodesicMode.LOCAL)
+        self.assertEqual(distance.shape, (3,))
+        self.assertEqual(distance[2], 0)
+        bearing = GeographicApp.batch_bearing(0, 0, [1, 0], [0, -1])
+        np.testing.assert_allclose(bearing, [0, 270])
+
+    def test_local_error_bound(self):
+        lat2, lon2 = GeographicApp.batch_pbd(
+            self.lat, self.lon, self.bearing, self.distance)
+        distance, bearing = GeographicApp.batch_inverse(
+            self.lat, self.lon, lat2, lon2, GeodesicMode.LOCAL)
+        np.testing.assert_allclose(distance, self.distance, atol=0.01)
+        error = (bearing - self.bearing + 180) % 360 - 180
+        self.assertLess(np.abs(error[self.distance > 1]).max(), 0.001)
+
+        lat3, lon3 = GeographicApp.batch_pbd(
+            self.lat, self.lon, self.bearing, self.distance,
+            GeodesicMode.LOCAL)
+        miss = GeographicApp.batch_distance(lat2, lon2, lat3, lon3)
+        self.assertLess(miss.max(), 0.05)
+
+    def test_bad_mode(self):
+        with self.assertRaises(TypeError):
+            GeographicApp.batch_distance(0, 0, 1, 1, 'local')
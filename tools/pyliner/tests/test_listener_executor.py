@@ -0,0 +1,156 @@
+import threading
+import unittest
+
+from pyliner.apps.communication import Communication
+from pyliner.base_vehicle import BaseVehicle
+from pyliner.listener_executor import ListenerExecutor, ListenerStats, \
+    OverflowPolicy
+from tests.fixtures import AIRLINER_MAP, GLOBAL_POSITION_MID, \
+    datagram, filled
+
+
+class Blocked(object):
+    """A listener which blocks until released, recording what it is given.
+
+    done is set once the listener has been called expected times, or with
+    'last'.
+    """
+
+    def __init__(self, expected=None):
+        self.calls = []
+        self.expected = expected
+        self.done = threading.Event()
+        self.release = threading.Event()
+        self.started = threading.Event()
+
+    def __call__(self, item):
+        self.started.set()
+        self.release.wait(5)
+        self.calls.append(item)
+        if item == 'last' or len(self.calls) == self.expected:
+            self.done.set()
+
+
+class TestListenerExecutor(unittest.TestCase):
+    def tearDown(self):
+        self.executor.shutdown(wait=True)
+
+    def submit_while_blocked(self, items):
+        listener = Blocked()
+        self.executor.submit(listener, 'first')
+        self.assertTrue(listener.started.wait(5))
+        for item in items:
+            self.executor.submit(listener, item)
+        return listener
+
+    def test_drop_oldest(self):
+        self.executor = ListenerExecutor(maxsize=2)
+        listener = self.submit_while_blocked([1, 2, 3, 'last'])
+        self.assertEqual(ListenerStats(depth=2, submitted=5, delivered=0,
+                                       dropped=2),
+                         self.executor.stats(listener))
+        listener.release.set()
+        self.assertTrue(listener.done.wait(5))
+        self.assertEqual(['first', 3, 'last'], listener.calls)
+
+    def test_coalesce_latest(self):
+        self.executor = ListenerExecutor(
+            maxsize=10, policy=OverflowPolicy.COALESCE_LATEST)
+        listener = self.submit_while_blocked([1, 2, 'last'])
+        self.assertEqual(1, self.executor.stats(listener).depth)
+        listener.release.set()
+        self.assertTrue(listener.done.wait(5))
+        self.assertEqual(['first', 'last'], listener.calls)
+        self.assertEqual(2, self.executor.stats()[listener].dropped)
+
+    def test_unbounded(self):
+        self.executor = ListenerExecutor(workers=2)
+        listener = self.submit_while_blocked(list(range(100)) + ['last'])
+        listener.release.set()
+        self.assertTrue(listener.done.wait(5))
+        self.assertEqual(['first'] + list(range(100)) + ['last'],
+                         listener.calls)
+        self.assertEqual(0, self.executor.stats(listener).dropped)
+
+    def test_slow_listener_isolated(self):
+        self.executor = ListenerExecutor(workers=1)
+        slow = self.submit_while_blocked([])
+        fast = threading.Event()
+        self.executor.submit(lambda item: fast.set(), None)
+        self.assertFalse(fast.wait(0.1))  # The only worker is held up.
+        slow.release.set()
+        self.assertTrue(fast.wait(5))
+
+    def test_exception(self):
+        self.executor = ListenerExecutor()
+        called = threading.Event()
+
+        def broken(item):
+            raise ValueError(item)
+        self.executor.submit(broken, 'boom')
+        self.executor.submit(lambda item: called.set(), None)
+        self.assertTrue(called.wait(5))
+        self.assertEqual(1, self.executor.stats(broken).delivered)
+
+    def test_remove_listener(self):
+        self.executor = ListenerExecutor()
+        idle = threading.Event()
+        self.executor.submit(lambda item: idle.set(), None)
+        self.assertTrue(idle.wait(5))
+        busy = self.submit_while_blocked(['last'])
+        self.assertEqual(2, len(self.executor.stats()))
+
+        for listener in list(self.executor.stats()):
+            self.executor.remove_listener(listener)
+        # The idle queue is forgotten at once, the busy one once it drains.
+        self.assertEqual([busy], list(self.executor.stats()))
+        busy.release.set()
+        self.assertTrue(busy.done.wait(5))
+        self.assertEqual(['first', 'last'], busy.calls)
+        self.executor.shutdown(wait=True)
+        self.assertEqual({}, self.executor.stats())
+
+
+class TestCommunicationExecutor(unittest.TestCase):
+    def setUp(self):
+        self.executor = ListenerExecutor(maxsize=4)
+        self.vehicle = BaseVehicle('test_listener_executor')
+        self.com = Communication(AIRLINER_MAP, listen=False,
+                                 listener_executor=self.executor)
+        self.vehicle.attach_app(self.com)
+
+    def tearDown(self):
+        self.vehicle.shutdown()
+        self.executor.shutdown(wait=True)
+
+    def test_listeners_do_not_block_receive(self):
+        lat = self.com.telemetry('/Airliner/PX4/VehicleGlobalPosition/Lat')
+        listener = Blocked(expected=5)
+        lat.add_listener(listener)
+        for value in range(10):
+            self.com._on_recv_telemetry(datagram(
+                GLOBAL_POSITION_MID, filled('PX4_VehicleGlobalPositionMsg_t',
+                                            Lat=float(value))))
+            self.assertTrue(listener.started.wait(5))
+        self.assertEqual(9.0, lat.value)
+
+        stats = self.executor.stats(listener)
+        self.assertEqual((4, 10, 5), (stats.depth, stats.submitted,
+                                      stats.dropped))
+        listener.release.set()
+        self.assertTrue(listener.done.wait(5))
+        # Each call was given the update it was queued for.
+        self.assertEqual([0.0, 6.0, 7.0, 8.0, 9.0],
+                         [update.value for update in listener.calls])
+
+    def test_remove_listener(self):
+        lat = self.com.telemetry('/Airliner/PX4/VehicleGlobalPosition/Lat')
+        listener = Blocked(expected=1)
+        listener.release.set()
+        lat.add_listener(listener)
+        self.com._on_recv_telemetry(datagram(
+            GLOBAL_POSITION_MID, filled('PX4_VehicleGlobalPositionMsg_t')))
+        self.assertTrue(listener.done.wait(5))
+        lat.remove_listener(listener)
+        self.executor.shutdown(wait=True)
+        self.assertNotIn(listener, self.executor.stats())
@@ -0,0 +1,125 @@
+import threading
+import unittest
+
+from pyliner.apps.loop_communication import LoopCommunication
+from pyliner.base_vehicle import BaseVehicle
+from pyliner.event_loop import EventLoop, LoopFuture
+from pyliner.intent import FutureTimeoutError
+from pyliner.util import init_socket
+from tests.fixtures import AIRLINER_MAP, GLOBAL_POSITION_MID, Commander, \
+    datagram, filled
+
+LAT = '/Airliner/PX4/VehicleGlobalPosition/Lat'
+
+
+class TestEventLoop(unittest.TestCase):
+    def setUp(self):
+        self.loop = EventLoop()
+        self.loop.start()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_call_later(self):
+        calls = []
+        done = LoopFuture()
+        self.loop.call_later(0.02, calls.append, 2)
+        self.loop.call_later(0.01, calls.append, 1)
+        self.loop.call_later(0.01, calls.append, 'cancelled').cancel()
+        self.loop.call_later(0.03, done.set_result, True)
+        self.assertTrue(done.result(5))
+        self.assertEqual([1, 2], calls)
+
+    def test_run(self):
+        self.assertIs(self.loop._thread,
+                      self.loop.run(threading.current_thread).result(5))
+        failed = self.loop.run(int, 'x')
+        self.assertIsInstance(failed.exception(5), ValueError)
+        self.assertRaises(ValueError, failed.result)
+        self.assertRaises(FutureTimeoutError, LoopFuture().result, 0)
+
+    def test_reader(self):
+        receiver, sender = init_socket(), init_socket()
+        receiver.bind(('127.0.0.1', 0))
+        received = LoopFuture()
+        self.loop.add_reader(
+            receiver, lambda sock: received.set_result(sock.recv(16)))
+        sender.sendto(b'ping', receiver.getsockname())
+        self.assertEqual(b'ping', received.result(5))
+        self.loop.remove_reader(receiver)
+        receiver.close()
+        sender.close()
+
+
+class TestLoopCommunication(unittest.TestCase):
+    def setUp(self):
+        self.loop = EventLoop()
+        self.loop.start()
+        self.vehicles = []
+        self.coms = []
+        for name in ('rocky', 'bullwinkle'):
+            vehicle = BaseVehicle(name)
+            com = LoopCommunication(AIRLINER_MAP, self.loop, to_port=0,
+                                    ci_port=9)
+            vehicle.attach_app(com)
+            self.vehicles.append(vehicle)
+            self.coms.append(com)
+
+    def tearDown(self):
+        for vehicle in self.vehicles:
+            vehicle.shutdown()
+        self.loop.close()
+
+    def send_position(self, com, latitude):
+        sender = init_socket()
+        sender.sendto(datagram(GLOBAL_POSITION_MID, filled(
+            'PX4_VehicleGlobalPositionMsg_t', Lat=latitude))[0],
+            ('127.0.0.1', com.receiver.server_address[1]))
+        sender.close()
+
+    def test_next(self):
+        rocky, bullwinkle = self.coms
+        pending = [com.telemetry(LAT).next() for com in self.coms]
+        self.send_position(rocky, 12.5)
+        self.assertEqual(12.5, pending[0].result(5))
+        self.assertFalse(pending[1].done())
+        self.send_position(bullwinkle, -3.0)
+        self.assertEqual(-3.0, pending[1].result(5))
+        self.assertEqual(12.5, rocky.telemetry(LAT).value)
+
+    def test_no_threads(self):
+        for com in self.coms:
+            self.assertIsNone(com.tlm_listener)
+            self.assertIsNone(com.control_thread)
+            self.assertTrue(com._rotating)
+            self.assertFalse(com.receiver.is_alive())
+
+    def test_send_command_async(self):
+        com = self.coms[0]
+        op_path = '/Airliner/PX4/ManualSetpoint'
+        args = [{'name': name.rsplit('/', 1)[1], 'value': 0}
+                for name in com._ops if name.startswith(op_path + '/')]
+        sent = com.send_command_async({'name': op_path, 'args': args})
+        self.assertIsInstance(sent, LoopFuture)
+        self.assertTrue(sent.result(5))
+
+    def test_detach(self):
+        com = self.coms[0]
+        fileno = com.receiver.socket.fileno()
+        self.vehicles[0].shutdown()
+        self.assertFalse(com._rotating)
+        self.assertNotIn(fileno, self.loop._readers)
+
+    def test_control_rotated_on_loop(self):
+        com = self.coms[0]
+        a, b = Commander('a'), Commander('b')
+        for app in (a, b):
+            self.vehicles[0].attach_app(app)
+        com.send_bytes = lambda message: True
+        a.send()
+        sender = threading.Thread(target=b.send)
+        sender.daemon = True
+        sender.start()
+        sender.join(5)
+        self.assertFalse(sender.is_alive())
+        self.assertEqual('b', com.control_current.app_name)
@@ -0,0 +1,84 @@
+import threading
+import time
+import unittest
+
+from pyliner.action import ACTION_AXIS_SET
+from pyliner.app import App
+from pyliner.apps.communication import Communication
+from pyliner.apps.navigation import Navigation
+from pyliner.apps.navigation.command_timeout import CommandTimeout
+from pyliner.apps.navigation.control import constant
+from pyliner.base_vehicle import BaseVehicle
+from pyliner.conversions import seconds
+from pyliner.intent import IntentFilter
+from tests.fixtures import AIRLINER_MAP, GLOBAL_POSITION_MID, \
+    datagram, filled
+
+
+class AxisRecorder(App):
+    def __init__(self):
+        super(AxisRecorder, self).__init__()
+        self.axes = []
+
+    def attach(self, vehicle):
+        super(AxisRecorder, self).attach(vehicle)
+        self.vehicle.add_filter(IntentFilter([ACTION_AXIS_SET]),
+                                lambda i: self.axes.append(i.data))
+
+    @property
+    def qualified_name(self):
+        return 'axis_recorder'
+
+
+class TestNavigation(unittest.TestCase):
+    def setUp(self):
+        self.vehicle = BaseVehicle('test_navigation')
+        self.com = Communication(AIRLINER_MAP, listen=False)
+        self.nav = Navigation()
+        self.recorder = AxisRecorder()
+        for app in (self.com, self.recorder, self.nav):
+            self.vehicle.attach_app(app)
+        self.nav.defaults.update(
+            {'method': constant(1.0), 'tolerance': 0.5, 'timeout': None})
+        self.nav.sleep_time = 0.05
+
+    def tearDown(self):
+        self.vehicle.shutdown()
+
+    def send_position(self, altitude):
+        self.com._on_recv_telemetry(datagram(
+            GLOBAL_POSITION_MID, filled('PX4_VehicleGlobalPositionMsg_t',
+                                        Alt=altitude)))
+
+    def test_wait_position(self):
+        seq = self.nav.position_seq
+        self.assertEqual(seq, self.nav.wait_position(seq, timeout=0.01))
+        self.send_position(1.0)
+        self.assertEqual(seq + 1, self.nav.wait_position(seq, timeout=0))
+
+    def test_wait_position_wakes_before_timeout(self):
+        seq = self.nav.position_seq
+        sender = threading.Timer(0.01, self.send_position, args=(1.0,))
+        sender.start()
+        start = time.time()
+        self.assertEqual(seq + 1, self.nav.wait_position(seq, timeout=5.0))
+        self.assertLess(time.time() - start, 1.0)
+        sender.join()
+
+    def test_vnav_wakes_on_telemetry(self):
+        self.send_position(0.0)
+        climb = threading.Thread(target=self.nav.vnav().to, args=(3.0,))
+        climb.start()
+        for altitude in (1.0, 2.0, 3.0):
+            time.sleep(0.15)  # Three safety-net wakeups with no new data.
+            self.send_position(altitude)
+        climb.join(5)
+        self.assertFalse(climb.is_alive())
+        # One control per position received, then the final zero.
+        self.assertEqual([{'z': 1.0}] * 3 + [{'z': 0.0}], self.recorder.axes)
+
+    def test_timeout(self):
+        self.send_position(0.0)
+        self.assertRaises(CommandTimeout, self.nav.vnav().to, 5.0,
+                          timeout=seconds(0.1))
+        self.assertEqual([{'z': 1.0}], self.recorder.axes)
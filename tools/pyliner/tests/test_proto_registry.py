@@ -0,0 +1,125 @@
+import os
+import tempfile
+import unittest
+
+from google.protobuf import descriptor_pb2
+
+from pyliner.proto_registry import MessageRegistry, merge_descriptors
+from pyliner.python_pb import CFE_ES_HkPacket_t_pb2, pyliner_msgs
+
+MESSAGES = {
+    'CFE_ES_HkPacket_t': ('pyliner.python_pb.CFE_ES_HkPacket_t_pb2',
+                          'CFE_ES_HkPacket_t_pb'),
+    'BAT_HkTlm_t': ('pyliner.python_pb.BAT_HkTlm_t_pb2', 'BAT_HkTlm_t_pb')}
+
+
+class TestMessageRegistry(unittest.TestCase):
+    def test_lazy(self):
+        registry = MessageRegistry(MESSAGES)
+        self.assertEqual(2, len(registry))
+        self.assertIn('BAT_HkTlm_t', registry)
+        self.assertEqual(set(MESSAGES), set(registry))
+        self.assertEqual(set(), registry.loaded)
+
+        cls = registry['CFE_ES_HkPacket_t']
+        self.assertIs(CFE_ES_HkPacket_t_pb2.CFE_ES_HkPacket_t_pb, cls)
+        self.assertIs(cls, registry['CFE_ES_HkPacket_t'])
+        self.assertEqual({'CFE_ES_HkPacket_t'}, registry.loaded)
+        with self.assertRaises(KeyError):
+            registry['UNKNOWN_t']
+
+    def test_bundle(self):
+        file_set = descriptor_pb2.FileDescriptorSet()
+        CFE_ES_HkPacket_t_pb2.DESCRIPTOR.CopyToProto(file_set.file.add())
+        handle, path = tempfile.mkstemp(suffix='.desc')
+        self.addCleanup(os.remove, path)
+        with os.fdopen(handle, 'wb') as bundle:
+            bundle.write(file_set.SerializeToString())
+
+        registry = MessageRegistry(MESSAGES, bundle=path)
+        cls = registry['CFE_ES_HkPacket_t']
+        self.assertIsNot(CFE_ES_HkPacket_t_pb2.CFE_ES_HkPacket_t_pb, cls)
+        msg = cls()
+        msg.Payload.CmdCounter = 3
+        original = CFE_ES_HkPacket_t_pb2.CFE_ES_HkPacket_t_pb()
+        original.MergeFromString(msg.SerializePartialToString())
+        self.assertEqual(3, original.Payload.CmdCounter)
+        # Missing from the bundle, so the module is imported instead.
+        self.assertEqual(
+            'BAT_HkTlm_t_pb', registry['BAT_HkTlm_t'].DESCRIPTOR.full_name)
+
+    def test_generated_map(self):
+        self.assertIsInstance(pyliner_msgs.proto_msg_map, MessageRegistry)
+        self.assertIn('PX4_VehicleGlobalPositionMsg_t',
+                      pyliner_msgs.proto_msg_map)
+
+
+def generated_file(name, *messages):
+    """Build a file descriptor the way the generator writes one.
+
+    Args:
+        name (str): File name.
+        messages (tuple[str, list[tuple[str, str]]]): Message name and its
+            fields as (field name, message type or None for uint32).
+    """
+    file_proto = descriptor_pb2.FileDescriptorProto(name=name)
+    for message_name, fields in messages:
+        message = file_proto.message_type.add(name=message_name)
+        for number, (field_name, type_name) in enumerate(fields, 1):
+            field = message.field.add(
+                name=field_name, number=number,
+                label=descriptor_pb2.FieldDescriptorProto.LABEL_REQUIRED)
+            if type_name is None:
+                field.type = descriptor_pb2.FieldDescriptorProto.TYPE_UINT32
+            else:
+                field.type = descriptor_pb2.FieldDescriptorProto.TYPE_MESSAGE
+                field.type_name = '.' + type_name
+    return file_proto
+
+
+class TestMergeDescriptors(unittest.TestCase):
+    def setUp(self):
+        header = ('Header_pb', [('Length', None)])
+        self.files = [
+            generated_file('_py_A_t.proto', header, ('Spare', [('X', None)]),
+                           ('A_t_pb', [('Hdr', 'Header_pb'),
+                                       ('Spare', 'Spare')])),
+            generated_file('_py_B_t.proto', header, ('Spare', [('Y', None)]),
+                           ('B_t_pb', [('Hdr', 'Header_pb'),
+                                       ('Spare', 'Spare')])),
+            generated_file('_py_Header.proto', header)]
+        self.merged = merge_descriptors(self.files)
+
+    def test_shared_types_written_once(self):
+        names = [file_proto.name for file_proto in self.merged.file]
+        self.assertEqual(1, names.count('Header_pb.proto'))
+        self.assertEqual(5, len(names))
+        # Dependencies come first.
+        for index, file_proto in enumerate(self.merged.file):
+            for dependency in file_proto.dependency:
+                self.assertIn(dependency, names[:index])
+
+    def test_conflicts_scoped(self):
+        by_name = {file_proto.name: file_proto
+                   for file_proto in self.merged.file}
+        self.assertEqual('_py_A_t', by_name['_py_A_t/Spare.proto'].package)
+        self.assertEqual(['Header_pb.proto', '_py_A_t/Spare.proto'],
+                         list(by_name['A_t_pb.proto'].dependency))
+        self.assertEqual('._py_B_t.Spare',
+                         by_name['B_t_pb.proto'].message_type[0].field[1]
+                         .type_name)
+
+    def test_registry_loads_merged(self):
+        handle, path = tempfile.mkstemp(suffix='.desc')
+        self.addCleanup(os.remove, path)
+        with os.fdopen(handle, 'wb') as bundle:
+            bundle.write(self.merged.SerializeToString())
+        registry = MessageRegistry(
+            {'A_t': ('unused', 'A_t_pb'), 'B_t': ('unused', 'B_t_pb')},
+            bundle=path)
+        a, b = registry['A_t'](), registry['B_t']()
+        a.Spare.X = 1
+        b.Spare.Y = 2
+        b.Hdr.Length = 3
+        self.assertEqual(3, b.Hdr.Length)
+        self.assertIs(type(a.Hdr), type(b.Hdr))
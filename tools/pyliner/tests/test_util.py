@@ -0,0 +1,48 @@
+import threading
+import unittest
+
+from pyliner.util import UDPReceiver, init_socket
+
+
+class TestUDPReceiver(unittest.TestCase):
+    def setUp(self):
+        self.batches = []
+        self.received = threading.Event()
+        self.receiver = UDPReceiver(('127.0.0.1', 0), self.on_batch,
+                                    batch_size=4, buffer_size=16)
+        self.sender = init_socket()
+
+    def tearDown(self):
+        self.receiver.close()
+        self.sender.close()
+
+    def on_batch(self, batch):
+        self.batches.append(batch)
+        self.received.set()
+
+    def send(self, *datagrams):
+        for data in datagrams:
+            self.sender.sendto(data, self.receiver.server_address)
+
+    def test_drain(self):
+        self.assertEqual([], self.receiver.drain())
+        self.send(b'one', b'two', b'three', b'four', b'five')
+        batch = self.receiver.drain()
+        self.assertEqual([b'one', b'two', b'three', b'four'],
+                         [data for data, _ in batch])
+        self.assertEqual(self.sender.getsockname()[1], batch[0][1][1])
+        self.assertEqual([b'five'], [data for data, _ in
+                                     self.receiver.drain()])
+
+    def test_buffer_reused(self):
+        self.send(b'a much longer datagram', b'short')
+        first, second = self.receiver.drain()
+        self.assertEqual(b'a much longer da', first[0])
+        self.assertEqual(b'short', second[0])
+
+    def test_thread(self):
+        self.receiver.start()
+        self.send(b'hello')
+        self.assertTrue(self.received.wait(5))
+        self.assertEqual([b'hello'], [data for data, _ in self.batches[0]])
+        self.assertEqual(1, self.receiver.datagrams)